@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Busca por Titular
+=============================
+
+Simula a digitação de nomes em uma caixa de busca (uma consulta por tecla)
+sobre ``SistemaBancario.buscar_contas_por_titular``, com e sem o cache LRU.
+
+Para executar:
+    python benchmarks/bench_busca_titular.py --contas 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+NOMES = ("João", "Maria", "José", "Ana", "Antônio", "Francisca", "Carlos",
+         "Paulo", "Adriana", "Lucas", "Juliana", "Márcio", "Patrícia",
+         "Thiago", "Fernanda", "Raimundo", "Sebastião", "Luíza", "Otávio")
+SOBRENOMES = ("Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira",
+              "Alves", "Pereira", "Lima", "Gomes", "Ribeiro", "Carvalho",
+              "Araújo", "Melo", "Barbosa", "Cardoso", "Nascimento", "Conceição")
+
+
+def nome_aleatorio(rng: random.Random) -> str:
+    return (f"{rng.choice(NOMES)} {rng.choice(SOBRENOMES)} "
+            f"{rng.choice(SOBRENOMES)} {rng.randrange(10**5):05d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--contas", type=int, default=1_000_000)
+    parser.add_argument("--limite", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    banco = SistemaBancario("Benchmark")
+    inicio = time.perf_counter()
+    banco.criar_contas_em_lote((nome_aleatorio(rng), f"{i:011d}")
+                               for i in range(args.contas))
+    print(f"Contas: {len(banco)} (criadas e indexadas em "
+          f"{time.perf_counter() - inicio:.1f}s)")
+    
+    alvos = [nome_aleatorio(rng) for _ in range(50)]
+    consultas = [alvo[:n] for alvo in alvos for n in range(1, len(alvo) + 1)]
+    
+    for rotulo, limpar in (("sem cache", True), ("com cache", False)):
+        tempos = []
+        for consulta in consultas:
+            if limpar:
+                banco._indice_titulares._cache.limpar()
+            t0 = time.perf_counter()
+            banco.buscar_contas_por_titular(consulta, args.limite)
+            tempos.append(time.perf_counter() - t0)
+        tempos.sort()
+        mediana = tempos[len(tempos) // 2]
+        p99 = tempos[int(len(tempos) * 0.99)]
+        print(f"{rotulo}: mediana {mediana * 1e6:9.1f} µs, "
+              f"p99 {p99 * 1e6:9.1f} µs ({len(consultas)} consultas)")
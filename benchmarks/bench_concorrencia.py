@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Operações Concorrentes
+==================================
+
+Várias threads executam depósitos, saques, pagamentos e transferências
+aleatórias sobre as mesmas contas. Ao final verifica que o dinheiro foi
+conservado (saldo total = inicial + depósitos - saques - pagamentos) e
+reporta a vazão para cada quantidade de threads.
+
+Observação: no CPython com GIL a vazão não cresce com o número de threads;
+as travas por conta garantem a correção e permitem paralelismo real em
+interpretadores sem GIL (free-threaded).
+
+Para executar:
+    python benchmarks/bench_concorrencia.py --threads 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+
+def rodada(quantidade_threads: int, contas: int, operacoes: int, seed: int) -> float:
+    """Executa uma rodada e retorna a vazão em operações por segundo."""
+    banco = SistemaBancario("Benchmark")
+    numeros = []
+    for i in range(contas):
+        conta = banco.criar_conta(f"Cliente {i}", f"{i:011d}")
+        conta.depositar(1000)
+        numeros.append(conta.numero_conta)
+    saldo_inicial = 1000 * contas
+    movimentos = [0] * quantidade_threads
+    
+    def trabalhar(indice: int):
+        rng = random.Random(seed + indice)
+        liquido = 0
+        for _ in range(operacoes):
+            numero = rng.choice(numeros)
+            conta = banco.contas[numero]
+            valor = rng.randint(1, 100)
+            operacao = rng.random()
+            try:
+                if operacao < 0.25:
+                    conta.depositar(valor)
+                    liquido += valor
+                elif operacao < 0.45:
+                    conta.sacar(valor)
+                    liquido -= valor
+                elif operacao < 0.55:
+                    conta.pagar_conta(valor, "Conta de consumo")
+                    liquido -= valor
+                else:
+                    destino = rng.choice(numeros)
+                    if destino != numero:
+                        banco.transferir_entre_contas(numero, destino, valor)
+            except RuntimeError:
+                pass
+        movimentos[indice] = liquido
+    
+    threads = [threading.Thread(target=trabalhar, args=(i,))
+               for i in range(quantidade_threads)]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    decorrido = time.perf_counter() - inicio
+    
+    esperado = saldo_inicial + sum(movimentos)
+    soma = sum(conta.saldo for conta in banco.contas.values())
+    assert soma == esperado, (soma, esperado)
+    assert banco.obter_estatisticas()['saldo_total'] == esperado
+    assert all(conta.saldo >= 0 for conta in banco.contas.values())
+    return quantidade_threads * operacoes / decorrido
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--contas", type=int, default=100)
+    parser.add_argument("--operacoes", type=int, default=50_000,
+                        help="operações por thread")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    print(f"{'threads':>8} {'ops/s':>12}  conservação")
+    for quantidade in args.threads:
+        vazao = rodada(quantidade, args.contas, args.operacoes, args.seed)
+        print(f"{quantidade:>8} {vazao:>12,.0f}  ok")
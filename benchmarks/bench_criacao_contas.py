@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Criação de Contas em Escala
+=======================================
+
+Mede o custo de ``SistemaBancario.criar_conta`` à medida que o banco cresce.
+Com o índice de CPF/CNPJ, o tempo por conta deve permanecer estável mesmo
+com 1 milhão de contas cadastradas.
+
+Para executar:
+    python benchmarks/bench_criacao_contas.py --contas 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+
+def executar(total_contas: int, janela: int):
+    """
+    Cria ``total_contas`` contas e reporta o tempo médio por janela.
+    
+    Args:
+        total_contas (int): Quantidade de contas a criar
+        janela (int): Quantidade de contas por medição
+    """
+    banco = SistemaBancario("Benchmark")
+    print(f"{'contas':>12} {'µs/conta':>10}")
+    
+    inicio_total = time.perf_counter()
+    for base in range(0, total_contas, janela):
+        inicio = time.perf_counter()
+        for i in range(base, min(base + janela, total_contas)):
+            banco.criar_conta(f"Cliente {i}", f"{i:011d}")
+        decorrido = time.perf_counter() - inicio
+        criadas = min(base + janela, total_contas) - base
+        print(f"{base + criadas:>12} {decorrido / criadas * 1e6:>10.2f}")
+    
+    print(f"\nTotal: {time.perf_counter() - inicio_total:.2f}s "
+          f"para {len(banco)} contas")
+    
+    # Consultas por documento (formatado e sem formatação)
+    inicio = time.perf_counter()
+    for i in range(0, total_contas, max(1, total_contas // 10000)):
+        doc = f"{i:011d}"
+        assert banco.buscar_por_documento(f"{doc[:3]}.{doc[3:6]}.{doc[6:9]}-{doc[9:]}")
+    consultas = len(range(0, total_contas, max(1, total_contas // 10000)))
+    print(f"buscar_por_documento: "
+          f"{(time.perf_counter() - inicio) / consultas * 1e6:.2f} µs/consulta")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--contas", type=int, default=1_000_000)
+    parser.add_argument("--janela", type=int, default=100_000)
+    args = parser.parse_args()
+    executar(args.contas, args.janela)
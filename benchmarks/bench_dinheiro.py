@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Dinheiro em Centavos Inteiros
+=========================================
+
+Mede a vazão de ``depositar``/``sacar`` e verifica a conservação exata do
+dinheiro ao longo de operações aleatórias: a soma dos saldos deve ser
+igual, centavo a centavo, a depósitos - saques - pagamentos, e o extrato de
+cada conta deve fechar com o saldo final.
+
+Para executar:
+    python benchmarks/bench_dinheiro.py --operacoes 10000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+from src.dinheiro import para_centavos
+
+
+def vazao(repeticoes: int, operacoes: int) -> float:
+    """Melhor vazão (ops/s) de pares depositar/sacar em uma conta."""
+    banco = SistemaBancario("Benchmark")
+    conta = banco.criar_conta("Cliente", "00000000000")
+    melhor = 0.0
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for _ in range(operacoes // 2):
+            conta.depositar(10.5)
+            conta.sacar(3.25)
+        melhor = max(melhor, operacoes / (time.perf_counter() - inicio))
+    return melhor
+
+
+def conservacao(operacoes: int, contas: int, seed: int):
+    """Executa operações aleatórias e confere a conservação do dinheiro."""
+    rng = random.Random(seed)
+    banco = SistemaBancario("Conservação")
+    numeros = [banco.criar_conta(f"Cliente {i}", f"{i:011d}").numero_conta
+               for i in range(contas)]
+    liquido = 0
+    for _ in range(operacoes):
+        numero = rng.choice(numeros)
+        conta = banco.contas[numero]
+        # Valores com até 2 casas decimais, como chegam da interface
+        valor = rng.randint(1, 100_000) / 100
+        operacao = rng.random()
+        try:
+            if operacao < 0.4:
+                conta.depositar(valor)
+                liquido += para_centavos(valor)
+            elif operacao < 0.6:
+                conta.sacar(valor)
+                liquido -= para_centavos(valor)
+            elif operacao < 0.7:
+                conta.pagar_conta(valor, "Conta de consumo")
+                liquido -= para_centavos(valor)
+            else:
+                banco.transferir_entre_contas(numero, rng.choice(numeros), valor)
+        except (ValueError, RuntimeError):
+            pass
+    
+    soma = sum(conta.saldo_centavos for conta in banco.contas.values())
+    assert soma == liquido, (soma, liquido)
+    assert banco.obter_estatisticas()['saldo_total'] == liquido / 100
+    for conta in banco.contas.values():
+        assert sum(conta.extrato._valor) == conta.saldo_centavos
+    return soma
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--operacoes", type=int, default=1_000_000,
+                        help="operações aleatórias na verificação de conservação")
+    parser.add_argument("--contas", type=int, default=1000)
+    parser.add_argument("--vazao", type=int, default=200_000,
+                        help="operações por repetição na medição de vazão")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    print(f"depositar/sacar: {vazao(5, args.vazao):,.0f} ops/s (melhor de 5)")
+    inicio = time.perf_counter()
+    soma = conservacao(args.operacoes, args.contas, args.seed)
+    print(f"Conservação: ok após {args.operacoes:,} operações "
+          f"(saldo total R$ {soma / 100:,.2f}, "
+          f"{time.perf_counter() - inicio:.1f}s)")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Estatísticas Incrementais
+=====================================
+
+Executa operações aleatórias (depósitos, saques, transferências, pagamentos,
+criação e remoção de contas) e, periodicamente, compara
+``SistemaBancario.obter_estatisticas`` com um recálculo completo sobre todas
+as contas. Em seguida mede o custo de cada chamada.
+
+Para executar:
+    python benchmarks/bench_estatisticas.py --contas 100000 --operacoes 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+
+def recalcular(banco: SistemaBancario) -> dict:
+    """Estatísticas recalculadas varrendo todas as contas."""
+    contas = list(banco.contas.values())
+    if not contas:
+        return {'total_contas': 0, 'saldo_total': 0.0, 'conta_maior_saldo': None,
+                'conta_menor_saldo': None, 'saldo_medio': 0.0}
+    total = sum(conta.saldo_centavos for conta in contas)
+    maior = max(contas, key=lambda c: c.saldo_centavos)
+    menor = min(contas, key=lambda c: c.saldo_centavos)
+    return {
+        'total_contas': len(contas),
+        'saldo_total': total / 100,
+        'saldo_medio': total / (len(contas) * 100),
+        'conta_maior_saldo': {'numero': maior.numero_conta, 'titular': maior.titular,
+                              'saldo': maior.saldo},
+        'conta_menor_saldo': {'numero': menor.numero_conta, 'titular': menor.titular,
+                              'saldo': menor.saldo},
+    }
+
+
+def operar(banco: SistemaBancario, rng: random.Random, numeros: list, sequencia: list):
+    """Executa uma operação aleatória, ignorando rejeições de negócio."""
+    numero = rng.choice(numeros)
+    conta = banco.contas[numero]
+    valor = round(rng.uniform(0.01, 500.0), rng.choice((0, 2, 7)))
+    operacao = rng.random()
+    try:
+        if operacao < 0.35:
+            conta.depositar(valor)
+        elif operacao < 0.55:
+            conta.sacar(valor)
+        elif operacao < 0.75:
+            banco.transferir_entre_contas(numero, rng.choice(numeros), valor)
+        elif operacao < 0.9:
+            conta.pagar_conta(valor, "Conta de consumo")
+        elif operacao < 0.95:
+            nova = banco.criar_conta("Cliente", f"DOC{sequencia[0]}")
+            sequencia[0] += 1
+            numeros.append(nova.numero_conta)
+        elif len(numeros) > 1:
+            if conta.saldo:
+                conta.sacar(conta.saldo)
+            banco.remover_conta(numero)
+            numeros.remove(numero)
+    except (ValueError, RuntimeError):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--contas", type=int, default=100_000)
+    parser.add_argument("--operacoes", type=int, default=200_000)
+    parser.add_argument("--verificar-a-cada", type=int, default=97)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    banco = SistemaBancario("Benchmark")
+    
+    # Verificação: muitas rodadas pequenas comparadas ao recálculo completo
+    verificacoes = 0
+    pequeno = SistemaBancario("Verificação")
+    numeros = [pequeno.criar_conta("Cliente", f"V{i}").numero_conta for i in range(50)]
+    sequencia = [0]
+    for i in range(args.operacoes // 10):
+        operar(pequeno, rng, numeros, sequencia)
+        if i % 7 == 0:
+            assert pequeno.obter_estatisticas() == recalcular(pequeno), i
+            verificacoes += 1
+    print(f"Verificações contra recálculo completo: {verificacoes} (todas iguais)")
+    
+    numeros = [banco.criar_conta("Cliente", f"{i:011d}").numero_conta
+               for i in range(args.contas)]
+    for i in range(args.operacoes):
+        operar(banco, rng, numeros, sequencia)
+        if i % args.verificar_a_cada == 0 and i < 2000:
+            assert banco.obter_estatisticas() == recalcular(banco), i
+    assert banco.obter_estatisticas() == recalcular(banco)
+    
+    repeticoes = 1000
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        banco.obter_estatisticas()
+    incremental = (time.perf_counter() - inicio) / repeticoes
+    
+    inicio = time.perf_counter()
+    for _ in range(10):
+        recalcular(banco)
+    completo = (time.perf_counter() - inicio) / 10
+    
+    print(f"Contas: {len(banco)}")
+    print(f"obter_estatisticas (incremental): {incremental * 1e6:10.1f} µs")
+    print(f"Recálculo completo:               {completo * 1e6:10.1f} µs")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Exportação de extratos em fluxo
+===========================================
+
+Gera um snapshot sintético (``--contas`` contas com ``--transacoes``
+transações cada), abre o sistema sem materializar as contas e exporta o
+banco inteiro com ``exportacao.exportar_sistema`` em cada formato, com e
+sem compressão (na própria thread e em ``--trabalhadores`` threads).
+Reporta linhas por segundo, tamanho do arquivo e o pico de memória
+(tracemalloc) de cada exportação.
+
+A referência é a exportação ingênua: ``csv.writer`` linha a linha sobre
+``iter_extrato`` de cada conta (materializando as contas), medida nas
+primeiras ``--referencia`` contas.
+
+Para executar (100 milhões de transações, ~3,4 GB de snapshot em disco):
+    python benchmarks/bench_exportacao.py --contas 100000 --transacoes 1000
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import exportacao
+from src.banco import SistemaBancario
+from src.extrato import Extrato, para_timestamp
+from src.snapshot import salvar_snapshot
+
+
+def gerar(diretorio: str, contas: int, transacoes: int):
+    """Grava um snapshot sintético com o mesmo extrato em cada conta."""
+    inicio = datetime(2024, 1, 1)
+    extrato = Extrato()
+    saldo = 0
+    for i in range(transacoes):
+        valor = 0 if i == 0 else (1234 if i % 3 else -567)
+        saldo += valor
+        tipo = "CRIAÇÃO DE CONTA" if i == 0 else ("DEPÓSITO" if valor > 0 else "SAQUE")
+        extrato.registrar(inicio + timedelta(seconds=37 * i, microseconds=i), tipo,
+                          valor, "Conta criada" if i == 0 else tipo.capitalize(), saldo)
+    colunas = extrato.exportar_colunas()
+    salvar_snapshot(diretorio, {
+        'sequencia': 0,
+        'proximo_numero': 1001 + contas,
+        'saldo_total': saldo * contas,
+        'anterior': None,
+        'removidas': set(),
+        'contas': [(1001 + i, f"Cliente {i}", f"{i:011d}", para_timestamp(inicio),
+                    saldo, colunas) for i in range(contas)],
+    })
+
+
+def referencia(sistema: SistemaBancario, caminho: str, contas: int) -> int:
+    """Exportação ingênua em CSV das primeiras contas; retorna as linhas."""
+    linhas = 0
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(['conta', 'data_hora', 'tipo', 'valor', 'descricao', 'saldo_apos'])
+        for numero in sorted(sistema.contas)[:contas]:
+            for transacao in sistema.contas[numero].iter_extrato(desc=False):
+                escritor.writerow([numero, transacao['data_hora'].isoformat(),
+                                   transacao['tipo'], transacao['valor'],
+                                   transacao['descricao'], transacao['saldo_apos']])
+                linhas += 1
+    return linhas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contas', type=int, default=10000)
+    parser.add_argument('--transacoes', type=int, default=1000,
+                        help="Transações por conta")
+    parser.add_argument('--trabalhadores', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--referencia', type=int, default=200,
+                        help="Contas exportadas pela referência ingênua")
+    parser.add_argument('--memoria', action='store_true',
+                        help="Mede o pico de memória (tracemalloc, mais lento)")
+    args = parser.parse_args()
+
+    diretorio = tempfile.mkdtemp(prefix='bench_exportacao_')
+    try:
+        gerar(diretorio, args.contas, args.transacoes)
+        total = args.contas * args.transacoes
+        print(f"{total:,} transações ({args.contas:,} contas), "
+              f"{args.trabalhadores} thread(s) de compressão\n")
+        saida = os.path.join(diretorio, 'saida')
+
+        sistema = SistemaBancario.abrir(diretorio)
+        inicio = time.perf_counter()
+        linhas = referencia(sistema, saida, args.referencia)
+        duracao = time.perf_counter() - inicio
+        print(f"{'Formato':<34} {'Linhas/s':>12} {'MiB':>9} {'Pico MiB':>9}")
+        print(f"{'csv.writer + iter_extrato':<34} {linhas / duracao:>12,.0f} "
+              f"{os.path.getsize(saida) / 2**20 * total / linhas:>9,.1f} {'-':>9}")
+        sistema.fechar()
+
+        casos = [(formato, comprimir, trabalhadores)
+                 for formato in exportacao.FORMATOS
+                 for comprimir, trabalhadores in ((False, 0), (True, 0),
+                                                  (True, args.trabalhadores))]
+        for formato, comprimir, trabalhadores in casos:
+            # Sistema reaberto a cada caso: nenhuma conta materializada
+            sistema = SistemaBancario.abrir(diretorio)
+            if args.memoria:
+                tracemalloc.start()
+            inicio = time.perf_counter()
+            resultado = exportacao.exportar_sistema(sistema, saida, formato, comprimir,
+                                                    trabalhadores)
+            duracao = time.perf_counter() - inicio
+            pico = '-'
+            if args.memoria:
+                pico = f"{tracemalloc.get_traced_memory()[1] / 2**20:.1f}"
+                tracemalloc.stop()
+            assert resultado['linhas'] == total, resultado
+            nome = formato + (f" + compressão ({trabalhadores} thr.)" if comprimir else "")
+            print(f"{nome:<34} {total / duracao:>12,.0f} "
+                  f"{resultado['bytes'] / 2**20:>9,.1f} {pico:>9}")
+            sistema.fechar()
+            os.remove(saida)
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
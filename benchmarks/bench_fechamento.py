@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Fechamento mensal (juros e tarifas em lote)
+=======================================================
+
+Duas medidas:
+
+- cálculo: juros e tarifa sobre um vetor de saldos (padrão: 10 milhões),
+  com ``numpy`` e com o cálculo em Python sobre ``array`` (usado quando o
+  ``numpy`` não está instalado);
+- fechamento completo: ``fechamento.aplicar_em_lote`` contra o laço
+  anterior (``depositar`` e ``pagar_conta`` conta a conta), em memória e
+  com diário de operações. Os saldos finais dos dois caminhos são
+  conferidos.
+
+O fechamento completo usa menos contas que o cálculo: cada conta
+materializada ocupa cerca de 2 KB.
+
+Para executar:
+    python benchmarks/bench_fechamento.py --vetor 10000000 --contas 200000
+"""
+
+import argparse
+import gc
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import fechamento
+from src.banco import SistemaBancario
+
+TAXA = "0.005"
+TARIFA = "12.90"
+ISENCAO = 5000
+
+
+def regras() -> list:
+    """Regras do fechamento medido."""
+    return [fechamento.Juros(TAXA, "Rendimento mensal"),
+            fechamento.Tarifa(TARIFA, "Tarifa de manutenção", isento_a_partir_de=ISENCAO)]
+
+
+def saldos_aleatorios(quantidade: int, seed: int) -> list:
+    """Saldos em centavos: parte zerada, parte abaixo da tarifa, parte isenta."""
+    rng = random.Random(seed)
+    return [rng.choice((0, 500, rng.randint(1, 1_000_000), rng.randint(1, 100_000_000)))
+            for _ in range(quantidade)]
+
+
+def medir_calculo(saldos: list, usar_numpy: bool) -> float:
+    """Segundos para calcular juros e tarifa de todos os saldos."""
+    modulo = fechamento.numpy
+    if not usar_numpy:
+        fechamento.numpy = None
+    try:
+        vetor = fechamento._vetor(saldos)
+        gc.collect()
+        inicio = time.perf_counter()
+        for regra in regras():
+            _, vetor, _, _ = fechamento._limitar_lancamentos(vetor, regra.calcular(vetor))
+        return time.perf_counter() - inicio
+    finally:
+        fechamento.numpy = modulo
+
+
+def montar(saldos: list, diretorio: str = None) -> SistemaBancario:
+    """Sistema com uma conta por saldo."""
+    if diretorio is None:
+        sistema = SistemaBancario("Benchmark")
+    else:
+        sistema = SistemaBancario.abrir(diretorio, sincrono=False, snapshot_a_cada=0)
+    sistema.criar_contas_em_lote((f"Cliente {i}", f"{i:011d}") for i in range(len(saldos)))
+    for numero, centavos in zip(sorted(sistema.contas), saldos):
+        if centavos:
+            sistema.contas[numero].depositar(centavos / 100)
+    return sistema
+
+
+def fechar_conta_a_conta(sistema: SistemaBancario):
+    """Caminho anterior: uma operação por lançamento, conta a conta."""
+    taxa = float(TAXA)
+    for conta in list(sistema.contas.values()):
+        juros = round(conta.saldo_centavos * taxa)
+        if juros:
+            conta.depositar(juros / 100, "Rendimento mensal")
+        if conta.saldo < ISENCAO:
+            try:
+                conta.pagar_conta(TARIFA, "Tarifa de manutenção")
+            except RuntimeError:
+                pass
+
+
+def medir_fechamento(saldos: list, duravel: bool, caminho) -> tuple:
+    """Segundos do fechamento e saldos finais (em ordem de número)."""
+    diretorio = tempfile.mkdtemp() if duravel else None
+    try:
+        sistema = montar(saldos, diretorio)
+        gc.collect()
+        inicio = time.perf_counter()
+        caminho(sistema)
+        if duravel:
+            sistema._diario.aguardar()
+        duracao = time.perf_counter() - inicio
+        finais = [sistema.contas[numero].saldo_centavos for numero in sorted(sistema.contas)]
+        sistema.fechar()
+        return duracao, finais
+    finally:
+        if diretorio is not None:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vetor', type=int, default=10_000_000)
+    parser.add_argument('--contas', type=int, default=200_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    saldos = saldos_aleatorios(args.vetor, args.seed)
+    print(f"Cálculo de juros e tarifa ({args.vetor:,} saldos)")
+    calculo_python = medir_calculo(saldos, usar_numpy=False)
+    print(f"{'Python (array)':<28} {calculo_python:>8.3f} s")
+    if fechamento.vetorizado():
+        calculo_numpy = medir_calculo(saldos, usar_numpy=True)
+        print(f"{'numpy':<28} {calculo_numpy:>8.3f} s "
+              f"({calculo_python / calculo_numpy:.0f}x)")
+    else:
+        print("numpy não instalado: apenas o cálculo em Python")
+    del saldos
+    gc.collect()
+
+    saldos = saldos_aleatorios(args.contas, args.seed)
+    lote = lambda sistema: fechamento.aplicar_em_lote(sistema, regras())
+    print(f"\nFechamento completo ({args.contas:,} contas, µs por conta)")
+    for duravel in (False, True):
+        anterior, esperado = medir_fechamento(saldos, duravel, fechar_conta_a_conta)
+        novo, finais = medir_fechamento(saldos, duravel, lote)
+        assert finais == esperado, "Saldos finais divergentes"
+        modo = "com diário" if duravel else "em memória"
+        print(f"{'Conta a conta, ' + modo:<28} {anterior / args.contas * 1e6:>8.2f}")
+        print(f"{'aplicar_em_lote, ' + modo:<28} {novo / args.contas * 1e6:>8.2f} "
+              f"({anterior / novo:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Sobrecarga das chaves de idempotência
+=================================================
+
+Mede o custo das chaves de idempotência no caminho das operações:
+
+- ``depositar`` sem chave (referência);
+- ``depositar`` com uma chave nova por operação (consulta + registro, com
+  o cache cheio, descartando a chave mais antiga a cada registro);
+- repetições de depósitos já feitos (respondidas pelo cache, sem executar);
+- ``consultar`` e ``registrar`` do cache isolados.
+
+Para executar:
+    python benchmarks/bench_idempotencia.py --operacoes 100000 --repeticoes 5
+    python benchmarks/bench_idempotencia.py --duravel
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+from src.idempotencia import CacheIdempotencia
+
+
+def medir(rotulo: str, operacoes: int, repeticoes: int, funcao,
+          referencia: float = None) -> float:
+    """
+    Executa ``funcao(i)`` para ``i`` em faixas seguidas de ``operacoes``
+    (uma por repetição) e imprime o melhor custo por operação.
+    """
+    melhor = float('inf')
+    for repeticao in range(repeticoes):
+        faixa = range(repeticao * operacoes, (repeticao + 1) * operacoes)
+        inicio = time.perf_counter()
+        for i in faixa:
+            funcao(i)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    por_operacao = melhor / operacoes * 1e6
+    extra = f" ({por_operacao - referencia:+.2f} µs)" if referencia is not None else ""
+    print(f"{rotulo:<44} {operacoes / melhor:>12,.0f} op/s {por_operacao:>8.2f} µs{extra}")
+    return por_operacao
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--operacoes', type=int, default=100000)
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help="Repetições de cada medida (vale a melhor)")
+    parser.add_argument('--capacidade', type=int, default=100000,
+                        help="Capacidade do cache de idempotência")
+    parser.add_argument('--duravel', action='store_true',
+                        help="Sistema persistente assíncrono (diário em segundo plano)")
+    args = parser.parse_args()
+
+    diretorio = tempfile.mkdtemp(prefix='bench_idempotencia_') if args.duravel else None
+    try:
+        sistema = (SistemaBancario.abrir(diretorio, "Benchmark", sincrono=False,
+                                         snapshot_a_cada=0) if diretorio
+                   else SistemaBancario("Benchmark"))
+        sistema.idempotencia = CacheIdempotencia(args.capacidade)
+        conta = sistema.criar_conta("Cliente", "00000000000")
+        n = args.operacoes
+        print(f"{n:,} operações, cache de {args.capacidade:,} chaves"
+              + (", durável" if args.duravel else "") + "\n")
+
+        # Cache já cheio: cada registro também descarta a chave mais antiga
+        for i in range(args.capacidade):
+            sistema.idempotencia.registrar(
+                sistema.idempotencia.novo_item(f"antiga-{i}", "depositar:0:0", True))
+
+        depositar = conta.depositar
+        r = args.repeticoes
+        base = medir("depositar sem chave", n, r, lambda i: depositar(1))
+        medir("depositar com chave nova", n, r,
+              lambda i: depositar(1, chave_idempotencia=f"op-{i}"), base)
+        saldo = conta.saldo_centavos
+        # As últimas chaves registradas ainda estão no cache
+        recentes = min(n * r, args.capacidade)
+        primeira = n * r - recentes
+        medir("repetição (resultado do cache)", n, r,
+              lambda i: depositar(1, chave_idempotencia=f"op-{primeira + i % recentes}"),
+              base)
+        assert conta.saldo_centavos == saldo
+
+        cache = sistema.idempotencia
+        assinatura = f"depositar:{conta.numero_conta}:100"
+        print()
+        medir("cache.consultar (chave existente)", n, r,
+              lambda i: cache.consultar(f"op-{primeira + i % recentes}", assinatura))
+        medir("cache.consultar (chave ausente)", n, r,
+              lambda i: cache.consultar(f"nova-{i}", assinatura))
+        medir("cache.registrar (com descarte)", n, r,
+              lambda i: cache.registrar(cache.novo_item(f"nova-{i}", assinatura, True)))
+        sistema.fechar()
+    finally:
+        if diretorio:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Ingestão de arquivos de movimentações
+=================================================
+
+Gera um arquivo CSV de depósitos, saques e pagamentos (com uma parcela de
+registros sem saldo ou inválidos) e compara:
+
+- laço: leitura com ``csv.DictReader`` e uma chamada de ``depositar``,
+  ``sacar`` ou ``pagar_conta`` por registro, com rejeições por exceção;
+- ``ingestao.ingerir_arquivo`` na própria thread e com ``--trabalhadores``
+  threads, gravando o relatório de rejeições.
+
+Os saldos finais dos caminhos são comparados para garantir o mesmo resultado.
+
+Para executar:
+    python benchmarks/bench_ingestao.py --contas 50000 --registros 1000000
+    python benchmarks/bench_ingestao.py --duravel
+"""
+
+import argparse
+import csv
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import ingestao
+from src.banco import SistemaBancario
+from src.conta import ContaBancaria
+
+
+def gerar(caminho: str, numeros: list, registros: int, seed: int):
+    """Grava o arquivo de movimentações (~5% dos registros são rejeitados)."""
+    rng = random.Random(seed)
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(['conta', 'operacao', 'valor', 'descricao'])
+        for _ in range(registros):
+            sorteio = rng.random()
+            conta = rng.choice(numeros)
+            if sorteio < 0.5:
+                escritor.writerow([conta, 'deposito', f"{rng.randint(1, 50000) / 100:.2f}",
+                                   'Depósito parceiro'])
+            elif sorteio < 0.8:
+                escritor.writerow([conta, 'saque', f"{rng.randint(1, 60000) / 100:.2f}", ''])
+            elif sorteio < 0.99:
+                escritor.writerow([conta, 'pagamento', f"{rng.randint(1, 30000) / 100:.2f}",
+                                   rng.choice(('Conta de luz', 'Conta de água', 'Internet'))])
+            else:
+                escritor.writerow([conta, 'transferencia', 'abc', ''])
+
+
+def preparar(contas: int, diretorio: str = None) -> SistemaBancario:
+    """Cria o sistema com as contas e um saldo inicial."""
+    sistema = (SistemaBancario.abrir(diretorio, "Benchmark") if diretorio
+               else SistemaBancario("Benchmark"))
+    sistema.criar_contas_em_lote((f"Cliente {i}", f"{i:011d}") for i in range(contas))
+    for numero in sorted(sistema.contas):
+        sistema.contas[numero].depositar(1000)
+    return sistema
+
+
+def laco(sistema: SistemaBancario, caminho: str) -> int:
+    """Uma chamada por registro; retorna a quantidade de rejeições."""
+    rejeitadas = 0
+    with open(caminho, newline='', encoding='utf-8') as arquivo:
+        for registro in csv.DictReader(arquivo):
+            try:
+                conta = sistema.autenticar_conta(int(registro['conta']))
+                operacao = registro['operacao']
+                if operacao == 'deposito':
+                    conta.depositar(registro['valor'], registro['descricao'] or "Depósito")
+                elif operacao == 'saque':
+                    conta.sacar(registro['valor'], registro['descricao'] or "Saque")
+                elif operacao == 'pagamento':
+                    conta.pagar_conta(registro['valor'], registro['descricao'])
+                else:
+                    raise ValueError("Operação desconhecida")
+            except (ValueError, RuntimeError):
+                rejeitadas += 1
+    return rejeitadas
+
+
+def executar(rotulo: str, args, caminho: str, trabalhadores) -> list:
+    """Executa um caminho em um sistema novo; retorna os saldos na ordem das contas."""
+    diretorio = tempfile.mkdtemp(prefix='bench_ingestao_') if args.duravel else None
+    try:
+        sistema = preparar(args.contas, diretorio)
+        if args.memoria:
+            tracemalloc.start()
+        inicio = time.perf_counter()
+        if trabalhadores is None:
+            rejeitadas = laco(sistema, caminho)
+        else:
+            resumo = ingestao.ingerir_arquivo(sistema, caminho, caminho + '.rejeitados',
+                                              trabalhadores, args.tamanho_bloco)
+            rejeitadas = resumo['rejeitadas']
+        segundos = time.perf_counter() - inicio
+        pico = '-'
+        if args.memoria:
+            pico = f"{tracemalloc.get_traced_memory()[1] / 2**20:.1f}"
+            tracemalloc.stop()
+
+        saldos = [sistema.contas[numero].saldo_centavos for numero in sorted(sistema.contas)]
+        sistema.fechar()
+        print(f"{rotulo:<34} {segundos:>8.2f} s {args.registros / segundos:>12,.0f} reg/s "
+              f"{rejeitadas:>9,} {pico:>9}")
+        return saldos
+    finally:
+        if diretorio:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contas', type=int, default=20000)
+    parser.add_argument('--registros', type=int, default=500000)
+    parser.add_argument('--trabalhadores', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--tamanho-bloco', type=int, default=50000)
+    parser.add_argument('--duravel', action='store_true',
+                        help="Sistema persistente síncrono (fsync por operação)")
+    parser.add_argument('--memoria', action='store_true',
+                        help="Mede o pico de memória (tracemalloc, mais lento)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    diretorio = tempfile.mkdtemp(prefix='bench_ingestao_')
+    try:
+        caminho = os.path.join(diretorio, 'movimentos.csv')
+        numeros = list(range(1001, 1001 + args.contas))
+        gerar(caminho, numeros, args.registros, args.seed)
+        print(f"{args.contas:,} contas, {args.registros:,} registros, blocos de "
+              f"{args.tamanho_bloco:,}" + (", durável" if args.duravel else "") + "\n")
+        print(f"{'Caminho':<34} {'Tempo':>10} {'Registros/s':>16} {'Rejeições':>9} "
+              f"{'Pico MiB':>9}")
+
+        # Números de conta iguais em todos os sistemas (começam em 1001)
+        resultados = []
+        for rotulo, trabalhadores in (
+                ("laço com exceções", None),
+                ("ingerir_arquivo (0 thr.)", 0),
+                (f"ingerir_arquivo ({args.trabalhadores} thr.)", args.trabalhadores)):
+            ContaBancaria._proximo_numero = 1001
+            resultados.append(executar(rotulo, args, caminho, trabalhadores))
+        assert all(saldos == resultados[0] for saldos in resultados)
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Leituras consistentes concorrentes com transferências
+=================================================================
+
+Threads escritoras fazem transferências aleatórias (o saldo total não
+muda) enquanto uma thread leitora audita continuamente a soma dos saldos
+de todas as contas, de três formas:
+
+- travas: suspende o sistema (``_travar_tudo``) durante a soma;
+- ingênua: soma os saldos sem travas (mais barata, mas inconsistente);
+- visão versionada: ``auditar_saldo_total``, sem bloquear as escritoras.
+
+Para cada forma, mede transferências por segundo, a maior latência de uma
+transferência, auditorias por segundo e quantas auditorias divergiram do
+saldo total do sistema.
+
+Para executar:
+    python benchmarks/bench_leituras_concorrentes.py --contas 50000 --duracao 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+
+def auditar_com_travas(sistema: SistemaBancario) -> bool:
+    """Soma os saldos com o sistema suspenso."""
+    with sistema._travar_tudo():
+        soma = sum(conta.saldo_centavos for conta in sistema.contas.values())
+        return soma == sistema._saldo_total
+
+
+def auditar_ingenua(sistema: SistemaBancario) -> bool:
+    """Soma os saldos sem travas (o resultado pode misturar instantes)."""
+    soma = sum(conta.saldo_centavos for conta in sistema.contas.values())
+    return soma == sistema._saldo_total
+
+
+def auditar_visao(sistema: SistemaBancario) -> bool:
+    """Soma os saldos em uma visão versionada."""
+    return sistema.auditar_saldo_total()['consistente']
+
+
+def executar(sistema: SistemaBancario, numeros: list, args, auditar) -> dict:
+    """Roda escritoras (e a leitora, se houver) durante a duração pedida."""
+    parar = threading.Event()
+    transferencias = [0] * args.escritores
+    latencias = [0.0] * args.escritores
+
+    def escritora(indice: int):
+        rng = random.Random(args.seed + indice)
+        feitas = 0
+        pior = 0.0
+        while not parar.is_set():
+            origem, destino = rng.sample(numeros, 2)
+            inicio = time.perf_counter()
+            sistema.transferir_entre_contas(origem, destino, rng.randint(1, 100))
+            pior = max(pior, time.perf_counter() - inicio)
+            feitas += 1
+        transferencias[indice] = feitas
+        latencias[indice] = pior
+
+    auditorias = divergentes = 0
+    threads = [threading.Thread(target=escritora, args=(i,)) for i in range(args.escritores)]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    fim = inicio + args.duracao
+    if auditar is None:
+        time.sleep(args.duracao)
+    else:
+        while time.perf_counter() < fim:
+            auditorias += 1
+            if not auditar(sistema):
+                divergentes += 1
+    parar.set()
+    for thread in threads:
+        thread.join()
+    duracao = time.perf_counter() - inicio
+
+    return {
+        'transferencias': sum(transferencias) / duracao,
+        'latencia_maxima': max(latencias),
+        'auditorias': auditorias / duracao,
+        'divergentes': divergentes,
+        'total_auditorias': auditorias,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contas', type=int, default=50000)
+    parser.add_argument('--escritores', type=int, default=2)
+    parser.add_argument('--duracao', type=float, default=3.0)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    sistema = SistemaBancario("Benchmark")
+    sistema.criar_contas_em_lote((f"Cliente {i}", f"{i:011d}") for i in range(args.contas))
+    numeros = sorted(sistema.contas)
+    for numero in numeros:
+        # Saldo alto o bastante para nenhuma transferência ser recusada
+        sistema.contas[numero].depositar(1_000_000)
+
+    formas = (("sem leitora", None), ("travas (_travar_tudo)", auditar_com_travas),
+              ("ingênua (sem travas)", auditar_ingenua), ("visão versionada", auditar_visao))
+    print(f"{args.contas:,} contas, {args.escritores} escritoras, {args.duracao:.1f} s por forma\n")
+    print(f"{'Forma':<24} {'Transf./s':>11} {'Pior transf.':>13} {'Auditorias/s':>13} "
+          f"{'Divergentes':>12}")
+    for nome, auditar in formas:
+        resultado = executar(sistema, numeros, args, auditar)
+        divergentes = (f"{resultado['divergentes']}/{resultado['total_auditorias']}"
+                       if auditar is not None else '-')
+        print(f"{nome:<24} {resultado['transferencias']:>11,.0f} "
+              f"{resultado['latencia_maxima'] * 1000:>10.1f} ms "
+              f"{resultado['auditorias']:>13.1f} {divergentes:>12}")
+
+    final = sistema.auditar_saldo_total()
+    assert final['consistente'] and final['contas'] == args.contas, final
+
+
+if __name__ == "__main__":
+    main()
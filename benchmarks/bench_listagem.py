@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Listagem Paginada de Contas
+=======================================
+
+Mede o custo de obter uma página de 50 contas com
+``SistemaBancario.iter_contas`` em cada ordenação, comparado a
+``listar_contas`` (todas as contas).
+
+Para executar:
+    python benchmarks/bench_listagem.py --contas 5000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--contas", type=int, default=1_000_000)
+    parser.add_argument("--pagina", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    banco = SistemaBancario("Benchmark")
+    banco.criar_contas_em_lote((f"Cliente {rng.randrange(10**6):06d}", f"{i:011d}")
+                               for i in range(args.contas))
+    for conta in rng.sample(list(banco.contas.values()), min(args.contas, 10000)):
+        conta.depositar(rng.randint(1, 10000))
+    
+    print(f"Contas: {len(banco)}")
+    for ordem in ('numero', 'saldo', 'titular'):
+        repeticoes = 200
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            offset = rng.randrange(len(banco))
+            pagina = list(banco.iter_contas(offset, args.pagina, order_by=ordem))
+        decorrido = (time.perf_counter() - inicio) / repeticoes
+        print(f"iter_contas(order_by={ordem!r:9}): {decorrido * 1e6:10.1f} µs/página")
+    
+    inicio = time.perf_counter()
+    banco.listar_contas()
+    print(f"listar_contas (completa):      "
+          f"{(time.perf_counter() - inicio) * 1e6:10.1f} µs")
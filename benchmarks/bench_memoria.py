@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Memória por conta e por transação (tracemalloc)
+===========================================================
+
+Mede com ``tracemalloc`` os bytes alocados:
+
+- por conta: contas criadas em lote e cadastradas no sistema (objeto da
+  conta, extrato com a transação de criação e índices do sistema);
+- por transação armazenada: depósitos registrados no extrato colunar;
+- por transação montada: transações do extrato mantidas em uma lista
+  (como em ``list(conta.obter_extrato())``).
+
+Para executar:
+    python benchmarks/bench_memoria.py --contas 200000 --transacoes 200000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+
+def medir(funcao) -> tuple:
+    """Executa a função e retorna (resultado, bytes alocados que permanecem)."""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado = funcao()
+    gc.collect()
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return resultado, depois - antes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contas', type=int, default=200000)
+    parser.add_argument('--transacoes', type=int, default=200000)
+    args = parser.parse_args()
+
+    sistema = SistemaBancario("Benchmark")
+    _, por_contas = medir(lambda: sistema.criar_contas_em_lote(
+        (f"Cliente {i}", f"{i:011d}") for i in range(args.contas)))
+
+    conta = sistema.contas[min(sistema.contas)]
+
+    def depositar():
+        for _ in range(args.transacoes):
+            conta.depositar(1)
+
+    _, por_registros = medir(depositar)
+    transacoes, por_montadas = medir(lambda: list(conta.obter_extrato()))
+
+    print(f"{'Medida':<32} {'Bytes':>10}")
+    print(f"{'Por conta':<32} {por_contas / args.contas:>10.1f}")
+    print(f"{'Por transação armazenada':<32} {por_registros / args.transacoes:>10.1f}")
+    print(f"{'Por transação montada':<32} {por_montadas / len(transacoes):>10.1f}")
+    print(f"\nTipo das transações montadas: {type(transacoes[0]).__name__}")
+
+
+if __name__ == "__main__":
+    main()
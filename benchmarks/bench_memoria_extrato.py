@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Memória do Extrato
+==============================
+
+Compara a memória ocupada por N transações no formato antigo (lista de
+dicionários com ``datetime``) e no extrato colunar (``src.extrato.Extrato``),
+medida com ``tracemalloc``.
+
+Para executar:
+    python benchmarks/bench_memoria_extrato.py --transacoes 1000000
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.extrato import Extrato
+
+TIPOS = ("DEPÓSITO", "SAQUE", "PAGAMENTO")
+DESCRICOES = ("Depósito", "Saque", "Conta de luz", "Conta de água")
+
+
+def gerar(total: int):
+    """Gera transações sintéticas (data/hora, tipo, valor, descrição, saldo)."""
+    inicio = datetime(2024, 1, 1)
+    saldo = 0.0
+    for i in range(total):
+        valor = float(i % 500) + 0.25
+        saldo += valor
+        yield (inicio + timedelta(seconds=i), TIPOS[i % 3], valor,
+               DESCRICOES[i % 4], saldo)
+
+
+def medir(construir) -> int:
+    """Retorna os bytes alocados (e mantidos) pela estrutura construída."""
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    estrutura = construir()
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del estrutura
+    return depois - antes
+
+
+def lista_de_dicionarios(total: int):
+    extrato = []
+    for data_hora, tipo, valor, descricao, saldo in gerar(total):
+        extrato.append({'data_hora': data_hora, 'tipo': tipo, 'valor': valor,
+                        'descricao': descricao, 'saldo_apos': saldo})
+    return extrato
+
+
+def colunar(total: int):
+    extrato = Extrato()
+    for data_hora, tipo, valor, descricao, saldo in gerar(total):
+        extrato.registrar(data_hora, tipo, valor, descricao, saldo)
+    return extrato
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transacoes", type=int, default=1_000_000)
+    args = parser.parse_args()
+    
+    total = args.transacoes
+    antigo = medir(lambda: lista_de_dicionarios(total))
+    novo = medir(lambda: colunar(total))
+    
+    print(f"Transações: {total}")
+    print(f"Lista de dicionários: {antigo / total:8.1f} bytes/transação")
+    print(f"Extrato colunar:      {novo / total:8.1f} bytes/transação")
+    print(f"Redução:              {antigo / max(novo, 1):8.1f}x")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Custo da instrumentação (métricas)
+==============================================
+
+Executa a mesma carga (depósitos, saques -- parte deles sem saldo --,
+transferências, pagamentos e consultas de estatísticas) com a
+instrumentação desligada e ligada: cada rodada executa o mesmo plano nos
+dois modos (alternando qual vem primeiro) e o custo é a mediana das razões
+entre os tempos das rodadas. Também confere que ``desativar()`` devolve os
+métodos originais e que as contagens batem com a carga executada.
+
+Para executar:
+    python benchmarks/bench_metricas.py --operacoes 50000 --rodadas 11
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import metricas
+from src.banco import SistemaBancario
+from src.conta import ContaBancaria
+
+
+def preparar(contas: int) -> tuple:
+    """Sistema com contas de saldo baixo (para haver saques recusados)."""
+    sistema = SistemaBancario("Benchmark")
+    sistema.criar_contas_em_lote((f"Cliente {i}", f"{i:011d}") for i in range(contas))
+    numeros = sorted(sistema.contas)
+    for numero in numeros:
+        sistema.contas[numero].depositar(100)
+    return sistema, numeros
+
+
+def planejar(sistema: SistemaBancario, numeros: list, operacoes: int, seed: int) -> list:
+    """Sorteia a carga mista de uma rodada."""
+    rng = random.Random(seed)
+    return [(rng.random(), sistema.contas[rng.choice(numeros)],
+             rng.choice(numeros), rng.randint(1, 60))
+            for _ in range(operacoes)]
+
+
+def carga(sistema: SistemaBancario, plano: list) -> float:
+    """Executa a carga mista; retorna a duração em segundos."""
+    inicio = time.perf_counter()
+    for sorteio, conta, destino, valor in plano:
+        try:
+            if sorteio < 0.4:
+                conta.depositar(valor)
+            elif sorteio < 0.7:
+                conta.sacar(valor)
+            elif sorteio < 0.9:
+                sistema.transferir_entre_contas(conta.numero_conta, destino, valor)
+            elif sorteio < 0.99:
+                conta.pagar_conta(valor, "Conta de luz")
+            else:
+                sistema.obter_estatisticas()
+        except (ValueError, RuntimeError):
+            pass
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contas', type=int, default=10000)
+    parser.add_argument('--operacoes', type=int, default=50000)
+    parser.add_argument('--rodadas', type=int, default=11)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    originais = {nome: ContaBancaria.__dict__[nome]
+                 for nome in metricas.METODOS_INSTRUMENTADOS[ContaBancaria]}
+    sistema, numeros = preparar(args.contas)
+    registro = metricas.RegistroMetricas()
+    desligada, ligada, razoes = [], [], []
+    depositos = 0
+    for rodada in range(args.rodadas):
+        # Mesmo plano nos dois modos, alternando qual roda primeiro
+        plano = planejar(sistema, numeros, args.operacoes, args.seed + rodada)
+        depositos += sum(1 for item in plano if item[0] < 0.4)
+        tempos = {}
+        for ligar in ((False, True) if rodada % 2 == 0 else (True, False)):
+            if ligar:
+                metricas.ativar(registro)
+            tempos[ligar] = carga(sistema, plano)
+            if ligar:
+                metricas.desativar()
+        desligada.append(tempos[False])
+        ligada.append(tempos[True])
+        razoes.append(tempos[True] / tempos[False])
+
+    assert metricas.registro_ativo() is None
+    assert all(ContaBancaria.__dict__[nome] is original
+               for nome, original in originais.items()), "Métodos não restaurados"
+    instantaneo = registro.instantaneo()
+    assert instantaneo['depositar']['chamadas'] == depositos, "Contagem de depósitos divergente"
+
+    razoes.sort()
+    custo = (razoes[len(razoes) // 2] - 1) * 100
+    print(f"{args.operacoes:,} operações por rodada, {args.rodadas} rodadas, "
+          f"amostragem de latência 1/{registro.amostragem}\n")
+    print(f"{'Instrumentação desligada':<32} {min(desligada):>8.3f} s "
+          f"{args.operacoes / min(desligada):>12,.0f} ops/s (melhor rodada)")
+    print(f"{'Instrumentação ligada':<32} {min(ligada):>8.3f} s "
+          f"{args.operacoes / min(ligada):>12,.0f} ops/s (melhor rodada)")
+    print(f"{'Custo (mediana por rodada)':<32} {custo:>+7.1f}%\n")
+
+    print(f"{'Operação':<26} {'Chamadas':>10} {'p50':>10} {'p99':>10}  Erros")
+    for operacao, dados in instantaneo.items():
+        print(f"{operacao:<26} {dados['chamadas']:>10,} "
+              f"{dados['p50_segundos'] * 1e6:>8.1f}µs {dados['p99_segundos'] * 1e6:>8.1f}µs"
+              f"  {dados['erros'] or ''}")
+
+
+if __name__ == "__main__":
+    main()
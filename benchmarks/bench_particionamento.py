@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Sistema particionado entre processos (escala com núcleos)
+=====================================================================
+
+Mede a vazão de depósitos e saques do ``BancoParticionado`` com 1, 2, 4...
+partições, comparada com um ``SistemaBancario`` em um único processo. As
+operações são enviadas em lotes (``executar_em_lote``), um pedido por
+partição, para que o roteador não seja o gargalo.
+
+Em seguida, várias threads fazem transferências aleatórias (a maioria entre
+partições, em duas fases) e o saldo total é conferido: o dinheiro precisa
+ser conservado.
+
+A escala só aparece com núcleos livres: com menos núcleos que partições,
+os processos disputam a mesma CPU.
+
+Para executar:
+    python benchmarks/bench_particionamento.py --particoes 1,2,4,8
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+from src.sharding import BancoParticionado
+
+
+def gerar_operacoes(numeros: list, quantidade: int, seed: int) -> list:
+    """Depósitos e saques aleatórios de pequeno valor."""
+    rng = random.Random(seed)
+    return [('depositar' if rng.random() < 0.5 else 'sacar', rng.choice(numeros),
+             rng.randint(1, 50))
+            for _ in range(quantidade)]
+
+
+def medir_processo_unico(args) -> float:
+    """Vazão de um SistemaBancario comum, chamado em laço."""
+    sistema = SistemaBancario("Benchmark")
+    sistema.criar_contas_em_lote((f"Cliente {i}", f"{i:011d}") for i in range(args.contas))
+    numeros = sorted(sistema.contas)
+    for numero in numeros:
+        sistema.contas[numero].depositar(1000)
+    operacoes = gerar_operacoes(numeros, args.operacoes, args.seed)
+
+    inicio = time.perf_counter()
+    for operacao, numero, valor in operacoes:
+        conta = sistema.contas[numero]
+        try:
+            getattr(conta, operacao)(valor)
+        except RuntimeError:
+            pass
+    return args.operacoes / (time.perf_counter() - inicio)
+
+
+def medir_particionado(args, particoes: int) -> float:
+    """Vazão do sistema particionado e conferência da conservação do dinheiro."""
+    banco = BancoParticionado(particoes, "Benchmark")
+    try:
+        relatorio = banco.criar_contas_em_lote((f"Cliente {i}", f"{i:011d}")
+                                               for i in range(args.contas))
+        numeros = [resultado['numero_conta'] for resultado in relatorio]
+        banco.executar_em_lote(('depositar', numero, 1000) for numero in numeros)
+        operacoes = gerar_operacoes(numeros, args.operacoes, args.seed)
+
+        inicio = time.perf_counter()
+        for posicao in range(0, len(operacoes), args.tamanho_lote):
+            banco.executar_em_lote(operacoes[posicao:posicao + args.tamanho_lote])
+        vazao = args.operacoes / (time.perf_counter() - inicio)
+
+        # Transferências simultâneas: o total não pode mudar
+        antes = banco.obter_estatisticas()['saldo_total']
+
+        def transferir(seed: int):
+            rng = random.Random(seed)
+            for _ in range(args.transferencias):
+                origem, destino = rng.sample(numeros, 2)
+                try:
+                    banco.transferir_entre_contas(origem, destino, rng.randint(1, 200))
+                except RuntimeError:
+                    pass
+
+        threads = [threading.Thread(target=transferir, args=(args.seed + i,))
+                   for i in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        depois = banco.obter_estatisticas()['saldo_total']
+        assert antes == depois, f"Dinheiro não conservado: {antes} != {depois}"
+        return vazao
+    finally:
+        banco.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--particoes', default='1,2,4',
+                        help="Quantidades de partições, separadas por vírgula")
+    parser.add_argument('--contas', type=int, default=20000)
+    parser.add_argument('--operacoes', type=int, default=400000)
+    parser.add_argument('--tamanho-lote', type=int, default=50000,
+                        help="Operações por chamada de executar_em_lote")
+    parser.add_argument('--threads', type=int, default=4,
+                        help="Threads na conferência de transferências")
+    parser.add_argument('--transferencias', type=int, default=500,
+                        help="Transferências por thread na conferência")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} núcleos, {args.contas:,} contas, "
+          f"{args.operacoes:,} depósitos/saques\n")
+    base = medir_processo_unico(args)
+    print(f"{'Processo único (SistemaBancario)':<36} {base:>12,.0f} ops/s")
+    for particoes in (int(valor) for valor in args.particoes.split(',')):
+        vazao = medir_particionado(args, particoes)
+        print(f"{f'{particoes} partição(ões)':<36} {vazao:>12,.0f} ops/s "
+              f"{vazao / base:>6.2f}x  (dinheiro conservado)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Persistência (diário de operações e snapshots)
+==========================================================
+
+Mede a vazão das operações com persistência habilitada (síncrona, com
+gravação em grupo entre threads, e assíncrona) comparada ao sistema em
+memória, e o tempo de recuperação de um histórico: reaplicando o diário
+inteiro e a partir de um snapshot mais o final do diário. Verifica que o
+estado recuperado é igual ao original.
+
+Para executar:
+    python benchmarks/bench_persistencia.py --operacoes 20000 --historico 1000000
+
+Para o histórico de 10 milhões de operações:
+    python benchmarks/bench_persistencia.py --historico 10000000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+
+def preparar(banco: SistemaBancario, contas: int) -> list:
+    """Cria as contas com saldo inicial e retorna seus números."""
+    banco.criar_contas_em_lote((f"Cliente {i}", f"{i:011d}") for i in range(contas))
+    numeros = sorted(banco.contas)
+    for numero in numeros:
+        banco.contas[numero].depositar(1000)
+    return numeros
+
+
+def operar(banco: SistemaBancario, numeros: list, operacoes: int, seed: int):
+    """Executa operações aleatórias (depósitos, saques e transferências)."""
+    rng = random.Random(seed)
+    contas = banco.contas
+    for _ in range(operacoes):
+        origem = contas[rng.choice(numeros)]
+        operacao = rng.random()
+        try:
+            if operacao < 0.4:
+                origem.depositar(rng.randint(1, 100))
+            elif operacao < 0.7:
+                origem.sacar(rng.randint(1, 100))
+            else:
+                destino = contas[rng.choice(numeros)]
+                if destino is not origem:
+                    origem.transferir(destino, rng.randint(1, 100))
+        except RuntimeError:
+            pass
+
+
+def vazao(rotulo: str, banco: SistemaBancario, numeros: list, operacoes: int,
+          threads: int, seed: int):
+    """Mede e imprime a vazão de operações com uma quantidade de threads."""
+    por_thread = operacoes // threads
+    trabalhadores = [threading.Thread(target=operar,
+                                      args=(banco, numeros, por_thread, seed + i))
+                     for i in range(threads)]
+    inicio = time.perf_counter()
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    for trabalhador in trabalhadores:
+        trabalhador.join()
+    segundos = time.perf_counter() - inicio
+    print(f"{rotulo:<38} {por_thread * threads / segundos:>12,.0f} ops/s")
+
+
+def estado(banco: SistemaBancario) -> tuple:
+    """Resumo comparável do estado do sistema."""
+    return (len(banco), banco._saldo_total,
+            sum(len(conta.extrato) for conta in banco.contas.values()),
+            tuple((numero, conta.saldo_centavos)
+                  for numero, conta in sorted(banco.contas.items())))
+
+
+def recuperar(diretorio: str) -> tuple:
+    """Abre o sistema persistido e retorna (tempo, estado)."""
+    inicio = time.perf_counter()
+    banco = SistemaBancario.abrir(diretorio, snapshot_a_cada=0)
+    segundos = time.perf_counter() - inicio
+    resultado = estado(banco)
+    banco.fechar()
+    return segundos, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contas', type=int, default=1000)
+    parser.add_argument('--operacoes', type=int, default=20000,
+                        help="Operações por medição de vazão")
+    parser.add_argument('--threads', type=int, default=8,
+                        help="Threads na medição com gravação em grupo")
+    parser.add_argument('--historico', type=int, default=1000000,
+                        help="Operações no histórico usado na recuperação")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    raiz = tempfile.mkdtemp(prefix='bench_persistencia_')
+    try:
+        print(f"Vazão ({args.operacoes:,} operações, {args.contas:,} contas)")
+        banco = SistemaBancario("Benchmark")
+        vazao("Em memória", banco, preparar(banco, args.contas),
+              args.operacoes, 1, args.seed)
+
+        for rotulo, sincrono, threads in (
+                ("Persistente assíncrono", False, 1),
+                ("Persistente síncrono (1 thread)", True, 1),
+                (f"Persistente síncrono ({args.threads} threads)", True, args.threads)):
+            diretorio = os.path.join(raiz, f"vazao_{sincrono}_{threads}")
+            banco = SistemaBancario.abrir(diretorio, sincrono=sincrono)
+            vazao(rotulo, banco, preparar(banco, args.contas),
+                  args.operacoes, threads, args.seed)
+            banco.fechar()
+
+        print(f"\nRecuperação ({args.historico:,} operações)")
+        diretorio = os.path.join(raiz, "historico")
+        banco = SistemaBancario.abrir(diretorio, sincrono=False, snapshot_a_cada=0)
+        numeros = preparar(banco, args.contas)
+        inicio = time.perf_counter()
+        operar(banco, numeros, args.historico, args.seed)
+        print(f"{'Geração do histórico':<38} {time.perf_counter() - inicio:>10.2f} s")
+        original = estado(banco)
+        banco.fechar()
+        tamanho = sum(os.path.getsize(os.path.join(diretorio, nome))
+                      for nome in os.listdir(diretorio))
+        print(f"{'Tamanho do diário':<38} {tamanho / 2**20:>10.1f} MiB")
+
+        segundos, recuperado = recuperar(diretorio)
+        assert recuperado == original, "Estado recuperado difere do original"
+        print(f"{'Diário completo':<38} {segundos:>10.2f} s")
+
+        # Snapshot seguido de 1% de operações no final do diário
+        banco = SistemaBancario.abrir(diretorio, sincrono=False, snapshot_a_cada=0)
+        inicio = time.perf_counter()
+        banco.salvar_snapshot()
+        print(f"{'Gravação do snapshot':<38} {time.perf_counter() - inicio:>10.2f} s")
+        operar(banco, numeros, args.historico // 100, args.seed + 1)
+        original = estado(banco)
+        banco.fechar()
+
+        segundos, recuperado = recuperar(diretorio)
+        assert recuperado == original, "Estado recuperado difere do original"
+        print(f"{'Snapshot + 1% do diário':<38} {segundos:>10.2f} s")
+    finally:
+        shutil.rmtree(raiz, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
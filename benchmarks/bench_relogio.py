@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Relógio e formatação de datas
+=========================================
+
+Mede o custo por operação com cada relógio: a leitura isolada, depósitos
+e transferências. A referência "datetime.now()" reproduz o caminho
+anterior (``datetime.now()`` convertido em microssegundos a cada
+transação).
+
+Em seguida compara a formatação das datas de criação na listagem de
+contas: ``strftime`` a cada conta contra ``formatar_timestamp``, que
+reaproveita o texto de datas do mesmo segundo.
+
+Para executar:
+    python benchmarks/bench_relogio.py --operacoes 100000 --repeticoes 9
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import relogio
+from src.banco import SistemaBancario
+from src.extrato import para_timestamp
+
+
+class RelogioDatetime(relogio.Relogio):
+    """Caminho anterior: ``datetime.now()`` convertido a cada leitura."""
+
+    def timestamp(self) -> int:
+        return para_timestamp(datetime.now())
+
+
+def cronometrar(funcao, repeticoes: int) -> float:
+    """Melhor tempo (em segundos) entre as repetições."""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        gc.collect()
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def medir_relogios(args, relogios: list) -> dict:
+    """
+    Microssegundos por leitura, depósito e transferência, por relógio.
+
+    Os relógios se alternam a cada repetição, para que variações da máquina
+    ao longo da execução afetem todos igualmente.
+    """
+    sistema = SistemaBancario("Benchmark")
+    conta = sistema.criar_conta("Cliente", "00000000000")
+    destino = sistema.criar_conta("Cliente", "00000000001")
+    conta.depositar(args.operacoes * args.repeticoes * len(relogios))
+
+    def ler():
+        for _ in range(args.operacoes):
+            relogio.timestamp_agora()
+
+    def depositar():
+        for _ in range(args.operacoes):
+            conta.depositar(1)
+
+    def transferir():
+        for _ in range(args.operacoes):
+            conta.transferir(destino, 1)
+
+    casos = (('leitura', ler, args.operacoes), ('depositar', depositar, args.operacoes),
+             ('transferir', transferir, args.operacoes))
+    resultados = {nome: {caso: float('inf') for caso, _, _ in casos}
+                  for nome, _ in relogios}
+    for _ in range(args.repeticoes):
+        for nome, instancia in relogios:
+            anterior = relogio.definir_relogio(instancia)
+            try:
+                for caso, funcao, quantidade in casos:
+                    tempo = cronometrar(funcao, 1) / quantidade * 1e6
+                    resultados[nome][caso] = min(resultados[nome][caso], tempo)
+            finally:
+                relogio.definir_relogio(anterior)
+    return resultados
+
+
+def medir_formatacao(args) -> tuple:
+    """Microssegundos por conta: strftime direto e formatação em cache."""
+    manual = relogio.RelogioManual(datetime(2024, 1, 1))
+    anterior = relogio.definir_relogio(manual)
+    try:
+        sistema = SistemaBancario("Benchmark")
+        # Lotes de contas criadas em instantes diferentes
+        for lote in range(args.contas // 1000):
+            manual.avancar(61 * 1_000_000)
+            sistema.criar_contas_em_lote((f"Cliente {lote}-{i}", f"{lote:05d}{i:06d}")
+                                         for i in range(1000))
+    finally:
+        relogio.definir_relogio(anterior)
+    contas = list(sistema.contas.values())
+    formato = "%d/%m/%Y %H:%M"
+
+    def direto():
+        for conta in contas:
+            conta.data_criacao.strftime(formato)
+
+    def em_cache():
+        for conta in contas:
+            relogio.formatar_timestamp(conta._criacao, formato)
+
+    def listar():
+        for _ in sistema.iter_contas():
+            pass
+
+    return tuple(cronometrar(funcao, args.repeticoes) / len(contas) * 1e6
+                 for funcao in (direto, em_cache, listar))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--operacoes', type=int, default=100000)
+    parser.add_argument('--contas', type=int, default=100000)
+    parser.add_argument('--repeticoes', type=int, default=9)
+    args = parser.parse_args()
+
+    grosso = relogio.RelogioGrosso()
+    relogios = [("datetime.now()", RelogioDatetime()),
+                ("RelogioSistema", relogio.RelogioSistema()),
+                ("RelogioGrosso", grosso)]
+    try:
+        medidas = medir_relogios(args, relogios)
+    finally:
+        grosso.parar()
+    resultados = [(nome, medidas[nome]) for nome, _ in relogios]
+
+    casos = ('leitura', 'depositar', 'transferir')
+    print(f"{'µs por operação':<28}" + ''.join(f" {caso:>11}" for caso in casos))
+    for nome, medidas in resultados:
+        print(f"{nome:<28}" + ''.join(f" {medidas[caso]:>11.3f}" for caso in casos))
+    base = resultados[0][1]
+    for nome, medidas in resultados[1:]:
+        print(f"{'Economia ' + nome:<28}"
+              + ''.join(f" {base[caso] - medidas[caso]:>11.3f}" for caso in casos))
+
+    direto, em_cache, listar = medir_formatacao(args)
+    print(f"\nFormatação da data de criação ({args.contas:,} contas, µs por conta)")
+    print(f"{'strftime a cada conta':<28} {direto:>10.3f}")
+    print(f"{'formatar_timestamp':<28} {em_cache:>10.3f}")
+    print(f"{'iter_contas (completo)':<28} {listar:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Resumos por dia e por mês
+=====================================
+
+Preenche contas com históricos sintéticos de tamanhos crescentes (várias
+transações por dia, de vários tipos) e compara, para cada tamanho:
+
+- ``totais_periodo`` de um mês (percorre as transações do período);
+- ``resumo_mes`` e ``resumo_dia`` (resumos mantidos a cada transação);
+- ``resumo()`` da conta, que inclui os totais do mês atual;
+- a primeira consulta, que calcula os resumos a partir do extrato.
+
+Também mede ``depositar`` com e sem resumos calculados, o custo de manter
+os resumos a cada transação.
+
+Para executar:
+    python benchmarks/bench_resumos.py --tamanhos 1000 10000 100000 1000000
+    python benchmarks/bench_resumos.py --por-dia 50 --repeticoes 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import relogio
+from src.conta import ContaBancaria
+from src.extrato import de_timestamp, para_timestamp
+from src.relogio import RelogioManual
+
+# Tipos sorteados no histórico sintético, com o sinal do valor
+_TIPOS = (("DEPÓSITO", 1), ("SAQUE", -1), ("PAGAMENTO", -1),
+          ("TRANSFERÊNCIA ENVIADA", -1), ("TRANSFERÊNCIA RECEBIDA", 1))
+
+
+def preencher(transacoes: int, por_dia: int, fim: datetime, seed: int) -> ContaBancaria:
+    """Cria uma conta com ``transacoes`` transações terminando em ``fim``."""
+    rng = random.Random(seed)
+    intervalo = 86_400_000_000 // por_dia
+    timestamp = para_timestamp(fim) - transacoes * intervalo
+    # Conta criada no início do histórico (o extrato só avança no tempo)
+    anterior = relogio.definir_relogio(RelogioManual(de_timestamp(timestamp)))
+    try:
+        conta = ContaBancaria("Cliente", "00000000000")
+    finally:
+        relogio.definir_relogio(anterior)
+    registrar = conta.extrato.registrar_timestamp
+    saldo = 0
+    for _ in range(transacoes):
+        tipo, sinal = rng.choice(_TIPOS)
+        valor = sinal * rng.randint(1, 50000)
+        saldo += valor
+        registrar(timestamp, tipo, valor, tipo.capitalize(), saldo)
+        timestamp += intervalo
+    conta._centavos = saldo
+    return conta
+
+
+def medir(funcao, repeticoes: int, chamadas: int = 1) -> float:
+    """Melhor tempo por chamada, em microssegundos."""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for _ in range(chamadas):
+            funcao()
+        melhor = min(melhor, (time.perf_counter() - inicio) / chamadas)
+    return melhor * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanhos', type=int, nargs='+',
+                        default=[1000, 10000, 100000, 1000000],
+                        help="Quantidades de transações no histórico")
+    parser.add_argument('--por-dia', type=int, default=20,
+                        help="Transações por dia no histórico sintético")
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help="Repetições de cada medida (vale a melhor)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    # Relógio fixo: o "mês atual" de ``resumo()`` é o último mês do histórico
+    agora = datetime(2024, 6, 15, 12)
+    anterior = relogio.definir_relogio(RelogioManual(agora))
+    inicio_mes, fim_mes = datetime(2024, 6, 1), datetime(2024, 7, 1)
+    try:
+        print(f"{args.por_dia} transações por dia; tempos em µs (melhor de "
+              f"{args.repeticoes})\n")
+        print(f"{'Histórico':>10} {'totais_periodo':>15} {'1ª consulta':>12} "
+              f"{'resumo_mes':>11} {'resumo_dia':>11} {'resumo()':>10}")
+        for tamanho in args.tamanhos:
+            conta = preencher(tamanho, args.por_dia, agora, args.seed)
+            varredura = medir(lambda: conta.totais_periodo(inicio_mes, fim_mes),
+                              args.repeticoes)
+            inicio = time.perf_counter()
+            primeira = conta.resumo_mes(2024, 6)
+            calculo = (time.perf_counter() - inicio) * 1e6
+            assert primeira == conta.resumo_mes(2024, 6)
+            assert primeira['quantidade'] == conta.totais_periodo(inicio_mes,
+                                                                  fim_mes)['quantidade']
+            mensal = medir(lambda: conta.resumo_mes(2024, 6), args.repeticoes, 1000)
+            diario = medir(lambda: conta.resumo_dia(agora), args.repeticoes, 1000)
+            resumo = medir(conta.resumo, args.repeticoes, 1000)
+            print(f"{tamanho:>10,} {varredura:>15,.1f} {calculo:>12,.1f} "
+                  f"{mensal:>11.2f} {diario:>11.2f} {resumo:>10.2f}")
+
+        n = 100000
+        sem_resumos = preencher(1, args.por_dia, agora, args.seed)
+        com_resumos = preencher(1, args.por_dia, agora, args.seed)
+        com_resumos.resumo_mes()
+        base = medir(lambda: sem_resumos.depositar(1), args.repeticoes, n)
+        mantendo = medir(lambda: com_resumos.depositar(1), args.repeticoes, n)
+        print(f"\ndepositar sem resumos calculados {base:>8.2f} µs")
+        print(f"depositar mantendo os resumos    {mantendo:>8.2f} µs "
+              f"({mantendo - base:+.2f} µs)")
+    finally:
+        relogio.definir_relogio(anterior)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Serviço assíncrono (latência com milhares de clientes)
+==================================================================
+
+Gerador de carga para o ``ServicoBancario``: cada cliente tem a própria
+conta e executa operações em sequência (depósitos, saques e transferências
+para contas de outros clientes), todos os clientes ao mesmo tempo. Reporta
+a vazão e as latências p50/p99.
+
+Modos:
+    direto  chama as corrotinas do serviço no mesmo processo
+    tcp     sobe ``python -m src.servico`` em outro processo e conecta um
+            socket por cliente
+
+Para executar:
+    python benchmarks/bench_servico.py --modo tcp --clientes 2000
+    python benchmarks/bench_servico.py --modo tcp --clientes 2000 --duravel
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, RAIZ)
+
+from src.banco import SistemaBancario
+from src.servico import ServicoBancario
+
+
+def operacao(rng: random.Random, numero: int, numeros: list) -> tuple:
+    """Sorteia uma operação: (nome, argumentos)."""
+    sorteio = rng.random()
+    valor = rng.randint(1, 100)
+    if sorteio < 0.5:
+        return 'depositar', {'numero_conta': numero, 'valor': valor}
+    if sorteio < 0.7:
+        return 'sacar', {'numero_conta': numero, 'valor': valor}
+    destino = rng.choice(numeros)
+    if destino == numero:
+        return 'depositar', {'numero_conta': numero, 'valor': valor}
+    return 'transferir', {'numero_origem': numero, 'numero_destino': destino,
+                          'valor': valor}
+
+
+async def carga_direta(servico: ServicoBancario, clientes: int, operacoes: int,
+                       seed: int) -> list:
+    """Clientes chamando as corrotinas do serviço diretamente."""
+    numeros = []
+    for i in range(clientes):
+        conta = await servico.criar_conta(f"Cliente {i}", f"{i:011d}")
+        await servico.depositar(conta['numero_conta'], 1000)
+        numeros.append(conta['numero_conta'])
+
+    latencias = []
+
+    async def cliente(indice: int):
+        rng = random.Random(seed + indice)
+        for _ in range(operacoes):
+            nome, argumentos = operacao(rng, numeros[indice], numeros)
+            inicio = time.perf_counter()
+            try:
+                await getattr(servico, nome)(**argumentos)
+            except RuntimeError:
+                pass
+            latencias.append(time.perf_counter() - inicio)
+
+    await asyncio.gather(*(cliente(i) for i in range(clientes)))
+    return latencias
+
+
+async def carga_tcp(porta: int, clientes: int, operacoes: int, seed: int) -> list:
+    """Clientes conectados ao endpoint TCP, um socket por cliente."""
+    conexoes = [await asyncio.open_connection('127.0.0.1', porta)
+                for _ in range(clientes)]
+
+    async def pedir(conexao, identificador: int, nome: str, argumentos: dict) -> dict:
+        leitor, escritor = conexao
+        escritor.write((json.dumps({'id': identificador, 'op': nome,
+                                    'args': argumentos}) + '\n').encode())
+        await escritor.drain()
+        return json.loads(await leitor.readline())
+
+    numeros = []
+    for i, conexao in enumerate(conexoes):
+        resposta = await pedir(conexao, 0, 'criar_conta',
+                               {'titular': f"Cliente {i}", 'cpf_cnpj': f"{i:011d}"})
+        numeros.append(resposta['resultado']['numero_conta'])
+        await pedir(conexao, 0, 'depositar', {'numero_conta': numeros[-1], 'valor': 1000})
+
+    latencias = []
+
+    async def cliente(indice: int):
+        rng = random.Random(seed + indice)
+        for identificador in range(operacoes):
+            nome, argumentos = operacao(rng, numeros[indice], numeros)
+            inicio = time.perf_counter()
+            await pedir(conexoes[indice], identificador, nome, argumentos)
+            latencias.append(time.perf_counter() - inicio)
+
+    await asyncio.gather(*(cliente(i) for i in range(clientes)))
+    for _, escritor in conexoes:
+        escritor.close()
+    return latencias
+
+
+def relatorio(rotulo: str, latencias: list, segundos: float):
+    """Imprime vazão e percentis de latência."""
+    latencias.sort()
+    p50 = latencias[len(latencias) // 2]
+    p99 = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+    print(f"{rotulo}: {len(latencias) / segundos:,.0f} ops/s, "
+          f"p50 {p50 * 1000:.2f} ms, p99 {p99 * 1000:.2f} ms "
+          f"({len(latencias):,} operações)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modo', choices=('direto', 'tcp'), default='tcp')
+    parser.add_argument('--clientes', type=int, default=2000)
+    parser.add_argument('--operacoes', type=int, default=20,
+                        help="Operações por cliente")
+    parser.add_argument('--duravel', action='store_true',
+                        help="Sistema persistente síncrono (fsync em grupo)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    diretorio = tempfile.mkdtemp(prefix='bench_servico_') if args.duravel else None
+    rotulo = f"{args.modo}, {args.clientes:,} clientes" + (", durável" if args.duravel else "")
+    try:
+        if args.modo == 'direto':
+            sistema = (SistemaBancario.abrir(diretorio) if diretorio
+                       else SistemaBancario("Benchmark"))
+
+            async def executar():
+                servico = ServicoBancario(sistema)
+                inicio_carga = time.perf_counter()
+                latencias = await carga_direta(servico, args.clientes,
+                                               args.operacoes, args.seed)
+                return latencias, time.perf_counter() - inicio_carga
+
+            latencias, segundos = asyncio.run(executar())
+            sistema.fechar()
+        else:
+            comando = [sys.executable, '-m', 'src.servico', '--porta', '0']
+            if diretorio:
+                comando += ['--dados', diretorio]
+            servidor = subprocess.Popen(comando, cwd=RAIZ, stdout=subprocess.PIPE,
+                                        text=True)
+            try:
+                porta = int(servidor.stdout.readline().rsplit(':', 1)[1])
+
+                async def executar():
+                    inicio_carga = time.perf_counter()
+                    latencias = await carga_tcp(porta, args.clientes,
+                                                args.operacoes, args.seed)
+                    return latencias, time.perf_counter() - inicio_carga
+
+                latencias, segundos = asyncio.run(executar())
+            finally:
+                servidor.terminate()
+                servidor.wait()
+        relatorio(rotulo, latencias, segundos)
+    finally:
+        if diretorio:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Partida a frio a partir do snapshot binário
+=======================================================
+
+Gera um snapshot sintético (contas com algumas transações cada) e compara:
+
+- abertura preguiçosa: ``SistemaBancario.abrir`` mapeia o arquivo e lê
+  apenas o cabeçalho; ``buscar_conta`` materializa a conta no 1º acesso;
+- desserialização completa: materializar todas as contas como objetos.
+
+Também mede a montagem preguiçosa dos índices, feita na primeira operação
+que varre o sistema (aqui, ``obter_estatisticas``).
+
+Para executar:
+    python benchmarks/bench_snapshot.py --contas 5000000
+
+Com muitas contas a desserialização completa não cabe em memória; ela é
+medida nas primeiras ``--completa-ate`` contas e extrapolada.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+from src.extrato import Extrato, para_timestamp
+from src.snapshot import ARQUIVO_SNAPSHOT, salvar_snapshot
+
+
+def gerar(diretorio: str, contas: int, transacoes: int):
+    """Grava um snapshot sintético com as mesmas transações em cada conta."""
+    agora = datetime.now()
+    extrato = Extrato()
+    saldo = 0
+    for i in range(transacoes):
+        valor = 0 if i == 0 else 1000
+        saldo += valor
+        extrato.registrar(agora, "CRIAÇÃO DE CONTA" if i == 0 else "DEPÓSITO",
+                          valor, "Conta criada" if i == 0 else "Depósito", saldo)
+    colunas = extrato.exportar_colunas()
+    criacao = para_timestamp(agora)
+    salvar_snapshot(diretorio, {
+        'sequencia': 0,
+        'proximo_numero': 1001 + contas,
+        'saldo_total': saldo * contas,
+        'anterior': None,
+        'removidas': set(),
+        'contas': [(1001 + i, f"Cliente {i}", f"{i:011d}", criacao, saldo, colunas)
+                   for i in range(contas)],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contas', type=int, default=1000000)
+    parser.add_argument('--transacoes', type=int, default=5,
+                        help="Transações por conta")
+    parser.add_argument('--buscas', type=int, default=10000)
+    parser.add_argument('--completa-ate', type=int, default=1000000,
+                        help="Contas materializadas na desserialização completa")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    diretorio = tempfile.mkdtemp(prefix='bench_snapshot_')
+    try:
+        inicio = time.perf_counter()
+        gerar(diretorio, args.contas, args.transacoes)
+        tamanho = os.path.getsize(os.path.join(diretorio, ARQUIVO_SNAPSHOT))
+        print(f"Snapshot: {args.contas:,} contas, {args.contas * args.transacoes:,} "
+              f"transações, {tamanho / 2**20:,.1f} MiB "
+              f"(gerado em {time.perf_counter() - inicio:.1f} s)\n")
+
+        inicio = time.perf_counter()
+        banco = SistemaBancario.abrir(diretorio)
+        abertura = time.perf_counter() - inicio
+        print(f"{'Abertura preguiçosa':<40} {abertura * 1000:>10.2f} ms")
+
+        rng = random.Random(args.seed)
+        numeros = [1001 + rng.randrange(args.contas) for _ in range(args.buscas)]
+        inicio = time.perf_counter()
+        for numero in numeros:
+            banco.buscar_conta(numero)
+        primeira = (time.perf_counter() - inicio) / args.buscas
+        inicio = time.perf_counter()
+        for numero in numeros:
+            banco.buscar_conta(numero)
+        repetida = (time.perf_counter() - inicio) / args.buscas
+        print(f"{'buscar_conta (1º acesso, materializa)':<40} {primeira * 1e6:>10.2f} µs")
+        print(f"{'buscar_conta (já materializada)':<40} {repetida * 1e6:>10.2f} µs")
+
+        inicio = time.perf_counter()
+        banco.obter_estatisticas()
+        print(f"{'Índices (1ª varredura)':<40} {time.perf_counter() - inicio:>10.2f} s")
+        banco.fechar()
+        del banco
+
+        # Desserialização completa: todas as contas como objetos
+        quantidade = min(args.contas, args.completa_ate)
+        banco = SistemaBancario.abrir(diretorio)
+        inicio = time.perf_counter()
+        for numero in range(1001, 1001 + quantidade):
+            banco.contas[numero]
+        completa = (time.perf_counter() - inicio) * args.contas / quantidade
+        rotulo = "Desserialização completa"
+        if quantidade < args.contas:
+            rotulo += " (extrapolada)"
+        print(f"{rotulo:<40} {completa:>10.2f} s")
+        print(f"{'Abertura preguiçosa / completa':<40} {abertura / completa:>10.5f}")
+        banco.fechar()
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Transferências em lote (folha de pagamento e liquidação)
+====================================================================
+
+Compara ``transferir_entre_contas`` chamado uma vez por transferência com
+``transferir_em_lote`` (tudo ou nada e item a item) em dois cenários:
+
+- folha: poucas contas pagadoras pagam milhares de funcionários;
+- liquidação: transferências aleatórias entre todas as contas.
+
+Os saldos finais dos dois caminhos são comparados para garantir que o lote
+produz o mesmo resultado do laço.
+
+Para executar:
+    python benchmarks/bench_transferencias_lote.py --contas 20000 --transferencias 50000
+    python benchmarks/bench_transferencias_lote.py --duravel
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.banco import SistemaBancario
+
+
+def preparar(contas: int, transferencias: int,
+             diretorio: str = None) -> SistemaBancario:
+    """Cria o sistema com as contas e saldo suficiente para os cenários."""
+    sistema = (SistemaBancario.abrir(diretorio, "Benchmark") if diretorio
+               else SistemaBancario("Benchmark"))
+    sistema.criar_contas_em_lote((f"Cliente {i}", f"{i:011d}") for i in range(contas))
+    for indice, numero in enumerate(sorted(sistema.contas)):
+        # As dez primeiras são as pagadoras da folha
+        sistema.contas[numero].depositar(transferencias * 50 if indice < 10 else 10000)
+    return sistema
+
+
+def folha(numeros: list, transferencias: int, rng: random.Random) -> list:
+    """Dez contas pagadoras pagam salários às demais."""
+    pagadoras, funcionarios = numeros[:10], numeros[10:]
+    return [(pagadoras[i % len(pagadoras)], funcionarios[i % len(funcionarios)],
+             rng.randint(100, 500), "Salário")
+            for i in range(transferencias)]
+
+
+def liquidacao(numeros: list, transferencias: int, rng: random.Random) -> list:
+    """Transferências aleatórias de pequeno valor entre todas as contas."""
+    lote = []
+    while len(lote) < transferencias:
+        origem, destino = rng.choice(numeros), rng.choice(numeros)
+        if origem != destino:
+            lote.append((origem, destino, rng.randint(1, 50), "Liquidação"))
+    return lote
+
+
+def executar(rotulo: str, args, gerar, modo: str) -> tuple:
+    """Executa um cenário em um sistema novo; retorna (segundos, saldos na ordem das contas)."""
+    diretorio = tempfile.mkdtemp(prefix='bench_lote_') if args.duravel else None
+    try:
+        sistema = preparar(args.contas, args.transferencias, diretorio)
+        numeros = sorted(sistema.contas)
+        lote = gerar(numeros, args.transferencias, random.Random(args.seed))
+
+        inicio = time.perf_counter()
+        if modo == 'laco':
+            for origem, destino, valor, descricao in lote:
+                sistema.transferir_entre_contas(origem, destino, valor, descricao)
+        else:
+            for i in range(0, len(lote), args.tamanho_lote):
+                sistema.transferir_em_lote(lote[i:i + args.tamanho_lote],
+                                           atomico=(modo == 'atomico'))
+        segundos = time.perf_counter() - inicio
+
+        saldos = [sistema.contas[numero].saldo_centavos for numero in numeros]
+        sistema.fechar()
+        print(f"{rotulo:<40} {segundos:>8.3f} s {len(lote) / segundos:>12,.0f} transf/s")
+        return segundos, saldos
+    finally:
+        if diretorio:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contas', type=int, default=20000)
+    parser.add_argument('--transferencias', type=int, default=50000)
+    parser.add_argument('--tamanho-lote', type=int, default=10000,
+                        help="Transferências por chamada de transferir_em_lote")
+    parser.add_argument('--duravel', action='store_true',
+                        help="Sistema persistente síncrono (fsync por operação)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{args.contas:,} contas, {args.transferencias:,} transferências, "
+          f"lotes de {args.tamanho_lote:,}" + (", durável" if args.duravel else "") + "\n")
+    for cenario, gerar in (('Folha', folha), ('Liquidação', liquidacao)):
+        laco, saldos_laco = executar(f"{cenario}: laço transferir_entre_contas",
+                                     args, gerar, 'laco')
+        atomico, saldos_atomico = executar(f"{cenario}: lote tudo ou nada",
+                                           args, gerar, 'atomico')
+        item, saldos_item = executar(f"{cenario}: lote item a item",
+                                     args, gerar, 'item')
+        assert saldos_laco == saldos_atomico == saldos_item
+        print(f"{'  Ganho (laço / lote tudo ou nada)':<40} {laco / atomico:>8.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
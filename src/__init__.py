@@ -12,6 +12,20 @@ Um sistema bancário completo implementado em Python com funcionalidades de:
 Módulos:
     - conta: Classe ContaBancaria com operações individuais
     - banco: Classe SistemaBancario para gerenciar múltiplas contas
+    - dinheiro: Conversão entre reais e centavos inteiros
+    - extrato: Armazenamento colunar do histórico de transações
+    - relogio: Relógios intercambiáveis (µs) e formatação de datas em cache
+    - indices: Estruturas mantidas incrementalmente (listas ordenadas, busca)
+    - persistencia: Diário de operações (SistemaBancario.abrir)
+    - snapshot: Snapshot binário mapeado em memória, com carga sob demanda
+    - servico: Fachada assíncrona (asyncio) e endpoint TCP em linhas JSON
+    - bench: Suíte de benchmarks (python -m src.bench)
+    - metricas: Instrumentação opcional (contagens, latências, erros)
+    - fechamento: Juros e tarifas em lote sobre todas as contas (numpy opcional)
+    - exportacao: Exportação de extratos em fluxo (CSV, JSONL, colunar)
+    - ingestao: Aplicação em fluxo de arquivos de movimentações (códigos de resultado)
+    - idempotencia: Cache de chaves de idempotência (repetições seguras)
+    - sharding: Sistema particionado entre processos (BancoParticionado)
     - interface: Interface de usuário para interação
     - utils: Utilitários e helpers
 
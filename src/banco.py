@@ -3,11 +3,169 @@ Sistema Bancário - Módulo Banco
 Implementação da classe principal que gerencia múltiplas contas bancárias.
 """
 
-from typing import Dict, List, Optional
+import os
+import re
+import threading
+from contextlib import ExitStack, contextmanager
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 try:
     from .conta import ContaBancaria
+    from .dinheiro import LIMITE_CENTAVOS, formatar_centavos, para_centavos
+    from .idempotencia import AUSENTE, CacheIdempotencia
+    from .indices import IndiceTitulares, ListaOrdenada
+    from .persistencia import DiarioOperacoes, listar_segmentos, ler_segmento
+    from .relogio import formatar_timestamp, timestamp_agora
+    from .snapshot import ContasMapeadas, carregar_snapshot, salvar_snapshot
 except ImportError:
     from conta import ContaBancaria
+    from dinheiro import LIMITE_CENTAVOS, formatar_centavos, para_centavos
+    from idempotencia import AUSENTE, CacheIdempotencia
+    from indices import IndiceTitulares, ListaOrdenada
+    from persistencia import DiarioOperacoes, listar_segmentos, ler_segmento
+    from relogio import formatar_timestamp, timestamp_agora
+    from snapshot import ContasMapeadas, carregar_snapshot, salvar_snapshot
+
+
+_NAO_ALFANUMERICO = re.compile(r'[^0-9A-Za-z]')
+
+
+def normalizar_documento(cpf_cnpj: str) -> str:
+    """
+    Normaliza um CPF/CNPJ removendo pontuação e espaços.
+    
+    Args:
+        cpf_cnpj (str): Documento em qualquer formatação
+        
+    Returns:
+        str: Documento apenas com caracteres alfanuméricos (maiúsculos)
+    """
+    normalizado = _NAO_ALFANUMERICO.sub('', cpf_cnpj).upper()
+    # Documentos sem nenhum caractere alfanumérico mantêm o texto original
+    return normalizado or cpf_cnpj.strip()
+
+
+# Marca de conta sem saldo preservado em uma visão
+_NAO_PRESERVADO = object()
+
+
+class VisaoSaldos:
+    """
+    Saldos de todas as contas em uma versão fixa do sistema.
+    
+    Obtida com ``SistemaBancario.visao_saldos``. As leituras não usam as
+    travas das contas: enquanto a visão está aberta, a primeira operação
+    que altera, cria ou remove cada conta preserva antes o saldo que ela
+    tinha na versão da visão (cópia na escrita). As contas de uma mesma
+    operação são publicadas juntas, de modo que uma visão nunca mostra uma
+    transferência pela metade.
+    
+    Attributes:
+        versao (int): Versão do sistema em que a visão foi aberta
+        saldo_total_centavos (int): Saldo total do sistema nessa versão
+    """
+    
+    __slots__ = ('versao', 'saldo_total_centavos', '_sistema', '_preservados',
+                 '_removidas')
+    
+    def __init__(self, sistema: 'SistemaBancario', versao: int, saldo_total: int):
+        """
+        Inicializa a visão (com a trava do sistema obtida).
+        
+        Args:
+            sistema (SistemaBancario): Sistema observado
+            versao (int): Versão atual do sistema
+            saldo_total (int): Saldo total atual em centavos
+        """
+        self.versao = versao
+        self.saldo_total_centavos = saldo_total
+        self._sistema = sistema
+        # Saldo na versão da visão das contas alteradas depois dela
+        # (None = conta criada depois da visão)
+        self._preservados: Dict[int, Optional[int]] = {}
+        # Contas removidas depois da visão, em ordem de remoção
+        self._removidas: List[int] = []
+    
+    def _preservar(self, numero_conta: int, centavos: Optional[int]):
+        """Guarda o saldo da versão da visão antes da primeira alteração."""
+        if numero_conta not in self._preservados:
+            self._preservados[numero_conta] = centavos
+    
+    def saldo_centavos(self, numero_conta: int) -> int:
+        """
+        Obtém o saldo de uma conta na versão da visão.
+        
+        Args:
+            numero_conta (int): Número da conta
+            
+        Returns:
+            int: Saldo em centavos
+            
+        Raises:
+            ValueError: Se a conta não existia na versão da visão
+        """
+        conta = self._sistema.contas.get(numero_conta)
+        saldo = None if conta is None else conta._saldo_publicado
+        # Lido depois do saldo publicado: uma alteração no intervalo já
+        # terá preservado o saldo anterior
+        preservado = self._preservados.get(numero_conta, _NAO_PRESERVADO)
+        if preservado is not _NAO_PRESERVADO:
+            saldo = preservado
+        if saldo is None:
+            raise ValueError(f"Conta {numero_conta} não encontrada")
+        return saldo
+    
+    def saldo(self, numero_conta: int) -> float:
+        """
+        Obtém o saldo de uma conta na versão da visão, em reais.
+        
+        Args:
+            numero_conta (int): Número da conta
+            
+        Returns:
+            float: Saldo
+            
+        Raises:
+            ValueError: Se a conta não existia na versão da visão
+        """
+        return self.saldo_centavos(numero_conta) / 100
+    
+    def iterar(self) -> Iterator[Tuple[int, int]]:
+        """
+        Percorre todas as contas da versão da visão sem materializá-las.
+        
+        Yields:
+            Tuple: ``(numero, saldo em centavos)``, cada conta uma única vez
+        """
+        sistema = self._sistema
+        preservados = self._preservados
+        with sistema._trava:
+            congelado = sistema.contas.congelar()
+            removidas = list(self._removidas)
+        
+        # Contas cadastradas no congelamento (menos as criadas depois da visão)
+        for numero, saldo in sistema.contas.saldos_publicados(congelado):
+            preservado = preservados.get(numero, _NAO_PRESERVADO)
+            if preservado is not _NAO_PRESERVADO:
+                saldo = preservado
+            if saldo is not None:
+                yield numero, saldo
+        
+        # Contas removidas entre a visão e o congelamento
+        for numero in removidas:
+            saldo = preservados[numero]
+            if saldo is not None:
+                yield numero, saldo
+    
+    def total_centavos(self) -> int:
+        """
+        Soma os saldos de todas as contas na versão da visão.
+        
+        Returns:
+            int: Soma em centavos (igual a ``saldo_total_centavos`` em um
+            sistema consistente)
+        """
+        return sum(saldo for _, saldo in self.iterar())
 
 
 class SistemaBancario:
@@ -15,8 +173,39 @@ class SistemaBancario:
     Classe principal que gerencia o sistema bancário completo.
     
     Attributes:
-        contas (Dict[int, ContaBancaria]): Dicionário de contas por número
+        contas (ContasMapeadas): Dicionário de contas por número (as contas de
+            um snapshot são carregadas no primeiro acesso)
         nome_banco (str): Nome da instituição bancária
+        idempotencia (CacheIdempotencia): Resultados das operações por chave
+            de idempotência (persistidos junto com as operações)
+        _indice_documentos (Dict[str, int]): Número da conta por CPF/CNPJ normalizado
+        _saldo_total (int): Soma dos saldos em centavos, mantida a cada operação
+        _por_saldo (ListaOrdenada): Pares (saldo em centavos, número) em ordem de saldo
+        _por_numero (ListaOrdenada): Números de conta em ordem crescente
+        _por_titular (ListaOrdenada): Pares (titular, número) em ordem alfabética
+        _indice_titulares (IndiceTitulares): Índice de busca por nome do titular
+            (None = ainda não montado)
+        _versao (int): Versão do sistema, incrementada a cada operação que
+            altera saldos ou o cadastro de contas
+        _visoes (Tuple[VisaoSaldos, ...]): Visões de saldos abertas
+            (substituída, nunca alterada, ao abrir ou fechar uma visão)
+        _trava (threading.RLock): Protege o cadastro de contas e os índices
+        _diario (DiarioOperacoes): Diário de operações (None = sem persistência)
+        _transferencias (Dict[int, List]): Lados de transferências entre
+            partições ainda em andamento, por identificador:
+            ``[numero_conta, valor, tipo, descricao, confirmada]`` (ver
+            ``sharding``)
+        _indices_prontos (bool): Se os índices de documentos e as ordenações
+            já foram montados; um sistema aberto de um snapshot os monta na
+            primeira operação que precisa deles (e o índice de titulares na
+            primeira busca por nome)
+    
+    Cada conta tem a própria trava para as operações financeiras; a trava do
+    sistema protege apenas os índices compartilhados e é sempre obtida depois
+    das travas das contas envolvidas.
+    
+    Um sistema criado diretamente existe apenas em memória; para um sistema
+    durável, use ``SistemaBancario.abrir``.
     """
     
     def __init__(self, nome_banco: str = "Banco Digital Python"):
@@ -26,34 +215,759 @@ class SistemaBancario:
         Args:
             nome_banco (str): Nome da instituição
         """
-        self.contas: Dict[int, ContaBancaria] = {}
+        self.contas = ContasMapeadas(self)
         self.nome_banco = nome_banco
+        self.idempotencia = CacheIdempotencia()
+        self._indice_documentos: Dict[str, int] = {}
+        self._saldo_total = 0
+        self._por_saldo = ListaOrdenada()
+        self._por_numero = ListaOrdenada()
+        self._por_titular = ListaOrdenada()
+        self._indice_titulares = IndiceTitulares()
+        self._indices_prontos = True
+        self._versao = 0
+        self._visoes: Tuple[VisaoSaldos, ...] = ()
+        self._trava = threading.RLock()
+        self._transferencias: Dict[int, List[Any]] = {}
+        self._chaves_em_andamento: Set[str] = set()
+        
+        # Persistência (configurada por ``abrir``)
+        self._diario: Optional[DiarioOperacoes] = None
+        self._diretorio: Optional[str] = None
+        self._sincrono = True
+        self._snapshot_a_cada = 0
+        self._sequencia_snapshot = 0
+        self._trava_snapshot = threading.Lock()
+        self._local = threading.local()
+    
+    @classmethod
+    def abrir(cls, diretorio: str, nome_banco: str = "Banco Digital Python",
+              sincrono: bool = True,
+              snapshot_a_cada: int = 1000000) -> 'SistemaBancario':
+        """
+        Abre um sistema bancário durável, recuperando o estado gravado.
+        
+        Toda operação que altera o sistema é registrada em um diário de
+        operações antes de retornar. O estado é recuperado do snapshot mais
+        recente mais as operações do diário posteriores a ele.
+        
+        O snapshot é mapeado em memória: a abertura não depende da quantidade
+        de contas, que são carregadas no primeiro acesso, e os índices são
+        montados apenas na primeira operação que precisa deles.
+        
+        Args:
+            diretorio (str): Diretório de dados (criado se não existir)
+            nome_banco (str): Nome da instituição
+            sincrono (bool): Se True, cada operação só retorna depois de
+                gravada em disco; se False, a gravação ocorre em segundo
+                plano e uma queda pode perder as últimas operações
+            snapshot_a_cada (int): Quantidade de registros no diário que
+                dispara um snapshot automático (0 = apenas manual)
+            
+        Returns:
+            SistemaBancario: Sistema com o estado recuperado
+        """
+        os.makedirs(diretorio, exist_ok=True)
+        sistema = cls(nome_banco)
+        
+        snapshot = carregar_snapshot(diretorio)
+        sequencia = 0
+        if snapshot is not None:
+            sistema.contas = ContasMapeadas(sistema, snapshot)
+            sistema._saldo_total = snapshot.saldo_total
+            sistema._indices_prontos = False
+            sistema._indice_titulares = None
+            sistema._reservar_ate(snapshot.proximo_numero - 1)
+            sistema.idempotencia.restaurar(snapshot.idempotencia())
+            sistema._transferencias = {item[0]: item[1:]
+                                       for item in snapshot.transferencias()}
+            sequencia = snapshot.sequencia
+        sistema._sequencia_snapshot = sequencia
+        
+        # Reaplica as operações posteriores ao snapshot
+        tamanho_valido = None
+        for _, caminho in listar_segmentos(diretorio):
+            tamanho_valido = 0
+            for tamanho_valido, registro in ler_segmento(caminho):
+                if registro[0] > sequencia:
+                    sistema._aplicar_registro(registro)
+                    sequencia = registro[0]
+        
+        sistema._diario = DiarioOperacoes(diretorio, sequencia, tamanho_valido)
+        sistema._diretorio = diretorio
+        sistema._sincrono = sincrono
+        sistema._snapshot_a_cada = snapshot_a_cada
+        return sistema
+    
+    def salvar_snapshot(self):
+        """
+        Grava um snapshot do estado atual e descarta o diário já coberto.
+        
+        As operações ficam suspensas apenas enquanto o estado é copiado; a
+        gravação do arquivo acontece com o sistema liberado.
+        
+        Raises:
+            RuntimeError: Se o sistema não for persistente
+        """
+        if self._diario is None:
+            raise RuntimeError("Sistema sem persistência (use SistemaBancario.abrir)")
+        
+        with self._trava_snapshot:
+            self._gravar_snapshot()
+    
+    def _gravar_snapshot(self):
+        """Grava o snapshot (com a trava de snapshot já obtida)."""
+        with self._travar_tudo():
+            estado = self._capturar_estado()
+            # Operações seguintes vão para um novo segmento do diário
+            self._diario.iniciar_segmento()
+        
+        salvar_snapshot(self._diretorio, estado)
+        self._sequencia_snapshot = estado['sequencia']
+        self._diario.descartar_segmentos(estado['sequencia'])
+    
+    def fechar(self):
+        """
+        Grava as operações pendentes e fecha o diário (se houver).
+        
+        Depois de fechado, o sistema continua disponível apenas em memória.
+        """
+        if self._diario is not None:
+            self._diario.fechar()
+            self._diario = None
     
-    def criar_conta(self, titular: str, cpf_cnpj: str) -> ContaBancaria:
+    def criar_conta(self, titular: str, cpf_cnpj: str,
+                    chave_idempotencia: Optional[str] = None) -> ContaBancaria:
         """
         Cria uma nova conta bancária.
         
         Args:
             titular (str): Nome do titular
             cpf_cnpj (str): CPF ou CNPJ do titular
+            chave_idempotencia (str): Chave que identifica a operação; uma
+                repetição com a mesma chave devolve a conta já criada (ou,
+                se ela já tiver sido removida, levanta ``ValueError``)
             
         Returns:
             ContaBancaria: Nova conta criada
             
         Raises:
-            ValueError: Se titular ou CPF/CNPJ forem inválidos
+            ValueError: Se titular ou CPF/CNPJ forem inválidos, ou se a
+                conta criada pela chave já tiver sido removida
         """
-        # Valida se CPF/CNPJ já existe
-        for conta in self.contas.values():
-            if conta.cpf_cnpj == cpf_cnpj.strip():
+        self._garantir_indices()
+        with self._trava:
+            documento = normalizar_documento(cpf_cnpj or "")
+            idempotencia = None
+            if chave_idempotencia is not None:
+                idempotencia = (chave_idempotencia, f"criar_conta:{documento}")
+                anterior = self._repeticao(*idempotencia)
+                if anterior is not AUSENTE:
+                    conta = self.contas.get(anterior)
+                    if conta is None:
+                        raise ValueError(f"Conta {anterior}, criada com a chave "
+                                         f"{chave_idempotencia}, foi removida")
+                    return conta
+            
+            # Valida se CPF/CNPJ já existe
+            if documento and documento in self._indice_documentos:
                 raise ValueError(f"Já existe conta para o CPF/CNPJ: {cpf_cnpj}")
+            
+            # Cria nova conta
+            nova_conta = ContaBancaria(titular, cpf_cnpj)
+            self._adicionar_conta(nova_conta, documento,
+                                  idempotencia and (*idempotencia, nova_conta.numero_conta))
         
-        # Cria nova conta
-        nova_conta = ContaBancaria(titular, cpf_cnpj)
-        self.contas[nova_conta.numero_conta] = nova_conta
-        
+        self._aguardar_persistencia()
         return nova_conta
     
+    def criar_contas_em_lote(self, registros: Iterable[Any],
+                             tamanho_lote: int = 10000,
+                             chave_idempotencia: Optional[str] = None) -> List[Dict]:
+        """
+        Cria contas em lote a partir de um fluxo de registros.
+        
+        Cada registro pode ser um dicionário com as chaves ``titular`` e
+        ``cpf_cnpj`` ou uma tupla ``(titular, cpf_cnpj)``. Os registros são
+        validados em lotes; cada lote recebe uma faixa contínua de números de
+        conta e uma única data/hora de criação. Registros inválidos são
+        reportados sem interromper o processamento.
+        
+        Args:
+            registros (Iterable): Registros de clientes (ex.: ``ler_registros_csv``)
+            tamanho_lote (int): Quantidade de registros validados por vez
+            chave_idempotencia (str): Chave que identifica a importação; uma
+                repetição com a mesma chave devolve o relatório original,
+                refeito a partir de um resumo (os registros recusados
+                aparecem com um erro genérico). A chave fica reservada
+                durante a importação e é registrada ao final (uma importação
+                interrompida e repetida recusa os CPF/CNPJ já cadastrados)
+            
+        Returns:
+            List[Dict]: Resultado por registro, com as chaves ``linha``,
+            ``sucesso``, ``numero_conta`` e ``erro``
+            
+        Raises:
+            RuntimeError: Se uma importação com a mesma chave estiver em
+                andamento
+        """
+        if tamanho_lote <= 0:
+            raise ValueError("Tamanho do lote deve ser maior que zero")
+        
+        idempotencia = None
+        if chave_idempotencia is not None:
+            idempotencia = (chave_idempotencia, "criar_contas_em_lote")
+            with self._trava:
+                anterior = self._repeticao(*idempotencia)
+                if anterior is not AUSENTE:
+                    return self._relatorio_importacao(anterior)
+                if chave_idempotencia in self._chaves_em_andamento:
+                    raise RuntimeError("Importação com a chave "
+                                       f"{chave_idempotencia} ainda em andamento")
+                self._chaves_em_andamento.add(chave_idempotencia)
+        
+        try:
+            self._garantir_indices()
+            relatorio: List[Dict] = []
+            iterador = iter(registros)
+            linha = 0
+            
+            while True:
+                lote = list(islice(iterador, tamanho_lote))
+                if not lote:
+                    break
+                
+                with self._trava:
+                    self._processar_lote(lote, linha, relatorio)
+                self._aguardar_persistencia()
+                linha += len(lote)
+            
+            if idempotencia is not None:
+                self._registrar_idempotencia(
+                    (*idempotencia, self._resumir_importacao(relatorio)))
+                self._aguardar_persistencia()
+        finally:
+            if idempotencia is not None:
+                with self._trava:
+                    self._chaves_em_andamento.discard(chave_idempotencia)
+        return relatorio
+    
+    @staticmethod
+    def _resumir_importacao(relatorio: List[Dict]) -> Dict[str, Any]:
+        """
+        Resumo de um relatório de importação para a chave de idempotência.
+        
+        Guarda apenas a quantidade de linhas e as faixas de contas criadas
+        (linhas e números consecutivos), não o relatório inteiro.
+        
+        Returns:
+            Dict: ``linhas`` e ``criadas`` (listas ``[linha, numero, quantidade]``)
+        """
+        criadas: List[List[int]] = []
+        for resultado in relatorio:
+            if not resultado['sucesso']:
+                continue
+            faixa = criadas[-1] if criadas else None
+            if (faixa is not None and faixa[0] + faixa[2] == resultado['linha']
+                    and faixa[1] + faixa[2] == resultado['numero_conta']):
+                faixa[2] += 1
+            else:
+                criadas.append([resultado['linha'], resultado['numero_conta'], 1])
+        return {'linhas': len(relatorio), 'criadas': criadas}
+    
+    @staticmethod
+    def _relatorio_importacao(resumo: Dict[str, Any]) -> List[Dict]:
+        """Refaz o relatório de uma importação a partir do seu resumo."""
+        relatorio = [{'linha': linha, 'sucesso': False, 'numero_conta': None,
+                      'erro': "Registro recusado na importação original"}
+                     for linha in range(1, resumo['linhas'] + 1)]
+        for linha, numero, quantidade in resumo['criadas']:
+            for deslocamento in range(quantidade):
+                resultado = relatorio[linha - 1 + deslocamento]
+                resultado['sucesso'] = True
+                resultado['numero_conta'] = numero + deslocamento
+                resultado['erro'] = None
+        return relatorio
+    
+    def _processar_lote(self, lote: List[Any], linha: int, relatorio: List[Dict]):
+        """
+        Valida e cria as contas de um lote de registros.
+        
+        Args:
+            lote (List): Registros do lote
+            linha (int): Quantidade de registros processados antes do lote
+            relatorio (List[Dict]): Relatório que recebe o resultado por registro
+        """
+        # Validação do lote inteiro antes de criar qualquer conta
+        validos: List[Tuple[int, str, str, str]] = []
+        documentos_lote = set()
+        for registro in lote:
+            linha += 1
+            resultado = {'linha': linha, 'sucesso': False,
+                         'numero_conta': None, 'erro': None}
+            relatorio.append(resultado)
+            
+            titular, cpf_cnpj = self._extrair_registro(registro)
+            if titular is None:
+                resultado['erro'] = "Registro inválido"
+                continue
+            titular = titular.strip()
+            cpf_cnpj = cpf_cnpj.strip()
+            if not titular:
+                resultado['erro'] = "Nome do titular é obrigatório"
+                continue
+            if not cpf_cnpj:
+                resultado['erro'] = "CPF/CNPJ é obrigatório"
+                continue
+            
+            documento = normalizar_documento(cpf_cnpj)
+            if documento in self._indice_documentos or documento in documentos_lote:
+                resultado['erro'] = f"Já existe conta para o CPF/CNPJ: {cpf_cnpj}"
+                continue
+            documentos_lote.add(documento)
+            validos.append((len(relatorio) - 1, titular, cpf_cnpj, documento))
+        
+        if not validos:
+            return
+        
+        # Reserva a faixa de números e cria as contas do lote
+        numero = ContaBancaria._reservar_numeros(len(validos))
+        criacao = timestamp_agora()
+        for posicao, titular, cpf_cnpj, documento in validos:
+            conta = ContaBancaria._criar_validada(numero, titular, cpf_cnpj,
+                                                  criacao)
+            self._adicionar_conta(conta, documento)
+            
+            resultado = relatorio[posicao]
+            resultado['sucesso'] = True
+            resultado['numero_conta'] = numero
+            numero += 1
+    
+    def _adicionar_conta(self, conta: ContaBancaria, documento: str,
+                         idempotencia: Optional[Tuple[str, str, Any]] = None):
+        """
+        Cadastra uma conta e a inclui nos índices do sistema.
+        
+        Args:
+            conta (ContaBancaria): Conta a cadastrar
+            documento (str): CPF/CNPJ normalizado da conta
+            idempotencia (Tuple): ``(chave, assinatura, resultado)`` a
+                registrar junto com a criação (None = sem chave)
+        """
+        self._versao += 1
+        for visao in self._visoes:
+            visao._preservar(conta.numero_conta, None)
+        conta._saldo_publicado = conta.saldo_centavos
+        self.contas[conta.numero_conta] = conta
+        self._saldo_total += conta.saldo_centavos
+        if self._indices_prontos:
+            self._indice_documentos[documento] = conta.numero_conta
+            self._por_saldo.adicionar((conta.saldo_centavos, conta.numero_conta))
+            self._por_numero.adicionar(conta.numero_conta)
+            self._por_titular.adicionar((conta.titular, conta.numero_conta))
+        if self._indice_titulares is not None:
+            self._indice_titulares.adicionar(conta.numero_conta, conta.titular)
+        conta._sistema = self
+        self._gravar(['C', conta.numero_conta, conta.titular, conta.cpf_cnpj,
+                      conta._criacao], idempotencia)
+    
+    def _ao_movimentar(self, movimentos: Tuple[Tuple[ContaBancaria, int, int], ...],
+                       idempotencia: Optional[Tuple[str, str, Any]] = None,
+                       transferencia: Optional[Tuple[int, bool]] = None):
+        """
+        Atualiza os agregados e o diário após uma operação financeira.
+        
+        Chamado pelas próprias contas ao final de cada operação, ainda com
+        as travas das contas envolvidas. Todas as transações da operação
+        formam um único registro do diário, e os novos saldos são publicados
+        às visões de saldos juntos, em uma nova versão.
+        
+        Args:
+            movimentos: Tuplas ``(conta, saldo_anterior, inicio)``, com o
+                saldo antes da operação (em centavos) e a posição da primeira
+                transação registrada pela operação no extrato da conta
+            idempotencia (Tuple): ``(chave, assinatura, resultado)`` a
+                registrar junto com a operação (no mesmo registro do diário)
+            transferencia (Tuple): ``(identificador, manter)`` do lado de uma
+                transferência entre partições que a operação confirma; com
+                ``manter``, o lado fica guardado como confirmado até ser
+                descartado (ver ``_confirmar_transferencia``)
+        """
+        with self._trava:
+            self._versao += 1
+            visoes = self._visoes
+            for conta, saldo_anterior, _ in movimentos:
+                saldo = conta.saldo_centavos
+                self._saldo_total += saldo - saldo_anterior
+                if self._indices_prontos:
+                    self._por_saldo.remover((saldo_anterior, conta.numero_conta))
+                    self._por_saldo.adicionar((saldo, conta.numero_conta))
+                for visao in visoes:
+                    visao._preservar(conta.numero_conta, conta._saldo_publicado)
+                conta._saldo_publicado = saldo
+            
+            if transferencia is not None:
+                identificador, manter = transferencia
+                if manter:
+                    self._transferencias[identificador][4] = True
+                else:
+                    del self._transferencias[identificador]
+            
+            if self._diario is not None:
+                transacoes = [
+                    [conta.numero_conta, *transacao]
+                    for conta, _, inicio in movimentos
+                    for transacao in conta.extrato.brutos(inicio)
+                ]
+                registro = (['T', transacoes] if transferencia is None
+                            else ['X', *transferencia, transacoes])
+            else:
+                registro = None
+            self._gravar(registro, idempotencia)
+    
+    def _preparar_transferencia(self, identificador: int, numero_conta: int,
+                                valor: int, tipo: str, descricao: str):
+        """
+        Registra o lado preparado de uma transferência entre partições.
+        
+        O lado fica no diário (e nos snapshots) até ser confirmado ou
+        descartado, para que a recuperação possa concluir ou desfazer a
+        transferência.
+        
+        Args:
+            identificador (int): Identificador da transferência
+            numero_conta (int): Conta deste lado
+            valor (int): Valor a lançar na conta, em centavos (negativo para
+                o débito)
+            tipo (str): Tipo da transação a lançar
+            descricao (str): Descrição da transação a lançar
+        """
+        with self._trava:
+            self._transferencias[identificador] = [numero_conta, valor, tipo,
+                                                   descricao, False]
+            self._gravar(['P', identificador, numero_conta, valor, tipo, descricao])
+    
+    def _confirmar_transferencia(self, identificador: int, manter: bool):
+        """
+        Lança na conta o lado preparado de uma transferência entre partições.
+        
+        Args:
+            identificador (int): Identificador da transferência
+            manter (bool): Se True, o lado continua guardado como confirmado
+                (o destino, confirmado antes da origem, é a decisão de concluir
+                a transferência); se False, é descartado
+            
+        Raises:
+            ValueError: Se o lançamento exceder o limite de saldo da conta
+        """
+        numero_conta, valor, tipo, descricao, _ = self._transferencias[identificador]
+        conta = self.contas[numero_conta]
+        with conta._trava:
+            if conta._centavos + valor > LIMITE_CENTAVOS:
+                raise ValueError("Operação excede o limite de saldo da conta")
+            movimento = conta._registrar_lote([(tipo, valor, descricao)],
+                                              timestamp_agora())
+            self._ao_movimentar((movimento,), transferencia=(identificador, manter))
+    
+    def _descartar_transferencia(self, identificador: int):
+        """
+        Descarta o lado de uma transferência entre partições (desfeita, ou
+        confirmada e já concluída na outra partição).
+        
+        Args:
+            identificador (int): Identificador da transferência
+        """
+        with self._trava:
+            del self._transferencias[identificador]
+            self._gravar(['A', identificador])
+    
+    def _registrar_idempotencia(self, idempotencia: Tuple[str, str, Any]):
+        """
+        Registra a chave de uma operação que não gerou outro registro no diário.
+        
+        Args:
+            idempotencia (Tuple): ``(chave, assinatura, resultado)``
+        """
+        with self._trava:
+            self._gravar(['I'], idempotencia)
+    
+    def _gravar(self, registro: Optional[List[Any]],
+                idempotencia: Optional[Tuple[str, str, Any]] = None):
+        """
+        Grava o registro de uma operação no diário e registra sua chave.
+        
+        A chave de idempotência vai no próprio registro e só entra no cache
+        depois dele, com a sua sequência: uma repetição confirmada aguarda a
+        gravação desse registro (ver ``_repeticao``). Chamado com a trava
+        do sistema obtida.
+        
+        Args:
+            registro (List): Registro do diário (ignorado sem diário)
+            idempotencia (Tuple): ``(chave, assinatura, resultado)`` da
+                operação (None = operação sem chave)
+        """
+        item = None
+        if idempotencia is not None:
+            item = self.idempotencia.novo_item(*idempotencia)
+        sequencia = 0
+        if self._diario is not None:
+            if item is not None:
+                registro = registro + [item]
+            sequencia = self._diario.registrar(registro)
+        if item is not None:
+            self.idempotencia.registrar(item, sequencia)
+    
+    def _repeticao(self, chave: str, assinatura: str) -> Any:
+        """
+        Resultado original de uma operação repetida.
+        
+        Para quem confirma a durabilidade pela sequência da thread
+        (``_aguardar_persistencia`` e o serviço assíncrono), a repetição
+        passa a aguardar o registro da operação original, e não o último
+        registro feito pela thread.
+        
+        Args:
+            chave (str): Chave de idempotência
+            assinatura (str): Assinatura da operação
+            
+        Returns:
+            Resultado original, ou ``AUSENTE`` se a chave for nova
+            
+        Raises:
+            ValueError: Se a chave já foi usada em outra operação
+        """
+        registro = self.idempotencia.consultar_registro(chave, assinatura)
+        if registro is AUSENTE:
+            return AUSENTE
+        diario = self._diario
+        if diario is not None:
+            diario.definir_sequencia_da_thread(registro[1])
+            if self._sincrono and not getattr(self._local, 'adiar', False):
+                # A repetição retorna antes de ``_aguardar_persistencia``:
+                # aguarda aqui (repetições são raras e o registro original já
+                # está na fila de gravação)
+                diario.aguardar(registro[1])
+        return registro[0]
+    
+    def _aguardar_persistencia(self):
+        """
+        Aguarda a gravação da última operação da thread atual.
+        
+        Chamado ao final das operações, já sem nenhuma trava, o que permite
+        às operações simultâneas compartilharem a mesma sincronização em disco.
+        Também dispara o snapshot automático quando o diário cresce demais.
+        """
+        diario = self._diario
+        if diario is None:
+            return
+        if self._sincrono and not getattr(self._local, 'adiar', False):
+            diario.aguardar()
+        if (self._snapshot_a_cada
+                and diario.sequencia - self._sequencia_snapshot >= self._snapshot_a_cada
+                and self._trava_snapshot.acquire(blocking=False)):
+            # Apenas uma thread grava; as demais seguem sem esperar
+            try:
+                if diario.sequencia - self._sequencia_snapshot >= self._snapshot_a_cada:
+                    self._gravar_snapshot()
+            finally:
+                self._trava_snapshot.release()
+    
+    def _adiar_persistencia(self, adiar: bool = True):
+        """
+        Faz as operações da thread atual retornarem sem aguardar a gravação.
+        
+        Para quem confirma a durabilidade por conta própria (ex.: o serviço
+        assíncrono, que não pode bloquear o laço de eventos), usando
+        ``_diario.sequencia_da_thread()`` e ``_diario.aguardar``.
+        
+        Args:
+            adiar (bool): Se True, adia; se False, volta a aguardar
+        """
+        self._local.adiar = adiar
+    
+    @contextmanager
+    def _travar_tudo(self):
+        """
+        Suspende todas as operações: obtém as travas de todas as contas já
+        materializadas (em ordem de número), a trava do sistema e a do
+        dicionário de contas (impedindo novas materializações).
+        """
+        while True:
+            with self._trava:
+                contas = self.contas.materializadas()
+            with ExitStack() as pilha:
+                for conta in contas:
+                    pilha.enter_context(conta._trava)
+                pilha.enter_context(self._trava)
+                pilha.enter_context(self.contas.trava)
+                # Contas criadas, removidas ou carregadas no intervalo: tenta novamente
+                if self.contas.materializadas() == contas:
+                    yield
+                    return
+    
+    def _capturar_estado(self) -> Dict[str, Any]:
+        """
+        Copia o estado necessário para um snapshot (com o sistema suspenso).
+        
+        As contas ainda não materializadas não mudaram desde o snapshot
+        anterior e são copiadas diretamente dele na gravação.
+        
+        Returns:
+            Dict: Estado no formato de ``snapshot.salvar_snapshot``
+        """
+        return {
+            'sequencia': self._diario.sequencia,
+            'proximo_numero': ContaBancaria._proximo_numero,
+            'saldo_total': self._saldo_total,
+            'anterior': self.contas.snapshot,
+            'removidas': self.contas.removidas(),
+            'idempotencia': self.idempotencia.itens(),
+            'transferencias': [[identificador, *lado] for identificador, lado
+                               in self._transferencias.items()],
+            'contas': [(conta.numero_conta, conta.titular, conta.cpf_cnpj,
+                        conta._criacao, conta.saldo_centavos,
+                        conta.extrato.exportar_colunas())
+                       for conta in self.contas.materializadas()],
+        }
+    
+    def _garantir_indices(self):
+        """
+        Monta os índices a partir das contas, se ainda não foram montados.
+        
+        Usa os dados do snapshot diretamente, sem materializar as contas. As
+        operações ficam suspensas durante a montagem, para que nenhuma
+        alteração de saldo em andamento fique de fora dos índices.
+        """
+        if self._indices_prontos:
+            return
+        with self._travar_tudo():
+            if self._indices_prontos:
+                return
+            resumos = list(self.contas.resumos())
+            self._indice_documentos = {normalizar_documento(cpf_cnpj): numero
+                                       for numero, _, cpf_cnpj, _ in resumos}
+            self._por_saldo = ListaOrdenada((centavos, numero)
+                                            for numero, _, _, centavos in resumos)
+            self._por_numero = ListaOrdenada(numero for numero, _, _, _ in resumos)
+            self._por_titular = ListaOrdenada((titular, numero)
+                                              for numero, titular, _, _ in resumos)
+            self._indices_prontos = True
+    
+    def _aplicar_registro(self, registro: List[Any]):
+        """
+        Reaplica uma operação do diário durante a recuperação.
+        
+        Args:
+            registro (List): ``[sequencia, operacao, ...]``, com operação
+                'C' (criação), 'T' (transações), 'R' (remoção), 'I' (chave
+                de idempotência) ou, nas transferências entre partições, 'P'
+                (lado preparado), 'X' (lado confirmado, com suas transações)
+                e 'A' (lado descartado); 'C', 'T' e 'R' podem trazer ao final
+                a chave de idempotência da operação
+            
+        Raises:
+            ValueError: Se a operação for desconhecida
+        """
+        operacao = registro[1]
+        with self._trava:
+            if operacao == 'T':
+                self._ao_movimentar(self._reaplicar_transacoes(registro[2]))
+                self.idempotencia.restaurar(registro[3:])
+            elif operacao == 'X':
+                self._ao_movimentar(self._reaplicar_transacoes(registro[4]),
+                                    transferencia=(registro[2], registro[3]))
+            elif operacao == 'P':
+                self._transferencias[registro[2]] = [*registro[3:7], False]
+            elif operacao == 'A':
+                del self._transferencias[registro[2]]
+            elif operacao == 'C':
+                numero, titular, cpf_cnpj, criacao = registro[2:6]
+                conta = ContaBancaria._criar_validada(numero, titular, cpf_cnpj,
+                                                      criacao)
+                self._adicionar_conta(conta, normalizar_documento(cpf_cnpj))
+                self._reservar_ate(numero)
+                self.idempotencia.restaurar(registro[6:])
+            elif operacao == 'R':
+                self._retirar_conta(self.contas[registro[2]])
+                self.idempotencia.restaurar(registro[3:])
+            elif operacao == 'I':
+                self.idempotencia.restaurar(registro[2:])
+            else:
+                raise ValueError(f"Operação desconhecida no diário: {operacao!r}")
+    
+    def _reaplicar_transacoes(self, transacoes: List[List[Any]]
+                              ) -> Tuple[Tuple[ContaBancaria, int, int], ...]:
+        """Lança transações do diário nas contas; retorna os movimentos."""
+        movimentos: Dict[int, Tuple[ContaBancaria, int, int]] = {}
+        for numero, timestamp, tipo, valor, descricao in transacoes:
+            conta = self.contas[numero]
+            if numero not in movimentos:
+                movimentos[numero] = (conta, conta._centavos, len(conta.extrato))
+            conta._centavos += valor
+            conta.extrato.registrar_timestamp(timestamp, tipo, valor,
+                                              descricao, conta._centavos)
+        return tuple(movimentos.values())
+    
+    @staticmethod
+    def _reservar_ate(numero_conta: int):
+        """Garante que os próximos números de conta sejam maiores que um número."""
+        with ContaBancaria._trava_numeros:
+            if ContaBancaria._proximo_numero <= numero_conta:
+                ContaBancaria._proximo_numero = numero_conta + 1
+    
+    @staticmethod
+    def _extrair_registro(registro: Any) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extrai titular e CPF/CNPJ de um registro de importação.
+        
+        Args:
+            registro: Dicionário ou tupla ``(titular, cpf_cnpj)``
+            
+        Returns:
+            Tuple: ``(titular, cpf_cnpj)`` ou ``(None, None)`` se inválido
+        """
+        if isinstance(registro, dict):
+            titular = registro.get('titular')
+            cpf_cnpj = registro.get('cpf_cnpj')
+        elif isinstance(registro, (tuple, list)) and len(registro) == 2:
+            titular, cpf_cnpj = registro
+        else:
+            return None, None
+        
+        if not isinstance(titular, str) or not isinstance(cpf_cnpj, str):
+            return None, None
+        return titular, cpf_cnpj
+    
+    @staticmethod
+    def _extrair_transferencia(transferencia: Any) -> Tuple[int, int, Any, str]:
+        """
+        Extrai origem, destino, valor e descrição de uma transferência em lote.
+        
+        Args:
+            transferencia: Dicionário ou tupla ``(origem, destino, valor[, descricao])``
+            
+        Returns:
+            Tuple: ``(origem, destino, valor, descricao)``
+            
+        Raises:
+            ValueError: Se a transferência for inválida
+        """
+        if isinstance(transferencia, dict):
+            origem = transferencia.get('origem')
+            destino = transferencia.get('destino')
+            valor = transferencia.get('valor')
+            descricao = transferencia.get('descricao', "Transferência")
+        elif isinstance(transferencia, (tuple, list)) and len(transferencia) in (3, 4):
+            origem, destino, valor = transferencia[:3]
+            descricao = transferencia[3] if len(transferencia) == 4 else "Transferência"
+        else:
+            raise ValueError("Transferência inválida")
+        
+        if (not isinstance(origem, int) or not isinstance(destino, int)
+                or valor is None or not isinstance(descricao, str)):
+            raise ValueError("Transferência inválida")
+        return origem, destino, valor, descricao
+    
     def buscar_conta(self, numero_conta: int) -> Optional[ContaBancaria]:
         """
         Busca uma conta pelo número.
@@ -66,6 +980,22 @@ class SistemaBancario:
         """
         return self.contas.get(numero_conta)
     
+    def buscar_por_documento(self, cpf_cnpj: str) -> Optional[ContaBancaria]:
+        """
+        Busca uma conta pelo CPF/CNPJ do titular.
+        
+        Args:
+            cpf_cnpj (str): CPF ou CNPJ (com ou sem formatação)
+            
+        Returns:
+            ContaBancaria: Conta encontrada ou None se não existir
+        """
+        self._garantir_indices()
+        numero = self._indice_documentos.get(normalizar_documento(cpf_cnpj))
+        if numero is None:
+            return None
+        return self.contas.get(numero)
+    
     def autenticar_conta(self, numero_conta: int) -> ContaBancaria:
         """
         Autentica uma conta pelo número.
@@ -95,55 +1025,185 @@ class SistemaBancario:
         if not self.contas:
             return []
         
-        return [
-            {
+        return list(self.iter_contas())
+    
+    def iter_contas(self, offset: int = 0, limit: Optional[int] = None,
+                    order_by: str = 'numero', desc: bool = False) -> Iterator[Dict]:
+        """
+        Percorre as contas em ordem, com paginação.
+        
+        As ordenações são mantidas a cada operação; cada conta é formatada
+        apenas quando alcançada, de modo que o custo de uma página é
+        proporcional ao seu tamanho.
+        
+        Args:
+            offset (int): Quantidade de contas a pular
+            limit (int): Quantidade máxima de contas (None = todas)
+            order_by (str): Ordenação: 'numero', 'saldo' ou 'titular'
+            desc (bool): Se True, em ordem decrescente
+            
+        Yields:
+            Dict: Informações da conta (mesmo formato de ``listar_contas``)
+            
+        Raises:
+            ValueError: Se a ordenação ou a paginação forem inválidas
+        """
+        self._garantir_indices()
+        ordenacoes = {
+            'numero': self._por_numero,
+            'saldo': self._por_saldo,
+            'titular': self._por_titular,
+        }
+        if order_by not in ordenacoes:
+            raise ValueError(f"Ordenação inválida: {order_by}")
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset e limite não podem ser negativos")
+        
+        ordem = ordenacoes[order_by]
+        with self._trava:
+            total = len(ordem)
+            fim = total if limit is None else min(offset + limit, total)
+            if desc:
+                chaves = list(ordem.iterar(total - fim, total - offset, reverso=True))
+            else:
+                chaves = list(ordem.iterar(offset, fim))
+            contas = [self.contas[chave if order_by == 'numero' else chave[1]]
+                      for chave in chaves]
+        
+        for conta in contas:
+            yield {
                 'numero': conta.numero_conta,
                 'titular': conta.titular,
                 'saldo': conta.saldo,
-                'data_criacao': conta.data_criacao.strftime("%d/%m/%Y %H:%M")
+                'data_criacao': formatar_timestamp(conta._criacao, "%d/%m/%Y %H:%M")
             }
-            for conta in sorted(self.contas.values(), 
-                              key=lambda c: c.numero_conta)
-        ]
     
     def obter_estatisticas(self) -> Dict:
         """
         Obtém estatísticas gerais do sistema.
         
+        Os agregados são mantidos em centavos a cada operação, de modo que a
+        consulta custa O(log n) e é exata.
+        
         Returns:
             Dict: Estatísticas do sistema bancário
         """
-        if not self.contas:
-            return {
-                'total_contas': 0,
-                'saldo_total': 0.0,
-                'conta_maior_saldo': None,
-                'conta_menor_saldo': None,
-                'saldo_medio': 0.0
-            }
-        
-        saldos = [conta.saldo for conta in self.contas.values()]
-        conta_maior = max(self.contas.values(), key=lambda c: c.saldo)
-        conta_menor = min(self.contas.values(), key=lambda c: c.saldo)
+        self._garantir_indices()
+        with self._trava:
+            if not self.contas:
+                return {
+                    'total_contas': 0,
+                    'saldo_total': 0.0,
+                    'conta_maior_saldo': None,
+                    'conta_menor_saldo': None,
+                    'saldo_medio': 0.0
+                }
+            
+            # Agregados mantidos a cada operação: O(log n) em vez de varrer contas
+            total_contas = len(self.contas)
+            saldo_total = self._saldo_total
+            maior_saldo, _ = self._por_saldo.ultimo()
+            # Em caso de empate, a conta de menor número (mais antiga)
+            _, numero_maior = self._por_saldo[self._por_saldo.bisect_left((maior_saldo,))]
+            menor_saldo, numero_menor = self._por_saldo.primeiro()
+            conta_maior = self.contas[numero_maior]
+            conta_menor = self.contas[numero_menor]
         
         return {
-            'total_contas': len(self.contas),
-            'saldo_total': sum(saldos),
-            'saldo_medio': sum(saldos) / len(saldos),
+            'total_contas': total_contas,
+            'saldo_total': saldo_total / 100,
+            'saldo_medio': saldo_total / (total_contas * 100),
             'conta_maior_saldo': {
                 'numero': conta_maior.numero_conta,
                 'titular': conta_maior.titular,
-                'saldo': conta_maior.saldo
+                'saldo': maior_saldo / 100
             },
             'conta_menor_saldo': {
                 'numero': conta_menor.numero_conta,
                 'titular': conta_menor.titular,
-                'saldo': conta_menor.saldo
+                'saldo': menor_saldo / 100
             }
         }
     
+    @contextmanager
+    def visao_saldos(self) -> Iterator[VisaoSaldos]:
+        """
+        Abre uma visão dos saldos de todas as contas na versão atual.
+        
+        Abrir e fechar a visão custa O(1) sob a trava do sistema; as
+        leituras seguintes não bloqueiam as operações, que continuam (e
+        apenas preservam, uma vez por conta, o saldo anterior enquanto a
+        visão estiver aberta).
+        
+        Exemplo:
+            >>> with sistema.visao_saldos() as visao:
+            ...     total = visao.total_centavos()
+        
+        Yields:
+            VisaoSaldos: Visão consistente dos saldos
+        """
+        with self._trava:
+            visao = VisaoSaldos(self, self._versao, self._saldo_total)
+            self._visoes = self._visoes + (visao,)
+        try:
+            yield visao
+        finally:
+            with self._trava:
+                self._visoes = tuple(aberta for aberta in self._visoes
+                                     if aberta is not visao)
+    
+    def consultar_saldos(self, numeros_contas: Iterable[int]) -> Dict[int, float]:
+        """
+        Consulta os saldos de várias contas em um mesmo instante.
+        
+        Diferente de consultar uma conta por vez, nenhuma operação
+        concluída entre as leituras aparece pela metade (ex.: o débito de
+        uma transferência sem o crédito correspondente).
+        
+        Args:
+            numeros_contas (Iterable[int]): Números das contas
+        
+        Returns:
+            Dict[int, float]: Saldo de cada conta
+        
+        Raises:
+            ValueError: Se alguma conta não existir
+        """
+        with self.visao_saldos() as visao:
+            return {numero: visao.saldo(numero) for numero in numeros_contas}
+    
+    def auditar_saldo_total(self) -> Dict[str, Any]:
+        """
+        Confere o saldo total mantido pelo sistema somando as contas.
+        
+        A soma percorre uma visão de saldos: as operações continuam durante
+        a auditoria, e o resultado corresponde a uma única versão do sistema.
+        
+        Returns:
+            Dict: ``versao``, ``contas`` (quantidade somada), ``saldo_total``
+            (mantido pelo sistema), ``saldo_somado``, ``diferenca`` e
+            ``consistente``
+        """
+        with self.visao_saldos() as visao:
+            contas = 0
+            somado = 0
+            for _, centavos in visao.iterar():
+                contas += 1
+                somado += centavos
+        
+        diferenca = somado - visao.saldo_total_centavos
+        return {
+            'versao': visao.versao,
+            'contas': contas,
+            'saldo_total': visao.saldo_total_centavos / 100,
+            'saldo_somado': somado / 100,
+            'diferenca': diferenca / 100,
+            'consistente': diferenca == 0
+        }
+    
     def transferir_entre_contas(self, numero_origem: int, numero_destino: int,
-                               valor: float, descricao: str = "Transferência") -> bool:
+                               valor: float, descricao: str = "Transferência",
+                               chave_idempotencia: Optional[str] = None) -> bool:
         """
         Realiza transferência entre duas contas do sistema.
         
@@ -152,6 +1212,8 @@ class SistemaBancario:
             numero_destino (int): Número da conta de destino
             valor (float): Valor a ser transferido
             descricao (str): Descrição da transferência
+            chave_idempotencia (str): Chave que identifica a operação; uma
+                repetição com a mesma chave devolve o resultado original
             
         Returns:
             bool: True se a transferência foi bem-sucedida
@@ -168,33 +1230,227 @@ class SistemaBancario:
             raise ValueError("Não é possível transferir para a mesma conta")
         
         # Realiza transferência
-        return conta_origem.transferir(conta_destino, valor, descricao)
+        return conta_origem.transferir(conta_destino, valor, descricao,
+                                       chave_idempotencia)
     
-    def buscar_contas_por_titular(self, nome_titular: str) -> List[ContaBancaria]:
+    def transferir_em_lote(self, transferencias: Iterable[Any],
+                           atomico: bool = True,
+                           chave_idempotencia: Optional[str] = None) -> List[Dict]:
         """
-        Busca contas pelo nome do titular (busca parcial).
+        Realiza várias transferências de uma só vez (folha de pagamento,
+        liquidação).
+        
+        Cada transferência pode ser um dicionário com as chaves ``origem``,
+        ``destino``, ``valor`` e ``descricao`` (opcional) ou uma tupla
+        ``(origem, destino, valor[, descricao])``. Todas são validadas antes
+        de qualquer movimentação; as contas envolvidas são travadas uma única
+        vez (em ordem de número), os lançamentos de cada conta são gravados
+        no extrato de uma vez, com a mesma data/hora, e o lote inteiro é
+        persistido em um único registro do diário.
+        
+        Com ``atomico=True`` o lote é tudo ou nada: os movimentos são
+        compensados por conta e basta que o saldo final de cada conta não
+        fique negativo (no extrato, os créditos de cada conta precedem os
+        débitos). Com ``atomico=False`` as transferências são aplicadas na
+        ordem recebida e as inválidas ou sem saldo são apenas reportadas.
         
         Args:
-            nome_titular (str): Nome ou parte do nome do titular
+            transferencias (Iterable): Transferências a realizar
+            atomico (bool): Se True, aplica todas ou nenhuma
+            chave_idempotencia (str): Chave que identifica o lote; uma
+                repetição com a mesma chave devolve o relatório original
+                (refeito a partir das transferências recusadas)
             
         Returns:
-            List[ContaBancaria]: Lista de contas encontradas
+            List[Dict]: Resultado por transferência, com as chaves
+            ``indice``, ``sucesso`` e ``erro``
+            
+        Raises:
+            ValueError: Se ``atomico`` e alguma transferência for inválida
+            RuntimeError: Se ``atomico`` e alguma conta ficar sem saldo
+        """
+        relatorio: List[Dict] = []
+        validas: List[Tuple[Dict, ContaBancaria, ContaBancaria, int, str]] = []
+        encontradas: Dict[int, ContaBancaria] = {}
+        for indice, transferencia in enumerate(transferencias):
+            resultado = {'indice': indice, 'sucesso': False, 'erro': None}
+            relatorio.append(resultado)
+            try:
+                origem, destino, valor, descricao = \
+                    self._extrair_transferencia(transferencia)
+                centavos = para_centavos(valor)
+                if centavos <= 0:
+                    raise ValueError("Valor da transferência deve ser maior que zero")
+                if origem == destino:
+                    raise ValueError("Não é possível transferir para a mesma conta")
+                # Contas repetidas no lote (ex.: a pagadora) são buscadas uma vez
+                conta_origem = encontradas.get(origem) or self.autenticar_conta(origem)
+                conta_destino = encontradas.get(destino) or self.autenticar_conta(destino)
+                encontradas[origem] = conta_origem
+                encontradas[destino] = conta_destino
+            except ValueError as erro:
+                if atomico:
+                    raise ValueError(f"Transferência {indice}: {erro}") from None
+                resultado['erro'] = str(erro)
+                continue
+            validas.append((resultado, conta_origem, conta_destino, centavos,
+                            descricao))
+        
+        idempotencia = None
+        if chave_idempotencia is not None:
+            idempotencia = (chave_idempotencia,
+                            f"transferir_em_lote:{int(atomico)}:{len(relatorio)}")
+            anterior = self._repeticao(*idempotencia)
+            if anterior is not AUSENTE:
+                return self._relatorio_transferencias(anterior)
+        
+        if not validas:
+            if idempotencia is not None:
+                self._registrar_idempotencia(
+                    (*idempotencia, self._resumir_transferencias(relatorio)))
+                self._aguardar_persistencia()
+            return relatorio
+        
+        contas = sorted({conta.numero_conta: conta
+                         for _, origem, destino, _, _ in validas
+                         for conta in (origem, destino)}.values(),
+                        key=lambda conta: conta.numero_conta)
+        travadas = []
+        try:
+            for conta in contas:
+                conta._trava.acquire()
+                travadas.append(conta._trava)
+            
+            if idempotencia is not None:
+                # Repetição concorrente concluída enquanto as travas eram obtidas
+                anterior = self._repeticao(*idempotencia)
+                if anterior is not AUSENTE:
+                    return self._relatorio_transferencias(anterior)
+            
+            saldos = {conta.numero_conta: conta._centavos for conta in contas}
+            lancamentos: Dict[int, List[Tuple[str, int, str]]] = {
+                conta.numero_conta: [] for conta in contas}
+            for resultado, origem, destino, centavos, descricao in validas:
+                # Removida por outra thread entre a validação e a trava
+                if origem._sistema is not self or destino._sistema is not self:
+                    removida = origem if origem._sistema is not self else destino
+                    erro = f"Conta {removida.numero_conta} não encontrada"
+                    if atomico:
+                        raise ValueError(f"Transferência {resultado['indice']}: {erro}")
+                    resultado['erro'] = erro
+                    continue
+                if not atomico and centavos > saldos[origem.numero_conta]:
+                    resultado['erro'] = ("Saldo insuficiente. Saldo atual: R$ "
+                                         f"{formatar_centavos(saldos[origem.numero_conta])}")
+                    continue
+                if saldos[destino.numero_conta] + centavos > LIMITE_CENTAVOS:
+                    erro = "Operação excede o limite de saldo da conta destino"
+                    if atomico:
+                        raise ValueError(f"Transferência {resultado['indice']}: {erro}")
+                    resultado['erro'] = erro
+                    continue
+                
+                saldos[origem.numero_conta] -= centavos
+                saldos[destino.numero_conta] += centavos
+                lancamentos[origem.numero_conta].append(
+                    ("TRANSFERÊNCIA ENVIADA", -centavos,
+                     f"{descricao} - Para conta {destino.numero_conta}"))
+                lancamentos[destino.numero_conta].append(
+                    ("TRANSFERÊNCIA RECEBIDA", centavos,
+                     f"{descricao} - De conta {origem.numero_conta}"))
+                resultado['sucesso'] = True
+            
+            if atomico:
+                for conta in contas:
+                    if saldos[conta.numero_conta] < 0:
+                        raise RuntimeError(
+                            f"Saldo insuficiente na conta {conta.numero_conta}. "
+                            f"Saldo atual: R$ {formatar_centavos(conta._centavos)}")
+                    # Créditos antes dos débitos: o saldo nunca fica negativo
+                    # (nem passa do limite com todos os créditos somados)
+                    lancamentos[conta.numero_conta].sort(
+                        key=lambda lancamento: lancamento[1] < 0)
+                    creditos = sum(valor for _, valor, _ in lancamentos[conta.numero_conta]
+                                   if valor > 0)
+                    if conta._centavos + creditos > LIMITE_CENTAVOS:
+                        raise ValueError("Operação excede o limite de saldo da conta "
+                                         f"{conta.numero_conta}")
+            
+            if idempotencia is not None:
+                idempotencia = (*idempotencia, self._resumir_transferencias(relatorio))
+            timestamp = timestamp_agora()
+            movimentos = [conta._registrar_lote(lancamentos[conta.numero_conta],
+                                                timestamp)
+                          for conta in contas if lancamentos[conta.numero_conta]]
+            if movimentos:
+                # Uma única notificação: o lote é persistido em um só registro
+                self._ao_movimentar(movimentos, idempotencia)
+            elif idempotencia is not None:
+                self._registrar_idempotencia(idempotencia)
+        finally:
+            for trava in reversed(travadas):
+                trava.release()
+        self._aguardar_persistencia()
+        return relatorio
+    
+    @staticmethod
+    def _resumir_transferencias(relatorio: List[Dict]) -> Dict[str, Any]:
+        """
+        Resumo de um relatório de transferências para a chave de idempotência.
+        
+        Returns:
+            Dict: ``quantidade`` e ``recusadas`` (listas ``[indice, erro]``)
+        """
+        return {'quantidade': len(relatorio),
+                'recusadas': [[resultado['indice'], resultado['erro']]
+                              for resultado in relatorio if not resultado['sucesso']]}
+    
+    @staticmethod
+    def _relatorio_transferencias(resumo: Dict[str, Any]) -> List[Dict]:
+        """Refaz o relatório de um lote de transferências a partir do seu resumo."""
+        relatorio = [{'indice': indice, 'sucesso': True, 'erro': None}
+                     for indice in range(resumo['quantidade'])]
+        for indice, erro in resumo['recusadas']:
+            relatorio[indice]['sucesso'] = False
+            relatorio[indice]['erro'] = erro
+        return relatorio
+    
+    def buscar_contas_por_titular(self, nome_titular: str,
+                                  limite: Optional[int] = None) -> List[ContaBancaria]:
         """
-        nome_busca = nome_titular.lower().strip()
-        contas_encontradas = []
+        Busca contas pelo nome do titular (busca parcial).
         
-        for conta in self.contas.values():
-            if nome_busca in conta.titular.lower():
-                contas_encontradas.append(conta)
+        A busca ignora acentos e maiúsculas e casa com qualquer trecho do
+        nome. Buscas repetidas são atendidas por um cache LRU.
         
-        return sorted(contas_encontradas, key=lambda c: c.titular)
+        Args:
+            nome_titular (str): Nome ou parte do nome do titular
+            limite (int): Quantidade máxima de resultados (None = todos)
+            
+        Returns:
+            List[ContaBancaria]: Contas encontradas; primeiro as que têm uma
+            palavra do nome iniciada pelo termo, depois as demais, cada grupo
+            em ordem de número de conta
+        """
+        with self._trava:
+            if self._indice_titulares is None:
+                # Montagem adiada (sistema aberto de um snapshot); não depende
+                # dos saldos, basta a trava do sistema
+                self._indice_titulares = IndiceTitulares()
+                for numero, titular, _, _ in self.contas.resumos():
+                    self._indice_titulares.adicionar(numero, titular)
+            return [self.contas[numero]
+                    for numero in self._indice_titulares.buscar(nome_titular, limite)]
     
-    def remover_conta(self, numero_conta: int) -> bool:
+    def remover_conta(self, numero_conta: int,
+                      chave_idempotencia: Optional[str] = None) -> bool:
         """
         Remove uma conta do sistema (apenas se saldo for zero).
         
         Args:
             numero_conta (int): Número da conta a ser removida
+            chave_idempotencia (str): Chave que identifica a operação; uma
+                repetição com a mesma chave devolve o resultado original
             
         Returns:
             bool: True se a conta foi removida
@@ -203,17 +1459,62 @@ class SistemaBancario:
             ValueError: Se conta não existir
             RuntimeError: Se conta tiver saldo
         """
+        idempotencia = None
+        if chave_idempotencia is not None:
+            # A conta de uma repetição já não existe: consulta antes de buscá-la
+            idempotencia = (chave_idempotencia, f"remover_conta:{numero_conta}", True)
+            anterior = self._repeticao(*idempotencia[:2])
+            if anterior is not AUSENTE:
+                return anterior
         conta = self.autenticar_conta(numero_conta)
         
-        if conta.saldo != 0:
-            raise RuntimeError(
-                f"Não é possível remover conta com saldo. "
-                f"Saldo atual: R$ {conta.saldo:.2f}"
-            )
+        # Trava da conta antes da trava do sistema (mesma ordem das operações)
+        with conta._trava:
+            if idempotencia is not None:
+                anterior = self._repeticao(*idempotencia[:2])
+                if anterior is not AUSENTE:
+                    return anterior
+            if conta.saldo_centavos != 0:
+                raise RuntimeError(
+                    f"Não é possível remover conta com saldo. "
+                    f"Saldo atual: R$ {conta.saldo:.2f}"
+                )
+            
+            with self._trava:
+                if self.contas.get(numero_conta) is not conta:
+                    raise ValueError(f"Conta {numero_conta} não encontrada")
+                self._retirar_conta(conta, idempotencia)
         
-        del self.contas[numero_conta]
+        self._aguardar_persistencia()
         return True
     
+    def _retirar_conta(self, conta: ContaBancaria,
+                       idempotencia: Optional[Tuple[str, str, Any]] = None):
+        """
+        Descadastra uma conta e a retira dos índices do sistema.
+        
+        Args:
+            conta (ContaBancaria): Conta a descadastrar
+            idempotencia (Tuple): ``(chave, assinatura, resultado)`` a
+                registrar junto com a remoção (None = sem chave)
+        """
+        numero_conta = conta.numero_conta
+        self._versao += 1
+        for visao in self._visoes:
+            visao._preservar(numero_conta, conta._saldo_publicado)
+            visao._removidas.append(numero_conta)
+        del self.contas[numero_conta]
+        self._saldo_total -= conta.saldo_centavos
+        if self._indices_prontos:
+            self._indice_documentos.pop(normalizar_documento(conta.cpf_cnpj), None)
+            self._por_saldo.remover((conta.saldo_centavos, numero_conta))
+            self._por_numero.remover(numero_conta)
+            self._por_titular.remover((conta.titular, numero_conta))
+        if self._indice_titulares is not None:
+            self._indice_titulares.remover(numero_conta)
+        conta._sistema = None
+        self._gravar(['R', numero_conta], idempotencia)
+    
     def __str__(self) -> str:
         """Representação string do sistema."""
         return f"{self.nome_banco} - {len(self.contas)} contas cadastradas"
@@ -0,0 +1,351 @@
+"""
+Sistema Bancário - Módulo Bench
+Suíte de benchmarks dos caminhos críticos, com resultados em JSON.
+
+Cada caso monta seus dados (fora da medição) a partir da semente e dos
+tamanhos informados, executa a operação medida algumas vezes e guarda a
+melhor rodada. Os resultados podem ser gravados em JSON e comparados com os
+de outro commit; a execução falha se algum caso ficar mais lento que o
+limite de regressão.
+
+Para executar:
+    python -m src.bench --saida base.json
+    python -m src.bench --comparar base.json --limite 10
+    python -m src.bench --casos depositar,sacar --contas 100000
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+try:
+    from .banco import SistemaBancario
+    from .conta import ContaBancaria
+except ImportError:
+    from banco import SistemaBancario
+    from conta import ContaBancaria
+
+# Versão do formato do arquivo de resultados
+VERSAO_RESULTADOS = 1
+
+_NOMES = ('Ana', 'Bruno', 'Carla', 'Diego', 'Eduarda', 'Felipe', 'Gabriela',
+          'Heitor', 'Isabela', 'João', 'Larissa', 'Marcos', 'Natália', 'Otávio',
+          'Paula', 'Rafael', 'Sofia', 'Tiago', 'Vitória', 'William')
+_SOBRENOMES = ('Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira',
+               'Alves', 'Pereira', 'Lima', 'Gomes', 'Costa', 'Ribeiro',
+               'Martins', 'Carvalho', 'Almeida', 'Lopes', 'Soares', 'Araújo')
+
+
+def _nome(rng: random.Random) -> str:
+    """Nome aleatório de titular, com dois sobrenomes."""
+    return f"{rng.choice(_NOMES)} {rng.choice(_SOBRENOMES)} {rng.choice(_SOBRENOMES)}"
+
+
+def _popular(contas: int, rng: random.Random) -> Tuple[SistemaBancario, List[int]]:
+    """Cria um sistema com contas de titulares aleatórios e saldo inicial."""
+    sistema = SistemaBancario("Benchmark")
+    sistema.criar_contas_em_lote((_nome(rng), f"{i:011d}") for i in range(contas))
+    numeros = sorted(sistema.contas)
+    for numero in numeros:
+        sistema.contas[numero].depositar(rng.randint(100, 10000))
+    return sistema, numeros
+
+
+def _cronometrar(funcao: Callable[[], Any]) -> float:
+    """Tempo de uma chamada, em segundos."""
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def caso_criar_conta(args: argparse.Namespace, rng: random.Random) -> Tuple[int, float]:
+    """``criar_conta`` uma a uma, até o tamanho do sistema."""
+    sistema = SistemaBancario("Benchmark")
+    registros = [(_nome(rng), f"{i:011d}") for i in range(args.contas)]
+
+    def executar():
+        for titular, cpf_cnpj in registros:
+            sistema.criar_conta(titular, cpf_cnpj)
+    return args.contas, _cronometrar(executar)
+
+
+def _caso_operacao(operacao: str) -> Callable[[argparse.Namespace, random.Random],
+                                             Tuple[int, float]]:
+    """Monta o caso de uma operação financeira em contas aleatórias."""
+    def caso(args: argparse.Namespace, rng: random.Random) -> Tuple[int, float]:
+        sistema, numeros = _popular(args.contas, rng)
+        contas = [sistema.contas[rng.choice(numeros)] for _ in range(args.operacoes)]
+        valores = [rng.randint(1, 50) for _ in range(args.operacoes)]
+        if operacao in ('sacar', 'transferir'):
+            # Saldo para todos os débitos sorteados, fora da medição
+            debitos: Dict[ContaBancaria, int] = {}
+            for conta, valor in zip(contas, valores):
+                debitos[conta] = debitos.get(conta, 0) + valor
+            for conta, total in debitos.items():
+                conta.depositar(total)
+
+        if operacao == 'transferir':
+            destinos = [sistema.contas[rng.choice(numeros)] for _ in range(args.operacoes)]
+
+            def executar():
+                for conta, destino, valor in zip(contas, destinos, valores):
+                    if conta is not destino:
+                        conta.transferir(destino, valor)
+        else:
+            def executar():
+                for conta, valor in zip(contas, valores):
+                    getattr(conta, operacao)(valor)
+        return args.operacoes, _cronometrar(executar)
+    caso.__doc__ = f"``{operacao}`` em contas aleatórias."
+    return caso
+
+
+def caso_obter_extrato(args: argparse.Namespace, rng: random.Random) -> Tuple[int, float]:
+    """Leitura completa do extrato de uma conta com histórico longo."""
+    sistema, numeros = _popular(1, rng)
+    conta = sistema.contas[numeros[0]]
+    for _ in range(args.historico):
+        conta.depositar(rng.randint(1, 50))
+
+    def executar():
+        for _ in range(args.repeticoes // 10 or 1):
+            for _ in conta.obter_extrato():
+                pass
+    return (args.repeticoes // 10 or 1) * len(conta.extrato), _cronometrar(executar)
+
+
+def caso_pagina_extrato(args: argparse.Namespace, rng: random.Random) -> Tuple[int, float]:
+    """Páginas de 20 transações, das mais recentes, em um histórico longo."""
+    sistema, numeros = _popular(1, rng)
+    conta = sistema.contas[numeros[0]]
+    for _ in range(args.historico):
+        conta.depositar(rng.randint(1, 50))
+
+    def executar():
+        for _ in range(args.repeticoes):
+            cursor = None
+            for _ in range(5):
+                cursor = conta.pagina_extrato(cursor, 20)['proximo_cursor']
+    return args.repeticoes * 5, _cronometrar(executar)
+
+
+def caso_listar_contas(args: argparse.Namespace, rng: random.Random) -> Tuple[int, float]:
+    """``listar_contas`` completa (contas listadas por segundo)."""
+    sistema, _ = _popular(args.contas, rng)
+    rodadas = max(1, args.repeticoes // 20)
+
+    def executar():
+        for _ in range(rodadas):
+            sistema.listar_contas()
+    return rodadas * args.contas, _cronometrar(executar)
+
+
+def caso_iter_contas(args: argparse.Namespace, rng: random.Random) -> Tuple[int, float]:
+    """Páginas de 50 contas em ordem de saldo, em posições aleatórias."""
+    sistema, _ = _popular(args.contas, rng)
+    posicoes = [rng.randrange(max(1, args.contas - 50)) for _ in range(args.repeticoes)]
+
+    def executar():
+        for posicao in posicoes:
+            for _ in sistema.iter_contas(posicao, 50, 'saldo', True):
+                pass
+    return args.repeticoes, _cronometrar(executar)
+
+
+def caso_obter_estatisticas(args: argparse.Namespace,
+                            rng: random.Random) -> Tuple[int, float]:
+    """``obter_estatisticas`` intercalada com depósitos."""
+    sistema, numeros = _popular(args.contas, rng)
+    contas = [sistema.contas[rng.choice(numeros)] for _ in range(args.repeticoes)]
+
+    def executar():
+        for conta in contas:
+            conta.depositar(1)
+            sistema.obter_estatisticas()
+    return args.repeticoes, _cronometrar(executar)
+
+
+def caso_buscar_contas_por_titular(args: argparse.Namespace,
+                                   rng: random.Random) -> Tuple[int, float]:
+    """Buscas parciais por trechos de nomes sorteados (limite de 20 resultados)."""
+    sistema, _ = _popular(args.contas, rng)
+    termos = []
+    for _ in range(args.repeticoes):
+        palavra = rng.choice(_NOMES + _SOBRENOMES)
+        inicio = rng.randrange(len(palavra) - 2)
+        termos.append(palavra[inicio:inicio + rng.randint(3, len(palavra) - inicio)])
+
+    def executar():
+        for termo in termos:
+            sistema.buscar_contas_por_titular(termo, 20)
+    return args.repeticoes, _cronometrar(executar)
+
+
+# Casos disponíveis, na ordem de execução
+CASOS: Dict[str, Callable[[argparse.Namespace, random.Random], Tuple[int, float]]] = {
+    'criar_conta': caso_criar_conta,
+    'depositar': _caso_operacao('depositar'),
+    'sacar': _caso_operacao('sacar'),
+    'transferir': _caso_operacao('transferir'),
+    'obter_extrato': caso_obter_extrato,
+    'pagina_extrato': caso_pagina_extrato,
+    'listar_contas': caso_listar_contas,
+    'iter_contas': caso_iter_contas,
+    'obter_estatisticas': caso_obter_estatisticas,
+    'buscar_contas_por_titular': caso_buscar_contas_por_titular,
+}
+
+
+def executar_casos(args: argparse.Namespace, casos: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Executa os casos e retorna a melhor rodada de cada um.
+
+    Args:
+        args (Namespace): Tamanhos, semente e quantidade de rodadas
+        casos (List[str]): Nomes dos casos (chaves de ``CASOS``)
+
+    Returns:
+        Dict: Por caso, ``operacoes``, ``segundos`` e ``ops_por_segundo``
+    """
+    resultados = {}
+    for nome in casos:
+        melhor = None
+        for rodada in range(args.rodadas):
+            # Mesma semente em todas as rodadas: mesmos dados
+            operacoes, segundos = CASOS[nome](args, random.Random(args.seed))
+            if melhor is None or segundos < melhor[1]:
+                melhor = (operacoes, segundos)
+        operacoes, segundos = melhor
+        resultados[nome] = {
+            'operacoes': operacoes,
+            'segundos': round(segundos, 6),
+            'ops_por_segundo': round(operacoes / segundos, 1) if segundos else None,
+        }
+    return resultados
+
+
+def comparar(resultados: Dict[str, Dict[str, Any]], base: Dict[str, Any],
+             limite: float) -> List[str]:
+    """
+    Compara a vazão de cada caso com a de um arquivo de resultados anterior.
+
+    Args:
+        resultados (Dict): Resultados atuais (de ``executar_casos``)
+        base (Dict): Conteúdo do arquivo de resultados de referência
+        limite (float): Perda de vazão tolerada, em porcentagem
+
+    Returns:
+        List[str]: Casos com regressão acima do limite
+    """
+    regressoes = []
+    print(f"\n{'Caso':<28} {'Base':>14} {'Atual':>14} {'Variação':>10}")
+    for nome, atual in resultados.items():
+        referencia = base.get('resultados', {}).get(nome)
+        if not referencia or not referencia.get('ops_por_segundo') \
+                or not atual['ops_por_segundo']:
+            print(f"{nome:<28} {'-':>14} {atual['ops_por_segundo'] or 0:>14,.0f}")
+            continue
+        variacao = (atual['ops_por_segundo'] / referencia['ops_por_segundo'] - 1) * 100
+        marca = ""
+        if variacao < -limite:
+            regressoes.append(nome)
+            marca = "  REGRESSÃO"
+        print(f"{nome:<28} {referencia['ops_por_segundo']:>14,.0f} "
+              f"{atual['ops_por_segundo']:>14,.0f} {variacao:>+9.1f}%{marca}")
+    return regressoes
+
+
+def _commit_atual() -> Optional[str]:
+    """Commit do repositório, se disponível (para identificar os resultados)."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, check=True,
+                              timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Executa a suíte pela linha de comando.
+
+    Returns:
+        int: Código de saída (1 se houver regressão acima do limite)
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.bench', description="Benchmarks do sistema bancário",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('--casos', default=','.join(CASOS),
+                        help="Casos a executar, separados por vírgula")
+    parser.add_argument('--contas', type=int, default=20000,
+                        help="Contas no sistema")
+    parser.add_argument('--operacoes', type=int, default=50000,
+                        help="Operações financeiras por caso")
+    parser.add_argument('--historico', type=int, default=100000,
+                        help="Transações no extrato longo")
+    parser.add_argument('--repeticoes', type=int, default=1000,
+                        help="Consultas por caso")
+    parser.add_argument('--rodadas', type=int, default=3,
+                        help="Rodadas por caso (vale a mais rápida)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--saida', help="Arquivo JSON para gravar os resultados")
+    parser.add_argument('--comparar', help="Arquivo JSON de referência")
+    parser.add_argument('--limite', type=float, default=10.0,
+                        help="Regressão tolerada na comparação, em %%")
+    args = parser.parse_args(argv)
+
+    casos = [nome.strip() for nome in args.casos.split(',') if nome.strip()]
+    desconhecidos = [nome for nome in casos if nome not in CASOS]
+    if desconhecidos:
+        parser.error(f"Casos desconhecidos: {', '.join(desconhecidos)} "
+                     f"(disponíveis: {', '.join(CASOS)})")
+    if min(args.contas, args.operacoes, args.historico, args.repeticoes,
+           args.rodadas) <= 0:
+        parser.error("Tamanhos e rodadas devem ser maiores que zero")
+
+    parametros = {chave: getattr(args, chave) for chave in
+                  ('contas', 'operacoes', 'historico', 'repeticoes', 'rodadas', 'seed')}
+    print(f"Parâmetros: {parametros}\n")
+    print(f"{'Caso':<28} {'Operações':>12} {'Segundos':>10} {'Ops/s':>14}")
+    resultados = {}
+    for nome in casos:
+        resultados.update(executar_casos(args, [nome]))
+        resultado = resultados[nome]
+        print(f"{nome:<28} {resultado['operacoes']:>12,} {resultado['segundos']:>10.3f} "
+              f"{resultado['ops_por_segundo'] or 0:>14,.0f}")
+
+    documento = {
+        'versao': VERSAO_RESULTADOS,
+        'data_hora': datetime.now().isoformat(timespec='seconds'),
+        'commit': _commit_atual(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'parametros': parametros,
+        'resultados': resultados,
+    }
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(documento, arquivo, ensure_ascii=False, indent=2)
+        print(f"\nResultados gravados em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+        if base.get('parametros') != parametros:
+            print("\nAviso: parâmetros diferentes dos da referência; "
+                  "a comparação pode não ser válida")
+        regressoes = comparar(resultados, base, args.limite)
+        if regressoes:
+            print(f"\nRegressão acima de {args.limite:g}%: {', '.join(regressoes)}")
+            return 1
+        print(f"\nSem regressões acima de {args.limite:g}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,8 +3,22 @@ Sistema Bancário - Módulo Conta
 Implementação da classe Conta Bancária com todas as funcionalidades básicas.
 """
 
-from datetime import datetime
-from typing import List, Dict, Any
+import threading
+from datetime import date, datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+try:
+    from .dinheiro import LIMITE_CENTAVOS, Valor, formatar_centavos, para_centavos
+    from .extrato import Extrato, Transacao, VisaoExtrato, de_timestamp
+    from .idempotencia import AUSENTE, CacheIdempotencia
+    from .relogio import timestamp_agora
+except ImportError:
+    from dinheiro import LIMITE_CENTAVOS, Valor, formatar_centavos, para_centavos
+    from extrato import Extrato, Transacao, VisaoExtrato, de_timestamp
+    from idempotencia import AUSENTE, CacheIdempotencia
+    from relogio import timestamp_agora
+
+# Chaves de idempotência das contas sem sistema bancário
+_IDEMPOTENCIA_AVULSA = CacheIdempotencia()
 
 
 class ContaBancaria:
@@ -15,13 +29,23 @@ class ContaBancaria:
         numero_conta (int): Número único da conta
         titular (str): Nome do titular da conta
         cpf_cnpj (str): Documento do titular (CPF ou CNPJ)
-        saldo (float): Saldo atual da conta
-        extrato (List[Dict]): Histórico de transações da conta
+        saldo (float): Saldo atual da conta (em reais)
+        saldo_centavos (int): Saldo atual da conta em centavos
+        extrato (Extrato): Histórico de transações da conta (colunar)
         data_criacao (datetime): Data/hora de criação da conta
     """
     
+    # Atributos fixos, sem dicionário por instância: com milhões de contas
+    # em memória, o ``__dict__`` de cada uma é uma sobrecarga considerável
+    __slots__ = ('numero_conta', 'titular', 'cpf_cnpj', '_centavos', 'extrato',
+                 '_criacao', '_sistema', '_trava', '_saldo_publicado')
+    
     # Contador estático para gerar números únicos de conta
     _proximo_numero = 1001
+    _trava_numeros = threading.Lock()
+    
+    # Valores monetários são mantidos internamente em centavos inteiros;
+    # a conversão de/para reais acontece apenas nas bordas da API
     
     def __init__(self, titular: str, cpf_cnpj: str):
         """
@@ -40,25 +64,112 @@ class ContaBancaria:
         if not cpf_cnpj or not cpf_cnpj.strip():
             raise ValueError("CPF/CNPJ é obrigatório")
         
-        self.numero_conta = ContaBancaria._proximo_numero
-        ContaBancaria._proximo_numero += 1
+        self._inicializar(ContaBancaria._reservar_numeros(1), titular.strip(),
+                          cpf_cnpj.strip(), timestamp_agora())
+    
+    @classmethod
+    def _reservar_numeros(cls, quantidade: int) -> int:
+        """
+        Reserva uma faixa contínua de números de conta.
+        
+        Args:
+            quantidade (int): Quantidade de números a reservar
+            
+        Returns:
+            int: Primeiro número da faixa reservada
+        """
+        with ContaBancaria._trava_numeros:
+            inicio = ContaBancaria._proximo_numero
+            ContaBancaria._proximo_numero += quantidade
+        return inicio
+    
+    @classmethod
+    def _criar_validada(cls, numero_conta: int, titular: str, cpf_cnpj: str,
+                        criacao: int) -> 'ContaBancaria':
+        """
+        Cria uma conta a partir de dados já validados e normalizados.
+        
+        Usado por operações em lote, que validam os registros e reservam
+        os números de conta antecipadamente.
+        
+        Args:
+            numero_conta (int): Número reservado para a conta
+            titular (str): Nome do titular (sem espaços nas bordas)
+            cpf_cnpj (str): Documento do titular (sem espaços nas bordas)
+            criacao (int): Data/hora de criação compartilhada pelo lote, em
+                microssegundos desde a época
+            
+        Returns:
+            ContaBancaria: Nova conta
+        """
+        conta = cls.__new__(cls)
+        conta._inicializar(numero_conta, titular, cpf_cnpj, criacao)
+        return conta
+    
+    @classmethod
+    def _restaurar(cls, numero_conta: int, titular: str, cpf_cnpj: str,
+                   criacao: int, centavos: int,
+                   extrato: Extrato) -> 'ContaBancaria':
+        """
+        Recria uma conta persistida, com saldo e extrato já existentes.
+        
+        Args:
+            numero_conta (int): Número da conta
+            titular (str): Nome do titular
+            cpf_cnpj (str): Documento do titular
+            criacao (int): Data/hora de criação original, em microssegundos
+                desde a época
+            centavos (int): Saldo em centavos
+            extrato (Extrato): Extrato completo da conta
+            
+        Returns:
+            ContaBancaria: Conta restaurada
+        """
+        conta = cls.__new__(cls)
+        conta._inicializar(numero_conta, titular, cpf_cnpj, criacao,
+                           centavos, extrato)
+        return conta
+    
+    def _inicializar(self, numero_conta: int, titular: str, cpf_cnpj: str,
+                     criacao: int, centavos: int = 0,
+                     extrato: Optional[Extrato] = None):
+        """
+        Preenche os atributos da conta.
         
-        self.titular = titular.strip()
-        self.cpf_cnpj = cpf_cnpj.strip()
-        self.saldo = 0.0
-        self.extrato: List[Dict[str, Any]] = []
-        self.data_criacao = datetime.now()
+        Sem um extrato existente, a conta é nova e sua criação é registrada
+        em um extrato vazio.
+        """
+        self.numero_conta = numero_conta
+        self.titular = titular
+        self.cpf_cnpj = cpf_cnpj
+        self._centavos = centavos
+        # Saldo visto pelas visões de saldos (atualizado pelo sistema ao
+        # final de cada operação, junto com as demais contas envolvidas)
+        self._saldo_publicado = centavos
+        self.extrato = Extrato() if extrato is None else extrato
+        # Data/hora de criação em microssegundos (``data_criacao`` a converte)
+        self._criacao = criacao
+        # Sistema bancário notificado a cada alteração de saldo (se houver)
+        self._sistema = None
+        # Serializa as operações desta conta entre threads
+        self._trava = threading.RLock()
         
-        # Registra criação da conta no extrato
-        self._registrar_transacao("CRIAÇÃO DE CONTA", 0.0, "Conta criada")
+        if extrato is None:
+            # Registra criação da conta no extrato
+            self._registrar_transacao("CRIAÇÃO DE CONTA", 0, "Conta criada",
+                                      criacao)
     
-    def depositar(self, valor: float, descricao: str = "Depósito") -> bool:
+    def depositar(self, valor: Valor, descricao: str = "Depósito",
+                  chave_idempotencia: Optional[str] = None) -> bool:
         """
         Realiza um depósito na conta.
         
         Args:
-            valor (float): Valor a ser depositado
+            valor (float): Valor a ser depositado (em reais)
             descricao (str): Descrição da transação
+            chave_idempotencia (str): Chave que identifica a operação; uma
+                repetição com a mesma chave devolve o resultado original
+                sem depositar de novo
             
         Returns:
             bool: True se o depósito foi realizado com sucesso
@@ -66,20 +177,35 @@ class ContaBancaria:
         Raises:
             ValueError: Se o valor for inválido (menor ou igual a zero)
         """
-        if valor <= 0:
+        centavos = para_centavos(valor)
+        if centavos <= 0:
             raise ValueError("Valor do depósito deve ser maior que zero")
         
-        self.saldo += valor
-        self._registrar_transacao("DEPÓSITO", valor, descricao)
+        with self._trava:
+            idempotencia = None
+            if chave_idempotencia is not None:
+                idempotencia = (chave_idempotencia,
+                                f"depositar:{self.numero_conta}:{centavos}", True)
+                anterior = self._repeticao(idempotencia)
+                if anterior is not AUSENTE:
+                    return anterior
+            saldo_anterior = self._centavos
+            inicio = len(self.extrato)
+            self._registrar_transacao("DEPÓSITO", centavos, descricao)
+            self._notificar((self, saldo_anterior, inicio), idempotencia=idempotencia)
+        self._aguardar_persistencia()
         return True
     
-    def sacar(self, valor: float, descricao: str = "Saque") -> bool:
+    def sacar(self, valor: Valor, descricao: str = "Saque",
+              chave_idempotencia: Optional[str] = None) -> bool:
         """
         Realiza um saque da conta.
         
         Args:
-            valor (float): Valor a ser sacado
+            valor (float): Valor a ser sacado (em reais)
             descricao (str): Descrição da transação
+            chave_idempotencia (str): Chave que identifica a operação (ver
+                ``depositar``)
             
         Returns:
             bool: True se o saque foi realizado com sucesso
@@ -88,25 +214,40 @@ class ContaBancaria:
             ValueError: Se o valor for inválido
             RuntimeError: Se não houver saldo suficiente
         """
-        if valor <= 0:
+        centavos = para_centavos(valor)
+        if centavos <= 0:
             raise ValueError("Valor do saque deve ser maior que zero")
         
-        if valor > self.saldo:
-            raise RuntimeError(f"Saldo insuficiente. Saldo atual: R$ {self.saldo:.2f}")
-        
-        self.saldo -= valor
-        self._registrar_transacao("SAQUE", -valor, descricao)
+        with self._trava:
+            idempotencia = None
+            if chave_idempotencia is not None:
+                idempotencia = (chave_idempotencia,
+                                f"sacar:{self.numero_conta}:{centavos}", True)
+                anterior = self._repeticao(idempotencia)
+                if anterior is not AUSENTE:
+                    return anterior
+            saldo_anterior = self._centavos
+            if centavos > saldo_anterior:
+                raise RuntimeError(self._mensagem_saldo_insuficiente())
+            
+            inicio = len(self.extrato)
+            self._registrar_transacao("SAQUE", -centavos, descricao)
+            self._notificar((self, saldo_anterior, inicio), idempotencia=idempotencia)
+        self._aguardar_persistencia()
         return True
     
-    def transferir(self, conta_destino: 'ContaBancaria', valor: float, 
-                   descricao: str = "Transferência") -> bool:
+    def transferir(self, conta_destino: 'ContaBancaria', valor: Valor, 
+                   descricao: str = "Transferência",
+                   chave_idempotencia: Optional[str] = None) -> bool:
         """
         Transfere dinheiro para outra conta.
         
         Args:
             conta_destino (ContaBancaria): Conta que receberá a transferência
-            valor (float): Valor a ser transferido
+            valor (float): Valor a ser transferido (em reais)
             descricao (str): Descrição da transferência
+            chave_idempotencia (str): Chave que identifica a operação (ver
+                ``depositar``)
             
         Returns:
             bool: True se a transferência foi realizada com sucesso
@@ -118,30 +259,62 @@ class ContaBancaria:
         if not conta_destino:
             raise ValueError("Conta destino é obrigatória")
         
-        if valor <= 0:
+        centavos = para_centavos(valor)
+        if centavos <= 0:
             raise ValueError("Valor da transferência deve ser maior que zero")
         
-        if valor > self.saldo:
-            raise RuntimeError(f"Saldo insuficiente. Saldo atual: R$ {self.saldo:.2f}")
-        
-        # Realiza a transferência
-        self.saldo -= valor
-        conta_destino.saldo += valor
-        
-        # Registra nas duas contas
-        self._registrar_transacao("TRANSFERÊNCIA ENVIADA", -valor, 
-                                f"{descricao} - Para conta {conta_destino.numero_conta}")
-        conta_destino._registrar_transacao("TRANSFERÊNCIA RECEBIDA", valor,
-                                         f"{descricao} - De conta {self.numero_conta}")
+        # Trava as duas contas sempre na mesma ordem (por número) para evitar
+        # impasse entre transferências simultâneas em sentidos opostos
+        primeira, segunda = sorted((self, conta_destino),
+                                   key=lambda conta: conta.numero_conta)
+        with primeira._trava, segunda._trava:
+            idempotencia = None
+            if chave_idempotencia is not None:
+                idempotencia = (chave_idempotencia,
+                                f"transferir:{self.numero_conta}:"
+                                f"{conta_destino.numero_conta}:{centavos}", True)
+                anterior = self._repeticao(idempotencia)
+                if anterior is not AUSENTE:
+                    return anterior
+            if centavos > self._centavos:
+                raise RuntimeError(self._mensagem_saldo_insuficiente())
+            # Verificado antes de registrar a primeira perna
+            if conta_destino._centavos + centavos > LIMITE_CENTAVOS:
+                raise ValueError("Operação excede o limite de saldo da conta destino")
+            
+            saldo_anterior_origem = self._centavos
+            saldo_anterior_destino = conta_destino._centavos
+            inicio_origem = len(self.extrato)
+            inicio_destino = len(conta_destino.extrato)
+            
+            # Registra nas duas contas, com a mesma data/hora (cada registro
+            # também aplica o valor ao saldo)
+            timestamp = timestamp_agora()
+            self._registrar_transacao("TRANSFERÊNCIA ENVIADA", -centavos, 
+                                    f"{descricao} - Para conta {conta_destino.numero_conta}",
+                                    timestamp)
+            conta_destino._registrar_transacao("TRANSFERÊNCIA RECEBIDA", centavos,
+                                             f"{descricao} - De conta {self.numero_conta}",
+                                             timestamp)
+            # Uma única notificação: as duas pernas são persistidas juntas
+            self._notificar((self, saldo_anterior_origem, inicio_origem),
+                            (conta_destino, saldo_anterior_destino, inicio_destino),
+                            idempotencia=idempotencia)
+        self._aguardar_persistencia()
+        if conta_destino._sistema is not self._sistema:
+            conta_destino._aguardar_persistencia()
         return True
     
-    def pagar_conta(self, valor: float, descricao: str) -> bool:
+    def pagar_conta(self, valor: Valor, descricao: str,
+                    chave_idempotencia: Optional[str] = None) -> bool:
         """
         Realiza pagamento de conta/serviço.
         
         Args:
-            valor (float): Valor do pagamento
+            valor (float): Valor do pagamento (em reais)
             descricao (str): Descrição do pagamento
+            chave_idempotencia (str): Chave que identifica a operação (ver
+                ``depositar``)
             
         Returns:
             bool: True se o pagamento foi realizado com sucesso
@@ -150,19 +323,46 @@ class ContaBancaria:
             ValueError: Se o valor for inválido ou descrição vazia
             RuntimeError: Se não houver saldo suficiente
         """
-        if valor <= 0:
+        centavos = para_centavos(valor)
+        if centavos <= 0:
             raise ValueError("Valor do pagamento deve ser maior que zero")
         
         if not descricao or not descricao.strip():
             raise ValueError("Descrição do pagamento é obrigatória")
         
-        if valor > self.saldo:
-            raise RuntimeError(f"Saldo insuficiente. Saldo atual: R$ {self.saldo:.2f}")
-        
-        self.saldo -= valor
-        self._registrar_transacao("PAGAMENTO", -valor, descricao.strip())
+        with self._trava:
+            idempotencia = None
+            if chave_idempotencia is not None:
+                idempotencia = (chave_idempotencia,
+                                f"pagar_conta:{self.numero_conta}:{centavos}", True)
+                anterior = self._repeticao(idempotencia)
+                if anterior is not AUSENTE:
+                    return anterior
+            saldo_anterior = self._centavos
+            if centavos > saldo_anterior:
+                raise RuntimeError(self._mensagem_saldo_insuficiente())
+            
+            inicio = len(self.extrato)
+            self._registrar_transacao("PAGAMENTO", -centavos, descricao.strip())
+            self._notificar((self, saldo_anterior, inicio), idempotencia=idempotencia)
+        self._aguardar_persistencia()
         return True
     
+    @property
+    def saldo(self) -> float:
+        """Saldo atual da conta, em reais."""
+        return self._centavos / 100
+    
+    @property
+    def saldo_centavos(self) -> int:
+        """Saldo atual da conta, em centavos."""
+        return self._centavos
+    
+    @property
+    def data_criacao(self) -> datetime:
+        """Data/hora de criação da conta."""
+        return de_timestamp(self._criacao)
+    
     def obter_saldo(self) -> float:
         """
         Obtém o saldo atual da conta.
@@ -170,35 +370,226 @@ class ContaBancaria:
         Returns:
             float: Saldo atual da conta
         """
-        return self.saldo
+        return self._centavos / 100
     
-    def obter_extrato(self) -> List[Dict[str, Any]]:
+    def obter_extrato(self) -> VisaoExtrato:
         """
         Obtém o extrato completo da conta.
         
         Returns:
-            List[Dict]: Lista de transações (mais recentes primeiro)
+            VisaoExtrato: Sequência de transações (mais recentes primeiro),
+            montadas sob demanda a partir do extrato colunar
+        """
+        return VisaoExtrato(self.extrato)
+    
+    def iter_extrato(self, desc: bool = True, offset: int = 0,
+                     limit: Optional[int] = None,
+                     since: Optional[datetime] = None,
+                     until: Optional[datetime] = None) -> Iterator[Transacao]:
+        """
+        Percorre o extrato da conta sem copiá-lo.
+        
+        Args:
+            desc (bool): Se True, da transação mais recente para a mais antiga
+            offset (int): Quantidade de transações a pular
+            limit (int): Quantidade máxima de transações (None = todas)
+            since (datetime): Data/hora inicial, inclusiva
+            until (datetime): Data/hora final, exclusiva
+            
+        Yields:
+            Transacao: Transações do extrato
+        """
+        return self.extrato.iterar(desc, offset, limit, since, until)
+    
+    def obter_extrato_periodo(self, inicio: Optional[datetime] = None,
+                              fim: Optional[datetime] = None) -> List[Transacao]:
+        """
+        Obtém as transações de um período (mais recentes primeiro).
+        
+        Args:
+            inicio (datetime): Data/hora inicial, inclusiva (None = sem limite)
+            fim (datetime): Data/hora final, exclusiva (None = sem limite)
+            
+        Returns:
+            List[Transacao]: Transações do período
+        """
+        return list(self.extrato.iterar(since=inicio, until=fim))
+    
+    def totais_periodo(self, inicio: Optional[datetime] = None,
+                       fim: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Calcula os totais movimentados em um período.
+        
+        Args:
+            inicio (datetime): Data/hora inicial, inclusiva (None = sem limite)
+            fim (datetime): Data/hora final, exclusiva (None = sem limite)
+            
+        Returns:
+            Dict: ``quantidade``, ``entradas``, ``saidas``, ``saldo_periodo``
+            e ``por_tipo`` (total por tipo de transação)
+        """
+        return self.extrato.totais(inicio, fim)
+    
+    def resumo_dia(self, data: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Obtém os totais de um dia sem percorrer o extrato (ver ``Extrato``).
+        
+        Args:
+            data (date): Dia a consultar (padrão: hoje, pelo relógio do sistema)
+            
+        Returns:
+            Dict: ``quantidade``, ``entradas``, ``saidas``, ``saldo_periodo``,
+            ``por_tipo`` (total por tipo) e ``quantidade_por_tipo``
+        """
+        if data is None:
+            data = de_timestamp(timestamp_agora())
+        # Sob a trava: o resumo de uma conta restaurada é calculado no
+        # primeiro uso e as operações o atualizam
+        with self._trava:
+            return self.extrato.resumo_dia(data)
+    
+    def resumo_mes(self, ano: Optional[int] = None,
+                   mes: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Obtém os totais de um mês sem percorrer o extrato (ver ``Extrato``).
+        
+        Args:
+            ano (int): Ano (padrão: o atual, pelo relógio do sistema)
+            mes (int): Mês de 1 a 12 (padrão: o atual)
+            
+        Returns:
+            Dict: ``quantidade``, ``entradas``, ``saidas``, ``saldo_periodo``,
+            ``por_tipo`` (total por tipo) e ``quantidade_por_tipo``
+            
+        Raises:
+            ValueError: Se o mês for inválido
+        """
+        if ano is None or mes is None:
+            agora = de_timestamp(timestamp_agora())
+            ano = agora.year if ano is None else ano
+            mes = agora.month if mes is None else mes
+        with self._trava:
+            return self.extrato.resumo_mes(ano, mes)
+    
+    def pagina_extrato(self, cursor: Optional[int] = None, limite: int = 10,
+                       desc: bool = True) -> Dict[str, Any]:
+        """
+        Obtém uma página do extrato com paginação por cursor.
+        
+        Args:
+            cursor (int): Cursor retornado pela página anterior (None = início)
+            limite (int): Quantidade máxima de transações na página
+            desc (bool): Se True, da transação mais recente para a mais antiga
+            
+        Returns:
+            Dict: ``transacoes`` da página e ``proximo_cursor`` (None ao final)
         """
-        # Retorna uma cópia do extrato em ordem cronológica inversa
-        return self.extrato[::-1]
+        transacoes, proximo = self.extrato.pagina(cursor, limite, desc)
+        return {'transacoes': transacoes, 'proximo_cursor': proximo}
     
-    def _registrar_transacao(self, tipo: str, valor: float, descricao: str):
+    def _registrar_transacao(self, tipo: str, valor: int, descricao: str,
+                             timestamp: Optional[int] = None):
         """
-        Registra uma transação no extrato da conta.
+        Registra uma transação no extrato e aplica seu valor ao saldo.
+        
+        O saldo só muda depois que a transação entrou no extrato: se o
+        registro falhar, nem o extrato nem o saldo são alterados.
         
         Args:
             tipo (str): Tipo da transação
-            valor (float): Valor da transação
+            valor (int): Valor da transação em centavos
             descricao (str): Descrição da transação
+            timestamp (int): Data/hora da transação em microssegundos desde
+                a época (padrão: agora, pelo relógio do sistema)
+            
+        Raises:
+            ValueError: Se o saldo resultante exceder ``LIMITE_CENTAVOS``
+        """
+        saldo = self._centavos + valor
+        if not -LIMITE_CENTAVOS <= saldo <= LIMITE_CENTAVOS:
+            raise ValueError("Operação excede o limite de saldo da conta")
+        self.extrato.registrar_timestamp(
+            timestamp_agora() if timestamp is None else timestamp, tipo, valor,
+            descricao, saldo)
+        self._centavos = saldo
+    
+    def _registrar_lote(self, transacoes: List[Tuple[Any, int, Any]],
+                        timestamp: int,
+                        codificadas: bool = False) -> Tuple['ContaBancaria', int, int]:
+        """
+        Aplica transações já validadas, com a trava da conta já obtida.
+        
+        Usado pelas operações em lote do sistema bancário, que notificam o
+        sistema uma única vez ao final.
+        
+        Args:
+            transacoes (List[Tuple]): Tuplas ``(tipo, valor em centavos, descricao)``
+            timestamp (int): Data/hora compartilhada pelas transações, em
+                microssegundos desde a época
+            codificadas (bool): Se tipo e descrição já são códigos das
+                tabelas do extrato (``Extrato.registrar_codificadas``)
+            
+        Returns:
+            Tuple: Movimento ``(conta, saldo_anterior, inicio)`` para ``_notificar``
         """
-        transacao = {
-            'data_hora': datetime.now(),
-            'tipo': tipo,
-            'valor': valor,
-            'descricao': descricao,
-            'saldo_apos': self.saldo
-        }
-        self.extrato.append(transacao)
+        saldo_anterior = self._centavos
+        inicio = len(self.extrato)
+        registrar = (self.extrato.registrar_codificadas if codificadas
+                     else self.extrato.registrar_lote)
+        self._centavos = registrar(timestamp, transacoes, saldo_anterior)
+        return (self, saldo_anterior, inicio)
+    
+    def _mensagem_saldo_insuficiente(self) -> str:
+        """Mensagem de erro para operações sem saldo suficiente."""
+        return f"Saldo insuficiente. Saldo atual: R$ {formatar_centavos(self._centavos)}"
+    
+    def _repeticao(self, idempotencia: Tuple[str, str, Any]) -> Any:
+        """
+        Resultado original de uma operação repetida, com a trava já obtida.
+        
+        Args:
+            idempotencia (Tuple): ``(chave, assinatura, resultado)`` da operação
+            
+        Returns:
+            Resultado original, ou ``AUSENTE`` se a chave for nova
+            
+        Raises:
+            ValueError: Se a chave já foi usada em outra operação
+        """
+        if self._sistema is not None:
+            return self._sistema._repeticao(idempotencia[0], idempotencia[1])
+        return _IDEMPOTENCIA_AVULSA.consultar(idempotencia[0], idempotencia[1])
+    
+    def _notificar(self, *movimentos: Tuple['ContaBancaria', int, int],
+                   idempotencia: Optional[Tuple[str, str, Any]] = None):
+        """
+        Avisa o sistema bancário (se houver) sobre as alterações de uma operação.
+        
+        Args:
+            movimentos: Uma tupla ``(conta, saldo_anterior, inicio)`` por conta
+                alterada, com o saldo antes da operação (em centavos) e a
+                posição da primeira transação registrada pela operação
+            idempotencia (Tuple): ``(chave, assinatura, resultado)`` a registrar
+                junto com a operação (None = operação sem chave)
+        """
+        sistema = self._sistema
+        if sistema is None and idempotencia is not None:
+            _IDEMPOTENCIA_AVULSA.registrar(_IDEMPOTENCIA_AVULSA.novo_item(*idempotencia))
+        if all(conta._sistema is sistema for conta, _, _ in movimentos):
+            if sistema is not None:
+                sistema._ao_movimentar(movimentos, idempotencia)
+            return
+        # Contas de sistemas diferentes: cada sistema recebe a sua parte (a
+        # chave de idempotência fica com o sistema desta conta)
+        for movimento in movimentos:
+            if movimento[0]._sistema is not None:
+                movimento[0]._sistema._ao_movimentar(
+                    (movimento,), idempotencia if movimento[0] is self else None)
+    
+    def _aguardar_persistencia(self):
+        """Aguarda o sistema bancário (se houver) tornar a operação durável."""
+        if self._sistema is not None:
+            self._sistema._aguardar_persistencia()
     
     def __str__(self) -> str:
         """Representação string da conta."""
@@ -214,8 +605,12 @@ class ContaBancaria:
         """
         Retorna um resumo da conta em formato dicionário.
         
+        Todas as informações vêm de valores mantidos pela conta (inclusive
+        os totais do mês atual), sem percorrer o extrato.
+        
         Returns:
-            Dict: Informações principais da conta
+            Dict: Informações principais da conta e ``mes_atual`` (totais
+            do mês corrente, como em ``resumo_mes``)
         """
         return {
             'numero_conta': self.numero_conta,
@@ -223,5 +618,6 @@ class ContaBancaria:
             'cpf_cnpj': self.cpf_cnpj,
             'saldo': self.saldo,
             'data_criacao': self.data_criacao,
-            'total_transacoes': len(self.extrato)
+            'total_transacoes': len(self.extrato),
+            'mes_atual': self.resumo_mes()
         }
\ No newline at end of file
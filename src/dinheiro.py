@@ -0,0 +1,96 @@
+"""
+Sistema Bancário - Módulo Dinheiro
+Conversão entre valores monetários da API (reais) e centavos inteiros.
+"""
+
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Union
+
+Valor = Union[int, float, Decimal, str]
+
+# Maior valor em centavos (em módulo) aceito pelo sistema: as colunas do
+# extrato e os saldos persistidos são inteiros de 64 bits
+LIMITE_CENTAVOS = 2 ** 63 - 1
+
+
+def para_centavos(valor: Valor) -> int:
+    """
+    Converte um valor em reais para centavos inteiros.
+
+    Aceita ``int``, ``float``, ``Decimal`` ou texto (com ponto ou vírgula
+    decimal). Frações de centavo são arredondadas para o centavo mais
+    próximo (empates para o par).
+
+    Args:
+        valor: Valor em reais
+
+    Returns:
+        int: Valor em centavos
+
+    Raises:
+        ValueError: Se o valor não for numérico ou exceder ``LIMITE_CENTAVOS``
+    """
+    # Caminho rápido para os tipos mais comuns
+    tipo = type(valor)
+    if tipo is float:
+        try:
+            centavos = round(valor * 100)
+        except (OverflowError, ValueError):
+            raise ValueError(f"Valor inválido: {valor}") from None
+    elif tipo is int:
+        centavos = valor * 100
+    else:
+        centavos = _converter(valor)
+    if -LIMITE_CENTAVOS <= centavos <= LIMITE_CENTAVOS:
+        return centavos
+    raise ValueError(f"Valor fora do limite permitido: {valor}")
+
+
+def _converter(valor: Valor) -> int:
+    """Converte em centavos os tipos fora do caminho rápido (sem limite)."""
+    if isinstance(valor, str):
+        try:
+            valor = Decimal(valor.strip().replace(',', '.'))
+        except (ArithmeticError, ValueError):
+            raise ValueError(f"Valor inválido: {valor}") from None
+    if isinstance(valor, Decimal):
+        if not valor.is_finite():
+            raise ValueError(f"Valor inválido: {valor}")
+        try:
+            return int((valor * 100).to_integral_value(ROUND_HALF_EVEN))
+        except (ArithmeticError, ValueError):
+            # ``decimal.Overflow`` para expoentes enormes (ex.: "1e999999")
+            raise ValueError(f"Valor inválido: {valor}") from None
+    if isinstance(valor, int):
+        return int(valor) * 100
+    if isinstance(valor, float):
+        return para_centavos(float(valor))
+    raise ValueError(f"Valor inválido: {valor!r}")
+
+
+def de_centavos(centavos: int) -> float:
+    """
+    Converte centavos inteiros para reais.
+
+    Args:
+        centavos (int): Valor em centavos
+
+    Returns:
+        float: Valor em reais
+    """
+    return centavos / 100
+
+
+def formatar_centavos(centavos: int) -> str:
+    """
+    Formata centavos com duas casas decimais, sem passar por ``float``.
+
+    Args:
+        centavos (int): Valor em centavos
+
+    Returns:
+        str: Valor formatado (ex.: ``-1234.05``)
+    """
+    sinal = '-' if centavos < 0 else ''
+    reais, resto = divmod(abs(centavos), 100)
+    return f"{sinal}{reais}.{resto:02d}"
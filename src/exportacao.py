@@ -0,0 +1,453 @@
+"""
+Sistema Bancário - Módulo Exportação
+Exportação em fluxo de extratos (uma conta ou o banco inteiro) em CSV,
+JSONL ou formato colunar binário.
+
+As transações são lidas das colunas do extrato (ou direto do snapshot,
+sem materializar as contas) em blocos de tamanho limitado: a memória usada
+não depende do tamanho do extrato. Cada bloco é codificado, opcionalmente
+comprimido e gravado de uma vez. Com ``trabalhadores``, a compressão dos
+blocos acontece em paralelo (o ``zlib`` libera o GIL), e os blocos são
+gravados na ordem original.
+
+Formatos:
+
+- ``csv``: cabeçalho ``conta,data_hora,tipo,valor,descricao,saldo_apos``;
+- ``jsonl``: um objeto JSON por transação, com as mesmas chaves;
+- ``colunar``: blocos de colunas binárias de largura fixa (comprimidas por
+  coluna) seguidos das tabelas de textos e do índice dos blocos; lido com
+  ``ArquivoColunar``.
+
+Datas/horas no formato ISO 8601 (``2024-01-31T10:00:00.000000``) e valores
+em reais com duas casas, convertidos sem passar por ``float``. Com
+compressão, CSV e JSONL são gravados como gzip (um membro por bloco).
+
+Exemplo:
+    >>> from src import exportacao
+    >>> exportacao.exportar_sistema(sistema, "extratos.csv.gz", comprimir=True)
+"""
+
+import json
+import os
+import struct
+import zlib
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+try:
+    from .extrato import DESCRICOES, TIPOS
+    from .relogio import formatar_timestamp
+except ImportError:
+    from extrato import DESCRICOES, TIPOS
+    from relogio import formatar_timestamp
+
+FORMATOS = ('csv', 'jsonl', 'colunar')
+CABECALHO_CSV = "conta,data_hora,tipo,valor,descricao,saldo_apos\n"
+
+# Formato colunar: assinatura, versão, compressão (0 = nenhuma, 1 = zlib)
+_ASSINATURA = b'UBANKEXP'
+_VERSAO = 1
+_CABECALHO = struct.Struct('<8sII')
+# Bloco: quantidade de linhas e tamanho (em bytes) de cada coluna gravada
+_COLUNAS = (('conta', 'q'), ('data_hora', 'q'), ('tipo', 'H'), ('valor', 'q'),
+            ('descricao', 'I'), ('saldo_apos', 'q'))
+_BLOCO = struct.Struct('<q' + 'q' * len(_COLUNAS))
+# Rodapé: posição das tabelas de textos, posição do índice de blocos,
+# quantidade de blocos, quantidade de linhas e assinatura
+_RODAPE = struct.Struct('<qqqq8s')
+
+Colunas = Tuple[array, array, array, array, array]
+Destino = Union[str, os.PathLike, BinaryIO]
+
+
+def exportar_extrato(conta: Any, destino: Destino, formato: str = 'csv',
+                     inicio: Optional[datetime] = None, fim: Optional[datetime] = None,
+                     comprimir: bool = False, trabalhadores: int = 0,
+                     tamanho_bloco: int = 65536) -> Dict[str, int]:
+    """
+    Exporta o extrato de uma conta, da transação mais antiga à mais recente.
+
+    Args:
+        conta (ContaBancaria): Conta a exportar
+        destino (str | arquivo): Caminho ou arquivo binário aberto para escrita
+        formato (str): ``csv``, ``jsonl`` ou ``colunar``
+        inicio (datetime): Data/hora inicial, inclusiva (None = sem limite)
+        fim (datetime): Data/hora final, exclusiva (None = sem limite)
+        comprimir (bool): Se True, comprime os blocos (gzip ou zlib por coluna)
+        trabalhadores (int): Threads de compressão (0 = na própria thread)
+        tamanho_bloco (int): Transações por bloco gravado
+
+    Returns:
+        Dict: ``linhas``, ``blocos`` e ``bytes`` gravados
+
+    Raises:
+        ValueError: Se o formato ou os parâmetros forem inválidos
+    """
+    extrato = conta.extrato
+    primeira, ultima = extrato._limites(inicio, fim)
+    return _exportar([(conta.numero_conta, extrato.colunas, primeira, ultima)],
+                     destino, formato, comprimir, trabalhadores, tamanho_bloco)
+
+
+def exportar_sistema(sistema: Any, destino: Destino, formato: str = 'csv',
+                     comprimir: bool = False, trabalhadores: int = 0,
+                     tamanho_bloco: int = 65536) -> Dict[str, int]:
+    """
+    Exporta os extratos de todas as contas do sistema, em ordem de conta.
+
+    As contas do snapshot ainda não carregadas são lidas diretamente do
+    arquivo mapeado, sem materializá-las. Cada conta é exportada com as
+    transações existentes no momento em que é alcançada.
+
+    Args:
+        sistema (SistemaBancario): Sistema a exportar
+        destino (str | arquivo): Caminho ou arquivo binário aberto para escrita
+        formato (str): ``csv``, ``jsonl`` ou ``colunar``
+        comprimir (bool): Se True, comprime os blocos (gzip ou zlib por coluna)
+        trabalhadores (int): Threads de compressão (0 = na própria thread)
+        tamanho_bloco (int): Transações por bloco gravado
+
+    Returns:
+        Dict: ``linhas``, ``blocos`` e ``bytes`` gravados
+
+    Raises:
+        ValueError: Se o formato ou os parâmetros forem inválidos
+    """
+    return _exportar(sistema.contas.extratos(), destino, formato, comprimir,
+                     trabalhadores, tamanho_bloco)
+
+
+def _exportar(fontes: Any, destino: Destino, formato: str, comprimir: bool,
+              trabalhadores: int, tamanho_bloco: int) -> Dict[str, int]:
+    """Grava as faixas ``(numero, ler, inicio, fim)`` no formato pedido."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato} (use {', '.join(FORMATOS)})")
+    if tamanho_bloco <= 0:
+        raise ValueError("Tamanho do bloco deve ser maior que zero")
+    if trabalhadores < 0:
+        raise ValueError("Quantidade de trabalhadores não pode ser negativa")
+
+    codificador = (_CodificadorColunar(comprimir) if formato == 'colunar'
+                   else _CodificadorTexto(formato, comprimir))
+    with _Saida(destino, trabalhadores) as saida:
+        saida.gravar(codificador.cabecalho())
+        linhas = 0
+        for bloco in _blocos(fontes, tamanho_bloco):
+            quantidade = len(bloco[0][1][0]) if len(bloco) == 1 else sum(
+                len(colunas[0]) for _, colunas in bloco)
+            linhas += quantidade
+            saida.enviar(*codificador.bloco(bloco, quantidade))
+        saida.concluir()
+        saida.gravar(codificador.rodape(saida.posicoes, linhas, saida.bytes))
+    return {'linhas': linhas, 'blocos': len(saida.posicoes), 'bytes': saida.bytes}
+
+
+def _blocos(fontes: Any, tamanho_bloco: int) -> Iterator[List[Tuple[int, Colunas]]]:
+    """
+    Agrupa as transações em blocos de até ``tamanho_bloco`` linhas.
+
+    Yields:
+        List: Pares ``(numero da conta, colunas)`` do bloco
+    """
+    bloco: List[Tuple[int, Colunas]] = []
+    pendentes = 0
+    for numero, ler, inicio, fim in fontes:
+        while inicio < fim:
+            # Extratos grandes são divididos entre blocos
+            parte = min(fim, inicio + tamanho_bloco - pendentes)
+            bloco.append((numero, ler(inicio, parte)))
+            pendentes += parte - inicio
+            inicio = parte
+            if pendentes >= tamanho_bloco:
+                yield bloco
+                bloco, pendentes = [], 0
+    if bloco:
+        yield bloco
+
+
+class _Saida:
+    """
+    Arquivo de saída com compressão opcional em paralelo.
+
+    Os blocos enviados são processados pelas threads (no máximo duas
+    tarefas por thread aguardando) e gravados na ordem de envio.
+    """
+
+    def __init__(self, destino: Destino, trabalhadores: int):
+        """Abre o destino (se for um caminho) e inicia as threads."""
+        if isinstance(destino, (str, os.PathLike)):
+            self._arquivo = open(destino, 'wb')
+            self._fechar = True
+        else:
+            self._arquivo = destino
+            self._fechar = False
+        self._executor = (ThreadPoolExecutor(trabalhadores, thread_name_prefix='exportacao')
+                          if trabalhadores else None)
+        self._limite = 2 * trabalhadores
+        self._pendentes: deque = deque()
+        self.bytes = 0
+        # Posição (desde o início da exportação) de cada bloco gravado
+        self.posicoes: List[int] = []
+
+    def __enter__(self) -> '_Saida':
+        return self
+
+    def __exit__(self, *excecao):
+        for futuro in self._pendentes:
+            futuro.cancel()
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self._fechar:
+            self._arquivo.close()
+
+    def gravar(self, dados: bytes):
+        """Grava bytes diretamente (cabeçalho e rodapé)."""
+        self._arquivo.write(dados)
+        self.bytes += len(dados)
+
+    def enviar(self, funcao: Callable[..., bytes], *args: Any):
+        """Processa um bloco (em uma thread, se houver) e o grava em ordem."""
+        if self._executor is None:
+            self._gravar_bloco(funcao(*args))
+            return
+        self._pendentes.append(self._executor.submit(funcao, *args))
+        while len(self._pendentes) > self._limite:
+            self._gravar_bloco(self._pendentes.popleft().result())
+
+    def concluir(self):
+        """Aguarda e grava os blocos ainda em processamento."""
+        while self._pendentes:
+            self._gravar_bloco(self._pendentes.popleft().result())
+
+    def _gravar_bloco(self, dados: bytes):
+        """Grava um bloco, registrando sua posição."""
+        self.posicoes.append(self.bytes)
+        self.gravar(dados)
+
+
+class _TextosCodificados:
+    """Textos de uma tabela (``TIPOS``/``DESCRICOES``) já codificados para a saída."""
+
+    def __init__(self, tabela: Any, codificar: Callable[[str], str]):
+        """Inicializa a lista vazia (preenchida em ``atualizar``)."""
+        self._tabela = tabela
+        self._codificar = codificar
+        self.textos: List[str] = []
+
+    def atualizar(self) -> List[str]:
+        """Inclui os textos cadastrados desde a última chamada."""
+        if len(self.textos) < len(self._tabela):
+            self.textos.extend(map(self._codificar, self._tabela.textos()[len(self.textos):]))
+        return self.textos
+
+
+def _texto_csv(texto: str) -> str:
+    """Campo CSV, entre aspas quando necessário."""
+    if any(caractere in texto for caractere in ',"\r\n'):
+        return '"' + texto.replace('"', '""') + '"'
+    return texto
+
+
+def _texto_json(texto: str) -> str:
+    """Texto JSON (entre aspas, com escapes)."""
+    return json.dumps(texto, ensure_ascii=False)
+
+
+def _textos_reais(centavos: array) -> List[str]:
+    """Valores em reais com duas casas (como ``formatar_centavos``), de uma coluna inteira."""
+    return ["%d.%02d" % divmod(valor, 100) if valor >= 0
+            else "-%d.%02d" % divmod(-valor, 100) for valor in centavos]
+
+
+class _DatasISO:
+    """Formata colunas de timestamps em ISO 8601, reaproveitando o texto de cada segundo."""
+
+    def __init__(self):
+        """Inicializa o cache de segundos."""
+        self._segundos: Dict[int, str] = {}
+
+    def textos(self, timestamps: array) -> List[str]:
+        """Datas/horas de uma coluna inteira."""
+        segundos = self._segundos
+        if len(segundos) >= 4096:
+            segundos.clear()
+        textos = []
+        for timestamp in timestamps:
+            segundo, microssegundo = divmod(timestamp, 1_000_000)
+            texto = segundos.get(segundo)
+            if texto is None:
+                texto = segundos[segundo] = formatar_timestamp(
+                    segundo * 1_000_000, "%Y-%m-%dT%H:%M:%S")
+            textos.append(f"{texto}.{microssegundo:06d}")
+        return textos
+
+
+class _CodificadorTexto:
+    """Codificação de blocos em CSV ou JSONL."""
+
+    def __init__(self, formato: str, comprimir: bool):
+        """Prepara as tabelas de textos e o formatador de datas."""
+        self._csv = formato == 'csv'
+        codificar = _texto_csv if self._csv else _texto_json
+        self._tipos = _TextosCodificados(TIPOS, codificar)
+        self._descricoes = _TextosCodificados(DESCRICOES, codificar)
+        self._datas = _DatasISO()
+        self._comprimir = comprimir
+
+    def cabecalho(self) -> bytes:
+        """Cabeçalho do arquivo (apenas no CSV)."""
+        return self._finalizar(CABECALHO_CSV.encode()) if self._csv else b''
+
+    def bloco(self, bloco: List[Tuple[int, Colunas]],
+              quantidade: int) -> Tuple[Callable[..., bytes], Any]:
+        """Codifica o texto do bloco; a compressão fica para ``_finalizar``."""
+        tipos = self._tipos.atualizar()
+        descricoes = self._descricoes.atualizar()
+        partes = []
+        for numero, (datas, codigos_tipo, valores, codigos_descricao, saldos) in bloco:
+            # Colunas formatadas inteiras, depois combinadas linha a linha
+            linhas = zip(self._datas.textos(datas), codigos_tipo, _textos_reais(valores),
+                         codigos_descricao, _textos_reais(saldos))
+            if self._csv:
+                prefixo = f"{numero},"
+                partes.extend([f"{prefixo}{data},{tipos[t]},{valor},{descricoes[d]},{saldo}\n"
+                               for data, t, valor, d, saldo in linhas])
+            else:
+                prefixo = f'{{"conta":{numero},"data_hora":"'
+                partes.extend([
+                    f'{prefixo}{data}","tipo":{tipos[t]},"valor":{valor},'
+                    f'"descricao":{descricoes[d]},"saldo_apos":{saldo}}}\n'
+                    for data, t, valor, d, saldo in linhas])
+        return self._finalizar, ''.join(partes).encode()
+
+    def rodape(self, posicoes: List[int], linhas: int, posicao: int) -> bytes:
+        """Sem rodapé nos formatos de texto."""
+        return b''
+
+    def _finalizar(self, dados: bytes) -> bytes:
+        """Comprime o bloco como um membro gzip independente (se pedido)."""
+        if not self._comprimir:
+            return dados
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        return compressor.compress(dados) + compressor.flush()
+
+
+class _CodificadorColunar:
+    """Codificação de blocos no formato colunar binário."""
+
+    def __init__(self, comprimir: bool):
+        """Define a compressão das colunas."""
+        self._comprimir = comprimir
+
+    def cabecalho(self) -> bytes:
+        """Assinatura, versão e compressão."""
+        return _CABECALHO.pack(_ASSINATURA, _VERSAO, int(self._comprimir))
+
+    def bloco(self, bloco: List[Tuple[int, Colunas]],
+              quantidade: int) -> Tuple[Callable[..., bytes], Any]:
+        """Junta as colunas do bloco; a serialização fica para ``_finalizar``."""
+        if len(bloco) == 1:
+            numero, colunas = bloco[0]
+            contas = array('q', [numero]) * quantidade
+            return self._finalizar, [contas, *colunas]
+        juntas = [array(codigo) for _, codigo in _COLUNAS]
+        for numero, colunas in bloco:
+            juntas[0].extend(array('q', [numero]) * len(colunas[0]))
+            for destino, coluna in zip(juntas[1:], colunas):
+                destino.extend(coluna)
+        return self._finalizar, juntas
+
+    def rodape(self, posicoes: List[int], linhas: int, posicao: int) -> bytes:
+        """Tabelas de textos, índice dos blocos e rodapé fixo (a partir de ``posicao``)."""
+        # Tabelas completas ao final: cobrem os códigos de todos os blocos
+        tabelas = json.dumps({'tipos': TIPOS.textos(),
+                              'descricoes': DESCRICOES.textos()},
+                             ensure_ascii=False).encode()
+        return b''.join((tabelas, array('q', posicoes).tobytes(),
+                         _RODAPE.pack(posicao, posicao + len(tabelas),
+                                      len(posicoes), linhas, _ASSINATURA)))
+
+    def _finalizar(self, colunas: List[array]) -> bytes:
+        """Serializa (e comprime, se pedido) as colunas de um bloco."""
+        dados = [coluna.tobytes() for coluna in colunas]
+        if self._comprimir:
+            dados = [zlib.compress(coluna, 6) for coluna in dados]
+        return _BLOCO.pack(len(colunas[0]), *map(len, dados)) + b''.join(dados)
+
+
+class ArquivoColunar:
+    """
+    Leitura de um arquivo gravado no formato ``colunar``.
+
+    Attributes:
+        linhas (int): Quantidade de transações
+        tipos (List[str]): Texto de cada código de tipo
+        descricoes (List[str]): Texto de cada código de descrição
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Abre o arquivo e lê as tabelas e o índice dos blocos.
+
+        Args:
+            caminho (str): Caminho do arquivo
+
+        Raises:
+            ValueError: Se o arquivo não estiver no formato colunar
+        """
+        self._caminho = caminho
+        with open(caminho, 'rb') as arquivo:
+            assinatura, versao, comprimido = _CABECALHO.unpack(arquivo.read(_CABECALHO.size))
+            arquivo.seek(-_RODAPE.size, os.SEEK_END)
+            tabelas, indice, blocos, self.linhas, final = _RODAPE.unpack(
+                arquivo.read(_RODAPE.size))
+            if assinatura != _ASSINATURA or final != _ASSINATURA or versao != _VERSAO:
+                raise ValueError(f"Arquivo colunar inválido: {caminho}")
+            arquivo.seek(tabelas)
+            textos = json.loads(arquivo.read(indice - tabelas).decode())
+            self._posicoes = array('q')
+            self._posicoes.frombytes(arquivo.read(blocos * 8))
+        self._comprimido = bool(comprimido)
+        self.tipos: List[str] = textos['tipos']
+        self.descricoes: List[str] = textos['descricoes']
+
+    def __len__(self) -> int:
+        """Quantidade de transações."""
+        return self.linhas
+
+    def blocos(self) -> Iterator[Dict[str, array]]:
+        """
+        Percorre os blocos, um de cada vez.
+
+        Yields:
+            Dict[str, array]: Colunas do bloco (``conta``, ``data_hora``,
+            ``tipo``, ``valor``, ``descricao`` e ``saldo_apos``)
+        """
+        with open(self._caminho, 'rb') as arquivo:
+            for posicao in self._posicoes:
+                arquivo.seek(posicao)
+                _, *tamanhos = _BLOCO.unpack(arquivo.read(_BLOCO.size))
+                bloco = {}
+                for (nome, codigo), tamanho in zip(_COLUNAS, tamanhos):
+                    dados = arquivo.read(tamanho)
+                    coluna = array(codigo)
+                    coluna.frombytes(zlib.decompress(dados) if self._comprimido else dados)
+                    bloco[nome] = coluna
+                yield bloco
+
+    def transacoes(self) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as transações como dicionários (valores em centavos).
+
+        Yields:
+            Dict: ``conta``, ``data_hora`` (µs desde a época), ``tipo``,
+            ``valor``, ``descricao`` e ``saldo_apos``
+        """
+        for bloco in self.blocos():
+            for conta, data_hora, tipo, valor, descricao, saldo in zip(
+                    *(bloco[nome] for nome, _ in _COLUNAS)):
+                yield {'conta': conta, 'data_hora': data_hora, 'tipo': self.tipos[tipo],
+                       'valor': valor, 'descricao': self.descricoes[descricao],
+                       'saldo_apos': saldo}
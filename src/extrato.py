@@ -0,0 +1,827 @@
+"""
+Sistema Bancário - Módulo Extrato
+Armazenamento colunar compacto do histórico de transações das contas.
+"""
+
+import functools
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+try:
+    from .dinheiro import para_centavos
+except ImportError:
+    from dinheiro import para_centavos
+
+# Época usada para converter data/hora (local, sem fuso) em inteiros
+_EPOCA = datetime(1970, 1, 1)
+_UM_MICROSSEGUNDO = timedelta(microseconds=1)
+_MICROSSEGUNDOS_DIA = 86_400_000_000
+_ORDINAL_EPOCA = _EPOCA.toordinal()
+
+
+def para_timestamp(data_hora: datetime) -> int:
+    """
+    Converte uma data/hora em microssegundos desde a época.
+
+    Args:
+        data_hora (datetime): Data/hora a converter
+
+    Returns:
+        int: Microssegundos desde 01/01/1970 00:00
+    """
+    return (data_hora - _EPOCA) // _UM_MICROSSEGUNDO
+
+
+def de_timestamp(timestamp: int) -> datetime:
+    """
+    Converte microssegundos desde a época em data/hora.
+
+    Args:
+        timestamp (int): Microssegundos desde 01/01/1970 00:00
+
+    Returns:
+        datetime: Data/hora correspondente
+    """
+    return _EPOCA + timedelta(microseconds=timestamp)
+
+
+def _chave_mes(ano: int, mes: int) -> int:
+    """Chave de um mês nos resumos mensais (meses desde o ano zero)."""
+    return ano * 12 + mes - 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _mes_do_dia(dia: int) -> int:
+    """Chave do mês de um dia (dias desde a época), em cache."""
+    data = _EPOCA + timedelta(days=dia)
+    return _chave_mes(data.year, data.month)
+
+
+class TabelaStrings:
+    """
+    Tabela de strings internadas, compartilhada entre todos os extratos.
+
+    Cada texto distinto é armazenado uma única vez e referenciado por um
+    código inteiro nas colunas do extrato.
+    """
+
+    def __init__(self, valores: tuple = ()):
+        """
+        Inicializa a tabela.
+
+        Args:
+            valores (tuple): Textos pré-cadastrados, na ordem dos códigos
+        """
+        self._valores: List[str] = []
+        self._codigos: Dict[str, int] = {}
+        self._trava = threading.Lock()
+        for valor in valores:
+            self.codigo(valor)
+
+    def codigo(self, texto: str) -> int:
+        """
+        Obtém o código de um texto, cadastrando-o se necessário.
+
+        Args:
+            texto (str): Texto a internar
+
+        Returns:
+            int: Código do texto na tabela
+        """
+        codigo = self._codigos.get(texto)
+        if codigo is None:
+            # Cadastro sob trava; textos já conhecidos não pagam por ela
+            with self._trava:
+                codigo = self._codigos.get(texto)
+                if codigo is None:
+                    codigo = len(self._valores)
+                    self._valores.append(texto)
+                    self._codigos[texto] = codigo
+        return codigo
+
+    def texto(self, codigo: int) -> str:
+        """
+        Obtém o texto correspondente a um código.
+
+        Args:
+            codigo (int): Código do texto
+
+        Returns:
+            str: Texto internado
+        """
+        return self._valores[codigo]
+
+    def textos(self) -> List[str]:
+        """
+        Obtém uma cópia dos textos da tabela.
+
+        Returns:
+            List[str]: Textos na ordem dos códigos
+        """
+        return list(self._valores)
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de textos distintos."""
+        return len(self._valores)
+
+
+# Tipos de transação conhecidos (códigos estáveis) e descrições compartilhadas
+TIPOS = TabelaStrings((
+    "CRIAÇÃO DE CONTA",
+    "DEPÓSITO",
+    "SAQUE",
+    "TRANSFERÊNCIA ENVIADA",
+    "TRANSFERÊNCIA RECEBIDA",
+    "PAGAMENTO",
+    "RENDIMENTO",
+    "TARIFA",
+))
+DESCRICOES = TabelaStrings()
+
+# Nomes das colunas do extrato (atributos ``_<nome>``)
+_COLUNAS = ('data_hora', 'tipo', 'valor', 'descricao', 'saldo_apos')
+
+
+def _acumular(linha: List[int], codigo: int, valor: int):
+    """
+    Soma uma transação à linha de resumo de um período.
+
+    A linha guarda, para cada código de tipo, três inteiros consecutivos:
+    quantidade de transações, entradas e saídas (em centavos). Ela cresce
+    só até o maior código usado no período.
+    """
+    posicao = 3 * codigo
+    if len(linha) <= posicao:
+        linha.extend([0] * (posicao + 3 - len(linha)))
+    linha[posicao] += 1
+    if valor > 0:
+        linha[posicao + 1] += valor
+    else:
+        linha[posicao + 2] += valor
+
+
+def _totais_resumo(linha: Optional[List[int]]) -> Dict[str, Any]:
+    """
+    Converte uma linha de resumo no formato de ``Extrato.totais``.
+
+    Args:
+        linha (List[int]): Linha de resumo do período (None = sem transações)
+
+    Returns:
+        Dict: Quantidade de transações, entradas, saídas, saldo do período,
+        total e quantidade por tipo de transação
+    """
+    linha = linha or ()
+    quantidade = entradas = saidas = 0
+    por_tipo: Dict[str, float] = {}
+    quantidade_por_tipo: Dict[str, int] = {}
+    for posicao in range(0, len(linha), 3):
+        vezes, credito, debito = linha[posicao:posicao + 3]
+        if not vezes:
+            continue
+        tipo = TIPOS.texto(posicao // 3)
+        quantidade += vezes
+        entradas += credito
+        saidas += debito
+        por_tipo[tipo] = (credito + debito) / 100
+        quantidade_por_tipo[tipo] = vezes
+
+    return {
+        'quantidade': quantidade,
+        'entradas': entradas / 100,
+        'saidas': saidas / 100,
+        'saldo_periodo': (entradas + saidas) / 100,
+        'por_tipo': por_tipo,
+        'quantidade_por_tipo': quantidade_por_tipo
+    }
+
+
+class Transacao(Mapping):
+    """
+    Transação do extrato, montada sob demanda a partir das colunas.
+
+    Registro com ``__slots__`` (sem dicionário por instância) que também
+    se comporta como um mapeamento somente leitura com as chaves do
+    formato anterior: ``transacao['valor']``, ``get``, ``keys``, ``items``
+    e ``dict(transacao)`` continuam funcionando, e uma transação é igual ao
+    dicionário com os mesmos campos.
+
+    Attributes:
+        data_hora (datetime): Data/hora da transação
+        tipo (str): Tipo da transação
+        valor (float): Valor da transação (em reais)
+        descricao (str): Descrição da transação
+        saldo_apos (float): Saldo da conta após a transação (em reais)
+    """
+
+    __slots__ = _COLUNAS
+
+    def __init__(self, data_hora: datetime, tipo: str, valor: float,
+                 descricao: str, saldo_apos: float):
+        """
+        Inicializa a transação.
+
+        Args:
+            data_hora (datetime): Data/hora da transação
+            tipo (str): Tipo da transação
+            valor (float): Valor da transação (em reais)
+            descricao (str): Descrição da transação
+            saldo_apos (float): Saldo da conta após a transação (em reais)
+        """
+        self.data_hora = data_hora
+        self.tipo = tipo
+        self.valor = valor
+        self.descricao = descricao
+        self.saldo_apos = saldo_apos
+
+    def __getitem__(self, chave: str) -> Any:
+        """Acesso a um campo pelo nome, como em um dicionário."""
+        if chave not in _COLUNAS:
+            raise KeyError(chave)
+        return getattr(self, chave)
+
+    def __iter__(self) -> Iterator[str]:
+        """Itera os nomes dos campos."""
+        return iter(_COLUNAS)
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de campos."""
+        return len(_COLUNAS)
+
+    def __reduce__(self):
+        """Serializa (pickle) apenas os valores dos campos."""
+        return (Transacao, tuple(getattr(self, nome) for nome in _COLUNAS))
+
+    def __repr__(self) -> str:
+        """Representação técnica da transação."""
+        campos = ', '.join(f"{nome}={getattr(self, nome)!r}" for nome in _COLUNAS)
+        return f"Transacao({campos})"
+
+
+class Extrato:
+    """
+    Histórico de transações armazenado em colunas paralelas.
+
+    Cada campo da transação ocupa uma coluna ``array`` com tipo primitivo:
+    data/hora em microssegundos desde a época, tipo e descrição como códigos
+    das tabelas compartilhadas, valor e saldo em centavos inteiros. As
+    transações são expostas como registros ``Transacao`` montados sob
+    demanda, com acesso por chave compatível com o formato anterior
+    (``data_hora``, ``tipo``, ``valor``, ``descricao``, ``saldo_apos``) e
+    valores em reais.
+
+    O extrato também mantém resumos por dia e por mês (quantidade,
+    entradas e saídas por tipo). Eles são calculados no primeiro
+    ``resumo_dia`` ou ``resumo_mes``, com uma passada pelas colunas, e daí
+    em diante atualizados a cada transação registrada: as consultas
+    seguintes custam O(1), qualquer que seja o tamanho do histórico, e
+    extratos nunca consultados não pagam memória nem tempo por eles.
+    """
+
+    __slots__ = tuple('_' + nome for nome in _COLUNAS) + ('_por_dia', '_por_mes')
+
+    def __init__(self):
+        """Inicializa um extrato vazio."""
+        self._data_hora = array('q')
+        self._tipo = array('H')
+        self._valor = array('q')
+        self._descricao = array('I')
+        self._saldo_apos = array('q')
+        # Linhas de resumo (ver ``_acumular``) por dia desde a época e por
+        # mês (``_chave_mes``); None enquanto não forem consultadas
+        self._por_dia: Optional[Dict[int, List[int]]] = None
+        self._por_mes: Optional[Dict[int, List[int]]] = None
+
+    def registrar(self, data_hora: datetime, tipo: str, valor: int,
+                  descricao: str, saldo_apos: int):
+        """
+        Acrescenta uma transação ao final do extrato.
+
+        Args:
+            data_hora (datetime): Data/hora da transação
+            tipo (str): Tipo da transação
+            valor (int): Valor da transação em centavos
+            descricao (str): Descrição da transação
+            saldo_apos (int): Saldo da conta após a transação, em centavos
+        """
+        self.registrar_timestamp(para_timestamp(data_hora), tipo, valor,
+                                 descricao, saldo_apos)
+
+    def registrar_timestamp(self, timestamp: int, tipo: str, valor: int,
+                            descricao: str, saldo_apos: int):
+        """
+        Acrescenta uma transação com data/hora já convertida em timestamp.
+
+        Args:
+            timestamp (int): Microssegundos desde a época
+            tipo (str): Tipo da transação
+            valor (int): Valor da transação em centavos
+            descricao (str): Descrição da transação
+            saldo_apos (int): Saldo da conta após a transação, em centavos
+
+        Raises:
+            OverflowError: Se um valor exceder 64 bits (nada é registrado)
+        """
+        # Mantém a coluna de datas ordenada mesmo se o relógio retroceder,
+        # garantindo a busca binária por período
+        if self._data_hora and timestamp < self._data_hora[-1]:
+            timestamp = self._data_hora[-1]
+        inicio = len(self._valor)
+        try:
+            self._data_hora.append(timestamp)
+            self._tipo.append(TIPOS.codigo(tipo))
+            self._valor.append(valor)
+            self._descricao.append(DESCRICOES.codigo(descricao))
+            self._saldo_apos.append(saldo_apos)
+        except Exception:
+            self._desfazer(inicio)
+            raise
+        if self._por_dia is not None:
+            self._resumir(inicio)
+
+    def registrar_lote(self, timestamp: int,
+                       transacoes: List[Tuple[str, int, str]],
+                       saldo_inicial: int) -> int:
+        """
+        Acrescenta várias transações de uma vez, com a mesma data/hora.
+
+        Args:
+            timestamp (int): Microssegundos desde a época
+            transacoes (List[Tuple]): Tuplas ``(tipo, valor em centavos, descricao)``
+            saldo_inicial (int): Saldo antes da primeira transação, em centavos
+
+        Returns:
+            int: Saldo após a última transação, em centavos
+
+        Raises:
+            OverflowError: Se um valor exceder 64 bits (nada é registrado)
+        """
+        if len(transacoes) == 1:
+            tipo, valor, descricao = transacoes[0]
+            self.registrar_timestamp(timestamp, tipo, valor, descricao,
+                                     saldo_inicial + valor)
+            return saldo_inicial + valor
+
+        if self._data_hora and timestamp < self._data_hora[-1]:
+            timestamp = self._data_hora[-1]
+        tipos, valores, descricoes, saldos = [], [], [], []
+        saldo = saldo_inicial
+        for tipo, valor, descricao in transacoes:
+            saldo += valor
+            tipos.append(TIPOS.codigo(tipo))
+            valores.append(valor)
+            descricoes.append(DESCRICOES.codigo(descricao))
+            saldos.append(saldo)
+
+        inicio = len(self._valor)
+        try:
+            self._data_hora.extend([timestamp] * len(transacoes))
+            self._tipo.extend(tipos)
+            self._valor.extend(valores)
+            self._descricao.extend(descricoes)
+            self._saldo_apos.extend(saldos)
+        except Exception:
+            self._desfazer(inicio)
+            raise
+        if self._por_dia is not None:
+            self._resumir(inicio)
+        return saldo
+
+    def registrar_codificadas(self, timestamp: int,
+                              transacoes: List[Tuple[int, int, int]],
+                              saldo_inicial: int) -> int:
+        """
+        Mesmo que ``registrar_lote``, com tipo e descrição já convertidos.
+
+        Para operações que gravam o mesmo tipo e descrição em muitas
+        contas, que consultam as tabelas uma única vez.
+
+        Args:
+            timestamp (int): Microssegundos desde a época
+            transacoes (List[Tuple]): Tuplas ``(codigo do tipo, valor em
+                centavos, codigo da descricao)``, com códigos de ``TIPOS`` e
+                ``DESCRICOES``
+            saldo_inicial (int): Saldo antes da primeira transação, em centavos
+
+        Returns:
+            int: Saldo após a última transação, em centavos
+
+        Raises:
+            OverflowError: Se um valor exceder 64 bits (nada é registrado)
+        """
+        if self._data_hora and timestamp < self._data_hora[-1]:
+            timestamp = self._data_hora[-1]
+        saldo = saldo_inicial
+        inicio = len(self._valor)
+        try:
+            for tipo, valor, descricao in transacoes:
+                saldo += valor
+                self._data_hora.append(timestamp)
+                self._tipo.append(tipo)
+                self._valor.append(valor)
+                self._descricao.append(descricao)
+                self._saldo_apos.append(saldo)
+        except Exception:
+            self._desfazer(inicio)
+            raise
+        if self._por_dia is not None:
+            self._resumir(inicio)
+        return saldo
+
+    def _desfazer(self, tamanho: int):
+        """
+        Descarta as transações a partir de uma posição, em todas as colunas.
+
+        Usado quando um registro falha no meio (ex.: valor fora dos 64
+        bits): cada transação entra em todas as colunas ou em nenhuma.
+
+        Args:
+            tamanho (int): Quantidade de transações a manter
+        """
+        for nome in _COLUNAS:
+            del getattr(self, '_' + nome)[tamanho:]
+
+    def append(self, transacao: Mapping):
+        """
+        Acrescenta uma transação no formato de dicionário (ou ``Transacao``).
+
+        Args:
+            transacao (Mapping): Transação com as chaves do extrato (valores em reais)
+        """
+        self.registrar(transacao['data_hora'], transacao['tipo'],
+                       para_centavos(transacao['valor']), transacao['descricao'],
+                       para_centavos(transacao['saldo_apos']))
+
+    def transacao(self, indice: int) -> Transacao:
+        """
+        Monta a transação de uma posição.
+
+        Args:
+            indice (int): Posição da transação (0 = mais antiga)
+
+        Returns:
+            Transacao: Transação com data/hora, tipo, valor, descrição e saldo
+        """
+        return Transacao(de_timestamp(self._data_hora[indice]),
+                         TIPOS.texto(self._tipo[indice]),
+                         self._valor[indice] / 100,
+                         DESCRICOES.texto(self._descricao[indice]),
+                         self._saldo_apos[indice] / 100)
+
+    def brutos(self, inicio: int = 0) -> Iterator[Tuple[int, str, int, str]]:
+        """
+        Percorre as transações a partir de uma posição, em forma primitiva.
+
+        Usado pelo diário de operações, que grava as transações sem montar
+        dicionários nem converter valores.
+
+        Args:
+            inicio (int): Posição da primeira transação (0 = mais antiga)
+
+        Yields:
+            Tuple: ``(timestamp, tipo, valor em centavos, descricao)``
+        """
+        for indice in range(inicio, len(self._valor)):
+            yield (self._data_hora[indice], TIPOS.texto(self._tipo[indice]),
+                   self._valor[indice],
+                   DESCRICOES.texto(self._descricao[indice]))
+
+    def colunas(self, inicio: int = 0,
+                fim: Optional[int] = None) -> Tuple[array, array, array, array, array]:
+        """
+        Copia uma faixa das colunas do extrato.
+
+        Args:
+            inicio (int): Posição da primeira transação (0 = mais antiga)
+            fim (int): Posição final, exclusiva (None = até a última)
+
+        Returns:
+            Tuple: Colunas ``data_hora``, ``tipo`` (códigos de ``TIPOS``),
+            ``valor``, ``descricao`` (códigos de ``DESCRICOES``) e
+            ``saldo_apos``, nessa ordem
+        """
+        if fim is None:
+            # Última coluna preenchida por ``registrar_timestamp``: as demais
+            # têm ao menos esse tamanho mesmo com uma transação em andamento
+            fim = len(self._saldo_apos)
+        return (self._data_hora[inicio:fim], self._tipo[inicio:fim],
+                self._valor[inicio:fim], self._descricao[inicio:fim],
+                self._saldo_apos[inicio:fim])
+
+    def exportar_colunas(self) -> Dict[str, bytes]:
+        """
+        Copia as colunas do extrato em formato binário.
+
+        Os códigos de tipo e descrição referem-se às tabelas ``TIPOS`` e
+        ``DESCRICOES`` deste processo.
+
+        Returns:
+            Dict[str, bytes]: Conteúdo de cada coluna
+        """
+        return {nome: getattr(self, '_' + nome).tobytes() for nome in _COLUNAS}
+
+    @classmethod
+    def de_colunas(cls, colunas: Dict[str, bytes],
+                   mapa_tipos: Optional[List[int]] = None,
+                   mapa_descricoes: Optional[List[int]] = None) -> 'Extrato':
+        """
+        Reconstrói um extrato a partir de colunas exportadas.
+
+        Args:
+            colunas (Dict[str, bytes]): Colunas de ``exportar_colunas``
+            mapa_tipos (List[int]): Código atual de cada código de tipo
+                exportado (None = códigos idênticos)
+            mapa_descricoes (List[int]): Código atual de cada código de
+                descrição exportado (None = códigos idênticos)
+
+        Returns:
+            Extrato: Extrato com as transações das colunas
+        """
+        extrato = cls()
+        for nome in _COLUNAS:
+            getattr(extrato, '_' + nome).frombytes(colunas[nome])
+        if mapa_tipos is not None:
+            extrato._tipo = array('H', [mapa_tipos[c] for c in extrato._tipo])
+        if mapa_descricoes is not None:
+            extrato._descricao = array('I', [mapa_descricoes[c]
+                                             for c in extrato._descricao])
+        return extrato
+
+    def _resumir(self, inicio: int):
+        """
+        Soma aos resumos as transações recém-registradas (mesma data/hora).
+
+        Args:
+            inicio (int): Posição da primeira transação registrada
+        """
+        dia = self._data_hora[inicio] // _MICROSSEGUNDOS_DIA
+        linha_dia = self._por_dia.get(dia)
+        if linha_dia is None:
+            linha_dia = self._por_dia[dia] = []
+        mes = _mes_do_dia(dia)
+        linha_mes = self._por_mes.get(mes)
+        if linha_mes is None:
+            linha_mes = self._por_mes[mes] = []
+        for indice in range(inicio, len(self._valor)):
+            codigo = self._tipo[indice]
+            valor = self._valor[indice]
+            _acumular(linha_dia, codigo, valor)
+            _acumular(linha_mes, codigo, valor)
+
+    def _calcular_resumos(self):
+        """Calcula os resumos por dia e por mês a partir das colunas."""
+        por_dia: Dict[int, List[int]] = {}
+        por_mes: Dict[int, List[int]] = {}
+        datas = self._data_hora
+        tipos = self._tipo
+        valores = self._valor
+        inicio = 0
+        # Datas ordenadas: cada dia é uma faixa contínua das colunas,
+        # somada por tipo e sinal antes de chegar às linhas
+        while inicio < len(datas):
+            dia = datas[inicio] // _MICROSSEGUNDOS_DIA
+            fim = bisect_left(datas, (dia + 1) * _MICROSSEGUNDOS_DIA, inicio)
+            somas: Dict[int, List[int]] = {}
+            for codigo, valor in zip(tipos[inicio:fim], valores[inicio:fim]):
+                soma = somas.get(codigo)
+                if soma is None:
+                    soma = somas[codigo] = [0, 0, 0]
+                soma[0] += 1
+                soma[1 if valor > 0 else 2] += valor
+            linha_dia = por_dia[dia] = []
+            mes = _mes_do_dia(dia)
+            linha_mes = por_mes.get(mes)
+            if linha_mes is None:
+                linha_mes = por_mes[mes] = []
+            for linha in (linha_dia, linha_mes):
+                for codigo, soma in somas.items():
+                    posicao = 3 * codigo
+                    if len(linha) <= posicao:
+                        linha.extend([0] * (posicao + 3 - len(linha)))
+                    linha[posicao] += soma[0]
+                    linha[posicao + 1] += soma[1]
+                    linha[posicao + 2] += soma[2]
+            inicio = fim
+        self._por_dia = por_dia
+        self._por_mes = por_mes
+
+    def resumo_dia(self, data: date) -> Dict[str, Any]:
+        """
+        Obtém os totais de um dia pelos resumos (O(1) após a primeira consulta).
+
+        Args:
+            data (date): Dia a consultar (um ``datetime`` vale pelo seu dia)
+
+        Returns:
+            Dict: Mesmo formato de ``totais``, com ``quantidade_por_tipo``
+        """
+        if self._por_dia is None:
+            self._calcular_resumos()
+        return _totais_resumo(self._por_dia.get(data.toordinal() - _ORDINAL_EPOCA))
+
+    def resumo_mes(self, ano: int, mes: int) -> Dict[str, Any]:
+        """
+        Obtém os totais de um mês pelos resumos (O(1) após a primeira consulta).
+
+        Args:
+            ano (int): Ano
+            mes (int): Mês (1 a 12)
+
+        Returns:
+            Dict: Mesmo formato de ``totais``, com ``quantidade_por_tipo``
+
+        Raises:
+            ValueError: Se o mês for inválido
+        """
+        if not 1 <= mes <= 12:
+            raise ValueError("Mês deve estar entre 1 e 12")
+        if self._por_mes is None:
+            self._calcular_resumos()
+        return _totais_resumo(self._por_mes.get(_chave_mes(ano, mes)))
+
+    def _limites(self, inicio: Optional[datetime],
+                 fim: Optional[datetime]) -> Tuple[int, int]:
+        """
+        Calcula as posições ``[primeira, ultima)`` de um intervalo de datas.
+
+        Args:
+            inicio (datetime): Data/hora inicial, inclusiva (None = sem limite)
+            fim (datetime): Data/hora final, exclusiva (None = sem limite)
+
+        Returns:
+            Tuple[int, int]: Faixa de posições do extrato no intervalo
+        """
+        datas = self._data_hora
+        # A coluna de datas é ordenada: busca binária em O(log n)
+        ultima = len(datas) if fim is None else bisect_left(datas, para_timestamp(fim))
+        primeira = 0 if inicio is None else bisect_left(datas, para_timestamp(inicio),
+                                                         0, ultima)
+        return primeira, ultima
+
+    def iterar(self, desc: bool = True, offset: int = 0,
+               limit: Optional[int] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None) -> Iterator[Transacao]:
+        """
+        Percorre o extrato sem copiá-lo.
+
+        Args:
+            desc (bool): Se True, da transação mais recente para a mais antiga
+            offset (int): Quantidade de transações a pular
+            limit (int): Quantidade máxima de transações (None = todas)
+            since (datetime): Data/hora inicial, inclusiva
+            until (datetime): Data/hora final, exclusiva
+
+        O intervalo de datas é localizado por busca binária, de modo que o
+        custo é O(log n + k) para k transações percorridas.
+
+        Yields:
+            Transacao: Transações montadas sob demanda
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset e limite não podem ser negativos")
+
+        primeira, ultima = self._limites(since, until)
+        posicoes = (range(ultima - 1, primeira - 1, -1) if desc
+                    else range(primeira, ultima))
+        fim = None if limit is None else offset + limit
+        for indice in posicoes[offset:fim]:
+            yield self.transacao(indice)
+
+    def totais(self, inicio: Optional[datetime] = None,
+               fim: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Soma as transações de um período sem montar dicionários por transação.
+
+        As somas são feitas em centavos inteiros e convertidas para reais
+        apenas no resultado.
+
+        Args:
+            inicio (datetime): Data/hora inicial, inclusiva (None = sem limite)
+            fim (datetime): Data/hora final, exclusiva (None = sem limite)
+
+        Returns:
+            Dict: Quantidade de transações, entradas, saídas, saldo do período
+            e total por tipo de transação
+        """
+        primeira, ultima = self._limites(inicio, fim)
+        entradas = 0
+        saidas = 0
+        por_codigo: Dict[int, int] = {}
+        tipos = self._tipo
+        for indice in range(primeira, ultima):
+            valor = self._valor[indice]
+            if valor > 0:
+                entradas += valor
+            else:
+                saidas += valor
+            codigo = tipos[indice]
+            por_codigo[codigo] = por_codigo.get(codigo, 0) + valor
+
+        return {
+            'quantidade': ultima - primeira,
+            'entradas': entradas / 100,
+            'saidas': saidas / 100,
+            'saldo_periodo': (entradas + saidas) / 100,
+            'por_tipo': {TIPOS.texto(codigo): total / 100
+                         for codigo, total in por_codigo.items()}
+        }
+
+    def pagina(self, cursor: Optional[int] = None, limite: int = 10,
+               desc: bool = True) -> Tuple[List[Transacao], Optional[int]]:
+        """
+        Obtém uma página do extrato a partir de um cursor.
+
+        O cursor é a posição absoluta da próxima transação a exibir; como o
+        extrato só recebe novas transações no final, ele permanece válido
+        entre chamadas.
+
+        Args:
+            cursor (int): Cursor retornado pela página anterior (None = início)
+            limite (int): Quantidade máxima de transações na página
+            desc (bool): Se True, pagina da mais recente para a mais antiga
+
+        Returns:
+            Tuple: Transações da página e o cursor da próxima (ou None)
+        """
+        if limite <= 0:
+            raise ValueError("Limite da página deve ser maior que zero")
+
+        total = len(self)
+        if desc:
+            inicio = total - 1 if cursor is None else min(cursor, total - 1)
+            fim = max(inicio - limite, -1)
+            transacoes = [self.transacao(i) for i in range(inicio, fim, -1)]
+            proximo = fim if fim >= 0 else None
+        else:
+            inicio = 0 if cursor is None else max(cursor, 0)
+            fim = min(inicio + limite, total)
+            transacoes = [self.transacao(i) for i in range(inicio, fim)]
+            proximo = fim if fim < total else None
+        return transacoes, proximo
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de transações."""
+        return len(self._valor)
+
+    def __getitem__(self, indice: Union[int, slice]):
+        """Acesso por posição ou fatia, em ordem cronológica."""
+        if isinstance(indice, slice):
+            return [self.transacao(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice fora do extrato")
+        return self.transacao(indice)
+
+    def __iter__(self) -> Iterator[Transacao]:
+        """Itera as transações em ordem cronológica."""
+        for i in range(len(self)):
+            yield self.transacao(i)
+
+    def __reversed__(self) -> Iterator[Transacao]:
+        """Itera as transações da mais recente para a mais antiga."""
+        for i in range(len(self) - 1, -1, -1):
+            yield self.transacao(i)
+
+
+class VisaoExtrato:
+    """
+    Visão somente leitura do extrato em ordem cronológica inversa.
+
+    Não copia as colunas do extrato: as transações são montadas apenas
+    quando acessadas.
+    """
+
+    __slots__ = ('_extrato',)
+
+    def __init__(self, extrato: Extrato):
+        """
+        Inicializa a visão.
+
+        Args:
+            extrato (Extrato): Extrato de origem
+        """
+        self._extrato = extrato
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de transações."""
+        return len(self._extrato)
+
+    def __getitem__(self, indice: Union[int, slice]):
+        """Acesso por posição ou fatia (0 = mais recente)."""
+        total = len(self._extrato)
+        if isinstance(indice, slice):
+            return [self._extrato.transacao(total - 1 - i)
+                    for i in range(*indice.indices(total))]
+        if indice < 0:
+            indice += total
+        if not 0 <= indice < total:
+            raise IndexError("Índice fora do extrato")
+        return self._extrato.transacao(total - 1 - indice)
+
+    def __iter__(self) -> Iterator[Transacao]:
+        """Itera as transações da mais recente para a mais antiga."""
+        return reversed(self._extrato)
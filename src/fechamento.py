@@ -0,0 +1,347 @@
+"""
+Sistema Bancário - Módulo Fechamento
+Juros, tarifas e demais lançamentos periódicos aplicados em lote a todas as contas.
+
+Cada regra calcula o lançamento de todas as contas de uma vez, sobre o
+vetor de saldos em centavos (``numpy`` se instalado; caso contrário, um
+``array`` com o mesmo cálculo em Python). O processamento percorre as
+contas em blocos: as contas do bloco são travadas juntas (em ordem de
+número), os saldos são lidos para o vetor, as regras são aplicadas em
+sequência e os resultados voltam às contas, com um único registro no
+diário e uma única atualização dos agregados por bloco.
+
+Exemplo:
+    >>> from src import fechamento
+    >>> fechamento.aplicar_em_lote(sistema, [
+    ...     fechamento.Juros("0.005", "Rendimento mensal"),
+    ...     fechamento.Tarifa("12.90", "Tarifa de manutenção", isento_a_partir_de=5000),
+    ... ])
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence
+try:
+    from .dinheiro import LIMITE_CENTAVOS, Valor, para_centavos
+    from .extrato import DESCRICOES, TIPOS
+    from .relogio import timestamp_agora
+except ImportError:
+    from dinheiro import LIMITE_CENTAVOS, Valor, para_centavos
+    from extrato import DESCRICOES, TIPOS
+    from relogio import timestamp_agora
+
+try:
+    import numpy
+except ImportError:  # Dependência opcional: sem ela, cálculo em Python
+    numpy = None
+
+# Maior valor de um inteiro de 64 bits (limite dos vetores)
+_MAXIMO_64 = 2 ** 63 - 1
+
+
+def vetorizado() -> bool:
+    """
+    Informa se os cálculos usam ``numpy``.
+
+    Returns:
+        bool: True se o ``numpy`` estiver instalado
+    """
+    return numpy is not None
+
+
+def _vetor(valores: Sequence[int]) -> Any:
+    """Cria um vetor de inteiros de 64 bits (numpy ou ``array``)."""
+    if numpy is not None:
+        return numpy.array(valores, dtype=numpy.int64)
+    return array('q', valores)
+
+
+def _dividir_arredondando(numerador: int, denominador: int) -> int:
+    """Divisão inteira arredondada ao mais próximo (empates para o par)."""
+    quociente, resto = divmod(numerador, denominador)
+    if 2 * resto > denominador or (2 * resto == denominador and quociente % 2):
+        quociente += 1
+    return quociente
+
+
+class Regra(ABC):
+    """
+    Lançamento calculado para todas as contas de um bloco.
+
+    Subclasses implementam ``calcular``, que recebe o vetor de saldos (em
+    centavos) e devolve um vetor de mesmo tamanho com o valor de cada
+    lançamento: positivo para crédito, negativo para débito e zero para
+    nenhum lançamento.
+
+    Attributes:
+        tipo (str): Tipo das transações no extrato
+        descricao (str): Descrição das transações no extrato
+    """
+
+    tipo = "LANÇAMENTO"
+
+    def __init__(self, descricao: str):
+        """
+        Inicializa a regra.
+
+        Args:
+            descricao (str): Descrição das transações no extrato
+
+        Raises:
+            ValueError: Se a descrição for vazia
+        """
+        if not descricao or not descricao.strip():
+            raise ValueError("Descrição do lançamento é obrigatória")
+        self.descricao = descricao.strip()
+
+    @abstractmethod
+    def calcular(self, saldos: Any) -> Any:
+        """
+        Calcula os lançamentos de um bloco de contas.
+
+        Args:
+            saldos: Vetor de saldos em centavos (``numpy.ndarray`` ou
+                ``array('q')``)
+
+        Returns:
+            Vetor de valores em centavos, do mesmo tipo e tamanho
+        """
+
+
+class Juros(Regra):
+    """
+    Rendimento proporcional ao saldo, creditado em cada conta.
+
+    O valor é ``saldo * taxa`` arredondado ao centavo mais próximo (empates
+    para o par, como em ``para_centavos``), calculado em inteiros exatos.
+    """
+
+    tipo = "RENDIMENTO"
+
+    def __init__(self, taxa: Valor, descricao: str = "Rendimento",
+                 saldo_minimo: Valor = 0):
+        """
+        Inicializa a regra.
+
+        Args:
+            taxa (Valor): Taxa do período (ex.: ``"0.005"`` para 0,5%)
+            descricao (str): Descrição das transações no extrato
+            saldo_minimo (Valor): Saldo mínimo (em reais) para render
+
+        Raises:
+            ValueError: Se a taxa for negativa ou inválida
+        """
+        super().__init__(descricao)
+        if isinstance(taxa, str):
+            taxa = taxa.strip().replace(',', '.')
+        try:
+            taxa = Decimal(str(taxa)) if isinstance(taxa, float) else Decimal(taxa)
+        except ArithmeticError:
+            raise ValueError(f"Taxa inválida: {taxa}") from None
+        if not taxa.is_finite() or taxa < 0:
+            raise ValueError(f"Taxa inválida: {taxa}")
+        self.taxa = taxa
+        # Taxa como fração exata: juros = saldo * numerador / denominador
+        self._numerador, self._denominador = taxa.as_integer_ratio()
+        self._minimo = max(para_centavos(saldo_minimo), 1)
+
+    def calcular(self, saldos: Any) -> Any:
+        """Juros de cada conta, em centavos (zero abaixo do saldo mínimo)."""
+        numerador, denominador, minimo = self._numerador, self._denominador, self._minimo
+        if numpy is not None and len(saldos) and (
+                numerador == 0 or int(saldos.max()) <= _MAXIMO_64 // (2 * numerador)):
+            quociente, resto = numpy.divmod(saldos * numerador, denominador)
+            # Arredondamento para o par, como _dividir_arredondando
+            quociente += (2 * resto > denominador) | (
+                (2 * resto == denominador) & (quociente % 2 == 1))
+            quociente[saldos < minimo] = 0
+            return quociente
+        # Sem numpy (ou com saldos grandes demais para 64 bits): inteiros do
+        # Python, limitados a 64 bits (juros tão altos passam do limite de
+        # saldo e são recusados por ``_limitar_lancamentos``)
+        if numpy is not None:
+            saldos = saldos.tolist()
+        juros = [_dividir_arredondando(saldo * numerador, denominador)
+                 if saldo >= minimo else 0 for saldo in saldos]
+        try:
+            return _vetor(juros)
+        except OverflowError:
+            return _vetor([min(valor, _MAXIMO_64) for valor in juros])
+
+
+class Tarifa(Regra):
+    """
+    Valor fixo debitado de cada conta.
+
+    Contas sem saldo suficiente não são tarifadas (e são contadas no
+    relatório de ``aplicar_em_lote``).
+    """
+
+    tipo = "TARIFA"
+
+    def __init__(self, valor: Valor, descricao: str = "Tarifa",
+                 isento_a_partir_de: Optional[Valor] = None):
+        """
+        Inicializa a regra.
+
+        Args:
+            valor (Valor): Valor da tarifa (em reais)
+            descricao (str): Descrição das transações no extrato
+            isento_a_partir_de (Valor): Saldo (em reais) a partir do qual a
+                conta é isenta (None = nenhuma isenção)
+
+        Raises:
+            ValueError: Se o valor não for positivo
+        """
+        super().__init__(descricao)
+        self._centavos = para_centavos(valor)
+        if self._centavos <= 0:
+            raise ValueError("Valor da tarifa deve ser maior que zero")
+        self._isencao = (None if isento_a_partir_de is None
+                         else para_centavos(isento_a_partir_de))
+
+    def calcular(self, saldos: Any) -> Any:
+        """Tarifa de cada conta, em centavos (negativa; zero se isenta)."""
+        centavos, isencao = self._centavos, self._isencao
+        if numpy is not None:
+            tarifas = numpy.full(len(saldos), -centavos, dtype=numpy.int64)
+            if isencao is not None:
+                tarifas[saldos >= isencao] = 0
+            return tarifas
+        if isencao is None:
+            return array('q', [-centavos]) * len(saldos)
+        return array('q', [0 if saldo >= isencao else -centavos for saldo in saldos])
+
+
+def _limitar_lancamentos(saldos: Any, valores: Any) -> tuple:
+    """
+    Zera os débitos maiores que o saldo e os créditos que passariam do
+    limite de saldo (comparados sem somar, o que excederia 64 bits).
+
+    Returns:
+        tuple: (valores aplicáveis, novos saldos, quantidade de débitos
+        recusados, quantidade de créditos recusados)
+    """
+    if numpy is not None:
+        sem_saldo = (valores < 0) & (saldos < -valores)
+        excedidos = (valores > 0) & (saldos > LIMITE_CENTAVOS - valores)
+        quantidade, excedentes = int(sem_saldo.sum()), int(excedidos.sum())
+        if quantidade or excedentes:
+            valores = numpy.where(sem_saldo | excedidos, 0, valores)
+        return valores, saldos + valores, quantidade, excedentes
+    quantidade = excedentes = 0
+    aplicados = array('q', valores)
+    novos = array('q', saldos)
+    for posicao, (saldo, valor) in enumerate(zip(saldos, valores)):
+        if saldo + valor < 0:
+            aplicados[posicao] = 0
+            quantidade += 1
+            continue
+        try:
+            novos[posicao] = saldo + valor
+        except OverflowError:
+            # O limite de saldo é o maior valor do vetor de 64 bits
+            aplicados[posicao] = 0
+            excedentes += 1
+    return aplicados, novos, quantidade, excedentes
+
+
+def aplicar_em_lote(sistema: Any, regras: Sequence[Regra],
+                    tamanho_bloco: int = 50000) -> Dict[str, Any]:
+    """
+    Aplica regras de lançamento a todas as contas do sistema.
+
+    As regras são aplicadas em sequência sobre o saldo resultante da
+    anterior (ex.: a tarifa considera os juros já creditados). Todos os
+    lançamentos têm a mesma data/hora. Cada bloco é aplicado de forma
+    atômica: as contas do bloco ficam travadas enquanto os lançamentos são
+    calculados e gravados, e os demais blocos seguem sendo usados pelas
+    outras operações normalmente.
+
+    Args:
+        sistema (SistemaBancario): Sistema cujas contas serão processadas
+        regras (Sequence[Regra]): Regras a aplicar, em ordem
+        tamanho_bloco (int): Quantidade de contas travadas por vez
+
+    Returns:
+        Dict: ``contas`` (processadas), ``lancamentos`` (total) e
+        ``regras`` (por regra: ``tipo``, ``descricao``, ``lancamentos``,
+        ``total`` em reais, ``sem_saldo`` (débitos recusados) e
+        ``limite_excedido`` (créditos recusados por passarem do limite de
+        saldo))
+
+    Raises:
+        ValueError: Se não houver regras ou o tamanho do bloco for inválido
+    """
+    if not regras:
+        raise ValueError("Nenhuma regra informada")
+    if tamanho_bloco <= 0:
+        raise ValueError("Tamanho do bloco deve ser maior que zero")
+
+    relatorio = {'contas': 0, 'lancamentos': 0, 'regras': [
+        {'tipo': regra.tipo, 'descricao': regra.descricao, 'lancamentos': 0,
+         'total': 0, 'sem_saldo': 0, 'limite_excedido': 0} for regra in regras]}
+    timestamp = timestamp_agora()
+    # Números cadastrados no início (contas criadas durante o processamento ficam de fora)
+    numeros = iter(list(sistema.contas))
+    while True:
+        bloco = sorted(islice(numeros, tamanho_bloco))
+        if not bloco:
+            break
+        _aplicar_bloco(sistema, bloco, regras, timestamp, relatorio)
+
+    for resumo in relatorio['regras']:
+        relatorio['lancamentos'] += resumo['lancamentos']
+        resumo['total'] /= 100
+    sistema._aguardar_persistencia()
+    return relatorio
+
+
+def _aplicar_bloco(sistema: Any, numeros: List[int], regras: Sequence[Regra],
+                   timestamp: int, relatorio: Dict[str, Any]):
+    """Aplica as regras a um bloco de contas (números em ordem crescente)."""
+    contas = [conta for conta in map(sistema.contas.get, numeros) if conta is not None]
+    travadas = []
+    try:
+        for conta in contas:
+            conta._trava.acquire()
+            travadas.append(conta._trava)
+        # Removidas por outra thread antes da trava
+        contas = [conta for conta in contas if conta._sistema is sistema]
+        if not contas:
+            return
+
+        saldos = _vetor([conta._centavos for conta in contas])
+        colunas = []
+        for regra, resumo in zip(regras, relatorio['regras']):
+            valores, saldos, recusados, excedidos = _limitar_lancamentos(
+                saldos, regra.calcular(saldos))
+            resumo['sem_saldo'] += recusados
+            resumo['limite_excedido'] += excedidos
+            if numpy is not None:
+                resumo['lancamentos'] += int(numpy.count_nonzero(valores))
+                valores = valores.tolist()
+            else:
+                resumo['lancamentos'] += sum(1 for valor in valores if valor)
+            # Soma em inteiros do Python (o total do bloco pode passar de 64 bits)
+            resumo['total'] += sum(valores)
+            # Tipo e descrição convertidos uma única vez para todo o bloco
+            colunas.append((TIPOS.codigo(regra.tipo), valores,
+                            DESCRICOES.codigo(regra.descricao)))
+
+        movimentos = []
+        for posicao, conta in enumerate(contas):
+            lancamentos = [(tipo, valores[posicao], descricao)
+                           for tipo, valores, descricao in colunas if valores[posicao]]
+            if lancamentos:
+                movimentos.append(conta._registrar_lote(lancamentos, timestamp,
+                                                        codificadas=True))
+        relatorio['contas'] += len(contas)
+        if movimentos:
+            # Um único registro no diário por bloco
+            sistema._ao_movimentar(movimentos)
+    finally:
+        for trava in reversed(travadas):
+            trava.release()
@@ -0,0 +1,197 @@
+"""
+Sistema Bancário - Módulo Idempotência
+Cache de chaves de idempotência das operações que alteram o sistema.
+
+Clientes que repetem uma operação depois de um tempo esgotado enviam a
+mesma chave (``chave_idempotencia``); a repetição recebe o resultado
+original, sem executar a operação de novo. O cache é limitado em
+quantidade e em tempo: cada chave expira após a validade e, com o cache
+cheio, as mais antigas são descartadas.
+
+Em um sistema persistente, a chave é gravada no mesmo registro do diário
+da operação (e nos snapshots), de modo que a operação e sua chave
+sobrevivem juntas a uma reinicialização. Cada chave guarda também a
+sequência desse registro: uma repetição só é confirmada depois que o
+registro original estiver gravado em disco.
+
+Exemplo:
+    >>> conta.depositar(100, chave_idempotencia="pedido-8f2c")
+    True
+    >>> conta.depositar(100, chave_idempotencia="pedido-8f2c")  # repetição
+    True
+    >>> conta.saldo
+    100.0
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, List
+try:
+    from .relogio import timestamp_agora
+except ImportError:
+    from relogio import timestamp_agora
+
+# Resultado de ``consultar`` para chaves desconhecidas ou expiradas
+AUSENTE = object()
+
+
+class CacheIdempotencia:
+    """
+    Resultado de cada operação por chave de idempotência.
+
+    As chaves ficam em ordem de registro; como todas têm a mesma validade,
+    essa também é a ordem de expiração, e tanto as expiradas quanto as
+    excedentes são descartadas pelo início, em O(1) por chave.
+
+    Cada chave guarda também a assinatura da operação (ex.:
+    ``"depositar:1001:5000"``): reutilizar uma chave em outra operação é
+    um erro do cliente, não uma repetição.
+
+    Attributes:
+        capacidade (int): Quantidade máxima de chaves
+        validade (float): Tempo de vida de cada chave, em segundos
+    """
+
+    def __init__(self, capacidade: int = 100000, validade: float = 86400.0):
+        """
+        Inicializa o cache.
+
+        Args:
+            capacidade (int): Quantidade máxima de chaves
+            validade (float): Tempo de vida de cada chave, em segundos
+
+        Raises:
+            ValueError: Se a capacidade ou a validade não forem positivas
+        """
+        if capacidade <= 0:
+            raise ValueError("Capacidade deve ser maior que zero")
+        if validade <= 0:
+            raise ValueError("Validade deve ser maior que zero")
+        self.capacidade = capacidade
+        self.validade = validade
+        self._validade = int(validade * 1_000_000)
+        # Chave -> (assinatura, resultado, expiração em microssegundos,
+        # sequência do registro no diário; 0 = já gravado ou sem diário)
+        self._itens: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._trava = threading.Lock()
+
+    def consultar(self, chave: str, assinatura: str) -> Any:
+        """
+        Obtém o resultado original de uma operação já executada.
+
+        Args:
+            chave (str): Chave de idempotência
+            assinatura (str): Assinatura da operação sendo executada
+
+        Returns:
+            Resultado registrado, ou ``AUSENTE`` se a chave não existir (ou
+            tiver expirado)
+
+        Raises:
+            ValueError: Se a chave já foi usada em outra operação
+        """
+        registro = self.consultar_registro(chave, assinatura)
+        return registro if registro is AUSENTE else registro[0]
+
+    def consultar_registro(self, chave: str, assinatura: str) -> Any:
+        """
+        Obtém o resultado original e a sequência do registro no diário.
+
+        Args:
+            chave (str): Chave de idempotência
+            assinatura (str): Assinatura da operação sendo executada
+
+        Returns:
+            Tuple ``(resultado, sequencia)``, ou ``AUSENTE`` se a chave não
+            existir (ou tiver expirado)
+
+        Raises:
+            ValueError: Se a chave já foi usada em outra operação
+        """
+        # Leitura sem trava: o ``get`` do dicionário é atômico
+        item = self._itens.get(chave)
+        if item is None or item[2] <= timestamp_agora():
+            return AUSENTE
+        if item[0] != assinatura:
+            raise ValueError(f"Chave de idempotência já usada em outra operação: {chave}")
+        return item[1], item[3]
+
+    def novo_item(self, chave: str, assinatura: str, resultado: Any) -> List[Any]:
+        """
+        Monta o item de uma operação executada, sem registrá-lo ainda.
+
+        O item vai no registro da operação no diário e só depois é
+        registrado no cache (``registrar``), com a sequência desse registro.
+
+        Args:
+            chave (str): Chave de idempotência
+            assinatura (str): Assinatura da operação
+            resultado: Resultado da operação (serializável em JSON)
+
+        Returns:
+            List: ``[chave, assinatura, resultado, expiracao]``
+        """
+        return [chave, assinatura, resultado, timestamp_agora() + self._validade]
+
+    def registrar(self, item: List[Any], sequencia: int = 0):
+        """
+        Registra o resultado de uma operação executada.
+
+        Args:
+            item (List): Item montado por ``novo_item``
+            sequencia (int): Sequência do registro da operação no diário
+                (0 = sem diário)
+        """
+        chave, assinatura, resultado, expiracao = item
+        with self._trava:
+            self._inserir(chave, assinatura, resultado, expiracao, sequencia)
+            self._descartar(timestamp_agora())
+
+    def restaurar(self, itens: Iterable[List[Any]]):
+        """
+        Recarrega chaves gravadas (diário ou snapshot), ignorando as expiradas.
+
+        Como já estão em disco, não há registro a aguardar (sequência 0).
+
+        Args:
+            itens (Iterable): Listas ``[chave, assinatura, resultado, expiracao]``
+        """
+        agora = timestamp_agora()
+        with self._trava:
+            for chave, assinatura, resultado, expiracao in itens:
+                if expiracao > agora:
+                    self._inserir(chave, assinatura, resultado, expiracao, 0)
+            self._descartar(agora)
+
+    def itens(self) -> List[List[Any]]:
+        """
+        Copia as chaves válidas, em ordem de registro (para snapshots).
+
+        Returns:
+            List: Listas ``[chave, assinatura, resultado, expiracao]``
+        """
+        agora = timestamp_agora()
+        with self._trava:
+            return [[chave, assinatura, resultado, expiracao]
+                    for chave, (assinatura, resultado, expiracao, _) in self._itens.items()
+                    if expiracao > agora]
+
+    def _inserir(self, chave: str, assinatura: str, resultado: Any, expiracao: int,
+                 sequencia: int):
+        """Inclui (ou substitui) uma chave no fim da ordem (com a trava obtida)."""
+        itens = self._itens
+        if chave in itens:
+            del itens[chave]
+        itens[chave] = (assinatura, resultado, expiracao, sequencia)
+
+    def _descartar(self, agora: int):
+        """Descarta as chaves excedentes e as expiradas (com a trava obtida)."""
+        itens = self._itens
+        while len(itens) > self.capacidade:
+            itens.popitem(last=False)
+        while itens and next(iter(itens.values()))[2] <= agora:
+            itens.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Quantidade de chaves no cache (incluindo expiradas ainda não descartadas)."""
+        return len(self._itens)
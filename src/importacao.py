@@ -0,0 +1,53 @@
+"""
+Sistema Bancário - Módulo Importação
+Leitura em fluxo (streaming) de cadastros de clientes em CSV ou JSONL.
+"""
+
+import csv
+import json
+from typing import Any, Iterator
+
+
+def ler_registros_csv(caminho: str, delimitador: str = ',',
+                      codificacao: str = 'utf-8') -> Iterator[Any]:
+    """
+    Lê registros de clientes de um arquivo CSV, um por vez.
+
+    O arquivo deve ter cabeçalho com as colunas ``titular`` e ``cpf_cnpj``.
+
+    Args:
+        caminho (str): Caminho do arquivo CSV
+        delimitador (str): Separador de colunas
+        codificacao (str): Codificação do arquivo
+
+    Yields:
+        Dict: Registro com as colunas do arquivo
+    """
+    with open(caminho, newline='', encoding=codificacao) as arquivo:
+        yield from csv.DictReader(arquivo, delimiter=delimitador)
+
+
+def ler_registros_jsonl(caminho: str, codificacao: str = 'utf-8') -> Iterator[Any]:
+    """
+    Lê registros de clientes de um arquivo JSONL (um objeto JSON por linha).
+
+    Linhas em branco são ignoradas. Linhas com JSON inválido são repassadas
+    como texto, para que o consumidor as reporte como registros inválidos
+    sem interromper a leitura.
+
+    Args:
+        caminho (str): Caminho do arquivo JSONL
+        codificacao (str): Codificação do arquivo
+
+    Yields:
+        Dict: Registro decodificado (ou a linha original, se inválida)
+    """
+    with open(caminho, encoding=codificacao) as arquivo:
+        for linha in arquivo:
+            linha = linha.strip()
+            if not linha:
+                continue
+            try:
+                yield json.loads(linha)
+            except ValueError:
+                yield linha
@@ -0,0 +1,423 @@
+"""
+Sistema Bancário - Módulo Índices
+Estruturas auxiliares mantidas incrementalmente pelo sistema bancário.
+"""
+
+import heapq
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional
+
+
+class ListaOrdenada:
+    """
+    Lista mantida em ordem, dividida em blocos.
+
+    Inserções e remoções custam O(log n) para localizar o bloco mais o
+    deslocamento dentro de um bloco de tamanho limitado, evitando mover a
+    lista inteira como aconteceria com ``bisect.insort`` em uma única lista.
+    """
+
+    def __init__(self, itens: Iterable[Any] = (), carga: int = 1000):
+        """
+        Inicializa a lista.
+
+        Args:
+            itens (Iterable): Itens iniciais (em qualquer ordem)
+            carga (int): Tamanho de referência dos blocos
+        """
+        self._carga = carga
+        ordenados = sorted(itens)
+        self._blocos: List[list] = [ordenados[i:i + carga]
+                                    for i in range(0, len(ordenados), carga)]
+        self._maximos: List[Any] = [bloco[-1] for bloco in self._blocos]
+        self._tamanho = len(ordenados)
+        self._acumulados: Optional[List[int]] = None
+
+    def adicionar(self, item: Any):
+        """
+        Insere um item na posição ordenada.
+
+        Args:
+            item: Item comparável
+        """
+        self._tamanho += 1
+        self._acumulados = None
+        if not self._blocos:
+            self._blocos.append([item])
+            self._maximos.append(item)
+            return
+
+        posicao = bisect_right(self._maximos, item)
+        if posicao == len(self._blocos):
+            posicao -= 1
+            self._blocos[posicao].append(item)
+            self._maximos[posicao] = item
+        else:
+            insort(self._blocos[posicao], item)
+
+        bloco = self._blocos[posicao]
+        if len(bloco) > 2 * self._carga:
+            # Divide blocos grandes para manter inserções baratas
+            metade = len(bloco) // 2
+            self._blocos[posicao:posicao + 1] = [bloco[:metade], bloco[metade:]]
+            self._maximos[posicao:posicao + 1] = [bloco[metade - 1], bloco[-1]]
+
+    def remover(self, item: Any):
+        """
+        Remove um item da lista.
+
+        Args:
+            item: Item a remover
+
+        Raises:
+            ValueError: Se o item não estiver na lista
+        """
+        posicao = bisect_left(self._maximos, item)
+        if posicao == len(self._blocos):
+            raise ValueError(f"{item!r} não está na lista")
+        bloco = self._blocos[posicao]
+        indice = bisect_left(bloco, item)
+        if indice == len(bloco) or bloco[indice] != item:
+            raise ValueError(f"{item!r} não está na lista")
+
+        del bloco[indice]
+        self._tamanho -= 1
+        self._acumulados = None
+        if bloco:
+            self._maximos[posicao] = bloco[-1]
+        else:
+            del self._blocos[posicao]
+            del self._maximos[posicao]
+
+    def bisect_left(self, item: Any) -> int:
+        """
+        Posição (global) onde o item seria inserido, antes de iguais.
+
+        Args:
+            item: Item de referência
+
+        Returns:
+            int: Posição na lista ordenada
+        """
+        posicao = bisect_left(self._maximos, item)
+        if posicao == len(self._blocos):
+            return self._tamanho
+        return self._inicio_bloco(posicao) + bisect_left(self._blocos[posicao], item)
+
+    def iterar(self, inicio: int = 0, fim: Optional[int] = None,
+               reverso: bool = False) -> Iterator[Any]:
+        """
+        Percorre as posições ``[inicio, fim)`` sem copiar a lista.
+
+        Args:
+            inicio (int): Primeira posição
+            fim (int): Posição final, exclusiva (None = até o final)
+            reverso (bool): Se True, percorre da maior para a menor posição
+
+        Yields:
+            Itens na faixa solicitada
+        """
+        fim = self._tamanho if fim is None else min(fim, self._tamanho)
+        inicio = max(inicio, 0)
+        if inicio >= fim:
+            return
+        if reverso:
+            bloco, indice = self._localizar(fim - 1)
+            restantes = fim - inicio
+            while restantes:
+                atual = self._blocos[bloco]
+                while indice >= 0 and restantes:
+                    yield atual[indice]
+                    indice -= 1
+                    restantes -= 1
+                bloco -= 1
+                if bloco >= 0:
+                    indice = len(self._blocos[bloco]) - 1
+        else:
+            bloco, indice = self._localizar(inicio)
+            restantes = fim - inicio
+            while restantes:
+                atual = self._blocos[bloco]
+                while indice < len(atual) and restantes:
+                    yield atual[indice]
+                    indice += 1
+                    restantes -= 1
+                bloco += 1
+                indice = 0
+
+    def primeiro(self) -> Any:
+        """Retorna o menor item."""
+        return self._blocos[0][0]
+
+    def ultimo(self) -> Any:
+        """Retorna o maior item."""
+        return self._blocos[-1][-1]
+
+    def _inicio_bloco(self, bloco: int) -> int:
+        """Posição global do primeiro item de um bloco."""
+        if self._acumulados is None:
+            acumulados = []
+            total = 0
+            for atual in self._blocos:
+                acumulados.append(total)
+                total += len(atual)
+            self._acumulados = acumulados
+        return self._acumulados[bloco]
+
+    def _localizar(self, posicao: int):
+        """Converte uma posição global em (bloco, índice dentro do bloco)."""
+        self._inicio_bloco(0)
+        bloco = bisect_right(self._acumulados, posicao) - 1
+        return bloco, posicao - self._acumulados[bloco]
+
+    def __getitem__(self, posicao: int) -> Any:
+        """Acesso por posição."""
+        if posicao < 0:
+            posicao += self._tamanho
+        if not 0 <= posicao < self._tamanho:
+            raise IndexError("Posição fora da lista")
+        bloco, indice = self._localizar(posicao)
+        return self._blocos[bloco][indice]
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de itens."""
+        return self._tamanho
+
+    def __iter__(self) -> Iterator[Any]:
+        """Itera os itens em ordem."""
+        for bloco in self._blocos:
+            yield from bloco
+
+
+def normalizar_nome(texto: str) -> str:
+    """
+    Normaliza um nome para busca: sem acentos, minúsculo e espaços simples.
+
+    Args:
+        texto (str): Nome original
+
+    Returns:
+        str: Nome normalizado
+    """
+    decomposto = unicodedata.normalize('NFKD', texto)
+    sem_acentos = ''.join(c for c in decomposto if not unicodedata.combining(c))
+    return ' '.join(sem_acentos.casefold().split())
+
+
+class CacheLRU:
+    """Cache de tamanho limitado que descarta o item usado há mais tempo."""
+
+    def __init__(self, capacidade: int = 1024):
+        """
+        Inicializa o cache.
+
+        Args:
+            capacidade (int): Quantidade máxima de itens
+        """
+        self._capacidade = capacidade
+        self._itens: OrderedDict = OrderedDict()
+
+    def obter(self, chave: Hashable) -> Any:
+        """
+        Obtém um item do cache, marcando-o como usado recentemente.
+
+        Args:
+            chave: Chave do item
+
+        Returns:
+            Valor armazenado ou None se ausente
+        """
+        valor = self._itens.get(chave)
+        if valor is not None:
+            self._itens.move_to_end(chave)
+        return valor
+
+    def guardar(self, chave: Hashable, valor: Any):
+        """
+        Armazena um item, descartando o mais antigo se necessário.
+
+        Args:
+            chave: Chave do item
+            valor: Valor a armazenar (não None)
+        """
+        self._itens[chave] = valor
+        self._itens.move_to_end(chave)
+        if len(self._itens) > self._capacidade:
+            self._itens.popitem(last=False)
+
+    def limpar(self):
+        """Remove todos os itens do cache."""
+        self._itens.clear()
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de itens armazenados."""
+        return len(self._itens)
+
+
+class IndiceTitulares:
+    """
+    Índice de busca por nome do titular, insensível a acentos e maiúsculas.
+
+    Mantém, em ordem de número de conta, listas de contas por palavra e por
+    trigrama do nome normalizado. Os resultados vêm em dois níveis de
+    relevância: primeiro os nomes com uma palavra iniciada pelo termo, depois
+    os nomes que contêm o termo em outra posição; dentro de cada nível, em
+    ordem de número de conta. Termos com menos de 3 caracteres não têm
+    trigrama e percorrem todos os nomes no 2º nível. Com limite, a busca para
+    assim que encontra resultados suficientes.
+    """
+
+    def __init__(self, capacidade_cache: int = 1024):
+        """
+        Inicializa o índice vazio.
+
+        Args:
+            capacidade_cache (int): Quantidade de buscas recentes em cache
+        """
+        self._nomes: Dict[int, str] = {}
+        self._trigramas: Dict[str, array] = {}
+        self._palavras: Dict[str, array] = {}
+        self._palavras_ordenadas = ListaOrdenada()
+        self._removidos = 0
+        self._cache = CacheLRU(capacidade_cache)
+
+    def adicionar(self, numero: int, titular: str):
+        """
+        Indexa o nome do titular de uma conta.
+
+        Args:
+            numero (int): Número da conta
+            titular (str): Nome do titular
+        """
+        nome = normalizar_nome(titular)
+        self._nomes[numero] = nome
+        self._indexar(numero, nome)
+        self._cache.limpar()
+
+    def remover(self, numero: int):
+        """
+        Remove uma conta do índice.
+
+        As listas de trigramas e palavras são limpas de forma preguiçosa,
+        quando as remoções acumuladas superam as contas indexadas.
+
+        Args:
+            numero (int): Número da conta
+        """
+        if self._nomes.pop(numero, None) is None:
+            return
+        self._removidos += 1
+        self._cache.limpar()
+        if self._removidos > len(self._nomes):
+            self._reconstruir()
+
+    def buscar(self, consulta: str, limite: Optional[int] = None) -> List[int]:
+        """
+        Busca contas cujo nome do titular contém o termo.
+
+        Args:
+            consulta (str): Nome ou parte do nome
+            limite (int): Quantidade máxima de resultados (None = todos)
+
+        Returns:
+            List[int]: Números das contas, do mais ao menos relevante
+        """
+        termo = normalizar_nome(consulta)
+        chave = (termo, limite)
+        resultado = self._cache.obter(chave)
+        if resultado is None:
+            resultado = self._buscar(termo, limite)
+            self._cache.guardar(chave, resultado)
+        return list(resultado)
+
+    def _buscar(self, termo: str, limite: Optional[int]) -> tuple:
+        """Executa a busca sem consultar o cache."""
+        nomes = self._nomes
+        if not termo:
+            return tuple(islice(nomes, limite))
+
+        resultado: List[int] = []
+        encontrados = set()
+
+        # 1º nível: termo no início de uma palavra do nome. As listas de cada
+        # palavra estão em ordem de número, então a mescla já sai ordenada e
+        # pode parar assim que o limite for atingido.
+        primeira, _, resto = termo.partition(' ')
+        if resto:
+            # Termo com várias palavras: a primeira precisa estar completa
+            listas = [self._palavras.get(primeira, ())]
+        else:
+            listas = [self._palavras[palavra]
+                      for palavra in self._palavras_com_prefixo(primeira)]
+        espaco_termo = ' ' + termo
+        for numero in heapq.merge(*listas):
+            if numero in encontrados:
+                continue
+            nome = nomes.get(numero)
+            if nome is None or (resto and espaco_termo not in ' ' + nome):
+                continue
+            encontrados.add(numero)
+            resultado.append(numero)
+            if limite is not None and len(resultado) >= limite:
+                return tuple(resultado)
+
+        # 2º nível: termo em qualquer outra posição. A menor lista de
+        # trigramas já contém todos os candidatos; o trecho é confirmado no
+        # nome normalizado. Termos curtos demais para um trigrama percorrem
+        # todos os nomes (também em ordem de número: as contas são indexadas
+        # na ordem em que são criadas).
+        if len(termo) >= 3:
+            listas = []
+            for trigrama in {termo[i:i + 3] for i in range(len(termo) - 2)}:
+                lista = self._trigramas.get(trigrama)
+                if lista is None:
+                    return tuple(resultado)
+                listas.append(lista)
+            candidatos = min(listas, key=len)
+        else:
+            candidatos = nomes
+        for numero in candidatos:
+            if numero in encontrados:
+                continue
+            nome = nomes.get(numero)
+            if nome is None or termo not in nome:
+                continue
+            resultado.append(numero)
+            if limite is not None and len(resultado) >= limite:
+                break
+        return tuple(resultado)
+
+    def _palavras_com_prefixo(self, prefixo: str) -> Iterator[str]:
+        """Palavras indexadas que começam com o prefixo, em ordem alfabética."""
+        palavras = self._palavras_ordenadas
+        for palavra in palavras.iterar(palavras.bisect_left(prefixo)):
+            if not palavra.startswith(prefixo):
+                break
+            yield palavra
+
+    def _indexar(self, numero: int, nome: str):
+        """Inclui a conta nas listas de trigramas e palavras."""
+        for trigrama in {nome[i:i + 3] for i in range(len(nome) - 2)}:
+            lista = self._trigramas.get(trigrama)
+            if lista is None:
+                lista = self._trigramas[trigrama] = array('q')
+            lista.append(numero)
+        for palavra in set(nome.split()):
+            lista = self._palavras.get(palavra)
+            if lista is None:
+                lista = self._palavras[palavra] = array('q')
+                self._palavras_ordenadas.adicionar(palavra)
+            lista.append(numero)
+
+    def _reconstruir(self):
+        """Reconstrói as listas a partir das contas ainda indexadas."""
+        self._trigramas = {}
+        self._palavras = {}
+        self._palavras_ordenadas = ListaOrdenada()
+        self._removidos = 0
+        for numero, nome in self._nomes.items():
+            self._indexar(numero, nome)
@@ -0,0 +1,448 @@
+"""
+Sistema Bancário - Módulo Ingestão
+Aplicação em fluxo de arquivos de movimentações (depósitos, saques e
+pagamentos) recebidos dos canais parceiros.
+
+O processamento é um encadeamento de geradores: os registros são lidos
+(``ler_operacoes``), validados e agrupados por conta em blocos de tamanho
+fixo, e cada bloco é aplicado partição por partição (contas agrupadas pelo
+resto do número pela quantidade de partições), opcionalmente em um conjunto
+de threads. Apenas um bloco é aplicado enquanto o seguinte é lido, de modo
+que a memória usada não depende do tamanho do arquivo.
+
+As rejeições não usam exceções: cada registro recebe um código de resultado
+(``OK``, ``SALDO_INSUFICIENTE``...), e os rejeitados são gravados em um
+relatório CSV com a linha, os dados originais e o motivo.
+
+Exemplo:
+    >>> from src import ingestao
+    >>> ingestao.ingerir_arquivo(sistema, 'movimentos.csv',
+    ...                          rejeicoes='rejeitados.csv', trabalhadores=4)
+    {'linhas': 1000000, 'aplicadas': 998512, 'rejeitadas': 1488, ...}
+"""
+
+import csv
+import math
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+try:
+    from .dinheiro import LIMITE_CENTAVOS, para_centavos
+    from .extrato import DESCRICOES, TIPOS
+    from .importacao import ler_registros_jsonl
+    from .relogio import timestamp_agora
+except ImportError:
+    from dinheiro import LIMITE_CENTAVOS, para_centavos
+    from extrato import DESCRICOES, TIPOS
+    from importacao import ler_registros_jsonl
+    from relogio import timestamp_agora
+
+# Códigos de resultado por registro
+OK = 0
+REGISTRO_INVALIDO = 1
+OPERACAO_DESCONHECIDA = 2
+VALOR_INVALIDO = 3
+VALOR_NAO_POSITIVO = 4
+DESCRICAO_OBRIGATORIA = 5
+CONTA_NAO_ENCONTRADA = 6
+SALDO_INSUFICIENTE = 7
+LIMITE_EXCEDIDO = 8
+
+# Motivo de cada código (índice = código)
+MOTIVOS = (
+    "OK",
+    "Registro inválido",
+    "Operação desconhecida",
+    "Valor inválido",
+    "Valor deve ser maior que zero",
+    "Descrição do pagamento é obrigatória",
+    "Conta não encontrada",
+    "Saldo insuficiente",
+    "Limite de saldo da conta excedido",
+)
+
+CABECALHO_REJEICOES = ('linha', 'conta', 'operacao', 'valor', 'descricao',
+                       'codigo', 'motivo')
+
+# Operação no arquivo -> (nome, tipo no extrato, sinal, descrição padrão)
+_DEPOSITO = ('deposito', "DEPÓSITO", 1, "Depósito")
+_SAQUE = ('saque', "SAQUE", -1, "Saque")
+_PAGAMENTO = ('pagamento', "PAGAMENTO", -1, None)
+_OPERACOES = {
+    'deposito': _DEPOSITO,
+    'depósito': _DEPOSITO,
+    'saque': _SAQUE,
+    'pagamento': _PAGAMENTO,
+    'pagar_conta': _PAGAMENTO,
+}
+
+# Dígitos dos reais tratados nos caminhos rápidos de conversão; valores
+# maiores passam pela conversão completa, que verifica o limite
+_DIGITOS_REAIS = len(str(LIMITE_CENTAVOS // 100))
+
+# Operação validada: (linha, número da conta, operação, valor em centavos
+# com sinal, descrição, campos originais do registro)
+Operacao = Tuple[int, int, tuple, int, str, tuple]
+# Registro rejeitado: (linha, conta, operação, valor, descrição, código)
+Rejeicao = Tuple[int, Any, Any, Any, Any, int]
+
+
+def ler_operacoes(caminho: str, codificacao: str = 'utf-8') -> Iterator[Any]:
+    """
+    Lê as movimentações de um arquivo CSV ou JSONL, uma por vez.
+
+    O formato é escolhido pela extensão (``.jsonl``/``.json`` para JSONL;
+    qualquer outra para CSV). Os registros têm as colunas ``conta``,
+    ``operacao`` (``deposito``, ``saque`` ou ``pagamento``), ``valor`` e
+    ``descricao`` (opcional, exceto para pagamentos).
+
+    Args:
+        caminho (str): Caminho do arquivo
+        codificacao (str): Codificação do arquivo
+
+    Yields:
+        Registro lido: tupla ``(conta, operacao, valor[, descricao])`` para
+        CSV (None se a linha não tiver todas as colunas) ou dicionário para
+        JSONL (a linha original, se o JSON for inválido)
+
+    Raises:
+        ValueError: Se faltar uma coluna obrigatória no cabeçalho do CSV
+    """
+    if os.path.splitext(caminho)[1].lower() in ('.jsonl', '.json'):
+        return ler_registros_jsonl(caminho, codificacao)
+    return _ler_csv(caminho, codificacao)
+
+
+def _ler_csv(caminho: str, codificacao: str) -> Iterator[Optional[tuple]]:
+    """Lê um CSV de movimentações como tuplas na ordem de ``validar_operacoes``."""
+    with open(caminho, newline='', encoding=codificacao) as arquivo:
+        linhas = csv.reader(arquivo)
+        cabecalho = [coluna.strip().lower() for coluna in next(linhas, ())]
+        colunas = []
+        for coluna in ('conta', 'operacao', 'valor', 'descricao'):
+            if coluna in cabecalho:
+                colunas.append(cabecalho.index(coluna))
+            elif coluna != 'descricao':
+                raise ValueError(f"Coluna obrigatória ausente: {coluna}")
+        # Sem dicionário por linha: as colunas são extraídas por posição
+        extrair = itemgetter(*colunas)
+        minimo = max(colunas) + 1
+        for linha in linhas:
+            yield extrair(linha) if len(linha) >= minimo else None
+
+
+def _ler_centavos(valor: Any) -> Optional[int]:
+    """
+    Converte um valor em reais para centavos, ou None se inválido ou fora
+    de ``LIMITE_CENTAVOS`` (sem exceções).
+    """
+    tipo = type(valor)
+    centavos = None
+    if tipo is str:
+        # Caminho rápido para o formato usual dos arquivos ("1234.56")
+        inteiro, _, fracao = valor.strip().replace(',', '.').partition('.')
+        if (len(inteiro) <= _DIGITOS_REAIS and inteiro.isascii() and inteiro.isdigit()
+                and len(fracao) <= 2
+                and (not fracao or fracao.isascii() and fracao.isdigit())):
+            centavos = int(inteiro) * 100 + (int(fracao.ljust(2, '0')) if fracao else 0)
+    elif tipo is int:
+        centavos = valor * 100
+    elif tipo is float:
+        if not math.isfinite(valor):
+            return None
+        centavos = round(valor * 100)
+    elif tipo is bool or valor is None:
+        return None
+    if centavos is not None:
+        return centavos if -LIMITE_CENTAVOS <= centavos <= LIMITE_CENTAVOS else None
+    # Demais formatos (sinal, mais casas decimais, Decimal): conversão completa
+    try:
+        return para_centavos(valor)
+    except (ArithmeticError, ValueError):
+        return None
+
+
+def _ler_numero(conta: Any) -> Optional[int]:
+    """Converte o número da conta para inteiro, ou None se inválido."""
+    if type(conta) is int:
+        return conta
+    if type(conta) is str:
+        conta = conta.strip()
+        if conta.isascii() and conta.isdigit():
+            return int(conta)
+    return None
+
+
+def validar_operacoes(registros: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+    """
+    Valida um fluxo de registros de movimentação.
+
+    Cada registro pode ser um dicionário (``conta``, ``operacao``,
+    ``valor`` e ``descricao``) ou uma tupla ``(conta, operacao, valor[,
+    descricao])``. A existência da conta e o saldo são verificados apenas
+    na aplicação.
+
+    Args:
+        registros (Iterable): Registros a validar (ex.: ``ler_operacoes``)
+
+    Yields:
+        Tuple: ``(OK, operação validada)`` ou ``(código, rejeição)``
+    """
+    operacoes = _OPERACOES
+    for linha, registro in enumerate(registros, 1):
+        tipo = type(registro)
+        if tipo is tuple and len(registro) == 4:
+            conta, nome, valor, descricao = original = registro
+        elif tipo is dict:
+            conta = registro.get('conta')
+            nome = registro.get('operacao')
+            valor = registro.get('valor')
+            descricao = registro.get('descricao')
+            original = (conta, nome, valor, descricao)
+        elif isinstance(registro, (tuple, list)) and len(registro) in (3, 4):
+            conta, nome, valor = registro[:3]
+            descricao = registro[3] if len(registro) == 4 else None
+            original = (conta, nome, valor, descricao)
+        else:
+            yield REGISTRO_INVALIDO, (linha, None, None, None, None, REGISTRO_INVALIDO)
+            continue
+
+        # Caminhos rápidos para o formato usual dos arquivos; os demais
+        # formatos passam pelas conversões completas
+        if type(conta) is str and conta.isdigit() and conta.isascii():
+            numero = int(conta)
+        else:
+            numero = _ler_numero(conta)
+        operacao = operacoes.get(nome)
+        if operacao is None and type(nome) is str:
+            operacao = operacoes.get(nome.strip().lower())
+        if type(valor) is str and valor[-3:-2] == '.' and valor.isascii():
+            inteiro, fracao = valor[:-3], valor[-2:]
+            centavos = (int(inteiro) * 100 + int(fracao)
+                        if len(inteiro) <= _DIGITOS_REAIS and inteiro.isdigit()
+                        and fracao.isdigit() else _ler_centavos(valor))
+        else:
+            centavos = _ler_centavos(valor)
+        if descricao:
+            descricao = descricao.strip() if type(descricao) is str else False
+
+        if numero is None or descricao is False:
+            codigo = REGISTRO_INVALIDO
+        elif operacao is None:
+            codigo = OPERACAO_DESCONHECIDA
+        elif centavos is None or not -LIMITE_CENTAVOS <= centavos <= LIMITE_CENTAVOS:
+            # O caminho rápido acima não verifica o limite
+            codigo = VALOR_INVALIDO
+        elif centavos <= 0:
+            codigo = VALOR_NAO_POSITIVO
+        elif not descricao and operacao[3] is None:
+            codigo = DESCRICAO_OBRIGATORIA
+        else:
+            yield OK, (linha, numero, operacao, centavos * operacao[2],
+                       descricao or operacao[3], original)
+            continue
+        yield codigo, (linha, *original, codigo)
+
+
+def _aplicar_particao(sistema: Any, grupos: Dict[int, List[Operacao]]) -> Tuple[
+        List[Rejeicao], int, int, int]:
+    """
+    Aplica as operações de uma partição de contas.
+
+    As contas da partição são travadas juntas (em ordem de número), as
+    operações de cada conta são aplicadas na ordem do arquivo e todas as
+    transações da partição formam um único registro no diário.
+
+    Returns:
+        Tuple: (rejeições, operações aplicadas, créditos, débitos em centavos)
+    """
+    rejeitadas: List[Rejeicao] = []
+    aplicadas = creditos = debitos = 0
+    movimentos = []
+    travadas = []
+    timestamp = timestamp_agora()
+    # Códigos das tabelas do extrato, consultadas uma vez por texto
+    codigos_tipo: Dict[str, int] = {}
+    codigos_descricao: Dict[str, int] = {}
+    try:
+        for numero in sorted(grupos):
+            operacoes = grupos[numero]
+            conta = sistema.contas.get(numero)
+            if conta is not None:
+                conta._trava.acquire()
+                travadas.append(conta._trava)
+            # Inexistente ou removida por outra thread antes da trava
+            if conta is None or conta._sistema is not sistema:
+                rejeitadas.extend(_rejeicao(operacao, CONTA_NAO_ENCONTRADA)
+                                  for operacao in operacoes)
+                continue
+
+            saldo = conta._centavos
+            lancamentos = []
+            for operacao in operacoes:
+                valor = operacao[3]
+                if saldo + valor < 0:
+                    rejeitadas.append(_rejeicao(operacao, SALDO_INSUFICIENTE))
+                    continue
+                if saldo + valor > LIMITE_CENTAVOS:
+                    rejeitadas.append(_rejeicao(operacao, LIMITE_EXCEDIDO))
+                    continue
+                saldo += valor
+                if valor > 0:
+                    creditos += valor
+                else:
+                    debitos -= valor
+                tipo, descricao = operacao[2][1], operacao[4]
+                codigo_tipo = codigos_tipo.get(tipo)
+                if codigo_tipo is None:
+                    codigo_tipo = codigos_tipo[tipo] = TIPOS.codigo(tipo)
+                codigo_descricao = codigos_descricao.get(descricao)
+                if codigo_descricao is None:
+                    codigo_descricao = codigos_descricao[descricao] = \
+                        DESCRICOES.codigo(descricao)
+                lancamentos.append((codigo_tipo, valor, codigo_descricao))
+            if lancamentos:
+                aplicadas += len(lancamentos)
+                movimentos.append(conta._registrar_lote(lancamentos, timestamp,
+                                                        codificadas=True))
+        if movimentos:
+            # Um único registro no diário por partição
+            sistema._ao_movimentar(movimentos)
+    finally:
+        for trava in reversed(travadas):
+            trava.release()
+    sistema._aguardar_persistencia()
+    return rejeitadas, aplicadas, creditos, debitos
+
+
+def _rejeicao(operacao: Operacao, codigo: int) -> Rejeicao:
+    """Rejeição de uma operação já validada, com os campos originais."""
+    return (operacao[0], *operacao[5], codigo)
+
+
+def ingerir(sistema: Any, registros: Iterable[Any],
+            rejeicoes: Union[str, TextIO, None] = None, trabalhadores: int = 0,
+            tamanho_bloco: int = 50000) -> Dict[str, Any]:
+    """
+    Aplica um fluxo de movimentações às contas do sistema.
+
+    Os registros são validados e aplicados em blocos de ``tamanho_bloco``.
+    As operações de uma mesma conta são aplicadas na ordem recebida; as
+    inválidas, de contas inexistentes ou sem saldo são rejeitadas sem
+    interromper o processamento. Cada partição de um bloco é atômica em
+    relação às demais operações do sistema.
+
+    Args:
+        sistema (SistemaBancario): Sistema que recebe as movimentações
+        registros (Iterable): Registros de movimentação (ex.: ``ler_operacoes``)
+        rejeicoes (str | TextIO): Caminho ou arquivo de texto para o
+            relatório CSV dos registros rejeitados (None = não gravar)
+        trabalhadores (int): Threads que aplicam as partições de cada bloco
+            (0 = aplica na própria thread, em uma única partição)
+        tamanho_bloco (int): Quantidade de registros aplicados por vez
+
+    Returns:
+        Dict: ``linhas`` (registros lidos), ``aplicadas``, ``rejeitadas``,
+        ``motivos`` (rejeições por motivo), ``creditos`` e ``debitos`` (em reais)
+
+    Raises:
+        ValueError: Se o tamanho do bloco ou a quantidade de threads for inválida
+    """
+    if tamanho_bloco <= 0:
+        raise ValueError("Tamanho do bloco deve ser maior que zero")
+    if trabalhadores < 0:
+        raise ValueError("Quantidade de trabalhadores não pode ser negativa")
+
+    resumo = {'linhas': 0, 'aplicadas': 0, 'rejeitadas': 0, 'motivos': Counter(),
+              'creditos': 0, 'debitos': 0}
+    arquivo = (open(rejeicoes, 'w', newline='', encoding='utf-8')
+               if isinstance(rejeicoes, str) else rejeicoes)
+    escritor = None
+    if arquivo is not None:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(CABECALHO_REJEICOES)
+    executor = (ThreadPoolExecutor(trabalhadores, thread_name_prefix='ingestao')
+                if trabalhadores else None)
+    particoes = max(trabalhadores, 1)
+    validados = validar_operacoes(registros)
+    pendente = None
+    try:
+        while True:
+            bloco = list(islice(validados, tamanho_bloco))
+            # O bloco anterior termina antes de este ser aplicado (ordem por conta)
+            if pendente is not None:
+                _concluir(*pendente, resumo, escritor)
+                pendente = None
+            if not bloco:
+                break
+            resumo['linhas'] += len(bloco)
+
+            grupos: List[Dict[int, List[Operacao]]] = [{} for _ in range(particoes)]
+            rejeitadas: List[Rejeicao] = []
+            for codigo, dados in bloco:
+                if codigo:
+                    rejeitadas.append(dados)
+                else:
+                    grupos[dados[1] % particoes].setdefault(dados[1], []).append(dados)
+            del bloco
+            if executor is None:
+                resultados = [_aplicar_particao(sistema, grupos[0])]
+            else:
+                # Aplicado em segundo plano enquanto o próximo bloco é lido
+                resultados = [executor.submit(_aplicar_particao, sistema, grupo)
+                              for grupo in grupos if grupo]
+            pendente = (rejeitadas, resultados)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if arquivo is not None and arquivo is not rejeicoes:
+            arquivo.close()
+
+    resumo['motivos'] = {MOTIVOS[codigo]: quantidade
+                         for codigo, quantidade in sorted(resumo['motivos'].items())}
+    resumo['creditos'] /= 100
+    resumo['debitos'] /= 100
+    return resumo
+
+
+def _concluir(rejeitadas: List[Rejeicao], resultados: List[Any],
+              resumo: Dict[str, Any], escritor: Any):
+    """Aguarda a aplicação de um bloco, atualiza o resumo e grava as rejeições."""
+    for resultado in resultados:
+        if not isinstance(resultado, tuple):
+            resultado = resultado.result()
+        rejeicoes, aplicadas, creditos, debitos = resultado
+        rejeitadas.extend(rejeicoes)
+        resumo['aplicadas'] += aplicadas
+        resumo['creditos'] += creditos
+        resumo['debitos'] += debitos
+    resumo['rejeitadas'] += len(rejeitadas)
+    resumo['motivos'].update(rejeicao[5] for rejeicao in rejeitadas)
+    if escritor is not None:
+        rejeitadas.sort(key=lambda rejeicao: rejeicao[0])
+        escritor.writerows((*rejeicao, MOTIVOS[rejeicao[5]]) for rejeicao in rejeitadas)
+
+
+def ingerir_arquivo(sistema: Any, caminho: str,
+                    rejeicoes: Union[str, TextIO, None] = None,
+                    trabalhadores: int = 0, tamanho_bloco: int = 50000,
+                    codificacao: str = 'utf-8') -> Dict[str, Any]:
+    """
+    Aplica as movimentações de um arquivo CSV ou JSONL (``ler_operacoes``).
+
+    Args:
+        sistema (SistemaBancario): Sistema que recebe as movimentações
+        caminho (str): Caminho do arquivo de movimentações
+        rejeicoes (str | TextIO): Destino do relatório de rejeições (None = não gravar)
+        trabalhadores (int): Threads que aplicam as partições de cada bloco
+        tamanho_bloco (int): Quantidade de registros aplicados por vez
+        codificacao (str): Codificação do arquivo
+
+    Returns:
+        Dict: Resumo da ingestão (ver ``ingerir``)
+    """
+    return ingerir(sistema, ler_operacoes(caminho, codificacao), rejeicoes,
+                   trabalhadores, tamanho_bloco)
@@ -8,6 +8,7 @@ import sys
 from typing import Optional
 from .banco import SistemaBancario
 from .conta import ContaBancaria
+from .relogio import formatar_data
 
 
 class InterfaceBancaria:
@@ -19,9 +20,19 @@ class InterfaceBancaria:
         conta_atual (ContaBancaria): Conta atualmente logada
     """
     
-    def __init__(self):
-        """Inicializa a interface bancária."""
-        self.sistema = SistemaBancario("🏦 Banco Digital Python")
+    def __init__(self, diretorio_dados: Optional[str] = None):
+        """
+        Inicializa a interface bancária.
+        
+        Args:
+            diretorio_dados (str): Diretório para persistir o sistema
+                (None = apenas em memória)
+        """
+        if diretorio_dados:
+            self.sistema = SistemaBancario.abrir(diretorio_dados,
+                                                 "🏦 Banco Digital Python")
+        else:
+            self.sistema = SistemaBancario("🏦 Banco Digital Python")
         self.conta_atual: Optional[ContaBancaria] = None
     
     def limpar_tela(self):
@@ -277,44 +288,66 @@ class InterfaceBancaria:
         self.pausar()
     
     def visualizar_extrato(self):
-        """Visualiza o extrato da conta."""
-        self.exibir_cabecalho("EXTRATO BANCÁRIO")
+        """Visualiza o extrato da conta, página por página."""
+        cursor = None
+        pagina_atual = 1
         
-        extrato = self.conta_atual.obter_extrato()
-        
-        if not extrato:
-            print("📭 Nenhuma movimentação encontrada.")
-        else:
+        while True:
+            self.exibir_cabecalho(f"EXTRATO BANCÁRIO - PÁGINA {pagina_atual}")
+            
+            pagina = self.conta_atual.pagina_extrato(cursor, 10)
+            
+            if not pagina['transacoes']:
+                print("📭 Nenhuma movimentação encontrada.")
+                break
+            
             print(f"👤 Titular: {self.conta_atual.titular}")
             print(f"🔢 Conta: {self.conta_atual.numero_conta}")
             print()
             
-            for transacao in extrato[:10]:  # Mostra últimas 10 transações
-                data_hora = transacao['data_hora'].strftime("%d/%m/%Y %H:%M:%S")
-                tipo = transacao['tipo']
-                valor = transacao['valor']
-                descricao = transacao['descricao']
-                saldo_apos = transacao['saldo_apos']
-                
-                # Formatação colorida baseada no tipo
-                if valor > 0:
-                    valor_str = f"+R$ {valor:.2f} ✅"
-                elif valor < 0:
-                    valor_str = f"R$ {valor:.2f} ❌"
-                else:
-                    valor_str = f"R$ {valor:.2f} ℹ️"
-                
-                print(f"📅 {data_hora}")
-                print(f"📝 {tipo}: {descricao}")
-                print(f"💵 {valor_str}")
-                print(f"💰 Saldo após: R$ {saldo_apos:.2f}")
-                print("-" * 40)
+            for transacao in pagina['transacoes']:
+                self._exibir_transacao(transacao)
             
-            if len(extrato) > 10:
-                print(f"... e mais {len(extrato) - 10} transações")
+            cursor = pagina['proximo_cursor']
+            if cursor is None:
+                break
+            
+            # O cursor aponta para a próxima transação (mais antiga) a exibir
+            print(f"... e mais {cursor + 1} transações")
+            opcao = input("\n📄 Enter para a próxima página ou 0 para voltar: ").strip()
+            if opcao == "0":
+                return
+            pagina_atual += 1
         
         self.pausar()
     
+    def _exibir_transacao(self, transacao: dict):
+        """
+        Exibe uma transação do extrato.
+        
+        Args:
+            transacao (dict): Transação a ser exibida
+        """
+        data_hora = formatar_data(transacao['data_hora'])
+        tipo = transacao['tipo']
+        valor = transacao['valor']
+        descricao = transacao['descricao']
+        saldo_apos = transacao['saldo_apos']
+        
+        # Formatação colorida baseada no tipo
+        if valor > 0:
+            valor_str = f"+R$ {valor:.2f} ✅"
+        elif valor < 0:
+            valor_str = f"R$ {valor:.2f} ❌"
+        else:
+            valor_str = f"R$ {valor:.2f} ℹ️"
+        
+        print(f"📅 {data_hora}")
+        print(f"📝 {tipo}: {descricao}")
+        print(f"💵 {valor_str}")
+        print(f"💰 Saldo após: R$ {saldo_apos:.2f}")
+        print("-" * 40)
+    
     def transferir(self):
         """Realiza transferência para outra conta."""
         self.exibir_cabecalho("TRANSFERÊNCIA")
@@ -382,29 +415,50 @@ class InterfaceBancaria:
         print(f"👤 Titular: {resumo['titular']}")
         print(f"📄 CPF/CNPJ: {resumo['cpf_cnpj']}")
         print(f"💰 Saldo Atual: R$ {resumo['saldo']:.2f}")
-        print(f"📅 Data de Criação: {resumo['data_criacao'].strftime('%d/%m/%Y %H:%M:%S')}")
+        print(f"📅 Data de Criação: {formatar_data(resumo['data_criacao'])}")
         print(f"📊 Total de Transações: {resumo['total_transacoes']}")
         
+        mes_atual = resumo['mes_atual']
+        print(f"\n📆 Mês Atual: {mes_atual['quantidade']} transações")
+        for tipo, total in mes_atual['por_tipo'].items():
+            quantidade = mes_atual['quantidade_por_tipo'][tipo]
+            print(f"   {tipo}: {quantidade}x, R$ {abs(total):.2f}")
+        print(f"   Entradas: R$ {mes_atual['entradas']:.2f} | "
+              f"Saídas: R$ {abs(mes_atual['saidas']):.2f}")
+        
         self.pausar()
     
     def listar_contas(self):
-        """Lista todas as contas do sistema."""
-        self.exibir_cabecalho("TODAS AS CONTAS")
+        """Lista todas as contas do sistema, página por página."""
+        por_pagina = 20
+        total = len(self.sistema)
+        offset = 0
         
-        contas = self.sistema.listar_contas()
-        
-        if not contas:
-            print("📭 Nenhuma conta cadastrada no sistema.")
-        else:
-            print(f"📊 Total de contas: {len(contas)}")
+        while True:
+            self.exibir_cabecalho("TODAS AS CONTAS")
+            
+            if total == 0:
+                print("📭 Nenhuma conta cadastrada no sistema.")
+                break
+            
+            print(f"📊 Total de contas: {total}")
             print()
             
-            for conta in contas:
+            for conta in self.sistema.iter_contas(offset, por_pagina):
                 print(f"🔢 Conta: {conta['numero']}")
                 print(f"👤 Titular: {conta['titular']}")
                 print(f"💰 Saldo: R$ {conta['saldo']:.2f}")
                 print(f"📅 Criada em: {conta['data_criacao']}")
                 print("-" * 40)
+            
+            offset += por_pagina
+            if offset >= total:
+                break
+            
+            print(f"... e mais {total - offset} contas")
+            opcao = input("\n📄 Enter para a próxima página ou 0 para voltar: ").strip()
+            if opcao == "0":
+                return
         
         self.pausar()
     
@@ -447,11 +501,18 @@ class InterfaceBancaria:
         except Exception as e:
             print(f"\n💥 Erro inesperado: {e}")
             print("🔧 Entre em contato com o suporte técnico.")
+        finally:
+            self.sistema.fechar()
 
 
 def main():
-    """Função principal para executar a aplicação."""
-    interface = InterfaceBancaria()
+    """
+    Função principal para executar a aplicação.
+    
+    Se a variável de ambiente ``UNITY_BANK_DADOS`` indicar um diretório, o
+    sistema é persistido nele e recuperado na próxima execução.
+    """
+    interface = InterfaceBancaria(os.environ.get('UNITY_BANK_DADOS'))
     interface.executar()
 
 
@@ -0,0 +1,468 @@
+"""
+Sistema Bancário - Módulo Métricas
+Instrumentação opcional das operações: contagens, latências e erros.
+
+A instrumentação é ligada com ``ativar()``, que substitui os métodos das
+classes ``ContaBancaria`` e ``SistemaBancario`` por versões medidas, e
+desligada com ``desativar()``, que devolve os métodos originais. Desligada,
+não há custo algum: os métodos são exatamente os originais. Ligada, conta
+todas as chamadas e erros e mede a latência de uma amostra das chamadas.
+
+Exemplo:
+    >>> from src import metricas
+    >>> registro = metricas.ativar()
+    >>> ...  # operações do sistema
+    >>> print(registro.exportar_prometheus())
+    >>> metricas.desativar()
+"""
+
+import functools
+import json
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+try:
+    from .banco import SistemaBancario
+    from .conta import ContaBancaria
+except ImportError:
+    from banco import SistemaBancario
+    from conta import ContaBancaria
+
+# Métodos instrumentados por classe. Ficam de fora os geradores (o tempo
+# medido seria só o da criação do iterador) e ``buscar_conta``, uma consulta
+# de dicionário chamada por quase todas as operações, em que a medição
+# custaria mais que a própria chamada. Um método chamado por outro
+# instrumentado (ex.: ``transferir`` por ``transferir_entre_contas``) conta
+# apenas como a chamada externa.
+METODOS_INSTRUMENTADOS = {
+    ContaBancaria: ('depositar', 'sacar', 'transferir', 'pagar_conta',
+                    'obter_extrato', 'obter_extrato_periodo', 'totais_periodo',
+                    'resumo_dia', 'resumo_mes', 'pagina_extrato'),
+    SistemaBancario: ('criar_conta', 'criar_contas_em_lote', 'transferir_entre_contas',
+                      'transferir_em_lote', 'buscar_por_documento',
+                      'listar_contas', 'obter_estatisticas', 'buscar_contas_por_titular',
+                      'remover_conta', 'salvar_snapshot'),
+}
+
+# Motivos de erro por trecho da mensagem, testados em ordem; os demais erros
+# usam o nome da exceção. Testes de substring (e não expressões regulares)
+# porque a classificação roda a cada erro, no caminho das operações.
+_MOTIVOS: Tuple[Tuple[str, str], ...] = (
+    ('Saldo insuficiente', 'saldo_insuficiente'),
+    ('Valor', 'valor_invalido'),
+    ('não encontrada', 'conta_inexistente'),
+    ('Já existe conta', 'documento_duplicado'),
+    ('mesma conta', 'mesma_conta'),
+    ('remover conta com saldo', 'conta_com_saldo'),
+)
+
+# Histograma em potências de 2 nanossegundos: a faixa de uma duração é o
+# seu ``bit_length``, sem busca. Exportadas de ~1 µs (2**10) a ~1 s (2**30).
+_FAIXAS = 64
+_PRIMEIRA_FAIXA_EXPORTADA = 10
+_ULTIMA_FAIXA_EXPORTADA = 30
+
+# Prefixo dos nomes das métricas no formato Prometheus
+PREFIXO = 'unity_bank'
+
+
+def motivo_erro(erro: BaseException) -> str:
+    """
+    Classifica um erro de operação em um motivo de baixa cardinalidade.
+
+    Args:
+        erro (BaseException): Exceção levantada pela operação
+
+    Returns:
+        str: Motivo (ex.: ``saldo_insuficiente``) ou o nome da exceção
+    """
+    mensagem = str(erro)
+    for trecho, motivo in _MOTIVOS:
+        if trecho in mensagem:
+            return motivo
+    return type(erro).__name__
+
+
+class RegistroMetricas:
+    """
+    Métricas acumuladas das operações instrumentadas.
+
+    Chamadas e erros são contados em todas as chamadas; a latência é medida
+    em uma de cada ``amostragem`` chamadas, o que mantém o custo da
+    instrumentação baixo mesmo nas operações mais curtas. Cada thread
+    acumula as amostras em uma estrutura própria (sem travas no caminho das
+    operações); as exportações somam as estruturas de todas as threads. A
+    estrutura de uma thread encerrada é somada às das threads anteriores já
+    encerradas, de modo que threads de curta duração não acumulam memória.
+
+    Attributes:
+        amostragem (int): Mede a latência de uma a cada N chamadas
+    """
+
+    def __init__(self, amostragem: int = 16):
+        """
+        Inicializa um registro vazio.
+
+        Args:
+            amostragem (int): Mede a latência de uma a cada N chamadas
+                (1 = todas)
+
+        Raises:
+            ValueError: Se a amostragem não for positiva
+        """
+        if amostragem <= 0:
+            raise ValueError("Amostragem deve ser maior que zero")
+        self.amostragem = amostragem
+        # Reentrante: a estrutura de uma thread encerrada pode ser somada
+        # durante uma coleta de lixo em qualquer ponto
+        self._trava = threading.RLock()
+        self._local = threading.local()
+        # Por operação: contador de chamadas e o valor descontado pela
+        # última limpeza
+        self._contadores: Dict[str, _Contador] = {}
+        self._descontos: Dict[str, int] = {}
+        # Por thread: operação -> [amostras, nanossegundos, faixas...]
+        self._series: List[Dict[str, List[int]]] = []
+        # Por thread: (operação, motivo) -> erros
+        self._erros: List[Dict[Tuple[str, str], int]] = []
+        # Somas das threads já encerradas
+        self._series_encerradas: Dict[str, List[int]] = {}
+        self._erros_encerrados: Dict[Tuple[str, str], int] = {}
+
+    def contador(self, operacao: str) -> Callable[[], int]:
+        """
+        Contador de chamadas de uma operação.
+
+        Args:
+            operacao (str): Nome da operação
+
+        Returns:
+            Callable: Função que conta uma chamada e retorna a contagem anterior
+        """
+        with self._trava:
+            contador = self._contadores.get(operacao)
+            if contador is None:
+                contador = self._contadores[operacao] = _Contador()
+                self._descontos[operacao] = 0
+        return contador.proximo
+
+    def registrar(self, operacao: str, nanossegundos: int):
+        """
+        Registra a latência de uma chamada amostrada.
+
+        Args:
+            operacao (str): Nome da operação
+            nanossegundos (int): Duração da chamada
+        """
+        try:
+            series = self._local.series
+        except AttributeError:
+            series = self._iniciar_thread()
+        serie = series.get(operacao)
+        if serie is None:
+            serie = series[operacao] = [0] * (2 + _FAIXAS)
+        serie[0] += 1
+        serie[1] += nanossegundos
+        serie[2 + min(nanossegundos.bit_length(), _FAIXAS - 1)] += 1
+
+    def registrar_erro(self, operacao: str, erro: BaseException):
+        """
+        Registra uma chamada que falhou.
+
+        Args:
+            operacao (str): Nome da operação
+            erro (BaseException): Exceção levantada pela chamada
+        """
+        try:
+            erros = self._local.erros
+        except AttributeError:
+            self._iniciar_thread()
+            erros = self._local.erros
+        chave = (operacao, motivo_erro(erro))
+        erros[chave] = erros.get(chave, 0) + 1
+
+    def limpar(self):
+        """Descarta todas as métricas acumuladas."""
+        with self._trava:
+            for operacao, contador in self._contadores.items():
+                self._descontos[operacao] = contador.valor
+            for series in self._series:
+                series.clear()
+            for erros in self._erros:
+                erros.clear()
+            self._series_encerradas.clear()
+            self._erros_encerrados.clear()
+
+    def instantaneo(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Consolida as métricas de todas as threads.
+
+        Returns:
+            Dict: Por operação, ``chamadas``, ``erros`` (por motivo),
+            ``amostras``, ``media_segundos``, ``p50_segundos`` e
+            ``p99_segundos`` (limites superiores das faixas do histograma) e
+            ``histograma`` (pares ``[limite em segundos, acumulado]``),
+            estes calculados sobre as chamadas amostradas
+        """
+        chamadas, series, erros = self._consolidar()
+        resultado = {}
+        for operacao in sorted(chamadas):
+            if not chamadas[operacao]:
+                continue
+            serie = series.get(operacao, [0] * (2 + _FAIXAS))
+            resultado[operacao] = {
+                'chamadas': chamadas[operacao],
+                'erros': {motivo: quantidade
+                          for (nome, motivo), quantidade in sorted(erros.items())
+                          if nome == operacao},
+                'amostras': serie[0],
+                'media_segundos': serie[1] / 1e9 / serie[0] if serie[0] else None,
+                'p50_segundos': self._percentil(serie, 0.50),
+                'p99_segundos': self._percentil(serie, 0.99),
+                'histograma': [[limite, acumulado]
+                               for limite, acumulado in self._acumulados(serie)],
+            }
+        return resultado
+
+    def exportar_json(self) -> str:
+        """
+        Exporta as métricas como JSON.
+
+        Returns:
+            str: Documento JSON de ``instantaneo()``
+        """
+        return json.dumps(self.instantaneo(), ensure_ascii=False, indent=2)
+
+    def exportar_prometheus(self) -> str:
+        """
+        Exporta as métricas no formato de texto do Prometheus.
+
+        Returns:
+            str: Contadores de chamadas e erros e histograma de latência
+            (das chamadas amostradas)
+        """
+        chamadas, series, erros = self._consolidar()
+        linhas = [
+            f"# HELP {PREFIXO}_operacoes_total Chamadas por operação",
+            f"# TYPE {PREFIXO}_operacoes_total counter",
+        ]
+        for operacao in sorted(chamadas):
+            if chamadas[operacao]:
+                linhas.append(f'{PREFIXO}_operacoes_total{{operacao="{operacao}"}} '
+                              f'{chamadas[operacao]}')
+
+        linhas += [
+            f"# HELP {PREFIXO}_erros_total Operações que falharam, por motivo",
+            f"# TYPE {PREFIXO}_erros_total counter",
+        ]
+        for (operacao, motivo), quantidade in sorted(erros.items()):
+            linhas.append(f'{PREFIXO}_erros_total{{operacao="{operacao}",'
+                          f'motivo="{motivo}"}} {quantidade}')
+
+        linhas += [
+            f"# HELP {PREFIXO}_duracao_segundos Latência das operações "
+            f"(1 a cada {self.amostragem} chamadas)",
+            f"# TYPE {PREFIXO}_duracao_segundos histogram",
+        ]
+        for operacao in sorted(series):
+            serie = series[operacao]
+            rotulo = f'operacao="{operacao}"'
+            for limite, acumulado in self._acumulados(serie):
+                linhas.append(f'{PREFIXO}_duracao_segundos_bucket{{{rotulo},'
+                              f'le="{limite:.9g}"}} {acumulado}')
+            linhas.append(f'{PREFIXO}_duracao_segundos_bucket{{{rotulo},le="+Inf"}} '
+                          f'{serie[0]}')
+            linhas.append(f'{PREFIXO}_duracao_segundos_sum{{{rotulo}}} '
+                          f'{serie[1] / 1e9:.9f}')
+            linhas.append(f'{PREFIXO}_duracao_segundos_count{{{rotulo}}} {serie[0]}')
+        return '\n'.join(linhas) + '\n'
+
+    def _iniciar_thread(self) -> Dict[str, List[int]]:
+        """Cria as estruturas da thread atual e as inclui nas exportações."""
+        series: Dict[str, List[int]] = {}
+        erros: Dict[Tuple[str, str], int] = {}
+        with self._trava:
+            self._series.append(series)
+            self._erros.append(erros)
+        # O marcador só é referenciado pela thread: ao fim dela, é coletado
+        # e as estruturas passam para as somas das threads encerradas
+        marcador = _Marcador()
+        weakref.finalize(marcador, self._encerrar_thread, series, erros)
+        self._local.marcador = marcador
+        self._local.series = series
+        self._local.erros = erros
+        return series
+
+    def _encerrar_thread(self, series: Dict[str, List[int]],
+                         erros: Dict[Tuple[str, str], int]):
+        """Soma as estruturas de uma thread encerrada e as descarta."""
+        with self._trava:
+            self._series = [outras for outras in self._series if outras is not series]
+            self._erros = [outros for outros in self._erros if outros is not erros]
+            self._somar(self._series_encerradas, self._erros_encerrados, series, erros)
+
+    @staticmethod
+    def _somar(series: Dict[str, List[int]], erros: Dict[Tuple[str, str], int],
+               series_thread: Dict[str, List[int]],
+               erros_thread: Dict[Tuple[str, str], int]):
+        """Acumula as estruturas de uma thread em ``series`` e ``erros``."""
+        for operacao, serie in list(series_thread.items()):
+            total = series.setdefault(operacao, [0] * (2 + _FAIXAS))
+            for indice, valor in enumerate(list(serie)):
+                total[indice] += valor
+        for chave, quantidade in list(erros_thread.items()):
+            erros[chave] = erros.get(chave, 0) + quantidade
+
+    def _consolidar(self) -> Tuple[Dict[str, int], Dict[str, List[int]],
+                                   Dict[Tuple[str, str], int]]:
+        """Lê os contadores e soma as estruturas de todas as threads."""
+        series: Dict[str, List[int]] = {}
+        erros: Dict[Tuple[str, str], int] = {}
+        with self._trava:
+            chamadas = {operacao: contador.valor - self._descontos[operacao]
+                        for operacao, contador in self._contadores.items()}
+            self._somar(series, erros, self._series_encerradas, self._erros_encerrados)
+            for series_thread, erros_thread in zip(self._series, self._erros):
+                self._somar(series, erros, series_thread, erros_thread)
+        return chamadas, series, erros
+
+    @staticmethod
+    def _acumulados(serie: List[int]) -> List[Tuple[float, int]]:
+        """Contagens acumuladas por limite de faixa exportado (em segundos)."""
+        acumulado = sum(serie[2:2 + _PRIMEIRA_FAIXA_EXPORTADA])
+        resultado = []
+        for faixa in range(_PRIMEIRA_FAIXA_EXPORTADA, _ULTIMA_FAIXA_EXPORTADA + 1):
+            acumulado += serie[2 + faixa]
+            # Faixa b: durações de 2**(b-1) a 2**b - 1 nanossegundos
+            resultado.append(((1 << faixa) / 1e9, acumulado))
+        return resultado
+
+    @staticmethod
+    def _percentil(serie: List[int], fracao: float) -> Optional[float]:
+        """Limite superior (em segundos) da faixa que contém o percentil."""
+        if not serie[0]:
+            return None
+        alvo = fracao * serie[0]
+        acumulado = 0
+        for faixa in range(_FAIXAS):
+            acumulado += serie[2 + faixa]
+            if acumulado >= alvo:
+                return (1 << faixa) / 1e9
+        return None
+
+
+class _Marcador:
+    """Objeto guardado por cada thread para detectar o seu encerramento."""
+
+    __slots__ = ('__weakref__',)
+
+
+class _Contador:
+    """Contador de chamadas compartilhado pelas threads."""
+
+    __slots__ = ('valor', '_trava')
+
+    def __init__(self):
+        self.valor = 0
+        self._trava = threading.Lock()
+
+    def proximo(self) -> int:
+        """Conta uma chamada e retorna a contagem anterior."""
+        with self._trava:
+            valor = self.valor
+            self.valor = valor + 1
+        return valor
+
+
+# Estado da instrumentação: métodos originais e registro ativo
+_originais: Dict[Tuple[type, str], Callable] = {}
+_registro: Optional[RegistroMetricas] = None
+_trava_ativacao = threading.Lock()
+
+
+def _instrumentar(metodo: Callable, operacao: str,
+                  registro: RegistroMetricas) -> Callable:
+    """Envolve um método contando chamadas e erros e amostrando a latência."""
+    relogio = time.perf_counter_ns
+    local = registro._local
+    contar = registro.contador(operacao)
+    registrar = registro.registrar
+    registrar_erro = registro.registrar_erro
+    amostragem = registro.amostragem
+
+    @functools.wraps(metodo)
+    def instrumentado(*args, **kwargs):
+        if getattr(local, 'aninhada', False):
+            # Chamada por outra operação instrumentada: já contada por ela
+            return metodo(*args, **kwargs)
+        local.aninhada = True
+        try:
+            if contar() % amostragem:
+                try:
+                    return metodo(*args, **kwargs)
+                except Exception as erro:
+                    registrar_erro(operacao, erro)
+                    raise
+            inicio = relogio()
+            try:
+                resultado = metodo(*args, **kwargs)
+            except Exception as erro:
+                registrar(operacao, relogio() - inicio)
+                registrar_erro(operacao, erro)
+                raise
+            registrar(operacao, relogio() - inicio)
+            return resultado
+        finally:
+            local.aninhada = False
+
+    return instrumentado
+
+
+def ativar(registro: Optional[RegistroMetricas] = None) -> RegistroMetricas:
+    """
+    Liga a instrumentação das operações.
+
+    Args:
+        registro (RegistroMetricas): Registro que acumula as métricas (None
+            = um novo registro)
+
+    Returns:
+        RegistroMetricas: Registro em uso
+    """
+    global _registro
+    with _trava_ativacao:
+        if _registro is not None:
+            _restaurar()
+        _registro = registro if registro is not None else RegistroMetricas()
+        for classe, metodos in METODOS_INSTRUMENTADOS.items():
+            for nome in metodos:
+                original = classe.__dict__[nome]
+                _originais[(classe, nome)] = original
+                setattr(classe, nome, _instrumentar(original, nome, _registro))
+        return _registro
+
+
+def desativar():
+    """Desliga a instrumentação, devolvendo os métodos originais."""
+    global _registro
+    with _trava_ativacao:
+        _restaurar()
+        _registro = None
+
+
+def registro_ativo() -> Optional[RegistroMetricas]:
+    """
+    Registro da instrumentação ligada.
+
+    Returns:
+        RegistroMetricas: Registro em uso ou None se desligada
+    """
+    return _registro
+
+
+def _restaurar():
+    """Devolve os métodos originais (com a trava de ativação obtida)."""
+    for (classe, nome), original in _originais.items():
+        setattr(classe, nome, original)
+    _originais.clear()
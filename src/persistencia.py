@@ -0,0 +1,282 @@
+"""
+Sistema Bancário - Módulo Persistência
+Diário de operações (write-ahead log) com gravação em grupo.
+
+O estado do sistema é recuperado carregando o snapshot mais recente (módulo
+``snapshot``) e reaplicando apenas as operações do diário posteriores a ele.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Iterator, List, Optional, Tuple
+
+# Nomes dos segmentos do diário dentro do diretório de dados
+_PREFIXO_SEGMENTO = 'diario-'
+_SUFIXO_SEGMENTO = '.log'
+
+
+def caminho_segmento(diretorio: str, primeira_sequencia: int) -> str:
+    """
+    Monta o caminho do segmento do diário iniciado em uma sequência.
+
+    Args:
+        diretorio (str): Diretório de dados
+        primeira_sequencia (int): Sequência do primeiro registro do segmento
+
+    Returns:
+        str: Caminho do arquivo do segmento
+    """
+    return os.path.join(diretorio, f"{_PREFIXO_SEGMENTO}{primeira_sequencia:020d}"
+                                   f"{_SUFIXO_SEGMENTO}")
+
+
+def listar_segmentos(diretorio: str) -> List[Tuple[int, str]]:
+    """
+    Lista os segmentos do diário em ordem de sequência.
+
+    Args:
+        diretorio (str): Diretório de dados
+
+    Returns:
+        List[Tuple[int, str]]: Pares ``(primeira sequência, caminho)``
+    """
+    segmentos = []
+    for nome in os.listdir(diretorio):
+        if nome.startswith(_PREFIXO_SEGMENTO) and nome.endswith(_SUFIXO_SEGMENTO):
+            numero = nome[len(_PREFIXO_SEGMENTO):-len(_SUFIXO_SEGMENTO)]
+            if numero.isdigit():
+                segmentos.append((int(numero), os.path.join(diretorio, nome)))
+    segmentos.sort()
+    return segmentos
+
+
+def ler_segmento(caminho: str) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    Lê os registros de um segmento do diário.
+
+    A leitura para no primeiro registro incompleto ou corrompido, que só
+    pode ser resultado de uma gravação interrompida no final do arquivo.
+
+    Args:
+        caminho (str): Caminho do segmento
+
+    Yields:
+        Tuple: Posição do fim do registro no arquivo e o registro
+        ``[sequencia, operacao, ...]``
+    """
+    posicao = 0
+    with open(caminho, 'rb') as arquivo:
+        for linha in arquivo:
+            if not linha.endswith(b'\n'):
+                return
+            try:
+                registro = json.loads(linha)
+            except ValueError:
+                return
+            posicao += len(linha)
+            yield posicao, registro
+
+
+def sincronizar_diretorio(diretorio: str):
+    """Torna duráveis as criações e renomeações de arquivos do diretório."""
+    try:
+        descritor = os.open(diretorio, os.O_RDONLY)
+    except OSError:
+        # Plataformas sem fsync de diretórios (ex.: Windows)
+        return
+    try:
+        os.fsync(descritor)
+    except OSError:
+        pass
+    finally:
+        os.close(descritor)
+
+
+class DiarioOperacoes:
+    """
+    Diário de operações em linhas JSON, com gravação em grupo.
+
+    Cada registro recebe um número de sequência crescente. Os registros são
+    acumulados em memória e gravados por uma thread dedicada: os que chegam
+    enquanto um ``fsync`` está em andamento são gravados juntos no próximo,
+    de modo que operações simultâneas compartilham o custo da sincronização.
+
+    O diário é dividido em segmentos; um novo segmento é iniciado a cada
+    snapshot, e os anteriores podem então ser descartados.
+    """
+
+    def __init__(self, diretorio: str, sequencia: int = 0,
+                 tamanho_valido: Optional[int] = None):
+        """
+        Abre o diário para gravação.
+
+        Args:
+            diretorio (str): Diretório de dados
+            sequencia (int): Última sequência já registrada
+            tamanho_valido (int): Tamanho válido do último segmento; o
+                restante (gravação interrompida) é descartado
+        """
+        self._diretorio = diretorio
+        self._sequencia = sequencia
+        self._gravado = sequencia
+        self._pendentes: List[bytes] = []
+        self._erro: Optional[OSError] = None
+        self._fechado = False
+        self._local = threading.local()
+
+        self._trava = threading.Lock()
+        self._tem_pendentes = threading.Condition(self._trava)
+        self._gravou = threading.Condition(self._trava)
+
+        segmentos = listar_segmentos(diretorio)
+        if segmentos:
+            self._caminho = segmentos[-1][1]
+            if tamanho_valido is not None:
+                with open(self._caminho, 'r+b') as arquivo:
+                    arquivo.truncate(tamanho_valido)
+        else:
+            self._caminho = caminho_segmento(diretorio, sequencia + 1)
+        self._arquivo = open(self._caminho, 'ab')
+        sincronizar_diretorio(diretorio)
+
+        self._gravador = threading.Thread(target=self._gravar_continuamente,
+                                          name='diario-operacoes', daemon=True)
+        self._gravador.start()
+
+    @property
+    def sequencia(self) -> int:
+        """Sequência do último registro aceito."""
+        return self._sequencia
+
+    def registrar(self, registro: List[Any]) -> int:
+        """
+        Acrescenta um registro ao diário (sem aguardar a gravação).
+
+        Args:
+            registro (List): Operação e seus dados, ex.: ``['R', 1001]``
+
+        Returns:
+            int: Sequência atribuída ao registro
+
+        Raises:
+            RuntimeError: Se o diário estiver fechado ou com falha de gravação
+        """
+        with self._trava:
+            if self._fechado or self._erro is not None:
+                raise RuntimeError("Diário de operações indisponível")
+            self._sequencia += 1
+            sequencia = self._sequencia
+            self._pendentes.append(
+                json.dumps([sequencia] + registro, ensure_ascii=False,
+                           separators=(',', ':')).encode('utf-8') + b'\n')
+            self._tem_pendentes.notify()
+        self._local.sequencia = sequencia
+        return sequencia
+
+    @property
+    def sequencia_gravada(self) -> int:
+        """Sequência do último registro já gravado em disco."""
+        return self._gravado
+
+    def sequencia_da_thread(self) -> int:
+        """Sequência do último registro feito pela thread atual (0 = nenhum)."""
+        return getattr(self._local, 'sequencia', 0)
+
+    def definir_sequencia_da_thread(self, sequencia: int):
+        """
+        Define o registro que a thread atual deve aguardar.
+
+        Para operações que não gravam um registro próprio: uma repetição
+        aponta para o registro da operação original e uma operação sem
+        registro usa 0 (nada a aguardar).
+
+        Args:
+            sequencia (int): Sequência do registro (0 = nenhum)
+        """
+        self._local.sequencia = sequencia
+
+    def aguardar(self, sequencia: Optional[int] = None):
+        """
+        Aguarda até que um registro esteja gravado em disco.
+
+        Args:
+            sequencia (int): Sequência a aguardar (None = último registro
+                feito pela thread atual)
+
+        Raises:
+            RuntimeError: Se a gravação do diário falhar
+        """
+        if sequencia is None:
+            sequencia = self.sequencia_da_thread()
+        if self._gravado >= sequencia:
+            return
+        with self._trava:
+            while self._gravado < sequencia:
+                if self._erro is not None:
+                    raise RuntimeError("Falha ao gravar o diário de operações") \
+                        from self._erro
+                self._gravou.wait()
+
+    def iniciar_segmento(self):
+        """
+        Inicia um novo segmento a partir da próxima sequência.
+
+        Deve ser chamado sem registros simultâneos (com o sistema bloqueado);
+        os registros pendentes são gravados no segmento atual antes da troca.
+        """
+        self.aguardar(self._sequencia)
+        with self._trava:
+            self._arquivo.close()
+            self._caminho = caminho_segmento(self._diretorio, self._sequencia + 1)
+            self._arquivo = open(self._caminho, 'ab')
+        sincronizar_diretorio(self._diretorio)
+
+    def descartar_segmentos(self, sequencia: int):
+        """
+        Remove os segmentos cujos registros são todos anteriores a uma sequência.
+
+        Args:
+            sequencia (int): Sequência já coberta por um snapshot durável
+        """
+        segmentos = listar_segmentos(self._diretorio)
+        for indice, (_, caminho) in enumerate(segmentos[:-1]):
+            # Um segmento termina onde o seguinte começa
+            if segmentos[indice + 1][0] <= sequencia + 1 and caminho != self._caminho:
+                os.remove(caminho)
+
+    def fechar(self):
+        """Grava os registros pendentes e fecha o diário."""
+        with self._trava:
+            if self._fechado:
+                return
+            self._fechado = True
+            self._tem_pendentes.notify()
+        self._gravador.join()
+        self._arquivo.close()
+
+    def _gravar_continuamente(self):
+        """Laço da thread gravadora: grava e sincroniza os registros em grupo."""
+        while True:
+            with self._trava:
+                while not self._pendentes and not self._fechado:
+                    self._tem_pendentes.wait()
+                if not self._pendentes:
+                    return
+                lote, self._pendentes = self._pendentes, []
+                ultima = self._sequencia
+                arquivo = self._arquivo
+
+            try:
+                arquivo.write(b''.join(lote))
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+            except OSError as erro:
+                with self._trava:
+                    self._erro = erro
+                    self._gravou.notify_all()
+                return
+
+            with self._trava:
+                self._gravado = ultima
+                self._gravou.notify_all()
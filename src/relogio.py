@@ -0,0 +1,265 @@
+"""
+Sistema Bancário - Módulo Relógio
+Relógios intercambiáveis em microssegundos e formatação de datas com cache.
+
+Todas as datas/horas do sistema (criação de contas e transações) são lidas
+do relógio em uso, como inteiros em microssegundos desde a época (hora
+local, no mesmo formato de ``extrato.para_timestamp``):
+
+- ``RelogioSistema`` (padrão): hora exata do sistema, sem montar objetos
+  ``datetime``;
+- ``RelogioGrosso``: valor em cache, atualizado por uma thread a cada
+  intervalo (a leitura é só um acesso a atributo);
+- ``RelogioManual``: hora controlada pelo chamador, para testes e
+  simulações determinísticos.
+
+Exemplo:
+    >>> from src import relogio
+    >>> anterior = relogio.definir_relogio(relogio.RelogioManual(datetime(2024, 1, 1)))
+    >>> ...  # operações com data/hora fixa
+    >>> relogio.definir_relogio(anterior)
+"""
+
+import functools
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Union
+try:
+    from .extrato import de_timestamp, para_timestamp
+except ImportError:
+    from extrato import de_timestamp, para_timestamp
+
+# Formato padrão de data/hora exibido ao usuário
+FORMATO_DATA_HORA = "%d/%m/%Y %H:%M:%S"
+
+# Intervalo em que o fuso horário local é relido (mudanças de horário de
+# verão acontecem em múltiplos de 15 minutos)
+_JANELA_FUSO_NS = 15 * 60 * 1_000_000_000
+
+
+class Relogio(ABC):
+    """Fonte de data/hora do sistema, em microssegundos desde a época."""
+
+    @abstractmethod
+    def timestamp(self) -> int:
+        """
+        Lê a data/hora atual.
+
+        Returns:
+            int: Microssegundos desde 01/01/1970 00:00 (hora local)
+        """
+
+
+class RelogioSistema(Relogio):
+    """
+    Hora exata do sistema.
+
+    Lê ``time.time_ns()`` e soma o deslocamento do fuso local, relido a
+    cada 15 minutos, sem criar objetos ``datetime``.
+    """
+
+    def __init__(self):
+        """Inicializa o relógio."""
+        # (janela, deslocamento em µs) trocados juntos, em uma única atribuição
+        self._fuso = (None, 0)
+
+    def timestamp(self) -> int:
+        """
+        Lê a data/hora atual.
+
+        Returns:
+            int: Microssegundos desde 01/01/1970 00:00 (hora local)
+        """
+        nanossegundos = time.time_ns()
+        janela, deslocamento = self._fuso
+        if nanossegundos // _JANELA_FUSO_NS != janela:
+            deslocamento = time.localtime(nanossegundos // 1_000_000_000).tm_gmtoff * 1_000_000
+            self._fuso = (nanossegundos // _JANELA_FUSO_NS, deslocamento)
+        return nanossegundos // 1000 + deslocamento
+
+
+class RelogioGrosso(Relogio):
+    """
+    Hora do sistema em cache, atualizada uma vez por intervalo.
+
+    Uma thread de fundo relê a hora a cada ``intervalo`` segundos; as
+    leituras apenas devolvem o último valor. Transações próximas recebem a
+    mesma data/hora (a precisão é a do intervalo).
+    """
+
+    def __init__(self, intervalo: float = 0.01):
+        """
+        Inicializa o relógio e inicia a thread de atualização.
+
+        Args:
+            intervalo (float): Segundos entre atualizações
+
+        Raises:
+            ValueError: Se o intervalo não for positivo
+        """
+        if intervalo <= 0:
+            raise ValueError("Intervalo deve ser maior que zero")
+        self.intervalo = intervalo
+        self._origem = RelogioSistema()
+        self._atual = self._origem.timestamp()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._atualizar, daemon=True,
+                                        name="relogio-grosso")
+        self._thread.start()
+
+    def timestamp(self) -> int:
+        """
+        Lê a data/hora da última atualização.
+
+        Returns:
+            int: Microssegundos desde 01/01/1970 00:00 (hora local)
+        """
+        return self._atual
+
+    def parar(self):
+        """Encerra a thread de atualização (a hora deixa de avançar)."""
+        self._parar.set()
+        self._thread.join()
+
+    def _atualizar(self):
+        """Laço da thread de atualização."""
+        while not self._parar.wait(self.intervalo):
+            self._atual = self._origem.timestamp()
+
+
+class RelogioManual(Relogio):
+    """
+    Hora controlada pelo chamador.
+
+    Attributes:
+        passo (int): Microssegundos somados após cada leitura (0 = hora fixa)
+    """
+
+    def __init__(self, inicio: Union[datetime, int] = 0, passo: int = 0):
+        """
+        Inicializa o relógio.
+
+        Args:
+            inicio (datetime | int): Data/hora inicial (ou microssegundos
+                desde a época)
+            passo (int): Microssegundos somados após cada leitura
+        """
+        self._atual = 0
+        self.passo = passo
+        self._trava = threading.Lock()
+        self.definir(inicio)
+
+    def timestamp(self) -> int:
+        """
+        Lê a data/hora atual e avança o passo.
+
+        Returns:
+            int: Microssegundos desde 01/01/1970 00:00
+        """
+        with self._trava:
+            atual = self._atual
+            self._atual += self.passo
+        return atual
+
+    def definir(self, data_hora: Union[datetime, int]):
+        """
+        Define a data/hora atual.
+
+        Args:
+            data_hora (datetime | int): Data/hora (ou microssegundos desde a época)
+        """
+        if isinstance(data_hora, datetime):
+            data_hora = para_timestamp(data_hora)
+        with self._trava:
+            self._atual = data_hora
+
+    def avancar(self, microssegundos: int):
+        """
+        Avança a hora.
+
+        Args:
+            microssegundos (int): Quantidade a avançar
+        """
+        with self._trava:
+            self._atual += microssegundos
+
+
+# Relógio em uso pelo sistema
+_relogio: Relogio = RelogioSistema()
+
+
+def definir_relogio(relogio: Relogio) -> Relogio:
+    """
+    Troca o relógio usado pelo sistema.
+
+    Args:
+        relogio (Relogio): Novo relógio
+
+    Returns:
+        Relogio: Relógio usado até então (para restaurá-lo depois)
+    """
+    global _relogio
+    anterior, _relogio = _relogio, relogio
+    return anterior
+
+
+def relogio_atual() -> Relogio:
+    """
+    Obtém o relógio usado pelo sistema.
+
+    Returns:
+        Relogio: Relógio em uso
+    """
+    return _relogio
+
+
+def timestamp_agora() -> int:
+    """
+    Lê a data/hora atual do relógio em uso.
+
+    Returns:
+        int: Microssegundos desde 01/01/1970 00:00 (hora local)
+    """
+    return _relogio.timestamp()
+
+
+def formatar_timestamp(timestamp: int, formato: str = FORMATO_DATA_HORA) -> str:
+    """
+    Formata uma data/hora, reaproveitando as formatações recentes.
+
+    Datas/horas do mesmo segundo têm o mesmo texto (exceto em formatos com
+    ``%f``), de modo que contas criadas em lote e transações próximas
+    custam uma única chamada a ``strftime``.
+
+    Args:
+        timestamp (int): Microssegundos desde a época
+        formato (str): Formato de ``strftime``
+
+    Returns:
+        str: Data/hora formatada
+    """
+    if '%f' in formato:
+        return de_timestamp(timestamp).strftime(formato)
+    return _formatar_segundo(timestamp // 1_000_000, formato)
+
+
+def formatar_data(data_hora: datetime, formato: str = FORMATO_DATA_HORA) -> str:
+    """
+    Formata um ``datetime`` com o cache de ``formatar_timestamp``.
+
+    Args:
+        data_hora (datetime): Data/hora a formatar
+        formato (str): Formato de ``strftime``
+
+    Returns:
+        str: Data/hora formatada
+    """
+    return formatar_timestamp(para_timestamp(data_hora), formato)
+
+
+@functools.lru_cache(maxsize=4096)
+def _formatar_segundo(segundo: int, formato: str) -> str:
+    """Formata o início de um segundo (em cache)."""
+    return de_timestamp(segundo * 1_000_000).strftime(formato)
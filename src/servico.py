@@ -0,0 +1,398 @@
+"""
+Sistema Bancário - Módulo Serviço
+Fachada assíncrona (asyncio) do sistema bancário e endpoint TCP em linhas JSON.
+
+Protocolo TCP: cada linha é um pedido JSON ``{"id": 1, "op": "depositar",
+"args": {"numero_conta": 1001, "valor": 50}}`` e recebe uma linha de
+resposta ``{"id": 1, "ok": true, "resultado": ...}`` ou ``{"id": 1, "ok":
+false, "erro": "..."}``. Pedidos de uma mesma conexão podem ser enviados
+sem aguardar as respostas, que são identificadas pelo ``id``. As operações
+que alteram o sistema aceitam ``chave_idempotencia`` em ``args``: um pedido
+repetido (ex.: após um tempo esgotado) com a mesma chave não é reexecutado.
+
+Para executar:
+    python -m src.servico --porta 8765 --dados ./dados
+"""
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Tuple
+try:
+    from .banco import SistemaBancario
+    from .persistencia import DiarioOperacoes
+except ImportError:
+    from banco import SistemaBancario
+    from persistencia import DiarioOperacoes
+
+# Operações disponíveis pelo endpoint TCP
+OPERACOES = ('criar_conta', 'depositar', 'sacar', 'transferir', 'pagar_conta',
+             'remover_conta', 'saldo', 'extrato', 'estatisticas')
+# Argumentos de texto, recusados no pedido quando vêm com outro tipo
+_ARGUMENTOS_TEXTO = ('titular', 'cpf_cnpj', 'descricao', 'chave_idempotencia')
+
+
+def _serializar(objeto: Any) -> Any:
+    """Converte para JSON o que não é nativo: transações viram objetos, o resto texto."""
+    if isinstance(objeto, Mapping):
+        return dict(objeto)
+    return str(objeto)
+
+
+class ServicoBancario:
+    """
+    Fachada assíncrona do sistema bancário.
+
+    As operações executam no próprio laço de eventos. Cada uma é uma seção
+    crítica curta e sem bloqueio: as operações de uma mesma conta ficam
+    serializadas na ordem de chegada e as de contas diferentes se intercalam
+    livremente, sem threads. Em um sistema persistente síncrono, a gravação
+    em disco é confirmada sem bloquear o laço: uma única tarefa acompanha o
+    diário e libera as operações à medida que cada grupo é gravado.
+
+    Attributes:
+        sistema (SistemaBancario): Sistema bancário atendido
+    """
+
+    def __init__(self, sistema: SistemaBancario):
+        """
+        Inicializa o serviço.
+
+        Args:
+            sistema (SistemaBancario): Sistema bancário atendido
+        """
+        self.sistema = sistema
+        # Operações aguardando gravação: (sequência, desempate, futuro)
+        self._pendentes: List[Tuple[int, int, asyncio.Future]] = []
+        self._desempate = itertools.count()
+        self._maior_pendente = 0
+        self._acompanhamento: Optional[asyncio.Task] = None
+
+    async def criar_conta(self, titular: str, cpf_cnpj: str,
+                          chave_idempotencia: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Cria uma nova conta.
+
+        Args:
+            titular (str): Nome do titular
+            cpf_cnpj (str): CPF ou CNPJ do titular
+            chave_idempotencia (str): Chave para repetições seguras do pedido
+
+        Returns:
+            Dict: Resumo da conta criada
+        """
+        return await self._executar(
+            lambda: self.sistema.criar_conta(titular, cpf_cnpj,
+                                             chave_idempotencia).resumo())
+
+    async def depositar(self, numero_conta: int, valor: Any,
+                        descricao: str = "Depósito",
+                        chave_idempotencia: Optional[str] = None) -> float:
+        """
+        Deposita em uma conta.
+
+        Args:
+            numero_conta (int): Número da conta
+            valor: Valor em reais
+            descricao (str): Descrição da transação
+            chave_idempotencia (str): Chave para repetições seguras do pedido
+
+        Returns:
+            float: Saldo da conta após o depósito
+        """
+        def operar():
+            conta = self.sistema.autenticar_conta(numero_conta)
+            conta.depositar(valor, descricao, chave_idempotencia)
+            return conta.saldo
+        return await self._executar(operar)
+
+    async def sacar(self, numero_conta: int, valor: Any,
+                    descricao: str = "Saque",
+                    chave_idempotencia: Optional[str] = None) -> float:
+        """
+        Saca de uma conta.
+
+        Args:
+            numero_conta (int): Número da conta
+            valor: Valor em reais
+            descricao (str): Descrição da transação
+            chave_idempotencia (str): Chave para repetições seguras do pedido
+
+        Returns:
+            float: Saldo da conta após o saque
+        """
+        def operar():
+            conta = self.sistema.autenticar_conta(numero_conta)
+            conta.sacar(valor, descricao, chave_idempotencia)
+            return conta.saldo
+        return await self._executar(operar)
+
+    async def transferir(self, numero_origem: int, numero_destino: int,
+                         valor: Any, descricao: str = "Transferência",
+                         chave_idempotencia: Optional[str] = None) -> float:
+        """
+        Transfere entre duas contas do sistema.
+
+        Args:
+            numero_origem (int): Número da conta de origem
+            numero_destino (int): Número da conta de destino
+            valor: Valor em reais
+            descricao (str): Descrição da transferência
+            chave_idempotencia (str): Chave para repetições seguras do pedido
+
+        Returns:
+            float: Saldo da conta de origem após a transferência
+        """
+        def operar():
+            self.sistema.transferir_entre_contas(numero_origem, numero_destino,
+                                                 valor, descricao, chave_idempotencia)
+            return self.sistema.contas[numero_origem].saldo
+        return await self._executar(operar)
+
+    async def pagar_conta(self, numero_conta: int, valor: Any,
+                          descricao: str,
+                          chave_idempotencia: Optional[str] = None) -> float:
+        """
+        Paga uma conta/serviço.
+
+        Args:
+            numero_conta (int): Número da conta
+            valor: Valor em reais
+            descricao (str): Descrição do pagamento
+            chave_idempotencia (str): Chave para repetições seguras do pedido
+
+        Returns:
+            float: Saldo da conta após o pagamento
+        """
+        def operar():
+            conta = self.sistema.autenticar_conta(numero_conta)
+            conta.pagar_conta(valor, descricao, chave_idempotencia)
+            return conta.saldo
+        return await self._executar(operar)
+
+    async def remover_conta(self, numero_conta: int,
+                            chave_idempotencia: Optional[str] = None) -> bool:
+        """
+        Remove uma conta com saldo zero.
+
+        Args:
+            numero_conta (int): Número da conta
+            chave_idempotencia (str): Chave para repetições seguras do pedido
+
+        Returns:
+            bool: True se a conta foi removida
+        """
+        return await self._executar(
+            lambda: self.sistema.remover_conta(numero_conta, chave_idempotencia))
+
+    async def saldo(self, numero_conta: int) -> float:
+        """
+        Consulta o saldo de uma conta.
+
+        Args:
+            numero_conta (int): Número da conta
+
+        Returns:
+            float: Saldo atual
+        """
+        return self.sistema.autenticar_conta(numero_conta).obter_saldo()
+
+    async def extrato(self, numero_conta: int, cursor: Optional[int] = None,
+                      limite: int = 10) -> Dict[str, Any]:
+        """
+        Consulta uma página do extrato (mais recentes primeiro).
+
+        Args:
+            numero_conta (int): Número da conta
+            cursor (int): Cursor retornado pela página anterior
+            limite (int): Quantidade máxima de transações
+
+        Returns:
+            Dict: ``transacoes`` e ``proximo_cursor``
+        """
+        return self.sistema.autenticar_conta(numero_conta).pagina_extrato(
+            cursor, limite)
+
+    async def estatisticas(self) -> Dict[str, Any]:
+        """
+        Consulta as estatísticas do sistema.
+
+        Returns:
+            Dict: Estatísticas (mesmo formato de ``obter_estatisticas``)
+        """
+        return self.sistema.obter_estatisticas()
+
+    async def _executar(self, operacao: Callable[[], Any]) -> Any:
+        """
+        Executa uma operação que altera o sistema e aguarda sua gravação.
+
+        Args:
+            operacao (Callable): Função síncrona que executa a operação
+
+        Returns:
+            Resultado da operação
+        """
+        sistema = self.sistema
+        diario = sistema._diario
+        if diario is not None:
+            # A operação define o registro a aguardar: o seu próprio ou, em
+            # uma repetição, o da operação original (0 = nenhum)
+            diario.definir_sequencia_da_thread(0)
+        sistema._adiar_persistencia()
+        try:
+            resultado = operacao()
+        finally:
+            sistema._adiar_persistencia(False)
+
+        if diario is not None and sistema._sincrono:
+            await self._confirmar(diario, diario.sequencia_da_thread())
+        return resultado
+
+    async def _confirmar(self, diario: DiarioOperacoes, sequencia: int):
+        """Aguarda, sem bloquear o laço, até que a sequência esteja gravada."""
+        if diario.sequencia_gravada >= sequencia:
+            return
+        futuro = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._pendentes, (sequencia, next(self._desempate), futuro))
+        self._maior_pendente = max(self._maior_pendente, sequencia)
+        if self._acompanhamento is None or self._acompanhamento.done():
+            self._acompanhamento = asyncio.ensure_future(self._acompanhar(diario))
+        await futuro
+
+    async def _acompanhar(self, diario: DiarioOperacoes):
+        """Libera as operações pendentes à medida que o diário é gravado."""
+        laco = asyncio.get_running_loop()
+        while self._pendentes:
+            try:
+                # Um único aguardo em outra thread cobre todas as pendentes
+                await laco.run_in_executor(None, diario.aguardar, self._maior_pendente)
+            except RuntimeError as erro:
+                for _, _, futuro in self._pendentes:
+                    if not futuro.done():
+                        futuro.set_exception(erro)
+                self._pendentes.clear()
+                return
+            gravada = diario.sequencia_gravada
+            while self._pendentes and self._pendentes[0][0] <= gravada:
+                futuro = heapq.heappop(self._pendentes)[2]
+                if not futuro.done():
+                    futuro.set_result(None)
+
+    async def processar(self, linha: bytes) -> bytes:
+        """
+        Processa um pedido do protocolo em linhas JSON.
+
+        Args:
+            linha (bytes): Pedido JSON
+
+        Returns:
+            bytes: Resposta JSON terminada em quebra de linha
+        """
+        identificador = None
+        try:
+            pedido = json.loads(linha)
+            if not isinstance(pedido, dict):
+                raise ValueError("Pedido inválido")
+            identificador = pedido.get('id')
+            operacao = pedido.get('op')
+            if operacao not in OPERACOES:
+                raise ValueError(f"Operação desconhecida: {operacao}")
+            argumentos = pedido.get('args') or {}
+            if not isinstance(argumentos, dict):
+                raise ValueError("Argumentos inválidos")
+            for nome in _ARGUMENTOS_TEXTO:
+                valor = argumentos.get(nome)
+                if valor is not None and not isinstance(valor, str):
+                    raise ValueError(f"Argumento inválido: {nome}")
+            resultado = await getattr(self, operacao)(**argumentos)
+            resposta = {'id': identificador, 'ok': True, 'resultado': resultado}
+        except (ValueError, RuntimeError, TypeError, AttributeError) as erro:
+            # TypeError e AttributeError vêm de argumentos do cliente com tipo
+            # errado (ex.: descrição numérica); o pedido ainda recebe resposta
+            resposta = {'id': identificador, 'ok': False, 'erro': str(erro)}
+        return (json.dumps(resposta, ensure_ascii=False, default=_serializar)
+                + '\n').encode('utf-8')
+
+    async def atender(self, leitor: asyncio.StreamReader,
+                      escritor: asyncio.StreamWriter):
+        """
+        Atende uma conexão TCP até o cliente encerrá-la.
+
+        Args:
+            leitor (StreamReader): Fluxo de entrada da conexão
+            escritor (StreamWriter): Fluxo de saída da conexão
+        """
+        tarefas = set()
+
+        async def responder(linha: bytes):
+            escritor.write(await self.processar(linha))
+            await escritor.drain()
+
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                tarefa = asyncio.ensure_future(responder(linha))
+                tarefas.add(tarefa)
+                tarefa.add_done_callback(tarefas.discard)
+            if tarefas:
+                await asyncio.gather(*tarefas, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar_servidor(self, host: str = '127.0.0.1',
+                               porta: int = 8765) -> asyncio.AbstractServer:
+        """
+        Inicia o endpoint TCP.
+
+        Args:
+            host (str): Endereço de escuta
+            porta (int): Porta de escuta (0 = escolhida pelo sistema)
+
+        Returns:
+            asyncio.AbstractServer: Servidor em execução
+        """
+        return await asyncio.start_server(self.atender, host, porta,
+                                          backlog=4096)
+
+
+def main():
+    """Executa o endpoint TCP do sistema bancário."""
+    parser = argparse.ArgumentParser(description="Serviço TCP do sistema bancário")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--dados', default=None,
+                        help="Diretório para persistir o sistema (padrão: em memória)")
+    parser.add_argument('--assincrono', action='store_true',
+                        help="Não aguardar a gravação em disco de cada operação")
+    args = parser.parse_args()
+
+    if args.dados:
+        sistema = SistemaBancario.abrir(args.dados, sincrono=not args.assincrono)
+    else:
+        sistema = SistemaBancario()
+    servico = ServicoBancario(sistema)
+
+    async def executar():
+        servidor = await servico.iniciar_servidor(args.host, args.porta)
+        endereco = servidor.sockets[0].getsockname()
+        print(f"Serviço bancário em {endereco[0]}:{endereco[1]}", flush=True)
+        async with servidor:
+            await servidor.serve_forever()
+
+    try:
+        asyncio.run(executar())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sistema.fechar()
+
+
+if __name__ == "__main__":
+    main()
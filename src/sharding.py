@@ -0,0 +1,902 @@
+"""
+Sistema Bancário - Módulo Sharding
+Sistema bancário particionado entre processos, para usar vários núcleos.
+
+Cada partição é um ``SistemaBancario`` completo em um processo próprio e
+guarda as contas cujo ``numero_conta % particoes`` é o seu índice. O
+roteador (``BancoParticionado``) atribui os números de conta, mantém o
+índice global de CPF/CNPJ e encaminha cada operação à partição da conta.
+
+Transferências entre partições usam duas fases: a origem reserva o valor
+(que deixa de estar disponível para saques) e o destino reserva o crédito
+(dentro do limite de saldo) e fixa a conta (que não pode ser removida); só
+então as duas lançam a transferência. Se uma das preparações falhar, as
+reservas são desfeitas e nenhum saldo é alterado.
+
+Cada partição grava no próprio diário a preparação e a confirmação do seu
+lado. O destino confirma primeiro e guarda o lado confirmado, que é a
+decisão de concluir a transferência, até a origem confirmar. Ao iniciar, o
+roteador conclui as transferências com algum lado confirmado e desfaz as
+demais.
+"""
+
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future
+from heapq import merge
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+try:
+    from .banco import SistemaBancario, normalizar_documento
+    from .conta import ContaBancaria
+    from .dinheiro import LIMITE_CENTAVOS, formatar_centavos, para_centavos
+    from .indices import normalizar_nome
+    from .relogio import timestamp_agora
+except ImportError:
+    from banco import SistemaBancario, normalizar_documento
+    from conta import ContaBancaria
+    from dinheiro import LIMITE_CENTAVOS, formatar_centavos, para_centavos
+    from indices import normalizar_nome
+    from relogio import timestamp_agora
+
+# Erros repassados da partição ao chamador com o mesmo tipo
+_ERROS = {'ValueError': ValueError, 'RuntimeError': RuntimeError,
+          'TypeError': TypeError}
+
+# Operações aceitas por ``executar_em_lote``
+OPERACOES_LOTE = ('depositar', 'sacar', 'pagar_conta')
+
+
+class _ExecutorParticao:
+    """
+    Lado da partição: executa os comandos do roteador no próprio processo.
+
+    Os comandos chegam por um único canal e são executados um de cada vez,
+    de modo que as reservas das transferências entre partições não precisam
+    de travas próprias. Os lados preparados ficam no próprio sistema
+    (``SistemaBancario._transferencias``), gravados no diário.
+    """
+
+    def __init__(self, sistema: SistemaBancario):
+        self.sistema = sistema
+        # Por conta: [débitos reservados, créditos reservados, transferências
+        # pendentes], reconstruídos dos lados preparados recuperados
+        self._bloqueios: Dict[int, List[int]] = {}
+        for numero_conta, valor, _, _, confirmada in sistema._transferencias.values():
+            if not confirmada:
+                self._bloquear(numero_conta, valor)
+
+    def criar_conta(self, numero_conta: int, titular: str,
+                    cpf_cnpj: str) -> Dict[str, Any]:
+        """Cria uma conta já validada pelo roteador, com o número atribuído."""
+        sistema = self.sistema
+        sistema._garantir_indices()
+        with sistema._trava:
+            conta = ContaBancaria._criar_validada(numero_conta, titular, cpf_cnpj,
+                                                  timestamp_agora())
+            sistema._adicionar_conta(conta, normalizar_documento(cpf_cnpj))
+        SistemaBancario._reservar_ate(numero_conta)
+        sistema._aguardar_persistencia()
+        return conta.resumo()
+
+    def criar_contas(self, contas: List[Tuple[int, str, str]]) -> List[Optional[str]]:
+        """
+        Cria várias contas já validadas, com uma única espera pelo diário.
+
+        Returns:
+            List[Optional[str]]: Por conta, None se criada ou o erro
+        """
+        sistema = self.sistema
+        sistema._garantir_indices()
+        criacao = timestamp_agora()
+        erros: List[Optional[str]] = []
+        with sistema._trava:
+            for numero_conta, titular, cpf_cnpj in contas:
+                documento = normalizar_documento(cpf_cnpj)
+                if documento in sistema._indice_documentos:
+                    erros.append(f"Já existe conta para o CPF/CNPJ: {cpf_cnpj}")
+                    continue
+                try:
+                    conta = ContaBancaria._criar_validada(numero_conta, titular,
+                                                          cpf_cnpj, criacao)
+                    sistema._adicionar_conta(conta, documento)
+                except (ValueError, RuntimeError) as erro:
+                    erros.append(str(erro))
+                    continue
+                SistemaBancario._reservar_ate(numero_conta)
+                erros.append(None)
+        sistema._aguardar_persistencia()
+        return erros
+
+    def depositar(self, numero_conta: int, valor: Any, descricao: str) -> float:
+        conta = self.sistema.autenticar_conta(numero_conta)
+        self._verificar_limite(conta, para_centavos(valor))
+        conta.depositar(valor, descricao)
+        return conta.saldo
+
+    def sacar(self, numero_conta: int, valor: Any, descricao: str) -> float:
+        conta = self.sistema.autenticar_conta(numero_conta)
+        self._verificar_disponivel(conta, para_centavos(valor))
+        conta.sacar(valor, descricao)
+        return conta.saldo
+
+    def pagar_conta(self, numero_conta: int, valor: Any, descricao: str) -> float:
+        conta = self.sistema.autenticar_conta(numero_conta)
+        self._verificar_disponivel(conta, para_centavos(valor))
+        conta.pagar_conta(valor, descricao)
+        return conta.saldo
+
+    def transferir(self, numero_origem: int, numero_destino: int, valor: Any,
+                   descricao: str) -> bool:
+        """Transferência entre duas contas da própria partição."""
+        conta = self.sistema.autenticar_conta(numero_origem)
+        destino = self.sistema.autenticar_conta(numero_destino)
+        centavos = para_centavos(valor)
+        self._verificar_disponivel(conta, centavos)
+        self._verificar_limite(destino, centavos)
+        return self.sistema.transferir_entre_contas(numero_origem, numero_destino,
+                                                    valor, descricao)
+
+    def executar_lote(self, operacoes: List[Tuple[str, tuple]]) -> List[Tuple[bool, Any]]:
+        """
+        Executa várias operações de conta, com uma única espera pelo diário.
+
+        Returns:
+            List[Tuple[bool, Any]]: ``(True, saldo)`` ou ``(False, erro)`` por operação
+        """
+        sistema = self.sistema
+        resultados = []
+        sistema._adiar_persistencia()
+        try:
+            for operacao, argumentos in operacoes:
+                try:
+                    resultados.append((True, getattr(self, operacao)(*argumentos)))
+                except (ValueError, RuntimeError, TypeError) as erro:
+                    resultados.append((False, str(erro)))
+        finally:
+            sistema._adiar_persistencia(False)
+        sistema._aguardar_persistencia()
+        return resultados
+
+    def buscar_conta(self, numero_conta: int) -> Optional[Dict[str, Any]]:
+        conta = self.sistema.buscar_conta(numero_conta)
+        return conta.resumo() if conta else None
+
+    def pagina_extrato(self, numero_conta: int, cursor: Optional[int],
+                       limite: int) -> Dict[str, Any]:
+        return self.sistema.autenticar_conta(numero_conta).pagina_extrato(cursor, limite)
+
+    def remover_conta(self, numero_conta: int) -> str:
+        """Remove a conta; retorna o CPF/CNPJ normalizado para o roteador."""
+        if numero_conta in self._bloqueios:
+            raise RuntimeError("Não é possível remover conta com transferência em andamento")
+        conta = self.sistema.autenticar_conta(numero_conta)
+        self.sistema.remover_conta(numero_conta)
+        return normalizar_documento(conta.cpf_cnpj)
+
+    def listar_contas(self) -> List[Dict]:
+        return self.sistema.listar_contas()
+
+    def iter_contas(self, quantidade: Optional[int], order_by: str,
+                    desc: bool) -> List[Dict]:
+        return list(self.sistema.iter_contas(0, quantidade, order_by, desc))
+
+    def buscar_contas_por_titular(self, nome_titular: str,
+                                  limite: Optional[int]) -> List[Dict[str, Any]]:
+        return [conta.resumo()
+                for conta in self.sistema.buscar_contas_por_titular(nome_titular, limite)]
+
+    def estatisticas(self) -> Dict[str, Any]:
+        estatisticas = self.sistema.obter_estatisticas()
+        estatisticas['saldo_total_centavos'] = self.sistema._saldo_total
+        return estatisticas
+
+    def cadastro(self) -> Tuple[List[Tuple[str, int]], int]:
+        """Documentos e números das contas, para o roteador montar seu índice."""
+        documentos = [(normalizar_documento(cpf_cnpj), numero)
+                      for numero, _, cpf_cnpj, _ in self.sistema.contas.resumos()]
+        return documentos, ContaBancaria._proximo_numero
+
+    def preparar_debito(self, identificador: int, numero_conta: int,
+                        centavos: int, descricao: str) -> None:
+        """1ª fase na origem: reserva o valor da transferência."""
+        conta = self.sistema.autenticar_conta(numero_conta)
+        self._verificar_disponivel(conta, centavos)
+        self._preparar(identificador, numero_conta, -centavos,
+                       "TRANSFERÊNCIA ENVIADA", descricao)
+
+    def preparar_credito(self, identificador: int, numero_conta: int,
+                         centavos: int, descricao: str) -> None:
+        """1ª fase no destino: reserva o crédito e fixa a conta."""
+        conta = self.sistema.autenticar_conta(numero_conta)
+        self._verificar_limite(conta, centavos)
+        self._preparar(identificador, numero_conta, centavos,
+                       "TRANSFERÊNCIA RECEBIDA", descricao)
+
+    def confirmar(self, identificador: int, manter: bool) -> None:
+        """
+        2ª fase: libera a reserva e lança a transferência na conta.
+
+        Com ``manter`` (o destino), o lado confirmado fica gravado até o
+        roteador descartá-lo, depois de a origem também confirmar.
+        """
+        sistema = self.sistema
+        numero_conta, valor, _, _, _ = sistema._transferencias[identificador]
+        sistema._confirmar_transferencia(identificador, manter)
+        self._desbloquear(numero_conta, valor)
+        sistema._aguardar_persistencia()
+
+    def descartar(self, identificador: int) -> None:
+        """
+        Descarta um lado: desfaz a preparação de uma transferência que não
+        será confirmada, ou esquece um lado já confirmado.
+        """
+        sistema = self.sistema
+        lado = sistema._transferencias.get(identificador)
+        if lado is None:
+            return
+        numero_conta, valor, _, _, confirmada = lado
+        sistema._descartar_transferencia(identificador)
+        if not confirmada:
+            self._desbloquear(numero_conta, valor)
+        sistema._aguardar_persistencia()
+
+    def transferencias(self) -> List[Tuple[int, bool]]:
+        """Lados em andamento ``(identificador, confirmado)``, para a recuperação."""
+        return [(identificador, lado[4])
+                for identificador, lado in self.sistema._transferencias.items()]
+
+    def _verificar_disponivel(self, conta: ContaBancaria, centavos: int):
+        """Garante saldo fora das reservas de transferências em andamento."""
+        disponivel = conta.saldo_centavos - self._bloqueios.get(conta.numero_conta, (0,))[0]
+        if centavos > disponivel:
+            raise RuntimeError(f"Saldo insuficiente. Saldo disponível: R$ "
+                               f"{formatar_centavos(max(disponivel, 0))}")
+
+    def _verificar_limite(self, conta: ContaBancaria, centavos: int):
+        """Garante que um crédito, somado aos já reservados, cabe no limite."""
+        reservado = self._bloqueios.get(conta.numero_conta, (0, 0))[1]
+        if conta.saldo_centavos + reservado + centavos > LIMITE_CENTAVOS:
+            raise ValueError("Operação excede o limite de saldo da conta")
+
+    def _preparar(self, identificador: int, numero_conta: int, valor: int,
+                  tipo: str, descricao: str):
+        """Grava o lado preparado e reserva o valor na conta."""
+        self.sistema._preparar_transferencia(identificador, numero_conta, valor,
+                                             tipo, descricao)
+        self._bloquear(numero_conta, valor)
+        self.sistema._aguardar_persistencia()
+
+    def _bloquear(self, numero_conta: int, valor: int):
+        bloqueio = self._bloqueios.setdefault(numero_conta, [0, 0, 0])
+        bloqueio[0 if valor < 0 else 1] += abs(valor)
+        bloqueio[2] += 1
+
+    def _desbloquear(self, numero_conta: int, valor: int):
+        bloqueio = self._bloqueios[numero_conta]
+        bloqueio[0 if valor < 0 else 1] -= abs(valor)
+        bloqueio[2] -= 1
+        if not bloqueio[2]:
+            del self._bloqueios[numero_conta]
+
+
+def _executar_particao(conexao, nome_banco: str, diretorio: Optional[str]):
+    """Laço do processo de uma partição: atende os comandos até o fechamento."""
+    sistema = (SistemaBancario.abrir(diretorio, nome_banco) if diretorio
+               else SistemaBancario(nome_banco))
+    executor = _ExecutorParticao(sistema)
+    try:
+        while True:
+            try:
+                identificador, comando, argumentos = conexao.recv()
+            except EOFError:
+                break
+            if comando == 'fechar':
+                break
+            try:
+                resposta = (identificador, True, getattr(executor, comando)(*argumentos))
+            except Exception as erro:
+                resposta = (identificador, False, (type(erro).__name__, str(erro)))
+            conexao.send(resposta)
+    finally:
+        sistema.fechar()
+        conexao.close()
+
+
+class _Particao:
+    """
+    Lado do roteador: canal com o processo de uma partição.
+
+    Vários pedidos podem estar em andamento ao mesmo tempo (de threads
+    diferentes); uma thread recebe as respostas e completa os futuros.
+    """
+
+    def __init__(self, contexto, indice: int, nome_banco: str,
+                 diretorio: Optional[str]):
+        self._conexao, conexao_particao = contexto.Pipe()
+        self.processo = contexto.Process(target=_executar_particao,
+                                         args=(conexao_particao, nome_banco, diretorio),
+                                         name=f'particao-{indice}', daemon=True)
+        self.processo.start()
+        conexao_particao.close()
+
+        self._pendentes: Dict[int, Future] = {}
+        self._encerrada = False
+        self._identificadores = itertools.count()
+        self._trava = threading.Lock()
+        self._receptor = threading.Thread(target=self._receber,
+                                          name=f'particao-{indice}-respostas',
+                                          daemon=True)
+        self._receptor.start()
+
+    def enviar(self, comando: str, *argumentos: Any) -> Future:
+        """Envia um comando sem aguardar a resposta."""
+        futuro = Future()
+        with self._trava:
+            if self._encerrada:
+                raise RuntimeError("Partição indisponível")
+            identificador = next(self._identificadores)
+            self._pendentes[identificador] = futuro
+            try:
+                self._conexao.send((identificador, comando, argumentos))
+            except (OSError, ValueError):
+                del self._pendentes[identificador]
+                raise RuntimeError("Partição indisponível") from None
+        return futuro
+
+    def chamar(self, comando: str, *argumentos: Any) -> Any:
+        """Envia um comando e aguarda o resultado."""
+        return self.enviar(comando, *argumentos).result()
+
+    def fechar(self):
+        """Encerra o processo da partição após os comandos pendentes."""
+        with self._trava:
+            try:
+                self._conexao.send((None, 'fechar', ()))
+            except (OSError, ValueError):
+                pass
+        self.processo.join()
+        self._receptor.join()
+        self._conexao.close()
+
+    def _receber(self):
+        """Laço da thread receptora: completa os futuros com as respostas."""
+        while True:
+            try:
+                identificador, sucesso, resultado = self._conexao.recv()
+            except (EOFError, OSError):
+                break
+            futuro = self._pendentes.pop(identificador)
+            if sucesso:
+                futuro.set_result(resultado)
+            else:
+                tipo, mensagem = resultado
+                futuro.set_exception(_ERROS.get(tipo, RuntimeError)(mensagem))
+
+        with self._trava:
+            self._encerrada = True
+            pendentes, self._pendentes = self._pendentes, {}
+        for futuro in pendentes.values():
+            futuro.set_exception(RuntimeError("Partição indisponível"))
+
+
+class BancoParticionado:
+    """
+    Sistema bancário particionado por número de conta entre processos.
+
+    Expõe as operações do ``SistemaBancario``; como as contas vivem em
+    outros processos, as consultas retornam resumos (dicionários) em vez de
+    objetos ``ContaBancaria``, e as operações de conta (depósito, saque,
+    pagamento) recebem o número da conta. As chamadas podem ser feitas de
+    várias threads; as de partições diferentes executam em paralelo.
+
+    Attributes:
+        nome_banco (str): Nome da instituição bancária
+        particoes (int): Quantidade de partições (processos)
+    """
+
+    def __init__(self, particoes: Optional[int] = None,
+                 nome_banco: str = "Banco Digital Python",
+                 diretorio: Optional[str] = None):
+        """
+        Inicia os processos das partições.
+
+        Args:
+            particoes (int): Quantidade de partições (padrão: núcleos da máquina)
+            nome_banco (str): Nome da instituição bancária
+            diretorio (str): Diretório para persistir as partições (uma
+                subpasta por partição); None = apenas em memória
+
+        Raises:
+            ValueError: Se a quantidade de partições for inválida ou diferente
+                da usada no diretório
+        """
+        particoes = particoes or os.cpu_count() or 1
+        if particoes <= 0:
+            raise ValueError("Quantidade de partições deve ser maior que zero")
+
+        diretorios: List[Optional[str]] = [None] * particoes
+        if diretorio is not None:
+            os.makedirs(diretorio, exist_ok=True)
+            existentes = [nome for nome in os.listdir(diretorio)
+                          if nome.startswith('particao-')]
+            if existentes and len(existentes) != particoes:
+                raise ValueError(f"Diretório com {len(existentes)} partições, "
+                                 f"não {particoes}")
+            diretorios = [os.path.join(diretorio, f'particao-{indice:03d}')
+                          for indice in range(particoes)]
+
+        self.nome_banco = nome_banco
+        self.particoes = particoes
+        contexto = multiprocessing.get_context('spawn')
+        self._particoes = [_Particao(contexto, indice, nome_banco, diretorios[indice])
+                           for indice in range(particoes)]
+
+        # Índice global de CPF/CNPJ e numeração, reconstruídos das partições
+        self._indice_documentos: Dict[str, int] = {}
+        self._proximo_numero = ContaBancaria._proximo_numero
+        for documentos, proximo in self._em_todas('cadastro'):
+            self._indice_documentos.update(documentos)
+            self._proximo_numero = max(self._proximo_numero, proximo)
+        self._trava = threading.Lock()
+        self._transacoes = itertools.count(1)
+        self._recuperar_transferencias()
+
+    def fechar(self):
+        """Grava as operações pendentes e encerra os processos das partições."""
+        for particao in self._particoes:
+            particao.fechar()
+
+    def criar_conta(self, titular: str, cpf_cnpj: str) -> Dict[str, Any]:
+        """
+        Cria uma nova conta na partição do número atribuído.
+
+        Args:
+            titular (str): Nome do titular
+            cpf_cnpj (str): CPF ou CNPJ do titular
+
+        Returns:
+            Dict: Resumo da conta criada (mesmo formato de ``ContaBancaria.resumo``)
+
+        Raises:
+            ValueError: Se titular ou CPF/CNPJ forem inválidos
+        """
+        if not titular or not titular.strip():
+            raise ValueError("Nome do titular é obrigatório")
+        if not cpf_cnpj or not cpf_cnpj.strip():
+            raise ValueError("CPF/CNPJ é obrigatório")
+
+        documento = normalizar_documento(cpf_cnpj)
+        with self._trava:
+            if documento in self._indice_documentos:
+                raise ValueError(f"Já existe conta para o CPF/CNPJ: {cpf_cnpj}")
+            numero = self._proximo_numero
+            self._proximo_numero += 1
+            self._indice_documentos[documento] = numero
+
+        try:
+            return self._particao(numero).chamar('criar_conta', numero, titular.strip(),
+                                                 cpf_cnpj.strip())
+        except (ValueError, RuntimeError):
+            with self._trava:
+                self._indice_documentos.pop(documento, None)
+            raise
+
+    def criar_contas_em_lote(self, registros: Iterable[Any]) -> List[Dict]:
+        """
+        Cria contas em lote, com um único pedido por partição.
+
+        Uma linha só é marcada como criada depois que a sua partição confirma;
+        as linhas recusadas ou de uma partição que falhou liberam o CPF/CNPJ
+        no índice global.
+
+        Args:
+            registros (Iterable): Dicionários ou tuplas ``(titular, cpf_cnpj)``
+
+        Returns:
+            List[Dict]: Resultado por registro, com as chaves ``linha``,
+            ``sucesso``, ``numero_conta`` e ``erro``
+        """
+        relatorio: List[Dict] = []
+        por_particao: Dict[int, List[Tuple[int, str, str]]] = {}
+        with self._trava:
+            for linha, registro in enumerate(registros, start=1):
+                resultado = {'linha': linha, 'sucesso': False,
+                             'numero_conta': None, 'erro': None}
+                relatorio.append(resultado)
+                titular, cpf_cnpj = SistemaBancario._extrair_registro(registro)
+                if titular is None:
+                    resultado['erro'] = "Registro inválido"
+                    continue
+                titular, cpf_cnpj = titular.strip(), cpf_cnpj.strip()
+                if not titular:
+                    resultado['erro'] = "Nome do titular é obrigatório"
+                    continue
+                if not cpf_cnpj:
+                    resultado['erro'] = "CPF/CNPJ é obrigatório"
+                    continue
+                documento = normalizar_documento(cpf_cnpj)
+                if documento in self._indice_documentos:
+                    resultado['erro'] = f"Já existe conta para o CPF/CNPJ: {cpf_cnpj}"
+                    continue
+
+                numero = self._proximo_numero
+                self._proximo_numero += 1
+                self._indice_documentos[documento] = numero
+                por_particao.setdefault(numero % self.particoes, []).append(
+                    (numero, titular, cpf_cnpj, documento, resultado))
+
+        futuros = []
+        for indice, contas in por_particao.items():
+            pedido = [conta[:3] for conta in contas]
+            try:
+                futuro = self._particoes[indice].enviar('criar_contas', pedido)
+            except RuntimeError as erro:
+                futuro = Future()
+                futuro.set_exception(erro)
+            futuros.append((contas, futuro))
+
+        recusados = []
+        for contas, futuro in futuros:
+            try:
+                erros = futuro.result()
+            except (ValueError, RuntimeError) as erro:
+                erros = [str(erro)] * len(contas)
+            for (numero, _, _, documento, resultado), erro in zip(contas, erros):
+                if erro is None:
+                    resultado['sucesso'] = True
+                    resultado['numero_conta'] = numero
+                else:
+                    resultado['erro'] = erro
+                    recusados.append(documento)
+        if recusados:
+            with self._trava:
+                for documento in recusados:
+                    self._indice_documentos.pop(documento, None)
+        return relatorio
+
+    def depositar(self, numero_conta: int, valor: Any,
+                  descricao: str = "Depósito") -> float:
+        """
+        Deposita em uma conta.
+
+        Returns:
+            float: Saldo da conta após o depósito
+        """
+        return self._particao(numero_conta).chamar('depositar', numero_conta, valor,
+                                                   descricao)
+
+    def sacar(self, numero_conta: int, valor: Any, descricao: str = "Saque") -> float:
+        """
+        Saca de uma conta (valores reservados por transferências em andamento
+        não estão disponíveis).
+
+        Returns:
+            float: Saldo da conta após o saque
+        """
+        return self._particao(numero_conta).chamar('sacar', numero_conta, valor,
+                                                   descricao)
+
+    def pagar_conta(self, numero_conta: int, valor: Any, descricao: str) -> float:
+        """
+        Paga uma conta/serviço.
+
+        Returns:
+            float: Saldo da conta após o pagamento
+        """
+        return self._particao(numero_conta).chamar('pagar_conta', numero_conta, valor,
+                                                   descricao)
+
+    def executar_em_lote(self, operacoes: Iterable[Tuple]) -> List[Dict]:
+        """
+        Executa operações de conta em lote, um pedido por partição.
+
+        As partições processam suas partes em paralelo; dentro de cada conta,
+        a ordem recebida é mantida.
+
+        Args:
+            operacoes (Iterable): Tuplas ``(operacao, numero_conta, valor[, descricao])``
+                com operação em ``OPERACOES_LOTE``
+
+        Returns:
+            List[Dict]: Resultado por operação, com as chaves ``sucesso``,
+            ``saldo`` e ``erro``
+        """
+        padrao = {'depositar': "Depósito", 'sacar': "Saque", 'pagar_conta': "Pagamento"}
+        relatorio: List[Dict] = []
+        por_particao: Dict[int, Tuple[List[int], List[Tuple[str, tuple]]]] = {}
+        for operacao in operacoes:
+            resultado = {'sucesso': False, 'saldo': None, 'erro': None}
+            relatorio.append(resultado)
+            if (not isinstance(operacao, (tuple, list)) or len(operacao) not in (3, 4)
+                    or operacao[0] not in OPERACOES_LOTE
+                    or not isinstance(operacao[1], int)):
+                resultado['erro'] = "Operação inválida"
+                continue
+            nome, numero, valor = operacao[:3]
+            descricao = operacao[3] if len(operacao) == 4 else padrao[nome]
+            posicoes, comandos = por_particao.setdefault(numero % self.particoes,
+                                                         ([], []))
+            posicoes.append(len(relatorio) - 1)
+            comandos.append((nome, (numero, valor, descricao)))
+
+        futuros = [(posicoes, self._particoes[indice].enviar('executar_lote', comandos))
+                   for indice, (posicoes, comandos) in por_particao.items()]
+        for posicoes, futuro in futuros:
+            for posicao, (sucesso, valor) in zip(posicoes, futuro.result()):
+                resultado = relatorio[posicao]
+                resultado['sucesso'] = sucesso
+                resultado['saldo' if sucesso else 'erro'] = valor
+        return relatorio
+
+    def transferir_entre_contas(self, numero_origem: int, numero_destino: int,
+                                valor: Any, descricao: str = "Transferência") -> bool:
+        """
+        Realiza transferência entre duas contas, em duas fases se estiverem
+        em partições diferentes.
+
+        Args:
+            numero_origem (int): Número da conta de origem
+            numero_destino (int): Número da conta de destino
+            valor: Valor a ser transferido
+            descricao (str): Descrição da transferência
+
+        Returns:
+            bool: True se a transferência foi bem-sucedida
+
+        Raises:
+            ValueError: Se alguma conta não existir, dados inválidos ou o
+                crédito exceder o limite de saldo do destino
+            RuntimeError: Se não houver saldo suficiente ou uma partição
+                falhar durante a confirmação (a transferência é concluída ou
+                desfeita na recuperação, ao reiniciar as partições)
+        """
+        if numero_origem == numero_destino:
+            raise ValueError("Não é possível transferir para a mesma conta")
+        origem = self._particao(numero_origem)
+        destino = self._particao(numero_destino)
+        if origem is destino:
+            return origem.chamar('transferir', numero_origem, numero_destino, valor,
+                                 descricao)
+
+        centavos = para_centavos(valor)
+        if centavos <= 0:
+            raise ValueError("Valor da transferência deve ser maior que zero")
+
+        # 1ª fase: as duas partições preparam ao mesmo tempo
+        identificador = next(self._transacoes)
+        preparacoes = [
+            (origem, origem.enviar('preparar_debito', identificador, numero_origem,
+                                   centavos, f"{descricao} - Para conta {numero_destino}")),
+            (destino, destino.enviar('preparar_credito', identificador, numero_destino,
+                                     centavos, f"{descricao} - De conta {numero_origem}")),
+        ]
+        erros = []
+        preparadas = []
+        for particao, futuro in preparacoes:
+            try:
+                futuro.result()
+                preparadas.append(particao)
+            except (ValueError, RuntimeError) as erro:
+                erros.append(erro)
+        if erros:
+            for particao in preparadas:
+                particao.chamar('descartar', identificador)
+            # Conta inexistente tem precedência sobre saldo insuficiente
+            raise next((erro for erro in erros if isinstance(erro, ValueError)), erros[0])
+
+        # 2ª fase: o destino confirma primeiro; o lado confirmado é a decisão
+        # de concluir a transferência
+        try:
+            destino.chamar('confirmar', identificador, True)
+        except ValueError:
+            # Recusado antes de qualquer lançamento
+            origem.chamar('descartar', identificador)
+            destino.chamar('descartar', identificador)
+            raise
+        except RuntimeError:
+            # Resultado incerto: a origem fica reservada até a recuperação
+            raise RuntimeError(f"Transferência {identificador} não confirmada: "
+                               f"será concluída ou desfeita na recuperação") from None
+        try:
+            origem.chamar('confirmar', identificador, False)
+        except RuntimeError:
+            raise RuntimeError(f"Transferência {identificador} creditada no destino: "
+                               f"o débito será concluído na recuperação") from None
+        destino.chamar('descartar', identificador)
+        return True
+
+    def buscar_conta(self, numero_conta: int) -> Optional[Dict[str, Any]]:
+        """
+        Busca uma conta pelo número.
+
+        Returns:
+            Dict: Resumo da conta ou None se não existir
+        """
+        return self._particao(numero_conta).chamar('buscar_conta', numero_conta)
+
+    def buscar_por_documento(self, cpf_cnpj: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca uma conta pelo CPF/CNPJ do titular (índice do roteador).
+
+        Returns:
+            Dict: Resumo da conta ou None se não existir
+        """
+        numero = self._indice_documentos.get(normalizar_documento(cpf_cnpj or ""))
+        return None if numero is None else self.buscar_conta(numero)
+
+    def autenticar_conta(self, numero_conta: int) -> Dict[str, Any]:
+        """
+        Autentica uma conta pelo número.
+
+        Returns:
+            Dict: Resumo da conta
+
+        Raises:
+            ValueError: Se a conta não existir
+        """
+        resumo = self.buscar_conta(numero_conta)
+        if resumo is None:
+            raise ValueError(f"Conta {numero_conta} não encontrada")
+        return resumo
+
+    def pagina_extrato(self, numero_conta: int, cursor: Optional[int] = None,
+                       limite: int = 10) -> Dict[str, Any]:
+        """
+        Consulta uma página do extrato (mais recentes primeiro).
+
+        Returns:
+            Dict: ``transacoes`` e ``proximo_cursor``
+        """
+        return self._particao(numero_conta).chamar('pagina_extrato', numero_conta,
+                                                   cursor, limite)
+
+    def remover_conta(self, numero_conta: int) -> bool:
+        """
+        Remove uma conta (apenas se saldo for zero).
+
+        Returns:
+            bool: True se a conta foi removida
+
+        Raises:
+            ValueError: Se conta não existir
+            RuntimeError: Se conta tiver saldo ou transferência em andamento
+        """
+        documento = self._particao(numero_conta).chamar('remover_conta', numero_conta)
+        with self._trava:
+            self._indice_documentos.pop(documento, None)
+        return True
+
+    def listar_contas(self) -> List[Dict]:
+        """
+        Lista todas as contas, em ordem de número.
+
+        Returns:
+            List[Dict]: Mesmo formato de ``SistemaBancario.listar_contas``
+        """
+        return list(merge(*self._em_todas('listar_contas'),
+                          key=lambda conta: conta['numero']))
+
+    def iter_contas(self, offset: int = 0, limit: Optional[int] = None,
+                    order_by: str = 'numero', desc: bool = False) -> Iterator[Dict]:
+        """
+        Itera sobre as contas de forma paginada, mesclando as partições.
+
+        Yields:
+            Dict: Mesmo formato de ``SistemaBancario.iter_contas``
+
+        Raises:
+            ValueError: Se a ordenação ou a paginação forem inválidas
+        """
+        chaves = {
+            'numero': lambda conta: conta['numero'],
+            'saldo': lambda conta: (conta['saldo'], conta['numero']),
+            'titular': lambda conta: (conta['titular'], conta['numero']),
+        }
+        if order_by not in chaves:
+            raise ValueError(f"Ordenação inválida: {order_by}")
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset e limite não podem ser negativos")
+
+        # Cada partição entrega apenas o necessário para a página
+        fim = None if limit is None else offset + limit
+        paginas = self._em_todas('iter_contas', fim, order_by, desc)
+        yield from itertools.islice(merge(*paginas, key=chaves[order_by], reverse=desc),
+                                    offset, fim)
+
+    def buscar_contas_por_titular(self, nome_titular: str,
+                                  limite: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Busca contas pelo nome do titular, com a mesma relevância do
+        ``SistemaBancario`` (início de palavra primeiro, depois por número).
+
+        Returns:
+            List[Dict]: Resumos das contas encontradas
+        """
+        termo = ' ' + normalizar_nome(nome_titular)
+
+        def relevancia(conta: Dict[str, Any]) -> Tuple[int, int]:
+            inicio_palavra = termo in ' ' + normalizar_nome(conta['titular'])
+            return (0 if inicio_palavra else 1, conta['numero_conta'])
+
+        resultados = sorted(itertools.chain.from_iterable(
+            self._em_todas('buscar_contas_por_titular', nome_titular, limite)),
+            key=relevancia)
+        return resultados if limite is None else resultados[:limite]
+
+    def obter_estatisticas(self) -> Dict:
+        """
+        Obtém estatísticas gerais, combinando as de cada partição.
+
+        Returns:
+            Dict: Mesmo formato de ``SistemaBancario.obter_estatisticas``
+        """
+        parciais = [estatisticas for estatisticas in self._em_todas('estatisticas')
+                    if estatisticas['total_contas']]
+        if not parciais:
+            return {
+                'total_contas': 0,
+                'saldo_total': 0.0,
+                'conta_maior_saldo': None,
+                'conta_menor_saldo': None,
+                'saldo_medio': 0.0
+            }
+
+        total_contas = sum(estatisticas['total_contas'] for estatisticas in parciais)
+        saldo_total = sum(estatisticas['saldo_total_centavos'] for estatisticas in parciais)
+        # Em caso de empate, a conta de menor número (como no SistemaBancario)
+        maior = min((estatisticas['conta_maior_saldo'] for estatisticas in parciais),
+                    key=lambda conta: (-conta['saldo'], conta['numero']))
+        menor = min((estatisticas['conta_menor_saldo'] for estatisticas in parciais),
+                    key=lambda conta: (conta['saldo'], conta['numero']))
+        return {
+            'total_contas': total_contas,
+            'saldo_total': saldo_total / 100,
+            'saldo_medio': saldo_total / (total_contas * 100),
+            'conta_maior_saldo': maior,
+            'conta_menor_saldo': menor
+        }
+
+    def _recuperar_transferencias(self):
+        """
+        Conclui ou desfaz as transferências entre partições interrompidas.
+
+        Uma transferência com algum lado confirmado (o destino) foi decidida
+        e tem os lados ainda preparados confirmados; as demais são desfeitas.
+        """
+        lados: Dict[int, List[Tuple[_Particao, bool]]] = {}
+        for particao, transferencias in zip(self._particoes,
+                                            self._em_todas('transferencias')):
+            for identificador, confirmado in transferencias:
+                lados.setdefault(identificador, []).append((particao, confirmado))
+        for identificador, partes in lados.items():
+            concluir = any(confirmado for _, confirmado in partes)
+            for particao, confirmado in partes:
+                if concluir and not confirmado:
+                    particao.chamar('confirmar', identificador, False)
+            for particao, confirmado in partes:
+                if confirmado or not concluir:
+                    particao.chamar('descartar', identificador)
+        if lados:
+            self._transacoes = itertools.count(max(lados) + 1)
+
+    def _particao(self, numero_conta: int) -> _Particao:
+        """Partição responsável por um número de conta."""
+        if not isinstance(numero_conta, int):
+            raise ValueError(f"Conta {numero_conta} não encontrada")
+        return self._particoes[numero_conta % self.particoes]
+
+    def _em_todas(self, comando: str, *argumentos: Any) -> List[Any]:
+        """Executa um comando em todas as partições, em paralelo."""
+        futuros = [particao.enviar(comando, *argumentos) for particao in self._particoes]
+        return [futuro.result() for futuro in futuros]
+
+    def __str__(self) -> str:
+        """Representação string do sistema."""
+        return (f"{self.nome_banco} - {len(self)} contas cadastradas "
+                f"em {self.particoes} partições")
+
+    def __len__(self) -> int:
+        """Retorna o número de contas no sistema."""
+        return len(self._indice_documentos)
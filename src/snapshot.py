@@ -0,0 +1,686 @@
+"""
+Sistema Bancário - Módulo Snapshot
+Snapshot binário de largura fixa, mapeado em memória e lido sob demanda.
+
+O arquivo guarda as contas e as transações em colunas de largura fixa
+(as mesmas colunas do ``Extrato``), de modo que abri-lo custa apenas o
+``mmap`` e a leitura do cabeçalho. As contas são materializadas como
+objetos ``ContaBancaria`` apenas quando acessadas.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from typing import (Any, Callable, Dict, Iterator, List, MutableMapping, Optional,
+                    Set, Tuple)
+try:
+    from .conta import ContaBancaria
+    from .extrato import DESCRICOES, TIPOS, Extrato
+    from .persistencia import sincronizar_diretorio
+except ImportError:
+    from conta import ContaBancaria
+    from extrato import DESCRICOES, TIPOS, Extrato
+    from persistencia import sincronizar_diretorio
+
+ARQUIVO_SNAPSHOT = 'snapshot.bin'
+VERSAO_SNAPSHOT = 4
+_ASSINATURA = b'UBANKSNP'
+
+# Assinatura, versão, sequência do diário, próximo número de conta,
+# quantidade de contas, quantidade de transações e saldo total (centavos)
+_CABECALHO = struct.Struct('<8sI4xqqqqq')
+_SECAO = struct.Struct('<qq')
+
+# Seções na ordem do arquivo: (nome, typecode do array ou None para bytes)
+_SECOES = (
+    ('numero', 'q'),
+    ('centavos', 'q'),
+    ('criacao', 'q'),
+    ('inicio_extrato', 'q'),
+    ('titular_pos', 'q'),
+    ('titular', None),
+    ('cpf_cnpj_pos', 'q'),
+    ('cpf_cnpj', None),
+    ('data_hora', 'q'),
+    ('tipo', 'H'),
+    ('valor', 'q'),
+    ('descricao', 'I'),
+    ('saldo_apos', 'q'),
+    ('tipos_pos', 'q'),
+    ('tipos', None),
+    ('descricoes_pos', 'q'),
+    ('descricoes', None),
+    # Versão 3: chaves de idempotência (JSON)
+    ('idempotencia', None),
+    # Versão 4: transferências entre partições em andamento (JSON)
+    ('transferencias', None),
+)
+# Seções de cada versão suportada (as anteriores não têm as últimas)
+_SECOES_POR_VERSAO = {2: _SECOES[:-2], 3: _SECOES[:-1], 4: _SECOES}
+_COLUNAS_EXTRATO = ('data_hora', 'tipo', 'valor', 'descricao', 'saldo_apos')
+_LARGURA = {nome: array(codigo).itemsize for nome, codigo in _SECOES if codigo}
+
+
+def _decodificar_textos(posicoes: memoryview, dados: memoryview) -> List[str]:
+    """Decodifica todos os textos de uma seção de textos."""
+    return [str(dados[posicoes[i]:posicoes[i + 1]], 'utf-8')
+            for i in range(len(posicoes) - 1)]
+
+
+class SnapshotMapeado:
+    """
+    Snapshot binário aberto via ``mmap``.
+
+    As seções são expostas como ``memoryview`` sobre o arquivo mapeado, sem
+    cópia; apenas as tabelas de tipos e descrições são lidas na abertura.
+
+    Attributes:
+        sequencia (int): Última sequência do diário coberta pelo snapshot
+        proximo_numero (int): Próximo número de conta no momento do snapshot
+        quantidade (int): Quantidade de contas
+        saldo_total (int): Soma dos saldos, em centavos
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Abre e mapeia um snapshot.
+
+        Args:
+            caminho (str): Caminho do arquivo
+
+        Raises:
+            ValueError: Se o arquivo não for um snapshot suportado
+        """
+        with open(caminho, 'rb') as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        visao = memoryview(self._mapa)
+
+        (assinatura, versao, self.sequencia, self.proximo_numero,
+         self.quantidade, _, self.saldo_total) = _CABECALHO.unpack_from(visao)
+        if assinatura != _ASSINATURA or versao not in _SECOES_POR_VERSAO:
+            raise ValueError(f"Snapshot não suportado: {caminho}")
+
+        self._bytes: Dict[str, memoryview] = {nome: memoryview(b'')
+                                              for nome, _ in _SECOES}
+        self._colunas: Dict[str, memoryview] = dict(self._bytes)
+        for indice, (nome, codigo) in enumerate(_SECOES_POR_VERSAO[versao]):
+            inicio, tamanho = _SECAO.unpack_from(
+                visao, _CABECALHO.size + indice * _SECAO.size)
+            secao = visao[inicio:inicio + tamanho]
+            self._bytes[nome] = secao
+            self._colunas[nome] = secao.cast(codigo) if codigo else secao
+
+        # Códigos do arquivo traduzidos para as tabelas deste processo
+        self.mapas: List[Optional[List[int]]] = []
+        for tabela, nome in ((TIPOS, 'tipos'), (DESCRICOES, 'descricoes')):
+            mapa = [tabela.codigo(texto) for texto in
+                    _decodificar_textos(self._colunas[nome + '_pos'], self._colunas[nome])]
+            self.mapas.append(None if mapa == list(range(len(mapa))) else mapa)
+
+    @property
+    def numeros(self) -> memoryview:
+        """Números das contas, em ordem crescente."""
+        return self._colunas['numero']
+
+    def posicao(self, numero_conta: int) -> Optional[int]:
+        """
+        Localiza uma conta por busca binária.
+
+        Args:
+            numero_conta (int): Número da conta
+
+        Returns:
+            int: Posição da conta no snapshot ou None se não existir
+        """
+        numeros = self._colunas['numero']
+        posicao = bisect_left(numeros, numero_conta)
+        if posicao < len(numeros) and numeros[posicao] == numero_conta:
+            return posicao
+        return None
+
+    def titular(self, posicao: int) -> str:
+        """Nome do titular da conta de uma posição."""
+        inicio, fim = self._colunas['titular_pos'][posicao:posicao + 2]
+        return str(self._bytes['titular'][inicio:fim], 'utf-8')
+
+    def cpf_cnpj(self, posicao: int) -> str:
+        """Documento do titular da conta de uma posição."""
+        inicio, fim = self._colunas['cpf_cnpj_pos'][posicao:posicao + 2]
+        return str(self._bytes['cpf_cnpj'][inicio:fim], 'utf-8')
+
+    def centavos(self, posicao: int) -> int:
+        """Saldo em centavos da conta de uma posição."""
+        return self._colunas['centavos'][posicao]
+
+    def conta(self, posicao: int) -> ContaBancaria:
+        """
+        Materializa a conta de uma posição, copiando seu extrato.
+
+        Args:
+            posicao (int): Posição da conta no snapshot
+
+        Returns:
+            ContaBancaria: Nova conta, ainda sem sistema associado
+        """
+        colunas = self._colunas
+        inicio, fim = colunas['inicio_extrato'][posicao:posicao + 2]
+        extrato = Extrato.de_colunas(
+            {nome: self._bytes[nome][inicio * _LARGURA[nome]:fim * _LARGURA[nome]]
+             for nome in _COLUNAS_EXTRATO},
+            *self.mapas)
+        return ContaBancaria._restaurar(
+            colunas['numero'][posicao], self.titular(posicao),
+            self.cpf_cnpj(posicao), colunas['criacao'][posicao],
+            colunas['centavos'][posicao], extrato)
+
+    def colunas_extrato(self, inicio: int, fim: int) -> Tuple[array, ...]:
+        """
+        Copia uma faixa das transações, no formato de ``Extrato.colunas``.
+
+        Args:
+            inicio (int): Primeira transação (posição nas seções do snapshot)
+            fim (int): Transação final (exclusiva)
+
+        Returns:
+            Tuple: Colunas ``data_hora``, ``tipo``, ``valor``, ``descricao``
+            e ``saldo_apos``, com códigos das tabelas deste processo
+        """
+        colunas = []
+        for nome, mapa in zip(_COLUNAS_EXTRATO, (None, self.mapas[0], None,
+                                                  self.mapas[1], None)):
+            coluna = array(self._colunas[nome].format)
+            coluna.frombytes(self.secao(nome, inicio, fim))
+            if mapa is not None:
+                coluna = array(coluna.typecode, [mapa[codigo] for codigo in coluna])
+            colunas.append(coluna)
+        return tuple(colunas)
+
+    def secao(self, nome: str, inicio: int, fim: int) -> memoryview:
+        """
+        Fatia de uma seção de largura fixa, em bytes.
+
+        Args:
+            nome (str): Nome da seção
+            inicio (int): Primeiro elemento
+            fim (int): Elemento final (exclusivo)
+
+        Returns:
+            memoryview: Bytes dos elementos ``[inicio, fim)``
+        """
+        largura = _LARGURA[nome]
+        return self._bytes[nome][inicio * largura:fim * largura]
+
+    def idempotencia(self) -> List[List[Any]]:
+        """
+        Chaves de idempotência gravadas no snapshot.
+
+        Returns:
+            List: Listas ``[chave, assinatura, resultado, expiracao]`` (ver
+            ``CacheIdempotencia.itens``)
+        """
+        dados = self._bytes['idempotencia']
+        return json.loads(str(dados, 'utf-8')) if len(dados) else []
+
+    def transferencias(self) -> List[List[Any]]:
+        """
+        Transferências entre partições em andamento gravadas no snapshot.
+
+        Returns:
+            List: Listas ``[identificador, numero_conta, valor, tipo,
+            descricao, confirmada]`` (ver ``SistemaBancario._transferencias``)
+        """
+        dados = self._bytes['transferencias']
+        return json.loads(str(dados, 'utf-8')) if len(dados) else []
+
+    def coluna(self, nome: str) -> memoryview:
+        """Seção inteira, tipada (ex.: ``coluna('centavos')[i]``)."""
+        return self._colunas[nome]
+
+    def dados(self, nome: str) -> memoryview:
+        """Seção inteira, em bytes."""
+        return self._bytes[nome]
+
+
+class ContasMapeadas(MutableMapping):
+    """
+    Dicionário de contas por número, com contas carregadas sob demanda.
+
+    As contas de um snapshot são materializadas na primeira vez que são
+    acessadas; as criadas depois (ou sem snapshot, todas) ficam em um
+    dicionário comum.
+    """
+
+    def __init__(self, sistema: Any = None, snapshot: Optional[SnapshotMapeado] = None):
+        """
+        Inicializa o dicionário.
+
+        Args:
+            sistema (SistemaBancario): Sistema associado às contas materializadas
+            snapshot (SnapshotMapeado): Snapshot de origem (None = vazio)
+        """
+        self._sistema = sistema
+        self._snapshot = snapshot
+        self._contas: Dict[int, ContaBancaria] = {}
+        self._removidas: Set[int] = set()
+        self._quantidade = snapshot.quantidade if snapshot is not None else 0
+        self.trava = threading.Lock()
+
+    @property
+    def snapshot(self) -> Optional[SnapshotMapeado]:
+        """Snapshot de origem das contas ainda não materializadas."""
+        return self._snapshot
+
+    def __getitem__(self, numero_conta: int) -> ContaBancaria:
+        """Obtém uma conta, materializando-a do snapshot se necessário."""
+        try:
+            return self._contas[numero_conta]
+        except KeyError:
+            if self._snapshot is None:
+                raise
+            return self._materializar(numero_conta)
+
+    def get(self, numero_conta: int, padrao: Any = None) -> Any:
+        """Obtém uma conta ou ``padrao`` se não existir."""
+        conta = self._contas.get(numero_conta)
+        if conta is not None or self._snapshot is None:
+            return conta if conta is not None else padrao
+        try:
+            return self._materializar(numero_conta)
+        except KeyError:
+            return padrao
+
+    def _materializar(self, numero_conta: int) -> ContaBancaria:
+        """Cria o objeto de uma conta do snapshot (uma única vez por conta)."""
+        with self.trava:
+            conta = self._contas.get(numero_conta)
+            if conta is not None:
+                return conta
+            posicao = self._snapshot.posicao(numero_conta)
+            if posicao is None or numero_conta in self._removidas:
+                raise KeyError(numero_conta)
+            conta = self._snapshot.conta(posicao)
+            conta._sistema = self._sistema
+            self._contas[numero_conta] = conta
+            return conta
+
+    def __contains__(self, numero_conta: object) -> bool:
+        """Verifica se a conta existe, sem materializá-la."""
+        if numero_conta in self._contas:
+            return True
+        return (self._snapshot is not None and numero_conta not in self._removidas
+                and self._snapshot.posicao(numero_conta) is not None)
+
+    def __setitem__(self, numero_conta: int, conta: ContaBancaria):
+        """Cadastra uma conta."""
+        with self.trava:
+            if not self._existe(numero_conta):
+                self._quantidade += 1
+            self._removidas.discard(numero_conta)
+            self._contas[numero_conta] = conta
+
+    def __delitem__(self, numero_conta: int):
+        """Descadastra uma conta."""
+        with self.trava:
+            if not self._existe(numero_conta):
+                raise KeyError(numero_conta)
+            self._contas.pop(numero_conta, None)
+            if self._snapshot is not None and self._snapshot.posicao(numero_conta) is not None:
+                self._removidas.add(numero_conta)
+            self._quantidade -= 1
+
+    def _existe(self, numero_conta: int) -> bool:
+        """Mesmo que ``in``, para uso com a trava já obtida."""
+        return ContasMapeadas.__contains__(self, numero_conta)
+
+    def __len__(self) -> int:
+        """Quantidade de contas cadastradas."""
+        return self._quantidade
+
+    def __iter__(self) -> Iterator[int]:
+        """Números das contas: as do snapshot em ordem, depois as novas."""
+        if self._snapshot is not None:
+            for numero in self._snapshot.numeros:
+                if numero not in self._removidas:
+                    yield numero
+        for numero in list(self._contas):
+            if self._snapshot is None or self._snapshot.posicao(numero) is None:
+                yield numero
+
+    def materializadas(self) -> List[ContaBancaria]:
+        """
+        Contas que já existem como objetos, em ordem de número.
+
+        Returns:
+            List[ContaBancaria]: Contas materializadas ou criadas
+        """
+        return [self._contas[numero] for numero in sorted(self._contas)]
+
+    def removidas(self) -> Set[int]:
+        """Cópia dos números de contas do snapshot que foram removidas."""
+        return set(self._removidas)
+
+    def resumos(self) -> Iterator[Tuple[int, str, str, int]]:
+        """
+        Percorre todas as contas sem materializá-las.
+
+        Yields:
+            Tuple: ``(numero, titular, cpf_cnpj, saldo em centavos)``
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            centavos = snapshot.coluna('centavos')
+            for posicao, numero in enumerate(snapshot.numeros):
+                if numero in self._removidas:
+                    continue
+                conta = self._contas.get(numero)
+                if conta is not None:
+                    yield (numero, conta.titular, conta.cpf_cnpj, conta.saldo_centavos)
+                else:
+                    yield (numero, snapshot.titular(posicao),
+                           snapshot.cpf_cnpj(posicao), centavos[posicao])
+        for numero, conta in list(self._contas.items()):
+            if snapshot is None or snapshot.posicao(numero) is None:
+                yield (numero, conta.titular, conta.cpf_cnpj, conta.saldo_centavos)
+
+    def extratos(self) -> Iterator[Tuple[int, Callable[[int, int], Tuple[array, ...]],
+                                         int, int]]:
+        """
+        Percorre os extratos de todas as contas sem materializá-las.
+
+        Yields:
+            Tuple: ``(numero, ler, inicio, fim)``; ``ler(a, b)`` copia as
+            colunas das transações ``[a, b)`` (como ``Extrato.colunas``),
+            e ``[inicio, fim)`` é a faixa do extrato da conta
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            limites = snapshot.coluna('inicio_extrato')
+            for posicao, numero in enumerate(snapshot.numeros):
+                if numero in self._removidas:
+                    continue
+                conta = self._contas.get(numero)
+                if conta is not None:
+                    yield numero, conta.extrato.colunas, 0, len(conta.extrato)
+                else:
+                    yield (numero, snapshot.colunas_extrato,
+                           limites[posicao], limites[posicao + 1])
+        for numero, conta in list(self._contas.items()):
+            if snapshot is None or snapshot.posicao(numero) is None:
+                yield numero, conta.extrato.colunas, 0, len(conta.extrato)
+
+    def congelar(self) -> Tuple[Set[int], List[int]]:
+        """
+        Copia o cadastro atual, para percorrê-lo depois com ``saldos_publicados``.
+
+        Returns:
+            Tuple: (números removidos do snapshot, números das contas
+            materializadas ou criadas)
+        """
+        with self.trava:
+            return set(self._removidas), list(self._contas)
+
+    def saldos_publicados(self, congelado: Tuple[Set[int], List[int]]
+                          ) -> Iterator[Tuple[int, Optional[int]]]:
+        """
+        Percorre as contas de um cadastro congelado sem materializá-las.
+
+        Args:
+            congelado (Tuple): Resultado de ``congelar``
+
+        Yields:
+            Tuple: ``(numero, saldo publicado em centavos)``; o saldo é None
+            para contas removidas depois do congelamento
+        """
+        removidas, numeros = congelado
+        snapshot = self._snapshot
+        if snapshot is not None:
+            centavos = snapshot.coluna('centavos')
+            for posicao, numero in enumerate(snapshot.numeros):
+                if numero in removidas:
+                    continue
+                conta = self._contas.get(numero)
+                if conta is not None:
+                    yield numero, conta._saldo_publicado
+                elif numero in self._removidas:
+                    yield numero, None
+                else:
+                    yield numero, centavos[posicao]
+        for numero in numeros:
+            if snapshot is None or snapshot.posicao(numero) is None:
+                conta = self._contas.get(numero)
+                yield numero, None if conta is None else conta._saldo_publicado
+
+
+def salvar_snapshot(diretorio: str, estado: Dict[str, Any]):
+    """
+    Grava um snapshot binário de forma atômica (temporário + renomeação).
+
+    As contas ainda não materializadas são copiadas do snapshot anterior em
+    faixas contínuas, sem criar objetos por conta.
+
+    Args:
+        diretorio (str): Diretório de dados
+        estado (Dict): ``sequencia``, ``proximo_numero``, ``saldo_total``,
+            ``anterior`` (SnapshotMapeado ou None), ``removidas`` (números do
+            snapshot anterior já removidos), ``contas`` (tuplas
+            ``(numero, titular, cpf_cnpj, criacao, centavos, colunas)`` das
+            contas materializadas, em ordem de número), ``idempotencia``
+            (opcional: chaves de ``CacheIdempotencia.itens``) e
+            ``transferencias`` (opcional: transferências entre partições em
+            andamento)
+    """
+    escritor = _EscritorSnapshot(estado['anterior'], estado['removidas'],
+                                 estado['contas'], estado.get('idempotencia', []),
+                                 estado.get('transferencias', []))
+    caminho = os.path.join(diretorio, ARQUIVO_SNAPSHOT)
+    temporario = caminho + '.tmp'
+
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(bytes(_CABECALHO.size + len(_SECOES) * _SECAO.size))
+        secoes = []
+        for nome, _ in _SECOES:
+            # Seções alinhadas em 8 bytes
+            arquivo.write(bytes(-arquivo.tell() % 8))
+            inicio = arquivo.tell()
+            escritor.escrever(arquivo, nome)
+            secoes.append((inicio, arquivo.tell() - inicio))
+
+        arquivo.seek(0)
+        arquivo.write(_CABECALHO.pack(_ASSINATURA, VERSAO_SNAPSHOT,
+                                      estado['sequencia'], estado['proximo_numero'],
+                                      escritor.quantidade, escritor.transacoes,
+                                      estado['saldo_total']))
+        for inicio, tamanho in secoes:
+            arquivo.write(_SECAO.pack(inicio, tamanho))
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+
+    os.replace(temporario, caminho)
+    sincronizar_diretorio(diretorio)
+
+
+def carregar_snapshot(diretorio: str) -> Optional[SnapshotMapeado]:
+    """
+    Abre o snapshot do diretório de dados, se existir.
+
+    Args:
+        diretorio (str): Diretório de dados
+
+    Returns:
+        SnapshotMapeado: Snapshot mapeado ou None se não houver
+    """
+    caminho = os.path.join(diretorio, ARQUIVO_SNAPSHOT)
+    if not os.path.exists(caminho):
+        return None
+    return SnapshotMapeado(caminho)
+
+
+# Posição de cada campo nas tuplas de contas materializadas
+_CAMPOS = {'numero': 0, 'titular': 1, 'cpf_cnpj': 2, 'criacao': 3, 'centavos': 4}
+
+
+class _EscritorSnapshot:
+    """
+    Grava as seções de um snapshot.
+
+    O plano intercala faixas contínuas de posições do snapshot anterior
+    (copiadas em bloco) com as contas materializadas, em ordem de número.
+    """
+
+    def __init__(self, anterior: Optional[SnapshotMapeado], removidas: Set[int],
+                 contas: List[tuple], idempotencia: List[List[Any]],
+                 transferencias: List[List[Any]]):
+        self._anterior = anterior
+        self._idempotencia = idempotencia
+        self._transferencias = transferencias
+        self._plano = self._planejar(anterior, removidas, contas)
+        self.quantidade = 0
+        self.transacoes = 0
+        for item in self._plano:
+            if type(item) is range:
+                inicios = anterior.coluna('inicio_extrato')
+                self.quantidade += len(item)
+                self.transacoes += inicios[item.stop] - inicios[item.start]
+            else:
+                self.quantidade += 1
+                self.transacoes += len(item[5]['valor']) // _LARGURA['valor']
+
+    @staticmethod
+    def _planejar(anterior: Optional[SnapshotMapeado], removidas: Set[int],
+                  contas: List[tuple]) -> List[Any]:
+        """Monta o plano: itens ``range`` do snapshot anterior ou tuplas de contas."""
+        if anterior is None:
+            return list(contas)
+
+        # Posições do snapshot anterior que deixam de ser copiadas (removidas
+        # ou materializadas) e onde entra cada conta materializada
+        eventos = [(anterior.posicao(numero), 1, None) for numero in removidas]
+        for conta in contas:
+            posicao = anterior.posicao(conta[0])
+            if posicao is None:
+                posicao = bisect_left(anterior.numeros, conta[0])
+            else:
+                eventos.append((posicao, 1, None))
+            eventos.append((posicao, 0, conta))
+        # Inserções antes das exclusões da mesma posição; ordenação estável
+        # preserva a ordem das contas novas
+        eventos.sort(key=lambda evento: evento[:2])
+
+        plano: List[Any] = []
+        atual = 0
+        for posicao, tipo, conta in eventos:
+            if posicao > atual:
+                plano.append(range(atual, posicao))
+                atual = posicao
+            if tipo == 0:
+                plano.append(conta)
+            else:
+                atual = posicao + 1
+        if atual < anterior.quantidade:
+            plano.append(range(atual, anterior.quantidade))
+        return plano
+
+    def escrever(self, arquivo: Any, nome: str):
+        """
+        Grava uma seção.
+
+        Args:
+            arquivo: Arquivo binário aberto para escrita
+            nome (str): Nome da seção (ver ``_SECOES``)
+        """
+        if nome in ('numero', 'criacao', 'centavos'):
+            self._por_conta(arquivo, nome)
+        elif nome in _COLUNAS_EXTRATO:
+            self._extrato(arquivo, nome)
+        elif nome in ('inicio_extrato', 'titular_pos', 'cpf_cnpj_pos'):
+            self._posicoes(arquivo, nome)
+        elif nome in ('titular', 'cpf_cnpj'):
+            self._textos(arquivo, nome)
+        elif nome in ('idempotencia', 'transferencias'):
+            itens = (self._idempotencia if nome == 'idempotencia'
+                     else self._transferencias)
+            arquivo.write(json.dumps(itens, ensure_ascii=False,
+                                     separators=(',', ':')).encode('utf-8'))
+        else:
+            # Tabelas de tipos e descrições deste processo
+            tabela = TIPOS if nome.startswith('tipos') else DESCRICOES
+            textos = [texto.encode('utf-8') for texto in tabela.textos()]
+            if nome.endswith('_pos'):
+                posicoes = array('q', [0])
+                for texto in textos:
+                    posicoes.append(posicoes[-1] + len(texto))
+                arquivo.write(posicoes.tobytes())
+            else:
+                arquivo.write(b''.join(textos))
+
+    def _por_conta(self, arquivo: Any, nome: str):
+        """Seção com um valor de largura fixa por conta."""
+        campo = _CAMPOS[nome]
+        novos = array('q')
+        for item in self._plano:
+            if type(item) is range:
+                arquivo.write(novos.tobytes())
+                del novos[:]
+                arquivo.write(self._anterior.secao(nome, item.start, item.stop))
+            else:
+                novos.append(item[campo])
+        arquivo.write(novos.tobytes())
+
+    def _extrato(self, arquivo: Any, nome: str):
+        """Coluna do extrato: as transações de todas as contas, em sequência."""
+        anterior = self._anterior
+        mapa = None
+        if anterior is not None and nome in ('tipo', 'descricao'):
+            mapa = anterior.mapas[0 if nome == 'tipo' else 1]
+        for item in self._plano:
+            if type(item) is range:
+                inicios = anterior.coluna('inicio_extrato')
+                dados = anterior.secao(nome, inicios[item.start], inicios[item.stop])
+                if mapa is not None:
+                    # Códigos do snapshot anterior traduzidos para este processo
+                    codigo = dict(_SECOES)[nome]
+                    dados = array(codigo, [mapa[c] for c in dados.cast(codigo)])
+                arquivo.write(dados)
+            else:
+                arquivo.write(item[5][nome])
+
+    def _posicoes(self, arquivo: Any, nome: str):
+        """Seção de posições acumuladas (uma por conta, mais a final)."""
+        if nome == 'inicio_extrato':
+            tamanho = lambda conta: len(conta[5]['valor']) // _LARGURA['valor']
+        else:
+            campo = _CAMPOS[nome[:-len('_pos')]]
+            tamanho = lambda conta: len(conta[campo].encode('utf-8'))
+
+        base = 0
+        novas = array('q')
+        for item in self._plano:
+            if type(item) is range:
+                antigas = self._anterior.coluna(nome)
+                deslocamento = base - antigas[item.start]
+                if deslocamento:
+                    novas.extend(posicao + deslocamento
+                                 for posicao in antigas[item.start:item.stop])
+                else:
+                    novas.frombytes(self._anterior.secao(nome, item.start, item.stop))
+                base += antigas[item.stop] - antigas[item.start]
+            else:
+                novas.append(base)
+                base += tamanho(item)
+        novas.append(base)
+        arquivo.write(novas.tobytes())
+
+    def _textos(self, arquivo: Any, nome: str):
+        """Seção de textos (titulares ou documentos) concatenados em UTF-8."""
+        campo = _CAMPOS[nome]
+        for item in self._plano:
+            if type(item) is range:
+                posicoes = self._anterior.coluna(nome + '_pos')
+                arquivo.write(self._anterior.dados(nome)[
+                    posicoes[item.start]:posicoes[item.stop]])
+            else:
+                arquivo.write(item[campo].encode('utf-8'))